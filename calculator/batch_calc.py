@@ -0,0 +1,294 @@
+"""
+7k Rebirth Damage Calculator - Batch (Vectorized) Calculation Functions
+สูตรเดียวกับ damage_calc.py แต่รับ "คอลัมน์" ของค่า (NumPy array) แทนค่าเดี่ยว
+
+- ค่ากลาง (Total ATK, RAW, Effective DEF) คำนวณด้วย float64
+- ค่าที่ต้อง ROUNDDOWN จะถูกตรวจว่าอยู่ใกล้จำนวนเต็มหรือไม่
+  ถ้าใกล้ → คำนวณแถวนั้นซ้ำด้วย Decimal (damage_calc.py) ผลลัพธ์จึงตรงกับ Decimal ทุกบิต
+- NumPy เป็น optional dependency (pip install numpy) ดู D007 ใน decisions.md
+"""
+
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - ทดสอบได้เฉพาะเครื่องที่ไม่มี numpy
+    np = None
+
+from constants import CONFIG_DEFAULTS, DEF_MODIFIER, FLOAT_ROUNDDOWN_GUARD
+from damage_calc import calculate_final_dmg_hp, calculate_final_dmg, to_decimal
+from fast_calc import SCENARIO_INPUT_KEYS, decimal_scenarios
+
+# ค่าที่รับได้: array, list, tuple หรือค่าเดี่ยว (broadcast ให้ยาวเท่าคอลัมน์อื่น)
+ArrayLike = Any
+
+_DEF_MODIFIER = float(DEF_MODIFIER)
+
+# ชื่อ scenario ทั้ง 4 แบบ (ดู D004)
+SCENARIOS = ("crit", "crit_weak", "no_crit", "weak_only")
+
+
+def numpy_available() -> bool:
+    """เช็คว่าติดตั้ง NumPy แล้วหรือยัง"""
+    return np is not None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "batch_calc ต้องใช้ NumPy - ติดตั้งด้วย: pip install numpy"
+        )
+
+
+def as_column(values: ArrayLike) -> "np.ndarray":
+    """แปลงค่าเป็น float64 array (Decimal/str จะถูกแปลงผ่าน float)"""
+    _require_numpy()
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    if isinstance(values, (list, tuple)):
+        return np.array([float(v) for v in values], dtype=np.float64)
+    return np.asarray(float(values), dtype=np.float64)
+
+
+def _columns(*values: ArrayLike) -> list["np.ndarray"]:
+    """แปลงและ broadcast ทุกคอลัมน์ให้มี shape เดียวกัน (1 มิติ)"""
+    arrays = np.broadcast_arrays(*(as_column(v) for v in values))
+    return [np.atleast_1d(a) for a in arrays]
+
+
+def _near_integer(values: "np.ndarray") -> "np.ndarray":
+    """
+    หาแถวที่ float อาจ ROUNDDOWN ได้ไม่ตรงกับ Decimal
+    (ใกล้จำนวนเต็มเกิน FLOAT_ROUNDDOWN_GUARD หรือไม่ใช่ตัวเลขจำกัด)
+
+    0.0 พอดีถือว่าปลอดภัย: เกิดจากตัวคูณเป็น 0 ซึ่ง Decimal ก็ได้ 0 เหมือนกัน
+    """
+    with np.errstate(invalid="ignore"):
+        tol = FLOAT_ROUNDDOWN_GUARD * np.maximum(1.0, np.abs(values))
+        frac = values - np.floor(values)
+        near = (frac < tol) | (frac > 1.0 - tol)
+        return ~np.isfinite(values) | (near & (values != 0.0))
+
+
+def _near_cap(dmg_hp: "np.ndarray", cap_atk: "np.ndarray") -> "np.ndarray":
+    """DMG_HP กับ Cap_ATK ใกล้กันมาก → float อาจเลือกฝั่งผิด ให้ Decimal ตัดสิน"""
+    return (cap_atk > 0) & np.isclose(dmg_hp, cap_atk, rtol=FLOAT_ROUNDDOWN_GUARD, atol=0.0)
+
+
+def _row_decimals(columns: Sequence["np.ndarray"], i: int) -> list[Decimal]:
+    """ดึงแถวที่ i เป็น Decimal (แปลงแบบเดียวกับ get_decimal: Decimal(str(float)))"""
+    return [to_decimal(float(col[i])) for col in columns]
+
+
+# ============================================
+# Vectorized formulas (1:1 กับ damage_calc.py)
+# ============================================
+
+def calculate_total_atk_batch(
+    atk_char: ArrayLike,
+    atk_pet: ArrayLike,
+    atk_base: ArrayLike,
+    formation: ArrayLike,
+    potential_pet: ArrayLike,
+    buff_atk: ArrayLike,
+    buff_atk_pet: ArrayLike
+) -> "np.ndarray":
+    """
+    คำนวณ Total ATK ทีละหลายแถว (float64)
+
+    สูตรเดียวกับ calculate_total_atk()
+    """
+    _require_numpy()
+    atk_char, atk_pet, atk_base, formation, potential_pet, buff_atk, buff_atk_pet = _columns(
+        atk_char, atk_pet, atk_base, formation, potential_pet, buff_atk, buff_atk_pet
+    )
+    formation_bonus = atk_base * (formation + potential_pet) / 100.0
+    base_atk = atk_char + atk_pet + formation_bonus
+    buff_mult = 1.0 + (buff_atk + buff_atk_pet) / 100.0
+    return base_atk * buff_mult
+
+
+def calculate_dmg_hp_batch(hp_target: ArrayLike, bonus_dmg_hp_target: ArrayLike) -> "np.ndarray":
+    """คำนวณ DMG_HP ทีละหลายแถว (float64)"""
+    _require_numpy()
+    hp_target, bonus_dmg_hp_target = _columns(hp_target, bonus_dmg_hp_target)
+    return hp_target * bonus_dmg_hp_target / 100.0
+
+
+def calculate_cap_atk_batch(total_atk: ArrayLike, cap_atk_percent: ArrayLike) -> "np.ndarray":
+    """คำนวณ Cap_ATK ทีละหลายแถว (float64)"""
+    _require_numpy()
+    total_atk, cap_atk_percent = _columns(total_atk, cap_atk_percent)
+    return total_atk * cap_atk_percent / 100.0
+
+
+def _select_hp_dmg(dmg_hp: "np.ndarray", cap_atk: "np.ndarray") -> "np.ndarray":
+    """IF(DMG_HP > Cap_ATK, Cap_ATK, DMG_HP) แบบเดียวกับ calculate_final_dmg_hp (ก่อนปัดลง)"""
+    return np.where((dmg_hp > cap_atk) & (cap_atk > 0), cap_atk, dmg_hp)
+
+
+def calculate_final_dmg_hp_batch(dmg_hp: ArrayLike, cap_atk: ArrayLike) -> "np.ndarray":
+    """
+    คำนวณ Final_DMG_HP ทีละหลายแถว (int64)
+
+    แถวที่อยู่ใกล้จำนวนเต็มจะคำนวณซ้ำด้วย calculate_final_dmg_hp()
+    """
+    _require_numpy()
+    dmg_hp, cap_atk = _columns(dmg_hp, cap_atk)
+    selected = _select_hp_dmg(dmg_hp, cap_atk)
+    risky = _near_integer(selected) | _near_cap(dmg_hp, cap_atk)
+    with np.errstate(invalid="ignore"):
+        result = np.trunc(np.where(risky, 0.0, selected)).astype(np.int64)
+    for i in np.flatnonzero(risky):
+        d_hp, d_cap = _row_decimals((dmg_hp, cap_atk), i)
+        result[i] = int(calculate_final_dmg_hp(d_hp, d_cap))
+    return result
+
+
+def calculate_raw_dmg_batch(
+    total_atk: ArrayLike,
+    skill_dmg: ArrayLike,
+    crit_dmg: ArrayLike,
+    weak_dmg: ArrayLike,
+    dmg_amp_buff: ArrayLike,
+    dmg_amp_debuff: ArrayLike,
+    dmg_reduction: ArrayLike,
+    final_dmg_hp: ArrayLike = 0
+) -> "np.ndarray":
+    """
+    คำนวณ RAW Damage ทีละหลายแถว (float64)
+
+    สูตรเดียวกับ calculate_raw_dmg()
+    """
+    _require_numpy()
+    (total_atk, skill_dmg, crit_dmg, weak_dmg,
+     dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp) = _columns(
+        total_atk, skill_dmg, crit_dmg, weak_dmg,
+        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
+    )
+    crit_mult = crit_dmg / 100.0
+    weak_mult = 1.0 + weak_dmg / 100.0
+    amp_buff_mult = 1.0 + dmg_amp_buff / 100.0
+    amp_debuff_reduction_mult = 1.0 + (dmg_amp_debuff - dmg_reduction) / 100.0
+    shared = crit_mult * weak_mult * amp_buff_mult * amp_debuff_reduction_mult
+    return total_atk * (skill_dmg / 100.0) * shared + final_dmg_hp * shared
+
+
+def calculate_effective_def_batch(
+    def_target: ArrayLike,
+    def_buff: ArrayLike,
+    def_reduce: ArrayLike,
+    ignore_def: ArrayLike
+) -> "np.ndarray":
+    """
+    คำนวณ Effective DEF ทีละหลายแถว (float64)
+
+    สูตรเดียวกับ calculate_effective_def()
+    """
+    _require_numpy()
+    def_target, def_buff, def_reduce, ignore_def = _columns(
+        def_target, def_buff, def_reduce, ignore_def
+    )
+    def_mult = 1.0 + def_buff / 100.0 - def_reduce / 100.0
+    ignore_mult = 1.0 - ignore_def / 100.0
+    return 1.0 + (_DEF_MODIFIER * def_target * def_mult * ignore_mult)
+
+
+def calculate_final_dmg_batch(raw_dmg: ArrayLike, effective_def: ArrayLike) -> "np.ndarray":
+    """
+    คำนวณ Final Damage ทีละหลายแถว (int64)
+
+    ROUNDDOWN(RAW_DMG / Effective_DEF) - แถวที่ใกล้จำนวนเต็มจะใช้ calculate_final_dmg()
+    """
+    _require_numpy()
+    raw_dmg, effective_def = _columns(raw_dmg, effective_def)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quotient = raw_dmg / effective_def
+    risky = _near_integer(quotient)
+    with np.errstate(invalid="ignore"):
+        result = np.trunc(np.where(risky, 0.0, quotient)).astype(np.int64)
+    for i in np.flatnonzero(risky):
+        d_raw, d_def = _row_decimals((raw_dmg, effective_def), i)
+        result[i] = calculate_final_dmg(d_raw, d_def)
+    return result
+
+
+# ============================================
+# End-to-end: config columns → 4 scenarios
+# ============================================
+
+# key ที่ใช้ในการคำนวณ 4 scenario (ใช้ร่วมกับ fast_calc)
+BATCH_INPUT_KEYS = SCENARIO_INPUT_KEYS
+
+
+def calculate_damage_batch(
+    columns: Mapping[str, ArrayLike],
+    atk_base: ArrayLike
+) -> dict[str, "np.ndarray"]:
+    """
+    คำนวณ Final Damage ต่อ hit ทั้ง 4 scenario สำหรับหลาย build พร้อมกัน
+
+    Args:
+        columns: key ของ config (เช่น "ATK_CHAR", "CRIT_DMG", "DEF_Target") → array ของค่า
+                 key ที่ไม่มีจะใช้ค่า default เดียวกับ main.py (CONFIG_DEFAULTS)
+        atk_base: ATK_BASE (ค่าเดียว หรือ array)
+
+    Returns:
+        dict ของ int64 array: "crit", "crit_weak", "no_crit", "weak_only"
+        รวมถึงค่ากลาง "total_atk", "final_dmg_hp", "effective_def"
+    """
+    _require_numpy()
+    keys = BATCH_INPUT_KEYS + ("ATK_BASE",)
+    raw_values = [columns.get(k, CONFIG_DEFAULTS.get(k, "0")) for k in BATCH_INPUT_KEYS]
+    cols = dict(zip(keys, _columns(*raw_values, atk_base)))
+
+    total_atk = calculate_total_atk_batch(
+        cols["ATK_CHAR"], cols["ATK_PET"], cols["ATK_BASE"],
+        cols["Formation"], cols["Potential_PET"],
+        cols["BUFF_ATK"], cols["BUFF_ATK_PET"]
+    )
+    dmg_hp = calculate_dmg_hp_batch(cols["HP_Target"], cols["Bonus_DMG_HP_Target"])
+    cap_atk = calculate_cap_atk_batch(total_atk, cols["Cap_ATK_Percent"])
+    selected_hp = _select_hp_dmg(dmg_hp, cap_atk)
+    risky = _near_integer(selected_hp) | _near_cap(dmg_hp, cap_atk)
+    with np.errstate(invalid="ignore"):
+        final_dmg_hp = np.trunc(np.where(risky, 0.0, selected_hp))
+    effective_def = calculate_effective_def_batch(
+        cols["DEF_Target"], cols["DEF_BUFF"], cols["DEF_REDUCE"], cols["Ignore_DEF"]
+    )
+
+    total_weak_dmg = 30.0 + cols["WEAK_DMG"]
+    variants = {
+        "crit": (cols["CRIT_DMG"], 0.0),
+        "crit_weak": (cols["CRIT_DMG"], total_weak_dmg),
+        "no_crit": (100.0, 0.0),
+        "weak_only": (100.0, total_weak_dmg),
+    }
+    results: dict[str, np.ndarray] = {}
+    for name, (crit, weak) in variants.items():
+        raw = calculate_raw_dmg_batch(
+            total_atk, cols["SKILL_DMG"], crit, weak,
+            cols["DMG_AMP_BUFF"], cols["DMG_AMP_DEBUFF"], cols["DMG_Reduction"], final_dmg_hp
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quotient = raw / effective_def
+        near = _near_integer(quotient)
+        risky |= near
+        with np.errstate(invalid="ignore"):
+            results[name] = np.trunc(np.where(near, 0.0, quotient)).astype(np.int64)
+
+    # แถวเสี่ยง: คำนวณทั้ง chain ใหม่ด้วย Decimal
+    ordered = [cols[k] for k in keys]
+    for i in np.flatnonzero(risky):
+        row = dict(zip(keys, _row_decimals(ordered, i)))
+        row_hp, finals = decimal_scenarios(row)
+        final_dmg_hp[i] = float(row_hp)
+        for name, value in zip(SCENARIOS, finals):
+            results[name][i] = value
+
+    results["total_atk"] = total_atk
+    results["final_dmg_hp"] = final_dmg_hp.astype(np.int64)
+    results["effective_def"] = effective_def
+    return results
@@ -0,0 +1,217 @@
+"""
+7k Rebirth Damage Calculator - Batch CLI (ไม่มีเมนู): JSON Lines เข้า → JSON Lines ออก
+
+แต่ละบรรทัดของ input คือ 1 job:
+    {"id": 1, "character": "miho", "skill": "skill2", "config": {"ATK_CHAR": 4200}, "preset": "castle_room1.json"}
+    - config: ค่าที่ทับ user config ฐาน (--config หรือ config.json)
+    - skill / preset / id / def_char / def_pet (Biscuit) ไม่บังคับ, skill รองรับ "both"
+
+แต่ละบรรทัดของ output คือผลของ job บรรทัดเดียวกัน (ลำดับเดียวกับ input):
+    {"id": 1, "line": 1, "character": "miho", ..., "damage": {"crit": ..., ...}}
+    job ที่ผิดพลาด → {"id": ..., "line": n, "error": "..."} แล้วทำบรรทัดถัดไปต่อ (return code 1)
+
+- อ่านทีละ chunk ของบรรทัด (ไม่โหลดทั้งไฟล์) หน่วยความจำจึงคงที่ไม่ว่า input จะใหญ่แค่ไหน
+- --workers N: กระจาย chunk ให้หลาย process ผ่าน parallel.imap_chunks (ค้างอยู่ไม่เกิน 2 chunk ต่อ worker)
+- ค่า Decimal ถูกเขียนเป็น string (ไม่เสียความแม่นยำ, D001)
+
+การใช้งาน:
+    python calculator/batch_cli.py jobs.jsonl -o results.jsonl --workers 8
+    cat jobs.jsonl | python calculator/batch_cli.py > results.jsonl
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import asdict
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
+
+# Add parent directory to path for imports (รันเป็นสคริปต์ได้)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from character_db import get_character_db
+from config_loader import load_json, load_user_config
+from parallel import imap_chunks
+from pipeline import compute_damage
+from results import DamageResult
+
+# จำนวนบรรทัดต่อ chunk (ต่อ 1 งานของ worker)
+DEFAULT_CHUNK_LINES = 256
+
+# user config ฐานของ process นี้ (ตั้งผ่าน _init_worker ใน worker)
+_base_config: dict[str, Any] = {}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} แปลงเป็น JSON ไม่ได้")
+
+
+def result_record(result: DamageResult) -> dict[str, Any]:
+    """ผลของ pipeline ในรูปที่เขียนเป็น JSON ได้ (เฉพาะค่าที่ใช้ตัดสิน build)"""
+    record: dict[str, Any] = {
+        "weapon_set": result.weapon_set,
+        "skill_hits": result.skill_hits,
+        "total_atk": result.total_atk,
+        "final_dmg_hp": result.final_dmg_hp,
+        "effective_def": result.effective_def,
+        "damage": {
+            "crit": result.final_dmg_crit,
+            "crit_weak": result.final_dmg_crit_weakness,
+            "no_crit": result.final_dmg_no_crit,
+            "weak_only": result.final_dmg_weakness_only,
+        },
+    }
+    if result.monster_hp:
+        record["monster_hp"] = result.monster_hp
+        record["atk_needed"] = result.atk_needed
+    if result.special_result is not None:
+        record["special"] = result.special_result.to_dict()
+    if result.both_skills is not None:
+        record["both_skills"] = asdict(result.both_skills)
+    return record
+
+
+def evaluate_job(job: Any, base_config: Mapping[str, Any]) -> dict[str, Any]:
+    """คำนวณ 1 job (dict จาก 1 บรรทัด) → record ผลลัพธ์ (ไม่รวม id / line)"""
+    if not isinstance(job, dict):
+        raise ValueError("แต่ละบรรทัดต้องเป็น JSON object")
+    character = job.get("character")
+    if not isinstance(character, str):
+        raise ValueError("ต้องมี 'character' เป็น string")
+    overrides = job.get("config") or {}
+    if not isinstance(overrides, dict):
+        raise ValueError("'config' ต้องเป็น JSON object")
+    preset_name = job.get("preset")
+    if preset_name is not None and not isinstance(preset_name, str):
+        raise ValueError("'preset' ต้องเป็นชื่อไฟล์ (string)")
+    preset = None
+    if preset_name:
+        try:
+            preset = dict(get_character_db().monster(preset_name).preset)
+        except KeyError:
+            raise KeyError(f"ไม่พบ monster preset '{preset_name}'") from None
+    def_char, def_pet = job.get("def_char"), job.get("def_pet")
+
+    result = compute_damage(
+        character, job.get("skill"), {**base_config, **overrides}, preset,
+        def_char=None if def_char is None else Decimal(str(def_char)),
+        def_pet=None if def_pet is None else Decimal(str(def_pet)),
+    )
+    return {
+        "character": character,
+        "skill": job.get("skill"),
+        "preset": preset_name,
+        **result_record(result),
+    }
+
+
+def process_line(line: str, number: int, base_config: Mapping[str, Any]) -> tuple[str, bool] | None:
+    """
+    1 บรรทัด input → (บรรทัด JSON ผลลัพธ์, สำเร็จไหม), บรรทัดว่างคืน None
+    """
+    if not line.strip():
+        return None
+    job_id = None
+    try:
+        job = json.loads(line)
+        if isinstance(job, dict):
+            job_id = job.get("id")
+        record = {"id": job_id, "line": number, **evaluate_job(job, base_config)}
+        ok = True
+    except (ValueError, KeyError, TypeError, ArithmeticError) as e:
+        message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        record = {"id": job_id, "line": number, "error": f"{type(e).__name__}: {message}"}
+        ok = False
+    return json.dumps(record, ensure_ascii=False, default=_json_default), ok
+
+
+def process_chunk(chunk: list[tuple[int, str]]) -> list[tuple[str, bool]]:
+    """คำนวณทั้ง chunk ด้วย user config ฐานของ process นี้"""
+    out = []
+    for number, line in chunk:
+        processed = process_line(line, number, _base_config)
+        if processed is not None:
+            out.append(processed)
+    return out
+
+
+def _init_worker(base_config: dict[str, Any]) -> None:
+    """ส่ง user config ฐานให้ worker ครั้งเดียว (CharacterDB ส่งมาแล้วโดย parallel.imap_chunks)"""
+    global _base_config
+    _base_config = base_config
+
+
+def iter_chunks(lines: Iterable[str], size: int) -> Iterator[list[tuple[int, str]]]:
+    """แบ่งบรรทัดเป็น chunk ละ size บรรทัด (เลขบรรทัดเริ่มที่ 1) โดยอ่านเท่าที่ต้องใช้"""
+    numbered = enumerate(lines, 1)
+    while chunk := list(islice(numbered, size)):
+        yield chunk
+
+
+def run_batch(
+    lines: Iterable[str],
+    out: TextIO,
+    base_config: Mapping[str, Any],
+    workers: int = 1,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+) -> tuple[int, int]:
+    """
+    อ่าน job ทีละบรรทัดแล้วเขียนผลทีละบรรทัด → (จำนวน job, จำนวน job ที่ error)
+    """
+    if workers <= 0 or chunk_lines <= 0:
+        raise ValueError("workers และ chunk_lines ต้อง > 0")
+    chunks = iter_chunks(lines, chunk_lines)
+    if workers == 1:
+        _init_worker(dict(base_config))
+        results: Iterator[list[tuple[str, bool]]] = map(process_chunk, chunks)
+    else:
+        results = imap_chunks(process_chunk, chunks, workers,
+                              initializer=_init_worker, initargs=(dict(base_config),))
+    total = errors = 0
+    for processed in results:
+        for text, ok in processed:
+            out.write(text + "\n")
+            total += 1
+            errors += not ok
+    return total, errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", nargs="?", default="-", help="ไฟล์ .jsonl หรือ - (stdin)")
+    parser.add_argument("-o", "--output", default="-", help="ไฟล์ผลลัพธ์ .jsonl หรือ - (stdout)")
+    parser.add_argument("--config", type=Path, help="user config ฐาน (ปริยาย: config.json)")
+    parser.add_argument("--workers", type=int, default=1, help="จำนวน process (1 = รันใน process นี้)")
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    args = parser.parse_args(argv)
+
+    base_config = load_json(args.config) if args.config else load_user_config()
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        total, errors = run_batch(source, sink, base_config, args.workers, args.chunk_lines)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    finally:
+        sink.flush()
+        if args.output != "-":
+            sink.close()
+        if args.input != "-":
+            source.close()
+    if errors:
+        print(f"⚠️ {errors:,} จาก {total:,} job ผิดพลาด (ดู \"error\" ใน output)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # stdin/stdout เป็น UTF-8 เสมอ (Windows console ใช้ encoding อื่นโดยปริยาย)
+    sys.stdin.reconfigure(encoding="utf-8")
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Benchmark: batch_calc (NumPy) vs damage_calc (Decimal ทีละแถว)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_batch_calc.py [--rows 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch_calc import SCENARIOS, as_column, calculate_damage_batch, numpy_available
+from damage_calc import (
+    calculate_total_atk,
+    calculate_dmg_hp,
+    calculate_cap_atk,
+    calculate_final_dmg_hp,
+    calculate_raw_dmg,
+    calculate_effective_def,
+    calculate_final_dmg,
+)
+from config_loader import get_decimal
+from constants import CONFIG_DEFAULTS
+
+ATK_BASE = 1500
+
+
+def make_rows(n: int, seed: int = 7) -> dict[str, list[float]]:
+    """สร้างคอลัมน์ build แบบสุ่ม (ช่วงค่าเดียวกับที่เจอในเกม)"""
+    rng = random.Random(seed)
+    columns: dict[str, list[float]] = {
+        "ATK_CHAR": [rng.randint(2000, 6000) for _ in range(n)],
+        "CRIT_DMG": [rng.randint(150, 350) for _ in range(n)],
+        "WEAK_DMG": [rng.choice([0, 23, 35, 58]) for _ in range(n)],
+        "DMG_AMP_BUFF": [rng.choice([0, 10, 40, 80]) for _ in range(n)],
+        "DEF_Target": [rng.randint(0, 3000) for _ in range(n)],
+        "Ignore_DEF": [rng.choice([0, 15, 40]) for _ in range(n)],
+        "HP_Target": [rng.randint(5000, 200000) for _ in range(n)],
+        "Bonus_DMG_HP_Target": [rng.choice([0, 7]) for _ in range(n)],
+        "Cap_ATK_Percent": [rng.choice([0, 100]) for _ in range(n)],
+    }
+    return columns
+
+
+def run_decimal(columns: dict[str, list[float]], n: int) -> list[tuple[int, ...]]:
+    """คำนวณ n แถวแรกแบบเดียวกับ main.py (Decimal ทีละแถว)"""
+    atk_base = Decimal(ATK_BASE)
+    results = []
+    for i in range(n):
+        row = {k: v[i] for k, v in columns.items()}
+        d = {k: get_decimal(row, k, default) for k, default in CONFIG_DEFAULTS.items()}
+        total_atk = calculate_total_atk(
+            d["ATK_CHAR"], d["ATK_PET"], atk_base,
+            d["Formation"], d["Potential_PET"], d["BUFF_ATK"], d["BUFF_ATK_PET"]
+        )
+        final_dmg_hp = calculate_final_dmg_hp(
+            calculate_dmg_hp(d["HP_Target"], d["Bonus_DMG_HP_Target"]),
+            calculate_cap_atk(total_atk, d["Cap_ATK_Percent"])
+        )
+        eff_def = calculate_effective_def(d["DEF_Target"], d["DEF_BUFF"], d["DEF_REDUCE"], d["Ignore_DEF"])
+        weak = Decimal("30") + d["WEAK_DMG"]
+        finals = []
+        for crit, w in ((d["CRIT_DMG"], Decimal("0")), (d["CRIT_DMG"], weak),
+                        (Decimal("100"), Decimal("0")), (Decimal("100"), weak)):
+            raw = calculate_raw_dmg(
+                total_atk, d["SKILL_DMG"], crit, w,
+                d["DMG_AMP_BUFF"], d["DMG_AMP_DEBUFF"], d["DMG_Reduction"], final_dmg_hp
+            )
+            finals.append(calculate_final_dmg(raw, eff_def))
+        results.append(tuple(finals))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="จำนวนแถวสำหรับ batch")
+    parser.add_argument("--decimal-rows", type=int, default=20_000,
+                        help="จำนวนแถวที่วัดด้วย Decimal (ช้า จึงวัดแค่บางส่วนแล้วเทียบต่อแถว)")
+    args = parser.parse_args()
+
+    if not numpy_available():
+        print("ต้องติดตั้ง NumPy ก่อน: pip install numpy")
+        return 1
+
+    columns = make_rows(args.rows)
+    n_dec = min(args.decimal_rows, args.rows)
+
+    start = time.perf_counter()
+    expected = run_decimal(columns, n_dec)
+    t_decimal = time.perf_counter() - start
+
+    arrays = {k: as_column(v) for k, v in columns.items()}
+    start = time.perf_counter()
+    result = calculate_damage_batch(arrays, atk_base=ATK_BASE)
+    t_batch = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for i in range(n_dec)
+        if tuple(int(result[name][i]) for name in SCENARIOS) != expected[i]
+    )
+
+    dec_rate = n_dec / t_decimal
+    batch_rate = args.rows / t_batch
+    print("=" * 60)
+    print("  Benchmark: batch_calc vs damage_calc")
+    print("=" * 60)
+    print(f"  Decimal (ทีละแถว): {n_dec:>10,} rows  {t_decimal:8.3f}s  {dec_rate:>12,.0f} rows/s")
+    print(f"  Batch (NumPy):     {args.rows:>10,} rows  {t_batch:8.3f}s  {batch_rate:>12,.0f} rows/s")
+    print(f"  Speedup: x{batch_rate / dec_rate:,.1f}")
+    print(f"  Mismatches (first {n_dec:,} rows): {mismatches}")
+    print("=" * 60)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
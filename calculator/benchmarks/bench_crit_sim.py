@@ -0,0 +1,48 @@
+"""
+Benchmark: crit_sim.simulate_kill (trials ต่อวินาที, 1 core และหลาย process)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_crit_sim.py [--trials 5000000] [--hits 8] [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crit_sim import HitDamage, simulate_kill
+
+
+def run(trials: int, hits: int, workers: int) -> tuple[float, float]:
+    """Returns (เวลา, kill probability)"""
+    damage = HitDamage(crit=1200, crit_weak=1600, no_crit=500, weak_only=700)
+    start = time.perf_counter()
+    result = simulate_kill(damage, hits, hp=hits * 900, crit_rate=0.4, weak_rate=0.5,
+                           trials=trials, seed=1, workers=workers)
+    return time.perf_counter() - start, result.kill_probability
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=5_000_000)
+    parser.add_argument("--hits", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"  Benchmark: crit_sim ({args.hits} hits/trial)")
+    print("=" * 60)
+    for workers in sorted({1, args.workers}):
+        elapsed, probability = run(args.trials, args.hits, workers)
+        print(f"  workers={workers:<3} {args.trials:>12,} trials  {elapsed:8.3f}s"
+              f"  {args.trials / elapsed:>14,.0f} trials/s  (P(kill)={probability:.4f})")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Benchmark: exact_kill.kill_probability (1 สกิล และ rotation 2 สกิล) เทียบกับ crit_sim
+
+การใช้งาน:
+    python calculator/benchmarks/bench_exact_kill.py [--hits 25] [--repeat 20] [--trials 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exact_kill import SkillHits, expected_damage, kill_probability
+from results import HitDamage
+
+
+def time_exact(skills: list[SkillHits], hp: int, repeat: int) -> tuple[float, float]:
+    """Returns (เวลาต่อครั้ง, kill probability)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        probability = kill_probability(skills, hp)
+    return (time.perf_counter() - start) / repeat, probability
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hits", type=int, default=25, help="จำนวน hit ต่อสกิล")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--trials", type=int, default=1_000_000, help="trial ของ crit_sim (0 = ข้าม)")
+    args = parser.parse_args()
+
+    first = SkillHits(HitDamage(1203, 1611, 517, 703), args.hits, 0.4, 0.5)
+    second = SkillHits(HitDamage(2207, 2999, 1013, 1409), args.hits, 0.3, 0.2)
+
+    print("=" * 60)
+    print(f"  Benchmark: exact kill probability ({args.hits} hits/skill)")
+    print("=" * 60)
+    for label, skills in (("1 skill", [first]), ("2 skills", [first, second])):
+        hp = int(expected_damage(skills))
+        elapsed, probability = time_exact(skills, hp, args.repeat)
+        print(f"  {label:<9} {sum(s.hits for s in skills):>4} hits  {elapsed * 1e3:10.2f} ms"
+              f"  (P(kill)={probability:.6f})")
+
+    if args.trials:
+        try:
+            from crit_sim import simulate_kill
+            hp = int(expected_damage([first]))
+            start = time.perf_counter()
+            sim = simulate_kill(first.damage, first.hits, hp, first.crit_rate, first.weak_rate,
+                                trials=args.trials, seed=1)
+            print(f"  crit_sim  {args.trials:>12,} trials  {(time.perf_counter() - start) * 1e3:10.2f} ms"
+                  f"  (P(kill)={sim.kill_probability:.6f})")
+        except ImportError:
+            print("  crit_sim: ข้าม (ไม่มี NumPy)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
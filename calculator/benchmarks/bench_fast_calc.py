@@ -0,0 +1,91 @@
+"""
+Benchmark: fast_calc backend "float" vs "decimal" (build เดียวต่อครั้ง ไม่ใช้ NumPy)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_fast_calc.py [--rows 20000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fast_calc import (
+    BACKEND_DECIMAL,
+    BACKEND_FLOAT,
+    SCENARIO_INPUT_KEYS,
+    calculate_scenarios,
+    float_scenarios,
+    use_backend,
+)
+from constants import CONFIG_DEFAULTS
+
+ATK_BASE = 1500
+
+
+def make_configs(n: int, seed: int = 7) -> list[dict[str, float]]:
+    """สร้าง config แบบสุ่ม (ช่วงค่าเดียวกับที่เจอในเกม)"""
+    rng = random.Random(seed)
+    return [
+        {
+            "ATK_CHAR": float(rng.randint(2000, 6000)),
+            "CRIT_DMG": float(rng.randint(150, 350)),
+            "WEAK_DMG": rng.choice([0.0, 23.0, 35.0, 58.0]),
+            "DMG_AMP_BUFF": rng.choice([0.0, 10.0, 40.0, 80.0]),
+            "DEF_Target": float(rng.randint(0, 3000)),
+            "Ignore_DEF": rng.choice([0.0, 15.0, 40.0]),
+            "HP_Target": float(rng.randint(5000, 200000)),
+            "Bonus_DMG_HP_Target": rng.choice([0.0, 7.0]),
+            "Cap_ATK_Percent": rng.choice([0.0, 100.0]),
+        }
+        for _ in range(n)
+    ]
+
+
+def run(configs: list[dict[str, float]], backend: str) -> tuple[float, list[tuple]]:
+    """คำนวณทุก config ด้วย backend ที่เลือก คืน (เวลา, ผลลัพธ์)"""
+    with use_backend(backend):
+        start = time.perf_counter()
+        results = [calculate_scenarios(config, ATK_BASE) for config in configs]
+        elapsed = time.perf_counter() - start
+    return elapsed, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000, help="จำนวน build ที่คำนวณ")
+    args = parser.parse_args()
+
+    configs = make_configs(args.rows)
+
+    t_decimal, expected = run(configs, BACKEND_DECIMAL)
+    t_float, result = run(configs, BACKEND_FLOAT)
+
+    mismatches = sum(1 for a, b in zip(result, expected) if a != b)
+    fallbacks = sum(
+        1 for config in configs
+        if float_scenarios(
+            [float(config.get(k, CONFIG_DEFAULTS[k])) for k in SCENARIO_INPUT_KEYS], float(ATK_BASE)
+        ) is None
+    )
+
+    dec_rate = args.rows / t_decimal
+    float_rate = args.rows / t_float
+    print("=" * 60)
+    print("  Benchmark: fast_calc float vs decimal")
+    print("=" * 60)
+    print(f"  Decimal: {args.rows:>10,} rows  {t_decimal:8.3f}s  {dec_rate:>12,.0f} rows/s")
+    print(f"  Float:   {args.rows:>10,} rows  {t_float:8.3f}s  {float_rate:>12,.0f} rows/s")
+    print(f"  Speedup: x{float_rate / dec_rate:,.1f}")
+    print(f"  Decimal fallbacks: {fallbacks:,} ({fallbacks / args.rows:.2%})")
+    print(f"  Mismatches: {mismatches}")
+    print("=" * 60)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Benchmark: แก้ config ทีละค่า (เหมือนพิมพ์ทีละแป้น)
+เทียบ compute_damage ทั้ง pipeline กับ DamageGraph.update (คำนวณเฉพาะ node ปลายทาง)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_incremental.py [--character miho] [--skill skill2] [--repeat 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import memo
+from config_loader import load_user_config
+from incremental import DamageGraph
+from pipeline import compute_damage
+
+# key ที่แก้ → ค่าที่สลับไปมา
+EDITS = (("CRIT_DMG", (186.0, 210.0)), ("DEF_Target", (1461.0, 900.0)),
+         ("ATK_CHAR", (3773.0, 4200.0)), ("HP_Target", (18205.0, 9000.0)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--character", default="miho")
+    parser.add_argument("--skill", default="skill2")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    user = load_user_config()
+    print("=" * 60)
+    print(f"  Benchmark: single-key edit ({args.character} {args.skill}, {args.repeat} edits/key)")
+    print("=" * 60)
+    print(f"  {'key':<12}{'pipeline µs':>14}{'graph µs':>12}{'speedup':>10}  recomputed")
+    with memo.memoization(False):
+        for key, values in EDITS:
+            config = dict(user)
+            start = time.perf_counter()
+            for i in range(args.repeat):
+                config[key] = values[i % 2]
+                compute_damage(args.character, args.skill, dict(config), None)
+            pipeline_us = (time.perf_counter() - start) / args.repeat * 1e6
+
+            graph = DamageGraph(args.character, args.skill, user)
+            start = time.perf_counter()
+            for i in range(args.repeat):
+                recomputed = graph.update({key: values[i % 2]})
+            graph_us = (time.perf_counter() - start) / args.repeat * 1e6
+            print(f"  {key:<12}{pipeline_us:>14.1f}{graph_us:>12.1f}{pipeline_us / graph_us:>9.1f}x  "
+                  f"{', '.join(sorted(recomputed))}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
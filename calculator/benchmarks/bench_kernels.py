@@ -0,0 +1,98 @@
+"""
+Benchmark: compiled damage kernel vs เส้นทางของ main.main
+(load_character_full → resolve_skill → run_pipeline ต่อ 1 build ไม่รวม input()/print())
+
+การใช้งาน:
+    python calculator/benchmarks/bench_kernels.py [--rows 5000] [--character miho] [--skill skill2]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from kernels import compile_kernel
+from config_loader import load_character_full, load_monster_preset
+from pipeline import resolve_skill, run_pipeline
+
+PRESET = "castle_room1.json"
+
+
+def make_users(n: int, weapon_set: int, seed: int = 7) -> list[dict[str, float]]:
+    """user config แบบสุ่ม (ช่วงค่าเดียวกับที่เจอในเกม)"""
+    rng = random.Random(seed)
+    return [
+        {
+            "Weapon_Set": weapon_set,
+            "ATK_CHAR": float(rng.randint(2000, 6000)),
+            "CRIT_DMG": float(rng.randint(150, 350)),
+            "DMG_AMP_BUFF": rng.choice([0.0, 10.0, 20.0]),
+            "Formation": rng.choice([0.0, 21.0, 42.0]),
+            "ATK_PET": float(rng.randint(300, 700)),
+            "BUFF_ATK_PET": 21.0,
+            "Potential_PET": 51.0,
+        }
+        for _ in range(n)
+    ]
+
+
+def run_main_path(character: str, skill: str, users: list[dict[str, float]]) -> tuple[float, list[tuple]]:
+    """เส้นทางเดียวกับ main.main: โหลดตัวละคร + preset แล้ว run_pipeline ทุก build"""
+    start = time.perf_counter()
+    results = []
+    for user in users:
+        meta, char_config = load_character_full(character)
+        skill_config, _, _ = resolve_skill(meta, skill)
+        r = run_pipeline(character, meta, char_config, skill_config, user,
+                         monster_preset=load_monster_preset(PRESET))
+        results.append((int(r.final_dmg_hp), (r.final_dmg_crit, r.final_dmg_crit_weakness,
+                                              r.final_dmg_no_crit, r.final_dmg_weakness_only)))
+    return time.perf_counter() - start, results
+
+
+def run_kernel(character: str, skill: str, weapon_set: int, users: list[dict[str, float]]) -> tuple[float, float, list[tuple]]:
+    """คอมไพล์ครั้งเดียว แล้วเรียก kernel ทุก build (ส่งค่าตาม kernel.variables)"""
+    start = time.perf_counter()
+    kernel = compile_kernel(character, skill, weapon_set, monster_preset=PRESET)
+    t_compile = time.perf_counter() - start
+
+    rows = [tuple(user.get(k) for k in kernel.variables) for user in users]
+    start = time.perf_counter()
+    results = [kernel(*row) for row in rows]
+    return t_compile, time.perf_counter() - start, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000, help="จำนวน build ที่คำนวณ")
+    parser.add_argument("--character", default="miho")
+    parser.add_argument("--skill", default="skill2")
+    parser.add_argument("--weapon-set", type=int, default=3)
+    args = parser.parse_args()
+
+    users = make_users(args.rows, args.weapon_set)
+
+    t_main, expected = run_main_path(args.character, args.skill, users)
+    t_compile, t_kernel, result = run_kernel(args.character, args.skill, args.weapon_set, users)
+    mismatches = sum(1 for a, b in zip(result, expected) if a != b)
+
+    main_us = t_main / args.rows * 1e6
+    kernel_us = t_kernel / args.rows * 1e6
+    print("=" * 60)
+    print(f"  Benchmark: damage kernel ({args.character} / {args.skill} / set {args.weapon_set})")
+    print("=" * 60)
+    print(f"  main path: {args.rows:>8,} builds  {t_main:8.3f}s  {main_us:10.1f} us/build")
+    print(f"  kernel:    {args.rows:>8,} builds  {t_kernel:8.3f}s  {kernel_us:10.1f} us/build")
+    print(f"  compile:   {t_compile * 1e6:10.1f} us (ครั้งเดียว)")
+    print(f"  Speedup: x{main_us / kernel_us:,.1f}")
+    print(f"  Mismatches: {mismatches}")
+    print("=" * 60)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
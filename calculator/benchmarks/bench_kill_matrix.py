@@ -0,0 +1,55 @@
+"""
+Benchmark: kill matrix ของตัวละคร 1 ตัวกับทุก monster preset
+เทียบ compute_damage ทีละ (สกิล, preset) กับ character_matrix (ส่วนที่ไม่ขึ้นกับเป้าหมายคำนวณครั้งเดียว)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_kill_matrix.py [--character sun_wukong] [--repeat 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import memo
+from config_loader import load_user_config
+from kill_matrix import character_matrix
+from pipeline import compute_damage
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--character", default="sun_wukong")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    user = load_user_config()
+    matrix = character_matrix(args.character, user)
+    pairs = [(cell.skill, f"{cell.target}.json") for cell in matrix.cells]
+
+    print("=" * 60)
+    print(f"  Benchmark: kill matrix {args.character} "
+          f"({len(matrix.skills)} skills x {len(matrix.targets)} presets)")
+    print("=" * 60)
+    with memo.memoization(False):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for skill, preset in pairs:
+                compute_damage(args.character, skill, dict(user), preset)
+        pipeline_ms = (time.perf_counter() - start) / args.repeat * 1e3
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            character_matrix(args.character, user)
+        matrix_ms = (time.perf_counter() - start) / args.repeat * 1e3
+    print(f"  compute_damage x {len(pairs):<3} {pipeline_ms:8.3f} ms/matrix")
+    print(f"  character_matrix     {matrix_ms:8.3f} ms/matrix  ({pipeline_ms / matrix_ms:.1f}x)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
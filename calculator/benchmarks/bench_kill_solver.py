@@ -0,0 +1,89 @@
+"""
+Benchmark: kill_solver.min_stat_to_kill (เวลาต่อการหา 1 ครั้ง) เทียบกับการวนหาทีละ 1
+
+การใช้งาน:
+    python calculator/benchmarks/bench_kill_solver.py [--rows 5000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from kill_solver import SOLVABLE_STATS, min_stat_to_kill
+from fast_calc import BACKEND_FLOAT, SCENARIO_INDEX, calculate_scenarios, use_backend
+
+ATK_BASE = 1500
+
+
+def make_cases(n: int, seed: int = 7) -> list[tuple[dict[str, float], str, int, int, str]]:
+    """สร้างโจทย์แบบสุ่ม (config, stat, hp, hits, scenario)"""
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(n):
+        config = {
+            "ATK_CHAR": float(rng.randint(2000, 6000)),
+            "CRIT_DMG": float(rng.randint(150, 350)),
+            "SKILL_DMG": float(rng.randint(50, 400)),
+            "WEAK_DMG": rng.choice([0.0, 23.0, 35.0]),
+            "DMG_AMP_BUFF": rng.choice([0.0, 10.0, 40.0]),
+            "DEF_Target": float(rng.randint(0, 3000)),
+            "Ignore_DEF": rng.choice([0.0, 15.0, 40.0]),
+        }
+        stat = rng.choice(SOLVABLE_STATS)
+        scenarios = ("crit", "crit_weak") if stat == "CRIT_DMG" else tuple(SCENARIO_INDEX)
+        cases.append((config, stat, rng.randint(5000, 100000), rng.randint(1, 5), rng.choice(scenarios)))
+    return cases
+
+
+def linear_scan(config: dict[str, float], stat: str, hp: int, hits: int, scenario: str) -> int | None:
+    """วิธีตรงๆ: เพิ่มทีละ 1 จากค่าปัจจุบันจนกว่าจะฆ่าได้ (ใช้เทียบเวลาเท่านั้น)"""
+    index = SCENARIO_INDEX[scenario]
+    trial = dict(config)
+    value = int(config[stat])
+    while value <= 100_000:
+        trial[stat] = value
+        if calculate_scenarios(trial, ATK_BASE)[1][index] * hits >= hp:
+            return value
+        value += 1
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000, help="จำนวนโจทย์")
+    parser.add_argument("--scan-rows", type=int, default=50, help="จำนวนโจทย์ที่ใช้วัด linear scan")
+    args = parser.parse_args()
+
+    cases = make_cases(args.rows)
+
+    start = time.perf_counter()
+    for case in cases:
+        min_stat_to_kill(case[0], ATK_BASE, *case[1:])
+    t_solver = time.perf_counter() - start
+
+    scan_cases = cases[:args.scan_rows]
+    with use_backend(BACKEND_FLOAT):
+        start = time.perf_counter()
+        for case in scan_cases:
+            linear_scan(*case)
+        t_scan = time.perf_counter() - start
+
+    solver_us = t_solver / args.rows * 1e6
+    scan_us = t_scan / max(len(scan_cases), 1) * 1e6
+    print("=" * 60)
+    print("  Benchmark: kill_solver.min_stat_to_kill")
+    print("=" * 60)
+    print(f"  Solver:      {args.rows:>8,} solves  {solver_us:10.1f} us/solve")
+    print(f"  Linear scan: {len(scan_cases):>8,} solves  {scan_us:10.1f} us/solve (float backend)")
+    print(f"  Speedup: x{scan_us / solver_us:,.0f}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
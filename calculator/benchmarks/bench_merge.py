@@ -0,0 +1,73 @@
+"""
+Benchmark: merge_configs เทียบกับ MergePlan ที่คอมไพล์ล่วงหน้า (ค่าปริยาย 100k merge)
+- merge_configs        : เรียกทีละชุด (จัดกลุ่ม key + float(ค่าตัวละคร) ทุกครั้ง)
+- MergePlan.apply      : compile_merge ครั้งเดียว แล้ว apply ทีละชุด
+- merge_configs_many   : bulk (รวมเวลา compile)
+ตรวจว่าผลทุกชุดตรงกันก่อนแสดงเวลา
+
+การใช้งาน:
+    python calculator/benchmarks/bench_merge.py [--merges 100000] [--character sun_wukong] [--skill skill1]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config_loader import compile_merge, load_character_full, load_user_config, merge_configs, merge_configs_many
+from pipeline import resolve_skill
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--merges", type=int, default=100_000)
+    parser.add_argument("--character", default="sun_wukong")
+    parser.add_argument("--skill", default=None)
+    parser.add_argument("--repeat", type=int, default=3, help="รอบต่อวิธี (แสดงรอบที่เร็วที่สุด)")
+    args = parser.parse_args()
+
+    meta, char_config = load_character_full(args.character)
+    if not meta:
+        print(f"ไม่พบตัวละคร '{args.character}'")
+        return 1
+    skill_config, _, _ = resolve_skill(meta, args.skill)
+    combined = {**char_config, **skill_config}
+
+    rng = random.Random(7)
+    base = load_user_config()
+    users = [{**base, "ATK_CHAR": round(rng.uniform(3000, 4500), 1),
+              "CRIT_DMG": round(rng.uniform(150, 300), 1)} for _ in range(args.merges)]
+
+    plan = compile_merge(combined)
+    if merge_configs_many(combined, users) != [merge_configs(combined, u) for u in users]:
+        print("❌ ผลของ MergePlan ไม่ตรงกับ merge_configs")
+        return 1
+
+    cases = [
+        ("merge_configs", lambda: [merge_configs(combined, u) for u in users]),
+        ("MergePlan.apply", lambda: [plan.apply(u) for u in users]),
+        ("merge_configs_many", lambda: merge_configs_many(combined, users)),
+    ]
+    print("=" * 60)
+    print(f"  Benchmark: {args.merges:,} merges ({args.character}, {len(combined)} char keys)")
+    print("=" * 60)
+    baseline = None
+    for name, fn in cases:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        per_merge = best / args.merges * 1e6
+        print(f"  {name:<20} {best * 1e3:9.1f} ms  {per_merge:6.2f} us/merge  ({baseline / best:.2f}x)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
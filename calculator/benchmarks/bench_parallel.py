@@ -0,0 +1,63 @@
+"""
+Benchmark: parallel.evaluate_builds - throughput และ speedup ตามจำนวน worker
+
+การใช้งาน:
+    python calculator/benchmarks/bench_parallel.py [--builds 20000] [--workers 1 2 4 8 16] [--chunk-size N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from character_db import get_character_db
+from parallel import default_workers, evaluate_builds
+
+BENCH_USER_CONFIG = {
+    "Weapon_Set": 4, "Formation": 0.0, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0,
+    "DMG_AMP_BUFF": 10.0, "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0, "DEF_BUFF": 0.0,
+}
+
+
+def make_builds(count: int) -> list[dict]:
+    """build ของทุกตัวละคร x (ไม่มี preset / ทุก monster preset) สลับกันไป"""
+    db = get_character_db()
+    names = db.names()
+    presets = [None, *db.monster_names()]
+    return [
+        {"character": names[i % len(names)], "preset": presets[i % len(presets)],
+         "config": {**BENCH_USER_CONFIG, "ATK_CHAR": 3000.0 + i % 2000}}
+        for i in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--builds", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, 16, default_workers()}))
+    parser.add_argument("--chunk-size", type=int, default=None, help="build ต่อ task (ปริยาย: เลือกอัตโนมัติ)")
+    args = parser.parse_args()
+
+    builds = make_builds(args.builds)
+    print("=" * 60)
+    print(f"  Benchmark: evaluate_builds ({args.builds:,} builds, {default_workers()} CPU)")
+    print("=" * 60)
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        evaluate_builds(builds, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"  workers={workers:<3} {elapsed:8.2f} s  {args.builds / elapsed:>10,.0f} builds/s"
+              f"  x{baseline / elapsed:.2f}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Benchmark: roster kill matrix (ทุกตัวละคร x สกิล x ชุดเซ็ท x preset)
+เทียบรอบแรก (parse SkillSpec ใหม่) กับรอบที่ใช้ cache ของ process (เช่น หลังแก้ config.json)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_roster.py [--repeat 20] [--workers 1]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import memo
+from config_loader import load_user_config
+from roster import clear_skill_cache, roster_matrices
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    user = load_user_config()
+    matrices = roster_matrices(user)
+    cells = sum(len(m.cells) for m in matrices)
+
+    print("=" * 60)
+    print(f"  Benchmark: roster kill matrix ({len(matrices)} matrices, {cells} cells, workers={args.workers})")
+    print("=" * 60)
+    with memo.memoization(False):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            clear_skill_cache()
+            roster_matrices(user, workers=args.workers)
+        cold_ms = (time.perf_counter() - start) / args.repeat * 1e3
+
+        start = time.perf_counter()
+        for i in range(args.repeat):
+            # config เปลี่ยนทุกรอบ: ใช้ได้แค่ cache ของ SkillSpec
+            roster_matrices({**user, "ATK_CHAR": float(user.get("ATK_CHAR", 0)) + i}, workers=args.workers)
+        warm_ms = (time.perf_counter() - start) / args.repeat * 1e3
+    print(f"  cold (parse skills)   {cold_ms:8.2f} ms/roster")
+    print(f"  warm (cached skills)  {warm_ms:8.2f} ms/roster  ({cold_ms / warm_ms:.1f}x)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
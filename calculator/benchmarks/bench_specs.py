@@ -0,0 +1,94 @@
+"""
+Benchmark: slotted records (specs.py) เทียบกับ config dict
+- หน่วยความจำของ build N ชุด (tracemalloc): dict ที่ merge แล้ว vs user dict vs Build
+- ความเร็วต่อ build: compute_damage (dict) vs specs.evaluate
+
+การใช้งาน:
+    python calculator/benchmarks/bench_specs.py [--builds 100000] [--character miho]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from character_db import get_character_db
+from pipeline import compute_damage, prepare_config, resolve_skill
+from specs import Build, SkillSpec, TargetSpec, evaluate
+
+BENCH_USER_CONFIG = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+
+def _users(count: int) -> list[dict]:
+    rng = random.Random(7)
+    return [{**BENCH_USER_CONFIG,
+             "ATK_CHAR": round(rng.uniform(3000, 4500), 1),
+             "CRIT_DMG": round(rng.uniform(150, 300), 1),
+             "DMG_AMP_BUFF": round(rng.uniform(0, 40), 1)} for _ in range(count)]
+
+
+def _footprint(make) -> tuple[float, object]:
+    tracemalloc.start()
+    objects = make()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, objects
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--builds", type=int, default=100_000)
+    parser.add_argument("--character", default="miho")
+    parser.add_argument("--skill", default=None)
+    args = parser.parse_args()
+
+    users = _users(args.builds)
+    entry = get_character_db().get(args.character)
+    skill_config, _, _ = resolve_skill(entry.meta, args.skill)
+
+    print("=" * 60)
+    print(f"  Benchmark: specs ({args.builds:,} builds, {args.character})")
+    print("=" * 60)
+    rows = [
+        ("merged dict", lambda: [prepare_config(dict(entry.config), skill_config, u)[1] for u in users]),
+        ("user dict", lambda: [dict(u) for u in users]),
+        ("Build", lambda: [Build.from_config(u) for u in users]),
+    ]
+    builds: list[Build] = []
+    for name, make in rows:
+        size, objects = _footprint(make)
+        print(f"  {name:<12} {size / 1024 / 1024:8.1f} MiB  ({size / args.builds:6.0f} B/build)")
+        if name == "Build":
+            builds = objects
+        del objects
+
+    skill = SkillSpec.load(args.character, args.skill)
+    target = TargetSpec.from_config(BENCH_USER_CONFIG)
+    sample = users[:min(len(users), 2000)]
+    start = time.perf_counter()
+    for u in sample:
+        compute_damage(args.character, args.skill, u)
+    pipeline_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+    start = time.perf_counter()
+    for build in builds:
+        evaluate(build, skill, target)
+    specs_us = (time.perf_counter() - start) / len(builds) * 1e6
+    print("-" * 60)
+    print(f"  compute_damage {pipeline_us:8.2f} us/build")
+    print(f"  evaluate       {specs_us:8.2f} us/build  ({pipeline_us / specs_us:.1f}x)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
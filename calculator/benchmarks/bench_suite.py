@@ -0,0 +1,333 @@
+"""
+Benchmark Suite: throughput ของทุกขั้นใน damage pipeline + ผลแบบ JSON สำหรับตรวจ regression
+
+ชุดที่วัด (ชื่อ case):
+- damage_calc.<ฟังก์ชัน>        ทุกสูตรใน damage_calc.py
+- memo.<ฟังก์ชัน>[.miss]        cache hit / miss ของ memo.py (hit ต้องเร็วกว่า miss)
+- logic.<ตัวละคร>               handler ใน character_registry (kwargs จริงที่ pipeline ส่งให้)
+- config_loader.<ฟังก์ชัน>      merge_configs / load_character_full
+- pipeline.<ตัวละคร>.<preset>   compute_damage แบบ headless ต่อตัวละคร x monster preset
+- import.<module>               เวลา import entry point ใน interpreter ใหม่ (ต้องไม่เกิน IMPORT_BUDGETS_MS)
+
+การใช้งาน:
+    python calculator/benchmarks/bench_suite.py --json bench.json
+    python calculator/benchmarks/bench_suite.py --baseline bench.json [--threshold 0.15]
+    python calculator/benchmarks/bench_suite.py --filter damage_calc --min-time 0.05
+
+Return code: 0 = ผ่าน, 1 = มี case ที่ ops/s ต่ำกว่า baseline * (1 - threshold), import เกิน budget
+             หรือ cache hit ของ memo ไม่เร็วกว่า miss
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import damage_calc
+import memo
+from character_db import get_character_db
+from character_registry import get_character_handler, register_character
+from config_loader import load_character_full, merge_configs
+from pipeline import compute_damage
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.15
+
+CALCULATOR_DIR = Path(__file__).parent.parent
+
+# เวลา import สูงสุด (ms, ไม่รวมเวลาเริ่ม interpreter) ของ entry point ที่สคริปต์ spawn บ่อย
+IMPORT_BUDGETS_MS: dict[str, float] = {
+    "main": 60.0,       # ถึงหน้าเมนู: module ของแต่ละโหมดถูก import หลังเลือกโหมด
+    "pipeline": 80.0,
+    "batch_cli": 100.0,
+}
+
+# จำนวนรอบขั้นต่ำของการวัด import (ใช้ค่าที่ดีที่สุด)
+IMPORT_REPEAT = 5
+
+# ค่าเดียวกับ config.json ตัวอย่าง (คงที่ เพื่อให้ผลเทียบกันได้ข้ามเครื่อง/commit)
+BENCH_USER_CONFIG: dict[str, Any] = {
+    "Weapon_Set": 4, "Formation": 0.0, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0,
+    "DMG_AMP_BUFF": 10.0, "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "Target_HP_Percent": 0.0,
+    "DMG_Reduction": 10.0, "DEF_BUFF": 0.0,
+}
+
+Case = tuple[str, Callable[[], Any]]
+
+
+def damage_calc_cases() -> list[Case]:
+    d = Decimal
+    return [
+        ("damage_calc.to_decimal", lambda: damage_calc.to_decimal(3773.5)),
+        ("damage_calc.calculate_total_atk", lambda: damage_calc.calculate_total_atk(
+            d("3773"), d("564"), d("1500"), d("0"), d("51"), d("0"), d("21"))),
+        ("damage_calc.calculate_dmg_hp", lambda: damage_calc.calculate_dmg_hp(d("18205"), d("12"))),
+        ("damage_calc.calculate_cap_atk", lambda: damage_calc.calculate_cap_atk(d("7000.5"), d("150"))),
+        ("damage_calc.calculate_final_dmg_hp", lambda: damage_calc.calculate_final_dmg_hp(d("2184.6"), d("10500.75"))),
+        ("damage_calc.calculate_raw_dmg", lambda: damage_calc.calculate_raw_dmg(
+            d("7000.5"), d("240"), d("186"), d("30"), d("40"), d("0"), d("10"), d("2184"))),
+        ("damage_calc.calculate_effective_def", lambda: damage_calc.calculate_effective_def(
+            d("1461"), d("0"), d("0"), d("15"))),
+        ("damage_calc.calculate_final_dmg", lambda: damage_calc.calculate_final_dmg(d("51234.567"), d("2.0957"))),
+    ]
+
+
+def _uncached(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """เรียก fn โดยปิด cache (= ต้นทุน miss: แปลงค่าใน config + สูตร)"""
+    def call() -> Any:
+        memo.set_enabled(False)
+        try:
+            return fn()
+        finally:
+            memo.set_enabled(True)
+    return call
+
+
+def memo_cases() -> list[Case]:
+    """cache hit / miss ของ memo.py ด้วย config ที่ merge แล้วของ BENCH_USER_CONFIG"""
+    config = merge_configs({}, BENCH_USER_CONFIG)
+    atk_base = Decimal("1500")
+    cases = [
+        ("memo.total_atk", lambda: memo.total_atk(config, atk_base)),
+        ("memo.effective_def", lambda: memo.effective_def(config)),
+    ]
+    return cases + [(f"{name}.miss", _uncached(fn)) for name, fn in cases]
+
+
+def slow_memo_hits(results: dict[str, float]) -> list[tuple[str, float, float]]:
+    """case ของ memo ที่ hit ไม่เร็วกว่า miss → [(ชื่อ, ops/s ของ miss, ops/s ของ hit)]"""
+    return [
+        (name, results[f"{name}.miss"], ops)
+        for name, ops in results.items()
+        if name.startswith("memo.") and f"{name}.miss" in results and ops <= results[f"{name}.miss"]
+    ]
+
+
+def _capture_handler_kwargs(character: str, presets: list[str | None]) -> dict[str, Any] | None:
+    """
+    kwargs ที่ pipeline ส่งให้ handler ของตัวละคร (ลองทีละ preset จนกว่า handler จะคืนผล)
+    ถ้าไม่มี preset ไหนเข้าเงื่อนไข ใช้ kwargs ล่าสุด (วัดเส้นทางที่ handler คืน None)
+    """
+    original = get_character_handler(character)
+    if original is None:
+        return None
+    captured: dict[str, Any] = {}
+
+    def recorder(**kwargs: Any) -> Any:
+        result = original(**kwargs)
+        if not captured.get("_hit"):
+            captured.clear()
+            captured.update(kwargs)
+            captured["_hit"] = result is not None
+        return result
+
+    register_character(character)(recorder)
+    try:
+        for preset in presets:
+            compute_damage(character, None, BENCH_USER_CONFIG, preset)
+            if captured.get("_hit"):
+                break
+    finally:
+        register_character(character)(original)
+    captured.pop("_hit", None)
+    return captured or None
+
+
+def logic_cases(characters: list[str], presets: list[str | None]) -> list[Case]:
+    cases = []
+    for character in characters:
+        handler = get_character_handler(character)
+        kwargs = _capture_handler_kwargs(character, presets)
+        if handler is None or kwargs is None:
+            continue
+        cases.append((f"logic.{character}", lambda h=handler, kw=kwargs: h(**kw)))
+    return cases
+
+
+def config_cases(characters: list[str]) -> list[Case]:
+    meta, char_config = load_character_full(characters[0])
+    skill_config = next(iter(meta.get("_skills", {}).values()), {})
+    combined = {**char_config, **skill_config}
+    return [
+        ("config_loader.merge_configs", lambda: merge_configs(combined, BENCH_USER_CONFIG)),
+        ("config_loader.load_character_full", lambda: load_character_full(characters[0])),
+    ]
+
+
+def pipeline_cases(characters: list[str], presets: list[str | None]) -> list[Case]:
+    return [
+        (f"pipeline.{character}.{(preset or 'none').removesuffix('.json')}",
+         lambda c=character, p=preset: compute_damage(c, None, BENCH_USER_CONFIG, p))
+        for character in characters
+        for preset in presets
+    ]
+
+
+def build_cases() -> list[Case]:
+    db = get_character_db()
+    characters = list(db.names())
+    presets: list[str | None] = [None, *db.monster_names()]
+    return (
+        damage_calc_cases()
+        + memo_cases()
+        + logic_cases(characters, presets)
+        + config_cases(characters)
+        + pipeline_cases(characters, presets)
+    )
+
+
+def measure_import(module: str, repeat: int = IMPORT_REPEAT) -> float:
+    """วินาทีที่ใช้ import module ใน interpreter ใหม่ (ค่าที่ดีที่สุดจาก repeat รอบ)"""
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    best = float("inf")
+    for _ in range(repeat):
+        done = subprocess.run([sys.executable, "-c", code], cwd=CALCULATOR_DIR,
+                              capture_output=True, text=True, check=True)
+        best = min(best, float(done.stdout))
+    return best
+
+
+def over_budget(import_ms: dict[str, float], budgets: dict[str, float]) -> list[tuple[str, float, float]]:
+    """module ที่ import นานเกิน budget → [(module, budget ms, วัดได้ ms)]"""
+    return [(module, budgets[module], ms) for module, ms in import_ms.items() if ms > budgets[module]]
+
+
+def measure(fn: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """ops/s ที่ดีที่สุดจาก repeat รอบ (แต่ละรอบนานอย่างน้อย min_time วินาที)"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+    best = number / elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = max(best, number / (time.perf_counter() - start))
+    return best
+
+
+def to_document(results: dict[str, float], min_time: float, repeat: int) -> dict[str, Any]:
+    """ผลลัพธ์ + ข้อมูลเครื่อง (schema ที่ --json เขียน และ --baseline อ่าน)"""
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "min_time": min_time,
+        "repeat": repeat,
+        "results": {
+            name: {"ops_per_sec": round(ops, 3), "us_per_op": round(1e6 / ops, 4)}
+            for name, ops in results.items()
+        },
+    }
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """ops/s ต่อ case จากไฟล์ที่ --json เขียนไว้"""
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{path}: schema {document.get('schema')} ไม่รองรับ (ต้องเป็น {SCHEMA_VERSION})")
+    return {name: entry["ops_per_sec"] for name, entry in document["results"].items()}
+
+
+def find_regressions(
+    current: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[tuple[str, float, float]]:
+    """case ที่ ops/s < baseline * (1 - threshold) → [(ชื่อ, baseline, current)]"""
+    return [
+        (name, baseline[name], ops)
+        for name, ops in current.items()
+        if name in baseline and ops < baseline[name] * (1.0 - threshold)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", type=Path, help="เขียนผลลัพธ์เป็น JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON จากรอบก่อน สำหรับตรวจ regression")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="ยอมให้ช้าลงได้กี่สัดส่วน (0.15 = 15%%)")
+    parser.add_argument("--filter", default="", help="วัดเฉพาะ case ที่ชื่อมีข้อความนี้")
+    parser.add_argument("--min-time", type=float, default=0.2, help="เวลาขั้นต่ำต่อรอบ (วินาที)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    cases = [(name, fn) for name, fn in build_cases() if args.filter in name]
+
+    print("=" * 60)
+    print(f"  Benchmark Suite ({len(cases)} cases)")
+    print("=" * 60)
+    results = {}
+    for name, fn in cases:
+        ops = results[name] = measure(fn, args.min_time, args.repeat)
+        line = f"  {name:<40} {ops:>14,.0f} ops/s"
+        if name in baseline:
+            line += f"  {ops / baseline[name] - 1:+7.1%}"
+        print(line)
+    import_ms = {}
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        name = f"import.{module}"
+        if args.filter not in name:
+            continue
+        seconds = measure_import(module, max(args.repeat, IMPORT_REPEAT))
+        results[name] = 1.0 / seconds
+        import_ms[module] = seconds * 1e3
+        line = f"  {name:<40} {seconds * 1e3:>11.1f} ms    (budget {budget:.0f} ms)"
+        if name in baseline:
+            line += f"  {results[name] / baseline[name] - 1:+7.1%}"
+        print(line)
+    print("=" * 60)
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(to_document(results, args.min_time, args.repeat), indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        print(f"  บันทึกผลที่ {args.json}")
+
+    slow_imports = over_budget(import_ms, IMPORT_BUDGETS_MS)
+    for module, budget, ms in slow_imports:
+        print(f"  ❌ import {module}: {ms:.1f} ms เกิน budget {budget:.0f} ms")
+    slow_hits = slow_memo_hits(results)
+    for name, miss, hit in slow_hits:
+        print(f"  ❌ {name}: cache hit {hit:,.0f} ops/s ไม่เร็วกว่า miss {miss:,.0f} ops/s")
+    failed = bool(slow_imports or slow_hits)
+
+    if not baseline:
+        return 1 if failed else 0
+    missing = sorted(set(baseline) - set(results)) if not args.filter else []
+    for name in missing:
+        print(f"  ⚠️ ไม่มี case นี้ในรอบนี้: {name}")
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(f"  ❌ {name}: {before:,.0f} → {after:,.0f} ops/s ({after / before - 1:+.1%})")
+    if regressions:
+        print(f"  Regression: {len(regressions)} case ช้าลงเกิน {args.threshold:.0%}")
+        return 1
+    print(f"  ไม่มี regression (threshold {args.threshold:.0%})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark: sweep.py บน grid ATK_CHAR x DEF_Target (ค่าปริยาย 1000 x 1000 = 1M แถว)
+แยกเวลา plan (prepare_config ต่อค่า axis) / คำนวณ (batch path) / เขียน CSV / เขียน npz
+
+การใช้งาน:
+    python calculator/benchmarks/bench_sweep.py [--size 1000] [--character espada]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch_calc import numpy_available
+from sweep import iter_sweep, parse_axis, plan_sweep, write_sweep
+
+BENCH_USER_CONFIG = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help="จำนวนค่าต่อ axis")
+    parser.add_argument("--character", default="espada")
+    args = parser.parse_args()
+
+    if not numpy_available():
+        print("ต้องติดตั้ง NumPy ก่อน: pip install numpy")
+        return 1
+
+    axes = [parse_axis(f"ATK_CHAR=3000:{3000 + args.size - 1}:1"),
+            parse_axis(f"DEF_Target=0:{args.size - 1}:1")]
+
+    print("=" * 60)
+    print(f"  Benchmark: sweep {args.character} {args.size} x {args.size}")
+    print("=" * 60)
+    start = time.perf_counter()
+    plan = plan_sweep(args.character, axes, None, BENCH_USER_CONFIG)
+    print(f"  plan         {(time.perf_counter() - start) * 1e3:10.2f} ms")
+
+    start = time.perf_counter()
+    rows = sum(len(chunk["crit"]) for chunk in iter_sweep(plan))
+    elapsed = time.perf_counter() - start
+    print(f"  compute      {elapsed * 1e3:10.2f} ms  ({rows / elapsed:,.0f} rows/s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in (".csv", ".npz"):
+            path = Path(tmp) / f"sweep{suffix}"
+            start = time.perf_counter()
+            write_sweep(plan, path)
+            elapsed = time.perf_counter() - start
+            size = path.stat().st_size / 1024 / 1024
+            print(f"  write {suffix:<6} {elapsed * 1e3:10.2f} ms  ({size:.1f} MiB)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Character DB - โหลดตัวละคร + monster preset ทั้งหมดครั้งเดียว เก็บเป็น index ในหน่วยความจำ
+
+- ข้อมูลทุกชิ้นเป็น read-only (MappingProxyType / tuple) แชร์ระหว่างการคำนวณได้อย่างปลอดภัย
+- ค้นหาตามชื่อ / element / class / rarity ได้ใน O(1)
+- ตรวจ mtime ของไฟล์ JSON ทุก check_interval วินาที ถ้ามีไฟล์เพิ่ม/ลบ/แก้ → โหลดใหม่ทั้งชุด
+  (ระหว่างนั้นไม่แตะ filesystem เลย เหมาะกับ process ที่รันนาน)
+
+config_loader.list_characters / load_character_full / load_monster_preset ใช้ DB นี้
+และคืน dict ที่ copy ออกมา (แก้ได้โดยไม่กระทบ DB)
+
+การใช้งาน:
+    from character_db import get_character_db
+    db = get_character_db()
+    miho = db.get("miho")
+    dark_legends = db.find(element="Dark", rarity="legend")
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+CHARACTERS_DIR = Path(__file__).parent / "characters"
+MONSTER_SUBDIR = "monster"
+
+# ตรวจ mtime ไม่บ่อยกว่านี้ (วินาที)
+DEFAULT_CHECK_INTERVAL = 1.0
+
+
+# ชนิดที่ freeze() สร้าง (thaw() ต้องแปลงกลับ)
+_CONTAINERS = (MappingProxyType, tuple)
+
+
+def freeze(value: Any) -> Any:
+    """แปลง dict → MappingProxyType, list → tuple (ทุกชั้น)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """แปลงกลับเป็น dict / list ที่แก้ไขได้ (ทุกชั้น) - ใช้ตอนส่งข้อมูลออกจาก DB"""
+    kind = type(value)
+    if kind is MappingProxyType:
+        return {k: v if type(v) not in _CONTAINERS else thaw(v) for k, v in value.items()}
+    if kind is tuple:
+        return [v if type(v) not in _CONTAINERS else thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class CharacterEntry:
+    """ตัวละครหนึ่งตัว (meta = key ที่ขึ้นต้นด้วย _, config = ค่าสำหรับคำนวณ)"""
+    name: str
+    meta: Mapping[str, Any]
+    config: Mapping[str, Any]
+
+    @property
+    def element(self) -> str:
+        return self.meta.get("_element", "")
+
+    @property
+    def rarity(self) -> str:
+        return self.meta.get("_rarity", "legend")
+
+    @property
+    def char_class(self) -> str:
+        return self.meta.get("_class", "magic")
+
+
+@dataclass(frozen=True, slots=True)
+class MonsterEntry:
+    """monster preset หนึ่งไฟล์ (preset = ค่าที่ไม่ใช่ null และไม่ขึ้นต้นด้วย _)"""
+    name: str
+    meta: Mapping[str, Any]
+    preset: Mapping[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """ข้อมูลทั้งชุดจากการโหลดหนึ่งครั้ง (สลับทั้งก้อนตอนโหลดใหม่)"""
+    signature: tuple[tuple[str, int, int], ...]
+    characters: Mapping[str, CharacterEntry]
+    monsters: Mapping[str, MonsterEntry]
+    by_element: Mapping[str, tuple[str, ...]]
+    by_class: Mapping[str, tuple[str, ...]]
+    by_rarity: Mapping[str, tuple[str, ...]]
+
+
+def parse_character(name: str, data: Mapping[str, Any]) -> CharacterEntry:
+    """แยก metadata และ config (ตัด comment "//" ออก) แบบเดียวกับ load_character_full เดิม"""
+    meta = {k: v for k, v in data.items() if k.startswith("_")}
+    config = {k: v for k, v in data.items() if not k.startswith("//") and not k.startswith("_")}
+    return CharacterEntry(name, freeze(meta), freeze(config))
+
+
+def parse_monster(name: str, data: Mapping[str, Any]) -> MonsterEntry:
+    """แยก metadata และ preset แบบเดียวกับ load_monster_preset เดิม"""
+    meta = {k: v for k, v in data.items() if k.startswith("_")}
+    preset = {k: v for k, v in data.items() if v is not None and not k.startswith("_")}
+    return MonsterEntry(name, freeze(meta), freeze(preset))
+
+
+def _json_files(directory: Path) -> list[os.DirEntry]:
+    """ไฟล์ .json ในโฟลเดอร์ (ลำดับเดียวกับ Path.glob)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [e for e in entries if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _signature(root: Path) -> tuple[tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) ของทุกไฟล์ JSON - เปลี่ยนเมื่อมีไฟล์เพิ่ม/ลบ/แก้"""
+    files = _json_files(root) + _json_files(root / MONSTER_SUBDIR)
+    return tuple((e.path, (st := e.stat()).st_mtime_ns, st.st_size) for e in files)
+
+
+def _index(characters: Mapping[str, CharacterEntry], attr: str) -> Mapping[str, tuple[str, ...]]:
+    """สร้าง index ค่า (ตัวพิมพ์เล็ก) → ชื่อตัวละคร"""
+    index: dict[str, list[str]] = {}
+    for name, entry in characters.items():
+        index.setdefault(getattr(entry, attr).lower(), []).append(name)
+    return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+
+def _snapshot(
+    signature: tuple[tuple[str, int, int], ...],
+    characters_raw: Mapping[str, Mapping[str, Any]],
+    monsters_raw: Mapping[str, Mapping[str, Any]],
+) -> _Snapshot:
+    """สร้าง snapshot จากข้อมูล JSON ดิบ (ชื่อไฟล์ไม่มี .json → dict)"""
+    characters = {name: parse_character(name, data) for name, data in characters_raw.items()}
+    monsters = {name: parse_monster(name, data) for name, data in monsters_raw.items()}
+    return _Snapshot(
+        signature=signature,
+        characters=MappingProxyType(characters),
+        monsters=MappingProxyType(monsters),
+        by_element=_index(characters, "element"),
+        by_class=_index(characters, "char_class"),
+        by_rarity=_index(characters, "rarity"),
+    )
+
+
+def _read_all(directory: Path) -> dict[str, Any]:
+    raw = {}
+    for entry in _json_files(directory):
+        with open(entry.path, "r", encoding="utf-8") as f:
+            raw[entry.name[:-5]] = json.load(f)
+    return raw
+
+
+def _load(root: Path, signature: tuple[tuple[str, int, int], ...]) -> _Snapshot:
+    """อ่าน JSON ทั้งหมดแล้วสร้าง snapshot ใหม่"""
+    return _snapshot(signature, _read_all(root), _read_all(root / MONSTER_SUBDIR))
+
+
+@dataclass
+class CharacterDB:
+    """
+    Index ของตัวละครและ monster preset ใน root (ค่าเริ่มต้น: characters/)
+    check_interval: วินาทีระหว่างการตรวจ mtime (0 = ตรวจทุกครั้ง, None = ไม่ตรวจ ใช้ refresh() เอง)
+    """
+    root: Path = CHARACTERS_DIR
+    check_interval: float | None = DEFAULT_CHECK_INTERVAL
+    _snapshot: _Snapshot | None = field(default=None, init=False, repr=False)
+    _checked_at: float = field(default=0.0, init=False, repr=False)
+
+    def refresh(self, force: bool = False) -> bool:
+        """ตรวจ mtime แล้วโหลดใหม่ถ้าไฟล์เปลี่ยน Returns True ถ้าโหลดใหม่"""
+        self._checked_at = time.monotonic()
+        signature = _signature(self.root)
+        if not force and self._snapshot is not None and self._snapshot.signature == signature:
+            return False
+        self._snapshot = _load(self.root, signature)
+        return True
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.refresh()
+        elif self.check_interval is not None and time.monotonic() - self._checked_at >= self.check_interval:
+            self.refresh()
+        return self._snapshot
+
+    # --- ตัวละคร ---
+
+    def names(self) -> tuple[str, ...]:
+        """ชื่อตัวละครทั้งหมด (ลำดับเดียวกับ list_characters เดิม)"""
+        return tuple(self._current().characters)
+
+    def get(self, name: str) -> CharacterEntry:
+        """ตัวละครตามชื่อไฟล์ (raise KeyError ถ้าไม่พบ)"""
+        return self._current().characters[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._current().characters
+
+    def __iter__(self) -> Iterator[CharacterEntry]:
+        return iter(self._current().characters.values())
+
+    def __len__(self) -> int:
+        return len(self._current().characters)
+
+    def find(
+        self,
+        element: str | None = None,
+        char_class: str | None = None,
+        rarity: str | None = None,
+    ) -> tuple[CharacterEntry, ...]:
+        """ตัวละครที่ตรงทุกเงื่อนไขที่ระบุ (ไม่สนตัวพิมพ์เล็ก/ใหญ่)"""
+        snapshot = self._current()
+        matches: set[str] | None = None
+        for index, value in (
+            (snapshot.by_element, element),
+            (snapshot.by_class, char_class),
+            (snapshot.by_rarity, rarity),
+        ):
+            if value is None:
+                continue
+            names = set(index.get(value.lower(), ()))
+            matches = names if matches is None else matches & names
+        if matches is None:
+            return tuple(snapshot.characters.values())
+        return tuple(entry for name, entry in snapshot.characters.items() if name in matches)
+
+    # --- monster preset ---
+
+    def monster_names(self) -> tuple[str, ...]:
+        """ชื่อ monster preset ทั้งหมด (ไม่มี .json)"""
+        return tuple(self._current().monsters)
+
+    def monster(self, name: str) -> MonsterEntry:
+        """monster preset ตามชื่อ (รับได้ทั้ง "castle_room1" และ "castle_room1.json")"""
+        return self._current().monsters[name.removesuffix(".json")]
+
+    # --- ส่งข้ามขอบเขต process ---
+
+    def dump(self) -> dict[str, Any]:
+        """ข้อมูลทั้งชุดเป็น dict/list ธรรมดา (pickle ได้) สำหรับ from_dump ใน process อื่น"""
+        snapshot = self._current()
+        return {
+            "root": str(self.root),
+            "signature": snapshot.signature,
+            "characters": {n: {**thaw(e.meta), **thaw(e.config)} for n, e in snapshot.characters.items()},
+            "monsters": {n: {**thaw(m.meta), **thaw(m.preset)} for n, m in snapshot.monsters.items()},
+        }
+
+    @classmethod
+    def from_dump(cls, data: Mapping[str, Any]) -> "CharacterDB":
+        """DB จากผลของ dump() โดยไม่อ่านไฟล์ (ไม่ตรวจ mtime จนกว่าจะเรียก refresh())"""
+        db = cls(root=Path(data["root"]), check_interval=None)
+        db._snapshot = _snapshot(tuple(map(tuple, data["signature"])), data["characters"], data["monsters"])
+        return db
+
+
+_default_db: CharacterDB | None = None
+
+
+def get_character_db() -> CharacterDB:
+    """DB ของโฟลเดอร์ characters/ (สร้างครั้งแรกที่เรียก)"""
+    global _default_db
+    if _default_db is None:
+        _default_db = CharacterDB()
+    return _default_db
+
+
+def set_character_db(db: CharacterDB | None) -> None:
+    """แทน DB ที่ get_character_db คืน (เช่น DB ที่ส่งมาให้ worker process, None = สร้างใหม่ครั้งหน้า)"""
+    global _default_db
+    _default_db = db
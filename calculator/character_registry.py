@@ -1,11 +1,27 @@
 """
 Character Registry - Registry pattern for character-specific logic
 แต่ละตัวละคร register logic ของตัวเองเพื่อลดการใช้ if/elif ใน main.py
+- handler: คำนวณอย่างเดียว (ไม่มี print) คืนผลลัพธ์ หรือ None ถ้าไม่เข้าเงื่อนไข
+- renderer: แสดงผลลัพธ์ของ handler (แยกออกมาเพื่อให้ข้ามได้ในโหมด headless)
 """
 
+import functools
+import importlib
 from decimal import Decimal
+from types import ModuleType
 from typing import Any, Callable, Protocol
 
+from config_loader import get_decimal
+from results import (
+    BiscuitResult,
+    CharacterResult,
+    EspadaResult,
+    FreyjaResult,
+    KlahanResult,
+    RyanResult,
+    SunWukongResult,
+)
+
 
 class CharacterHandler(Protocol):
     """Protocol สำหรับ character handler function"""
@@ -26,17 +42,23 @@ class CharacterHandler(Protocol):
         char_meta: dict[str, Any],
         skill_config: dict[str, Any],
         monster_preset: dict[str, Any] | None,
-    ) -> bool:
+    ) -> CharacterResult | None:
         """
         Handler function สำหรับตัวละคร
-        Returns True ถ้า handle แล้ว, False ถ้าไม่ใช่ตัวละครนี้
+        Returns ผลลัพธ์ถ้า handle แล้ว, None ถ้าไม่เข้าเงื่อนไข (ใช้ผล 4 กรณีปกติ)
         """
         ...
 
 
+# Renderer: แสดงผลลัพธ์ที่ handler คืนมา
+CharacterRenderer = Callable[[CharacterResult], None]
+
 # Registry เก็บ handler ของแต่ละตัวละคร
 _CHARACTER_HANDLERS: dict[str, CharacterHandler] = {}
 
+# Registry เก็บ renderer ของแต่ละตัวละคร
+_CHARACTER_RENDERERS: dict[str, CharacterRenderer] = {}
+
 
 def register_character(name: str) -> Callable[[CharacterHandler], CharacterHandler]:
     """
@@ -65,6 +87,34 @@ def list_registered_characters() -> list[str]:
     return list(_CHARACTER_HANDLERS.keys())
 
 
+def register_renderer(name: str) -> Callable[[CharacterRenderer], CharacterRenderer]:
+    """
+    Decorator สำหรับ register renderer ของผลลัพธ์ handler
+
+    การใช้งาน:
+    @register_renderer("freyja")
+    def render_freyja(result):
+        ...
+    """
+
+    def decorator(renderer: CharacterRenderer) -> CharacterRenderer:
+        _CHARACTER_RENDERERS[name.lower()] = renderer
+        return renderer
+
+    return decorator
+
+
+def get_character_renderer(name: str) -> CharacterRenderer | None:
+    """ดึง renderer ของตัวละครจาก registry"""
+    return _CHARACTER_RENDERERS.get(name.lower())
+
+
+@functools.cache
+def load_logic(name: str) -> ModuleType:
+    """logic/<name>.py - import ครั้งแรกที่ตัวละครนั้นถูกใช้แล้ว cache ไว้ (ไม่ต้อง import ทุกตัวตอนเริ่มโปรแกรม)"""
+    return importlib.import_module(f"logic.{name}")
+
+
 # ============================================
 # Character Handlers
 # ============================================
@@ -85,18 +135,15 @@ def handle_freyja(
     char_meta: dict[str, Any],
     skill_config: dict[str, Any],
     monster_preset: dict[str, Any] | None,
-) -> bool:
+) -> CharacterResult | None:
     """Handler สำหรับ Freyja - ใช้ HP Alteration logic"""
-    from decimal import Decimal as D
-    from logic.freyja import calculate_freyja_damage, print_freyja_results
-
-    hp_alteration = config.get("HP_Alteration", D("0"))
+    hp_alteration = config.get("HP_Alteration", Decimal("0"))
     is_both_skills = skill_config.get("_is_both_skills", False)
 
     if hp_alteration <= 0 or is_both_skills:
-        return False
+        return None
 
-    result = calculate_freyja_damage(
+    return load_logic("freyja").calculate_freyja_damage(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
         crit_dmg=crit_dmg,
@@ -110,9 +157,6 @@ def handle_freyja(
         hp_alteration=hp_alteration,
     )
 
-    print_freyja_results(result, hp_target)
-    return True
-
 
 @register_character("ryan")
 def handle_ryan(
@@ -130,20 +174,17 @@ def handle_ryan(
     char_meta: dict[str, Any],
     skill_config: dict[str, Any],
     monster_preset: dict[str, Any] | None,
-) -> bool:
+) -> CharacterResult | None:
     """Handler สำหรับ Ryan - ใช้ Lost HP Bonus logic"""
-    from decimal import Decimal as D
-    from logic.ryan import calculate_ryan_damage, print_ryan_results
-
-    lost_hp_bonus = config.get("Lost_HP_Bonus", D("0"))
-    weak_skill_dmg = config.get("WEAK_SKILL_DMG", D("0"))
-    target_hp_percent = config.get("Target_HP_Percent", D("100"))
+    lost_hp_bonus = config.get("Lost_HP_Bonus", Decimal("0"))
+    weak_skill_dmg = config.get("WEAK_SKILL_DMG", Decimal("0"))
+    target_hp_percent = config.get("Target_HP_Percent", Decimal("100"))
     is_both_skills = skill_config.get("_is_both_skills", False)
 
     if lost_hp_bonus <= 0 or is_both_skills:
-        return False
+        return None
 
-    result = calculate_ryan_damage(
+    return load_logic("ryan").calculate_ryan_damage(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
         weak_skill_dmg=weak_skill_dmg,
@@ -158,9 +199,6 @@ def handle_ryan(
         target_hp_percent=target_hp_percent,
     )
 
-    print_ryan_results(result)
-    return True
-
 
 @register_character("klahan")
 def handle_klahan(
@@ -178,17 +216,14 @@ def handle_klahan(
     char_meta: dict[str, Any],
     skill_config: dict[str, Any],
     monster_preset: dict[str, Any] | None,
-) -> bool:
+) -> CharacterResult | None:
     """Handler สำหรับ Klahan - ใช้ HP condition bonus logic"""
-    from decimal import Decimal as D
-    from logic.klahan import calculate_klahan_damage, print_klahan_results
-
-    hp_above_50_bonus = config.get("HP_Above_50_Bonus", D("0"))
-    hp_below_50_bonus = config.get("HP_Below_50_Bonus", D("0"))
+    hp_above_50_bonus = config.get("HP_Above_50_Bonus", Decimal("0"))
+    hp_below_50_bonus = config.get("HP_Below_50_Bonus", Decimal("0"))
     is_both_skills = skill_config.get("_is_both_skills", False)
 
     if (hp_above_50_bonus <= 0 and hp_below_50_bonus <= 0) or is_both_skills:
-        return False
+        return None
 
     # ดึงชื่อสกิล
     skill_name_display = skill_config.get("_name", "Skill")
@@ -201,7 +236,7 @@ def handle_klahan(
                 skill_name_display = val.get("_name", key)
                 break
 
-    result = calculate_klahan_damage(
+    return load_logic("klahan").calculate_klahan_damage(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
         hp_above_50_bonus=hp_above_50_bonus,
@@ -216,9 +251,6 @@ def handle_klahan(
         skill_name=skill_name_display,
     )
 
-    print_klahan_results(result)
-    return True
-
 
 @register_character("sun_wukong")
 def handle_sun_wukong(
@@ -236,15 +268,12 @@ def handle_sun_wukong(
     char_meta: dict[str, Any],
     skill_config: dict[str, Any],
     monster_preset: dict[str, Any] | None,
-) -> bool:
+) -> CharacterResult | None:
     """Handler สำหรับ Sun Wukong - ใช้ Castle Mode logic"""
-    from decimal import Decimal as D
-    from logic.sun_wukong import calculate_sun_wukong_castle_mode, print_castle_mode_results
-
     is_both_skills = skill_config.get("_is_both_skills", False)
 
     if not monster_preset or is_both_skills:
-        return False
+        return None
 
     # ดึงชื่อสกิล
     skill_name_display = skill_config.get("_name", "Skill")
@@ -255,7 +284,7 @@ def handle_sun_wukong(
                 skill_name_display = val.get("_name", key)
                 break
 
-    result = calculate_sun_wukong_castle_mode(
+    return load_logic("sun_wukong").calculate_sun_wukong_castle_mode(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
         crit_dmg=crit_dmg,
@@ -267,12 +296,9 @@ def handle_sun_wukong(
         skill_hits=skill_hits,
         hp_target=hp_target,
         skill_name=skill_name_display,
-        final_dmg_hp=config.get("Final_DMG_HP", D("0")),
+        final_dmg_hp=config.get("Final_DMG_HP", Decimal("0")),
     )
 
-    print_castle_mode_results(result)
-    return True
-
 
 @register_character("espada")
 def handle_espada(
@@ -290,20 +316,16 @@ def handle_espada(
     char_meta: dict[str, Any],
     skill_config: dict[str, Any],
     monster_preset: dict[str, Any] | None,
-) -> bool:
+) -> CharacterResult | None:
     """Handler สำหรับ Espada - ใช้ Bonus DMG HP Target logic"""
-    from decimal import Decimal as D
-    from logic.espada import calculate_espada_damage
-    from display import print_espada_results
-
-    bonus_dmg_hp_target = config.get("Bonus_DMG_HP_Target", D("0"))
-    cap_atk_percent = config.get("Cap_ATK_Percent", D("0"))
+    bonus_dmg_hp_target = config.get("Bonus_DMG_HP_Target", Decimal("0"))
+    cap_atk_percent = config.get("Cap_ATK_Percent", Decimal("0"))
     is_both_skills = skill_config.get("_is_both_skills", False)
 
     if bonus_dmg_hp_target <= 0 or is_both_skills:
-        return False
+        return None
 
-    result = calculate_espada_damage(
+    return load_logic("espada").calculate_espada_damage(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
         crit_dmg=crit_dmg,
@@ -313,13 +335,10 @@ def handle_espada(
         dmg_reduction=dmg_reduction,
         effective_def=eff_def,
         hp_target=hp_target,
-        bonus_dmg_hp_target=bonus_dmg_hp_target,
+        bonus_dmg_hp=bonus_dmg_hp_target,
         cap_atk_percent=cap_atk_percent,
     )
 
-    print_espada_results(result, weak_dmg, config.get("Final_DMG_HP", D("0")))
-    return True
-
 
 @register_character("biscuit")
 def handle_biscuit(
@@ -339,18 +358,16 @@ def handle_biscuit(
     monster_preset: dict[str, Any] | None,
     def_char: Decimal | None = None,
     def_pet: Decimal | None = None,
-) -> bool:
+) -> CharacterResult | None:
     """Handler สำหรับ Biscuit - ใช้ Dual Scaling ATK + DEF logic"""
-    from decimal import Decimal as D
-    from logic.biscuit import calculate_biscuit_damage, print_biscuit_results
-    from config_loader import get_decimal
-
     # Use provided values or fallback to config
     def_char = def_char if def_char is not None else get_decimal(config, "DEF_CHAR", "0")
     def_pet = def_pet if def_pet is not None else get_decimal(config, "DEF_PET", "0")
-    skill_dmg_from_def = config.get("SKILL_DMG_DEF", D("0"))
+    skill_dmg_from_def = config.get("SKILL_DMG_DEF", Decimal("0"))
+    # Castle Mode: HP มอนสำหรับเช็คว่าตายไหม
+    castle_hp = Decimal(monster_preset["HP_Target"]) if monster_preset and monster_preset.get("HP_Target") else None
 
-    result = calculate_biscuit_damage(
+    return load_logic("biscuit").calculate_biscuit_damage(
         total_atk=total_atk,
         skill_dmg_atk=skill_dmg,
         skill_dmg_def=skill_dmg_from_def,
@@ -363,19 +380,57 @@ def handle_biscuit(
         skill_hits=skill_hits,
         def_char=def_char,
         def_pet=def_pet,
-        final_dmg_hp=config.get("Final_DMG_HP", D("0")),
+        final_dmg_hp=config.get("Final_DMG_HP", Decimal("0")),
+        castle_hp=castle_hp,
     )
 
-    print_biscuit_results(result)
 
-    # Castle Mode Check
-    if monster_preset and monster_preset.get("HP_Target"):
-        hp_target_calc = D(monster_preset["HP_Target"])
-        dmg_normal = result["total_skill_dmg_normal"]
-        dmg_crit = result["total_skill_dmg_crit"]
+# ============================================
+# Character Renderers
+# ============================================
+
+@register_renderer("freyja")
+def render_freyja(result: FreyjaResult) -> None:
+    """แสดงผล Freyja"""
+    load_logic("freyja").print_freyja_results(result)
+
+
+@register_renderer("ryan")
+def render_ryan(result: RyanResult) -> None:
+    """แสดงผล Ryan"""
+    load_logic("ryan").print_ryan_results(result)
+
+
+@register_renderer("klahan")
+def render_klahan(result: KlahanResult) -> None:
+    """แสดงผล Klahan"""
+    load_logic("klahan").print_klahan_results(result)
+
+
+@register_renderer("sun_wukong")
+def render_sun_wukong(result: SunWukongResult) -> None:
+    """แสดงผล Sun Wukong Castle Mode"""
+    load_logic("sun_wukong").print_castle_mode_results(result)
+
+
+@register_renderer("espada")
+def render_espada(result: EspadaResult) -> None:
+    """แสดงผล Espada"""
+    from display import print_espada_results
+
+    print_espada_results(result)
+
 
-        from display import print_kill_status_block
+@register_renderer("biscuit")
+def render_biscuit(result: BiscuitResult) -> None:
+    """แสดงผล Biscuit (+ เช็คว่ามอนตายไหมในโหมดปราสาท)"""
+    from display import print_kill_status_block
 
-        print_kill_status_block(hp_target_calc, dmg_crit, "คริ", dmg_normal, "ธรรมดา")
+    load_logic("biscuit").print_biscuit_results(result)
 
-    return True
+    if result.castle_hp is not None:
+        print_kill_status_block(
+            result.castle_hp,
+            result.total_skill_dmg_crit, "คริ",
+            result.total_skill_dmg_normal, "ธรรมดา"
+        )
@@ -3,17 +3,20 @@ Config Loader - โหลดและจัดการ config files
 """
 
 import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from decimal import Decimal
 from typing import Any
 
+from character_db import get_character_db, thaw
+from constants import ADDITIVE_KEYS, MAPPING_KEYS
+from equipment import weapon_set_effects
+
 
 def list_characters() -> list[str]:
     """แสดงรายชื่อตัวละครที่มี config"""
-    chars_dir = Path(__file__).parent / "characters"
-    if not chars_dir.exists():
-        return []
-    return [f.stem for f in chars_dir.glob("*.json")]
+    return list(get_character_db().names())
 
 
 def load_json(path: Path) -> dict[str, Any]:
@@ -28,17 +31,12 @@ def load_json(path: Path) -> dict[str, Any]:
 
 
 def load_character_full(name: str) -> tuple[dict[str, Any], dict[str, Any]]:
-    """โหลด config จาก characters/[name].json รวม metadata"""
-    char_path = Path(__file__).parent / "characters" / f"{name}.json"
-    if char_path.exists():
-        with open(char_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # แยก metadata และ config
-            meta = {k: v for k, v in data.items() if k.startswith("_")}
-            config = {k: v for k, v in data.items() 
-                      if not k.startswith("//") and not k.startswith("_")}
-            return meta, config
-    return {}, {}
+    """โหลด config จาก characters/[name].json รวม metadata (ผ่าน CharacterDB, คืน copy ที่แก้ได้)"""
+    db = get_character_db()
+    if name not in db:
+        return {}, {}
+    entry = db.get(name)
+    return thaw(entry.meta), thaw(entry.config)
 
 
 def load_user_config() -> dict[str, Any]:
@@ -48,39 +46,22 @@ def load_user_config() -> dict[str, Any]:
 
 
 def load_monster_preset(filename: str) -> dict[str, Any]:
-    """โหลด monster preset จากไฟล์"""
-    monster_dir = Path(__file__).parent / "characters" / "monster"
-    monster_path = monster_dir / filename
-    
-    if monster_path.exists():
-        with open(monster_path, "r", encoding="utf-8") as f:
-            preset = json.load(f)
-        # กรองเฉพาะค่าที่ไม่ใช่ null และไม่ขึ้นต้นด้วย _
-        return {k: v for k, v in preset.items() if v is not None and not k.startswith("_")}
-    return {}
+    """โหลด monster preset จากไฟล์ (ผ่าน CharacterDB, คืน copy ที่แก้ได้)"""
+    try:
+        return thaw(get_character_db().monster(filename).preset)
+    except KeyError:
+        return {}
 
 
 def apply_weapon_set(config: dict[str, Any]) -> dict[str, Any]:
     """
-    ใช้ชุดเซ็ทอาวุธตาม Weapon_Set
-    0 = ไม่ใส่, 1 = จุดอ่อน(+35 WEAK), 2 = คริ(+15 IgnoreDEF), 
-    3 = ไฮดร้า(+70 DMG_AMP), 4 = ตีปราสาท(+30 DMG_AMP)
+    ใช้ชุดเซ็ทอาวุธตาม Weapon_Set (ตาราง equipment/weapon_sets.json)
+    0 = ไม่ใส่, 1 = จุดอ่อน(+35 WEAK), 2 = คริ(+15 IgnoreDEF),
+    3 = ไฮดร้า(+70 DMG_AMP), 4 = ตีปราสาท(+30 DMG_AMP), ค่าที่ไม่มีในตาราง = ไม่ใส่
+    แก้ config ที่ส่งมาแล้วคืน config เดิม
     """
-    weapon_set = int(config.get("Weapon_Set", 0))
-    
-    if weapon_set == 1:
-        # จุดอ่อน: +35% WEAK_DMG
-        config["WEAK_DMG"] = float(config.get("WEAK_DMG", 0)) + 35.0
-    elif weapon_set == 2:
-        # คริ: +15% Ignore_DEF
-        config["Ignore_DEF"] = float(config.get("Ignore_DEF", 0)) + 15.0
-    elif weapon_set == 3:
-        # ไฮดร้า: +70% DMG_AMP_BUFF
-        config["DMG_AMP_BUFF"] = float(config.get("DMG_AMP_BUFF", 0)) + 70.0
-    elif weapon_set == 4:
-        # ตีปราสาท: +30% DMG_AMP_BUFF
-        config["DMG_AMP_BUFF"] = float(config.get("DMG_AMP_BUFF", 0)) + 30.0
-    
+    for key, value in weapon_set_effects(int(config.get("Weapon_Set", 0))).effects:
+        config[key] = float(config.get(key, 0)) + value
     return config
 
 
@@ -92,26 +73,14 @@ def merge_configs(char_config: dict[str, Any], user_config: dict[str, Any]) -> d
     """
     merged = user_config.copy()
     
-    # ค่าที่ต้อง ADD กัน (ทั้งสองฝ่ายอาจมีค่า)
-    additive_keys = [
-        "SKILL_DMG", "CRIT_DMG", "WEAK_DMG", "DMG_AMP_BUFF", "DMG_AMP_DEBUFF", 
-        "DEF_REDUCE", "BUFF_ATK", "DMG_Reduction", "Ignore_DEF",
-        "Bonus_DMG_HP_Target", "Cap_ATK_Percent"
-    ]
-    
-    # ค่าที่ต้อง mapping ไปใส่ key อื่น (เช่น Bonus_Crit_DMG -> CRIT_DMG)
-    mapping_keys: dict[str, str] = {
-        "Bonus_Crit_DMG": "CRIT_DMG"
-    }
-    
     for key, value in char_config.items():
-        if key in additive_keys:
+        if key in ADDITIVE_KEYS:
             # ADD ค่าเข้าด้วยกัน
             user_value = user_config.get(key, 0)
             merged[key] = float(value) + float(user_value)
-        elif key in mapping_keys:
+        elif key in MAPPING_KEYS:
             # Mapping key: ADD ไปใส่ key ปลายทาง
-            target_key = mapping_keys[key]
+            target_key = MAPPING_KEYS[key]
             current_value = merged.get(target_key, 0)
             merged[target_key] = float(current_value) + float(value)
         elif key not in merged:
@@ -121,6 +90,67 @@ def merge_configs(char_config: dict[str, Any], user_config: dict[str, Any]) -> d
     return merged
 
 
+# ชนิดของขั้นใน MergePlan
+_ADD, _MAP, _SET = 0, 1, 2
+
+
+@dataclass(frozen=True, slots=True)
+class MergePlan:
+    """
+    merge_configs ที่คอมไพล์จาก character config ล่วงหน้า (ใช้ซ้ำกับ user config กี่ชุดก็ได้)
+    ขั้น (ชนิด, key ปลายทาง, ค่า) เรียงตาม character config: จัดกลุ่ม key และ float(ค่าตัวละคร) ครั้งเดียว
+    ผลตรงกับ merge_configs ทุกค่า รวมถึงลำดับ key
+    """
+    steps: tuple[tuple[int, str, Any], ...]
+
+    def apply(self, user_config: Mapping[str, Any]) -> dict[str, Any]:
+        """merge_configs(char_config, user_config)"""
+        merged = dict(user_config)
+        get = user_config.get
+        for kind, key, value in self.steps:
+            if kind == _ADD:
+                merged[key] = value + float(get(key, 0))
+            elif kind == _MAP:
+                merged[key] = float(merged.get(key, 0)) + value
+            elif key not in merged:
+                merged[key] = value
+        return merged
+
+    def apply_many(self, user_configs: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """apply ของทุก user config ตามลำดับ"""
+        apply = self.apply
+        return [apply(user_config) for user_config in user_configs]
+
+
+def compile_merge(char_config: Mapping[str, Any]) -> MergePlan:
+    """คอมไพล์ MergePlan (ค่า additive / mapping ที่ไม่ใช่ตัวเลข → ValueError ตั้งแต่ตอนนี้)"""
+    steps = []
+    for key, value in char_config.items():
+        if key in ADDITIVE_KEYS:
+            steps.append((_ADD, key, float(value)))
+        elif key in MAPPING_KEYS:
+            steps.append((_MAP, MAPPING_KEYS[key], float(value)))
+        else:
+            steps.append((_SET, key, value))
+    return MergePlan(tuple(steps))
+
+
+def merge_configs_many(
+    char_config: Mapping[str, Any], user_configs: Iterable[Mapping[str, Any]]
+) -> list[dict[str, Any]]:
+    """merge_configs ของ character config เดียวกับ user config N ชุด (คอมไพล์ครั้งเดียว)"""
+    return compile_merge(char_config).apply_many(user_configs)
+
+
 def get_decimal(config: dict[str, Any], key: str, default: str = "0") -> Decimal:
     """ดึงค่าจาก config เป็น Decimal"""
     return Decimal(str(config.get(key, default)))
+
+
+def get_crit_rate(config: dict[str, Any]) -> Decimal:
+    """
+    ดึงอัตราคริ (%) = CRIT_RATE (ผู้ใช้) + Bonus_Crit_Rate (ตัวละคร/สกิล)
+    จำกัดให้อยู่ในช่วง 0-100
+    """
+    rate = get_decimal(config, "CRIT_RATE") + get_decimal(config, "Bonus_Crit_Rate")
+    return min(max(rate, Decimal("0")), Decimal("100"))
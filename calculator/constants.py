@@ -8,6 +8,46 @@ from decimal import Decimal
 # DEF Modifier - ตัวคูณ DEF ในระบบ (ยืนยันจากการทดสอบ)
 DEF_MODIFIER = Decimal("0.00214135")
 
+# ระยะห่างจากจำนวนเต็ม (แบบ relative) ที่ถือว่า "เสี่ยง" สำหรับการคำนวณแบบ float
+# ถ้าผลลัพธ์ก่อน ROUNDDOWN อยู่ใกล้จำนวนเต็มกว่านี้ จะคำนวณซ้ำด้วย Decimal (ดู D007)
+FLOAT_ROUNDDOWN_GUARD = 1e-9
+
+# ค่า default ของ config แต่ละ key (ตรงกับ get_decimal(...) ใน main.py)
+CONFIG_DEFAULTS: dict[str, str] = {
+    "ATK_CHAR": "4000",
+    "BUFF_ATK": "0",
+    "Formation": "21",
+    "ATK_PET": "371",
+    "BUFF_ATK_PET": "17",
+    "Potential_PET": "21",
+    "SKILL_DMG": "160",
+    "SKILL_HITS": "1",
+    "CRIT_DMG": "256",
+    "WEAK_DMG": "0",
+    "DMG_AMP_BUFF": "0",
+    "DMG_AMP_DEBUFF": "0",
+    "DMG_Reduction": "0",
+    "DEF_REDUCE": "0",
+    "Ignore_DEF": "39",
+    "DEF_Target": "784",
+    "DEF_BUFF": "0",
+    "Bonus_DMG_HP_Target": "0",
+    "Cap_ATK_Percent": "0",
+    "HP_Target": "10790",
+}
+
+# ค่าที่ต้อง ADD กัน (ทั้งสองฝ่ายอาจมีค่า)
+ADDITIVE_KEYS = frozenset({
+    "SKILL_DMG", "CRIT_DMG", "WEAK_DMG", "DMG_AMP_BUFF", "DMG_AMP_DEBUFF",
+    "DEF_REDUCE", "BUFF_ATK", "DMG_Reduction", "Ignore_DEF",
+    "Bonus_DMG_HP_Target", "Cap_ATK_Percent"
+})
+
+# ค่าที่ต้อง mapping ไปใส่ key อื่น (เช่น Bonus_Crit_DMG -> CRIT_DMG)
+MAPPING_KEYS: dict[str, str] = {
+    "Bonus_Crit_DMG": "CRIT_DMG"
+}
+
 # ATK_BASE ตามสายและ Rarity (6 ดาว+5)
 # สาย: attack, magic, support, defense, balance
 
@@ -0,0 +1,190 @@
+"""
+Crit Simulator - จำลอง Monte Carlo ว่าสกิลหนึ่งครั้งฆ่ามอนได้กี่ % ตามอัตราคริ / อัตราติดจุดอ่อน
+
+- แต่ละ hit สุ่มอิสระ: คริด้วยโอกาส crit_rate, ติดจุดอ่อนด้วยโอกาส weak_rate
+  ผลของ 1 trial จึงเป็นจำนวน hit ของ 4 แบบ (คริ+จุดอ่อน, คริ, จุดอ่อน, ปกติ)
+  สุ่มด้วย multinomial ทีเดียวทั้ง chunk (การกระจายเหมือนสุ่มทีละ hit) แล้วคูณกับดาเมจต่อ hit
+- รายงานโอกาสฆ่า + ช่วงความเชื่อมั่น (Wilson score interval)
+- ใช้ NumPy (optional, ดู D007) และแบ่ง trial ไปหลาย process ได้ (workers > 1)
+
+การใช้งาน:
+    from crit_sim import simulate_character
+    sim = simulate_character("sun_wukong", "skill1", user_config, "castle_room1.json", weak_rate=1.0)
+    print(sim.kill_probability, sim.ci_low, sim.ci_high)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from statistics import NormalDist
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - ทดสอบได้เฉพาะเครื่องที่ไม่มี numpy
+    np = None
+
+from config_loader import get_crit_rate
+from pipeline import compute_damage
+from results import HitDamage
+
+DEFAULT_TRIALS = 1_000_000
+DEFAULT_CONFIDENCE = 0.95
+
+# จำนวน trial ต่อรอบการสุ่ม (จำกัดหน่วยความจำ: ~32 bytes ต่อ trial)
+CHUNK_SIZE = 1_000_000
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "crit_sim ต้องใช้ NumPy - ติดตั้งด้วย: pip install numpy"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationResult:
+    """ผลการจำลอง"""
+    trials: int
+    kills: int
+    kill_probability: float
+    ci_low: float
+    ci_high: float
+    confidence: float
+    mean_damage: float
+    crit_rate: float
+    weak_rate: float
+    hits: int
+    hp: int
+
+
+def wilson_interval(kills: int, trials: int, confidence: float = DEFAULT_CONFIDENCE) -> tuple[float, float]:
+    """ช่วงความเชื่อมั่นของสัดส่วน (Wilson score) - ใช้ได้ดีแม้โอกาสใกล้ 0 หรือ 1"""
+    if trials <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = kills / trials
+    denom = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    half = z * ((p * (1 - p) / trials + z * z / (4 * trials * trials)) ** 0.5) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _outcome_probabilities(crit_rate: float, weak_rate: float) -> list[float]:
+    """โอกาสต่อ hit ตามลำดับ (crit, crit_weak, no_crit, weak_only) - ลำดับเดียวกับ HitDamage"""
+    return [
+        crit_rate * (1 - weak_rate),
+        crit_rate * weak_rate,
+        (1 - crit_rate) * (1 - weak_rate),
+        (1 - crit_rate) * weak_rate,
+    ]
+
+
+def _run_trials(
+    damage: tuple[int, int, int, int],
+    probabilities: list[float],
+    hits: int,
+    hp: int,
+    trials: int,
+    seed: Any,
+) -> tuple[int, int]:
+    """สุ่ม trials ครั้ง Returns (จำนวนที่ฆ่าได้, ผลรวมดาเมจ) - ใช้ใน worker process ได้"""
+    rng = np.random.default_rng(seed)
+    damage_vector = np.array(damage, dtype=np.int64)
+    kills = 0
+    total = 0
+    remaining = trials
+    while remaining > 0:
+        size = min(remaining, CHUNK_SIZE)
+        counts = rng.multinomial(hits, probabilities, size=size)
+        totals = counts @ damage_vector
+        kills += int(np.count_nonzero(totals >= hp))
+        total += int(totals.sum())
+        remaining -= size
+    return kills, total
+
+
+def simulate_kill(
+    damage: HitDamage,
+    hits: int,
+    hp: int,
+    crit_rate: float,
+    weak_rate: float,
+    trials: int = DEFAULT_TRIALS,
+    seed: int | None = None,
+    workers: int = 1,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> SimulationResult:
+    """
+    จำลองสกิล 1 ครั้ง (hits hit) trials รอบ
+
+    Args:
+        crit_rate, weak_rate: โอกาสต่อ hit (0-1)
+        seed: ผลซ้ำได้เมื่อ seed และ workers เท่าเดิม
+        workers: จำนวน process (1 = รันใน process นี้)
+    """
+    _require_numpy()
+    if not 0.0 <= crit_rate <= 1.0 or not 0.0 <= weak_rate <= 1.0:
+        raise ValueError("crit_rate และ weak_rate ต้องอยู่ในช่วง 0-1")
+    if hits < 0 or trials <= 0 or workers <= 0:
+        raise ValueError("hits ต้อง >= 0, trials และ workers ต้อง > 0")
+
+    values = (damage.crit, damage.crit_weak, damage.no_crit, damage.weak_only)
+    probabilities = _outcome_probabilities(crit_rate, weak_rate)
+
+    if workers == 1:
+        kills, total = _run_trials(values, probabilities, hits, hp, trials, seed)
+    else:
+        # แต่ละ worker ได้ seed ย่อยที่ไม่ซ้ำกัน (SeedSequence.spawn)
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        shares = [trials // workers + (1 if i < trials % workers else 0) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                _run_trials,
+                [values] * workers, [probabilities] * workers, [hits] * workers, [hp] * workers,
+                shares, seeds,
+            ))
+        kills = sum(k for k, _ in parts)
+        total = sum(t for _, t in parts)
+
+    ci_low, ci_high = wilson_interval(kills, trials, confidence)
+    return SimulationResult(
+        trials=trials,
+        kills=kills,
+        kill_probability=kills / trials,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        confidence=confidence,
+        mean_damage=total / trials,
+        crit_rate=crit_rate,
+        weak_rate=weak_rate,
+        hits=hits,
+        hp=hp,
+    )
+
+
+def simulate_character(
+    character: str,
+    skill: str | None = None,
+    user_config: dict[str, Any] | None = None,
+    monster_preset: dict[str, Any] | str | None = None,
+    weak_rate: float = 0.0,
+    crit_rate: float | None = None,
+    **kwargs: Any,
+) -> SimulationResult:
+    """
+    จำลองโดยใช้ดาเมจต่อ hit จาก pipeline
+
+    Args:
+        crit_rate: None = CRIT_RATE + Bonus_Crit_Rate จาก config/ตัวละคร (get_crit_rate)
+        weak_rate: โอกาสติดจุดอ่อนต่อ hit (0-1)
+        kwargs: ส่งต่อให้ simulate_kill (trials, seed, workers, confidence)
+    HP เป้าหมาย = HP ของ monster preset ถ้ามี ไม่งั้นใช้ HP_Target
+    """
+    result = compute_damage(character, skill, user_config, monster_preset)
+    if crit_rate is None:
+        crit_rate = float(get_crit_rate(result.config) / Decimal("100"))
+    hp = result.monster_hp or int(result.hp_target)
+    return simulate_kill(
+        HitDamage.from_result(result), result.skill_hits, hp, crit_rate, weak_rate, **kwargs
+    )
@@ -3,6 +3,8 @@
 สูตรการคำนวณดาเมจตาม AGENTS.md (แก้ไขแล้ว)
 """
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from decimal import Decimal, ROUND_DOWN
 from constants import DEF_MODIFIER, ATK_BASE
 
@@ -115,6 +117,68 @@ def calculate_raw_dmg(
     return atk_dmg + hp_dmg
 
 
+@dataclass(frozen=True, slots=True)
+class RawMatrix:
+    """
+    RAW Damage ของทุกชุด (skill_dmg, crit_dmg, weak_dmg, final_dmg_hp)
+    index ตามลำดับค่าที่ส่งให้ calculate_raw_matrix: matrix[skill, crit, weak, hp]
+    """
+    shape: tuple[int, int, int, int]
+    values: tuple[Decimal, ...]
+
+    def __getitem__(self, index: tuple[int, int, int, int]) -> Decimal:
+        s, c, w, h = index
+        _, n_crit, n_weak, n_hp = self.shape
+        return self.values[((s * n_crit + c) * n_weak + w) * n_hp + h]
+
+
+def calculate_raw_matrix(
+    total_atk: Decimal,
+    skill_dmgs: Sequence[Decimal],
+    crit_dmgs: Sequence[Decimal],
+    weak_dmgs: Sequence[Decimal],
+    dmg_amp_buff: Decimal,
+    dmg_amp_debuff: Decimal,
+    dmg_reduction: Decimal,
+    final_dmg_hps: Sequence[Decimal] = (Decimal("0"),)
+) -> RawMatrix:
+    """
+    คำนวณ RAW Damage หลายกรณีในครั้งเดียว (คริ / จุดอ่อน / HP-based / SKILL_DMG หลายค่า)
+    
+    ตัวคูณที่ใช้ร่วมกัน (amp_buff, amp_debuff_reduction, crit, weak) และ Total_ATK * skill_mult
+    คำนวณครั้งเดียว ลำดับการคูณเหมือน calculate_raw_dmg ทุกขั้น ค่าที่ได้จึงเท่ากันทุกหลัก
+    """
+    amp_buff_mult = Decimal("1") + dmg_amp_buff / Decimal("100")
+    amp_debuff_reduction_mult = Decimal("1") + (dmg_amp_debuff - dmg_reduction) / Decimal("100")
+    crit_mults = [crit_dmg / Decimal("100") for crit_dmg in crit_dmgs]
+    weak_mults = [Decimal("1") + weak_dmg / Decimal("100") for weak_dmg in weak_dmgs]
+
+    # ส่วน HP-based ไม่ขึ้นกับ SKILL_DMG: คำนวณต่อ (crit, weak, hp) ครั้งเดียว (None = ไม่มี HP-based)
+    hp_parts = [
+        [
+            [
+                final_dmg_hp * crit_mult * weak_mult * amp_buff_mult * amp_debuff_reduction_mult
+                if final_dmg_hp else None
+                for final_dmg_hp in final_dmg_hps
+            ]
+            for weak_mult in weak_mults
+        ]
+        for crit_mult in crit_mults
+    ]
+
+    values = []
+    for skill_dmg in skill_dmgs:
+        base = total_atk * (skill_dmg / Decimal("100"))
+        for crit_mult, hp_by_weak in zip(crit_mults, hp_parts):
+            base_crit = base * crit_mult
+            for weak_mult, hp_by_hp in zip(weak_mults, hp_by_weak):
+                atk_dmg = base_crit * weak_mult * amp_buff_mult * amp_debuff_reduction_mult
+                values.extend(atk_dmg if hp_dmg is None else atk_dmg + hp_dmg for hp_dmg in hp_by_hp)
+
+    shape = (len(skill_dmgs), len(crit_mults), len(weak_mults), len(final_dmg_hps))
+    return RawMatrix(shape, tuple(values))
+
+
 def calculate_effective_def(
     def_target: Decimal,
     def_buff: Decimal,
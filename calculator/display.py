@@ -2,18 +2,15 @@
 Display - ฟังก์ชันแสดงผลทั้งหมด
 """
 
+from __future__ import annotations
+
 from decimal import Decimal
-from typing import Any
-from damage_calc import (
-    calculate_total_atk,
-    calculate_dmg_hp,
-    calculate_cap_atk,
-    calculate_final_dmg_hp,
-    calculate_raw_dmg,
-    calculate_effective_def,
-    calculate_final_dmg,
-)
-from config_loader import merge_configs
+from typing import TYPE_CHECKING, Any
+from equipment import get_weapon_sets
+
+if TYPE_CHECKING:
+    # ใช้แค่ใน type hint: หน้าเมนูไม่ต้องรอ import results / character_registry
+    from results import BothSkillsResult, DamageResult, EspadaResult
 
 
 def print_header() -> None:
@@ -30,16 +27,13 @@ def print_character_info(char_name: str, rarity: str, char_class: str, atk_base:
         print(f">>> ATK_BASE = {atk_base}")
 
 
+# ชื่อชุดเซ็ทอาวุธ (จาก equipment/weapon_sets.json)
+WEAPON_SET_NAMES = {weapon_set.id: weapon_set.name for weapon_set in get_weapon_sets().values()}
+
+
 def print_weapon_set(weapon_set: int):
     """แสดงข้อมูลชุดเซ็ทอาวุธ"""
-    weapon_names = {
-        0: "ไม่ใส่", 
-        1: "จุดอ่อน (+35% WEAK)", 
-        2: "คริ (+15% Ignore DEF)", 
-        3: "ไฮดร้า (+70% DMG_AMP)",
-        4: "ตีปราสาท (+30% DMG_AMP)"
-    }
-    print(f">>> โหลด config.json (ชุดเซ็ทอาวุธ: {weapon_names.get(weapon_set, 'ไม่ทราบ')})")
+    print(f">>> โหลด config.json (ชุดเซ็ทอาวุธ: {WEAPON_SET_NAMES.get(weapon_set, 'ไม่ทราบ')})")
 
 
 def print_input_values(
@@ -127,17 +121,6 @@ def print_effective_def(effective_def: Decimal) -> None:
     print(f"4. Effective_DEF = {effective_def:.2f}")
 
 
-def calc_atk_needed(current_dmg: int, monster_hp: int, current_atk: Decimal) -> int:
-    """คำนวณว่าต้องเพิ่ม ATK_CHAR อีกเท่าไหร่ถึงจะฆ่ามอนได้"""
-    if current_dmg <= 0 or monster_hp <= 0:
-        return 0
-    remaining = monster_hp - current_dmg
-    if remaining <= 0:
-        return 0  # ฆ่าได้แล้ว ไม่ต้องเพิ่ม
-    atk_needed = float(current_atk) * (remaining / current_dmg)
-    return int(atk_needed) + 1  # ปัดขึ้น
-
-
 def print_kill_status_block(hp_target: Decimal, dmg_1: Decimal, label_1: str, dmg_2: Decimal, label_2: str) -> None:
     """แสดงสถานะการฆ่ามอนสเตอร์ (Overkill / Remaining)"""
     hp_int = int(hp_target)
@@ -167,24 +150,26 @@ def print_kill_status_block(hp_target: Decimal, dmg_1: Decimal, label_1: str, dm
     print("-" * 60)
 
 
-def get_hp_status(damage: int, monster_hp: int, current_atk: Decimal) -> str:
-    """สร้างข้อความเลือดมอน"""
+def get_hp_status(damage: int, monster_hp: int, atk_needed: int | None = None) -> str:
+    """สร้างข้อความเลือดมอน (atk_needed = ATK_CHAR ที่ต้องเพิ่ม จาก kill_solver)"""
     if monster_hp <= 0:
         return ""  # ไม่ใช่โหมดปราสาท
     remaining = int(monster_hp) - damage
     if remaining <= 0:
         return f" 💀 มอนตาย (เกิน {-remaining:,})"
-    else:
-        return f" ❤️ เหลือเลือด {remaining:,}"
+    if atk_needed:
+        return f" ❤️ เหลือเลือด {remaining:,} (ATK_CHAR +{atk_needed:,})"
+    return f" ❤️ เหลือเลือด {remaining:,}"
 
 
 def print_final_damage_results(
     skill_hits: int, weak_dmg: Decimal,
     final_dmg_crit: int, final_dmg_crit_weakness: int,
     final_dmg_no_crit: int, final_dmg_weakness_only: int,
-    monster_hp: int, atk_char: Decimal
+    monster_hp: int, atk_needed: tuple[int | None, ...] | None = None
 ) -> None:
-    """แสดงผล Final Damage Results"""
+    """แสดงผล Final Damage Results (atk_needed ตามลำดับ crit, crit_weak, no_crit, weak_only)"""
+    need_crit, need_crit_weak, need_no_crit, need_weak_only = atk_needed or (None,) * 4
     print("\n" + "-" * 40)
     print("  Final Damage Results")
     print("-" * 40)
@@ -195,125 +180,111 @@ def print_final_damage_results(
         total_no_crit = final_dmg_no_crit * skill_hits
         total_weakness_only = final_dmg_weakness_only * skill_hits
         
-        print(f"  ติดคริ: {total_crit:,} ({skill_hits} hits x {final_dmg_crit:,}/hit){get_hp_status(total_crit, monster_hp, atk_char)}")
-        print(f"  ติดคริ+จุดอ่อน: {total_crit_weakness:,} (+{weak_dmg}%) ({skill_hits} hits x {final_dmg_crit_weakness:,}/hit){get_hp_status(total_crit_weakness, monster_hp, atk_char)}")
-        print(f"  ไม่ติดคริ: {total_no_crit:,} ({skill_hits} hits x {final_dmg_no_crit:,}/hit){get_hp_status(total_no_crit, monster_hp, atk_char)}")
-        print(f"  ติดแค่จุดอ่อน: {total_weakness_only:,} (+{weak_dmg}%) ({skill_hits} hits x {final_dmg_weakness_only:,}/hit){get_hp_status(total_weakness_only, monster_hp, atk_char)}")
+        print(f"  ติดคริ: {total_crit:,} ({skill_hits} hits x {final_dmg_crit:,}/hit){get_hp_status(total_crit, monster_hp, need_crit)}")
+        print(f"  ติดคริ+จุดอ่อน: {total_crit_weakness:,} (+{weak_dmg}%) ({skill_hits} hits x {final_dmg_crit_weakness:,}/hit){get_hp_status(total_crit_weakness, monster_hp, need_crit_weak)}")
+        print(f"  ไม่ติดคริ: {total_no_crit:,} ({skill_hits} hits x {final_dmg_no_crit:,}/hit){get_hp_status(total_no_crit, monster_hp, need_no_crit)}")
+        print(f"  ติดแค่จุดอ่อน: {total_weakness_only:,} (+{weak_dmg}%) ({skill_hits} hits x {final_dmg_weakness_only:,}/hit){get_hp_status(total_weakness_only, monster_hp, need_weak_only)}")
     else:
         total_crit = final_dmg_crit
         total_crit_weakness = final_dmg_crit_weakness
         total_no_crit = final_dmg_no_crit
         total_weakness_only = final_dmg_weakness_only
-        print(f"  ติดคริ: {final_dmg_crit:,}{get_hp_status(total_crit, monster_hp, atk_char)}")
-        print(f"  ติดคริ+จุดอ่อน: {final_dmg_crit_weakness:,} (+{weak_dmg}%){get_hp_status(total_crit_weakness, monster_hp, atk_char)}")
-        print(f"  ไม่ติดคริ: {final_dmg_no_crit:,}{get_hp_status(total_no_crit, monster_hp, atk_char)}")
-        print(f"  ติดแค่จุดอ่อน: {final_dmg_weakness_only:,} (+{weak_dmg}%){get_hp_status(total_weakness_only, monster_hp, atk_char)}")
+        print(f"  ติดคริ: {final_dmg_crit:,}{get_hp_status(total_crit, monster_hp, need_crit)}")
+        print(f"  ติดคริ+จุดอ่อน: {final_dmg_crit_weakness:,} (+{weak_dmg}%){get_hp_status(total_crit_weakness, monster_hp, need_crit_weak)}")
+        print(f"  ไม่ติดคริ: {final_dmg_no_crit:,}{get_hp_status(total_no_crit, monster_hp, need_no_crit)}")
+        print(f"  ติดแค่จุดอ่อน: {final_dmg_weakness_only:,} (+{weak_dmg}%){get_hp_status(total_weakness_only, monster_hp, need_weak_only)}")
     
     print("-" * 40)
 
 
-def print_espada_results(espada_result: dict[str, Any], weak_dmg: Decimal, final_dmg_hp: Decimal) -> None:
+def print_espada_results(espada_result: EspadaResult) -> None:
     """แสดงผล Espada แบบพิเศษ"""
+    weak_dmg = espada_result.weak_dmg
+    final_dmg_hp = espada_result.final_dmg_hp
     print("\n" + "=" * 60)
     print("  Espada Special Calculation (4 กรณี)")
     print("=" * 60)
     
     print(f"\n[1] คริ (ไม่มี HP-based):")
-    print(f"    RAW_DMG = {espada_result['crit_no_hp']['raw']:,.2f}")
-    print(f"    Final = {espada_result['crit_no_hp']['final']:,}")
+    print(f"    RAW_DMG = {espada_result.crit_no_hp.raw:,.2f}")
+    print(f"    Final = {espada_result.crit_no_hp.final:,}")
     
     print(f"\n[2] คริ + HP-based (HP: {final_dmg_hp:,}):")
-    print(f"    RAW_DMG = {espada_result['crit_with_hp']['raw']:,.2f}")
-    print(f"    Final = {espada_result['crit_with_hp']['final']:,}")
+    print(f"    RAW_DMG = {espada_result.crit_with_hp.raw:,.2f}")
+    print(f"    Final = {espada_result.crit_with_hp.final:,}")
     
     print(f"\n[3] จุดอ่อน (+{weak_dmg}%) (ไม่มี HP-based):")
-    print(f"    RAW_DMG = {espada_result['weak_no_hp']['raw']:,.2f}")
-    print(f"    Final = {espada_result['weak_no_hp']['final']:,}")
+    print(f"    RAW_DMG = {espada_result.weak_no_hp.raw:,.2f}")
+    print(f"    Final = {espada_result.weak_no_hp.final:,}")
     
     print(f"\n[4] จุดอ่อน (+{weak_dmg}%) + HP-based:")
-    print(f"    RAW_DMG = {espada_result['weak_with_hp']['raw']:,.2f}")
-    print(f"    Final = {espada_result['weak_with_hp']['final']:,}")
+    print(f"    RAW_DMG = {espada_result.weak_with_hp.raw:,.2f}")
+    print(f"    Final = {espada_result.weak_with_hp.final:,}")
     
     print("\n" + "=" * 60)
-    print(f">>> ดาเมจสูงสุด (คริ+HP): {espada_result['crit_with_hp']['final']:,} <<<")
-    print(f">>> ดาเมจสูงสุด (จุดอ่อน+HP): {espada_result['weak_with_hp']['final']:,} <<<")
+    print(f">>> ดาเมจสูงสุด (คริ+HP): {espada_result.crit_with_hp.final:,} <<<")
+    print(f">>> ดาเมจสูงสุด (จุดอ่อน+HP): {espada_result.weak_with_hp.final:,} <<<")
     print("=" * 60)
 
 
-def print_both_skills_results(
-    all_skills_data: list[dict[str, Any]], char_config: dict[str, Any], user_config: dict[str, Any], 
-    total_atk: Decimal, crit_dmg: Decimal, weak_dmg: Decimal, 
-    dmg_amp_buff: Decimal, dmg_amp_debuff: Decimal, dmg_reduction: Decimal,
-    def_target: Decimal, def_buff: Decimal, def_reduce: Decimal, hp_target: Decimal
-) -> None:
-    """แสดงผลรวมทั้งสองสกิล"""
+def print_both_skills_results(both: BothSkillsResult) -> None:
+    """แสดงผลรวมทั้งสองสกิล (คำนวณไว้แล้วใน pipeline.calculate_both_skills)"""
     print("\n" + "=" * 60)
     print("  📊 รวมทั้งสองสกิล (Both Skills)")
     print("=" * 60)
     
-    # คำนวณดาเมจแต่ละสกิล
-    total_damage_crit = Decimal("0")
-    total_damage_weak = Decimal("0")
-    
-    for skill_info in all_skills_data:
-        skill_name = skill_info["name"]
-        s_config = skill_info["config"]
-        
-        # Merge skill config with user config
-        merged_skill_config = char_config.copy()
-        merged_skill_config.update(s_config)
-        merged_skill = merge_configs(merged_skill_config, user_config)
-        
-        s_skill_dmg = Decimal(str(merged_skill.get("SKILL_DMG", 0)))
-        s_skill_hits = int(merged_skill.get("SKILL_HITS", 1))
-        s_ignore_def = Decimal(str(merged_skill.get("Ignore_DEF", 0)))
-        s_hp_alteration = Decimal(str(merged_skill.get("HP_Alteration", 0)))
-        s_bonus_hp = Decimal(str(merged_skill.get("Bonus_DMG_HP_Target", 0)))
-        s_cap_atk = Decimal(str(merged_skill.get("Cap_ATK_Percent", 0)))
-        
-        # คำนวณ Effective DEF สำหรับสกิลนี้
-        s_eff_def = calculate_effective_def(def_target, def_buff, def_reduce, s_ignore_def)
-        
-        # HP-based damage
-        s_dmg_hp = calculate_dmg_hp(hp_target, s_bonus_hp)
-        s_cap = calculate_cap_atk(total_atk, s_cap_atk)
-        s_final_hp = calculate_final_dmg_hp(s_dmg_hp, s_cap)
-        
-        # HP Alteration (Freyja)
-        s_hp_alt_dmg = Decimal("0")
-        if s_hp_alteration > 0:
-            s_hp_alt_dmg = hp_target * (Decimal("100") - s_hp_alteration) / Decimal("100")
-        
-        # RAW damage
-        s_raw_crit = calculate_raw_dmg(
-            total_atk, s_skill_dmg, crit_dmg, Decimal("0"),
-            dmg_amp_buff, dmg_amp_debuff, dmg_reduction, s_final_hp
-        )
-        s_raw_weak = calculate_raw_dmg(
-            total_atk, s_skill_dmg, crit_dmg, Decimal("30") + weak_dmg,
-            dmg_amp_buff, dmg_amp_debuff, dmg_reduction, s_final_hp
-        )
-        
-        # Final damage per skill
-        s_final_crit = calculate_final_dmg(s_raw_crit, s_eff_def) * s_skill_hits + int(s_hp_alt_dmg)
-        s_final_weak = calculate_final_dmg(s_raw_weak, s_eff_def) * s_skill_hits + int(s_hp_alt_dmg)
-        
-        total_damage_crit += s_final_crit
-        total_damage_weak += s_final_weak
-        
-        print(f"\n  [{skill_name}]")
-        print(f"    ดาเมจคริ: {s_final_crit:,}")
-        print(f"    ดาเมจติดจุดอ่อน: {s_final_weak:,}")
+    for skill in both.skills:
+        print(f"\n  [{skill.name}]")
+        print(f"    ดาเมจคริ: {skill.damage_crit:,}")
+        print(f"    ดาเมจติดจุดอ่อน: {skill.damage_weak:,}")
     
     print("\n" + "-" * 60)
-    print(f"  🎯 ดาเมจรวม (คริ): {int(total_damage_crit):,}")
-    print(f"  🎯 ดาเมจรวม (จุดอ่อน): {int(total_damage_weak):,}")
+    print(f"  🎯 ดาเมจรวม (คริ): {both.total_crit:,}")
+    print(f"  🎯 ดาเมจรวม (จุดอ่อน): {both.total_weak:,}")
     
     # เช็คว่ามอนตายไหม using reusable function
     print_kill_status_block(
-        hp_target, 
-        total_damage_crit, "คริ", 
-        total_damage_weak, "จุดอ่อน"
+        both.hp_target, 
+        both.total_crit, "คริ", 
+        both.total_weak, "จุดอ่อน"
     )
     
     print("=" * 60)
+
+
+def print_damage_result(result: DamageResult) -> None:
+    """แสดงผลลัพธ์ทั้งหมดจาก pipeline (ลำดับเดียวกับ main.py เดิม)"""
+    print_weapon_set(result.weapon_set)
+    
+    print_input_values(
+        result.atk_char, result.atk_pet, result.formation, result.potential_pet,
+        result.buff_atk, result.buff_atk_pet, result.skill_dmg, result.skill_hits,
+        result.crit_dmg, result.weak_dmg, result.dmg_amp_buff, result.dmg_amp_debuff,
+        result.def_target, result.def_reduce, result.ignore_def,
+        result.char_config, result.user_config
+    )
+    
+    print_calculation_header()
+    print_total_atk(result.total_atk)
+    print_hp_based_damage(result.dmg_hp, result.cap_atk, result.final_dmg_hp)
+    print_raw_damage(result.raw_dmg_crit, result.raw_dmg_crit_weakness)
+    print_effective_def(result.effective_def)
+    
+    # ตัวละครที่มี special logic: แสดงผลด้วย renderer ของตัวเอง
+    if result.is_special:
+        from character_registry import get_character_renderer
+
+        renderer = get_character_renderer(result.special_character)
+        if renderer:
+            renderer(result.special_result)
+        return
+    
+    print_final_damage_results(
+        result.skill_hits, result.weak_dmg,
+        result.final_dmg_crit, result.final_dmg_crit_weakness,
+        result.final_dmg_no_crit, result.final_dmg_weakness_only,
+        result.monster_hp, result.atk_needed
+    )
+    
+    if result.both_skills:
+        print_both_skills_results(result.both_skills)
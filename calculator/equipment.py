@@ -0,0 +1,137 @@
+"""
+Equipment - ตารางชุดเซ็ทอาวุธจาก equipment/weapon_sets.json (แทน if/elif ตาม Weapon_Set)
+
+- แต่ละชุดคือ stat ที่บวกเพิ่มให้ user config (เฉพาะ additive key เช่น WEAK_DMG, Ignore_DEF, DMG_AMP_BUFF)
+- effect ถูก parse + ตรวจครั้งเดียวเป็น EffectVector (เรียงตาม EFFECT_KEYS)
+  ใส่ให้ build ได้ในขั้นเดียว และบวกกับ effect ของอุปกรณ์อื่นได้ (a + b)
+- การบวกเข้า config: float(ค่าผู้ใช้) + ค่า effect ลำดับเดียวกับ apply_weapon_set เดิม (ผลตรงทุกบิต)
+  effect ที่ซ้อนกันจะถูกรวมกันก่อน แล้วบวกเข้า config ครั้งเดียว
+
+การใช้งาน:
+    from equipment import get_weapon_sets, weapon_set_effects
+    for weapon_set in get_weapon_sets().values():
+        print(weapon_set.id, weapon_set.name, weapon_set.effects.as_dict())
+    config = (weapon_set_effects(3) + EffectVector.of({"CRIT_DMG": 20})).apply(user_config)
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from constants import ADDITIVE_KEYS
+
+EQUIPMENT_DIR = Path(__file__).parent / "equipment"
+WEAPON_SETS_FILE = EQUIPMENT_DIR / "weapon_sets.json"
+
+# ลำดับของช่องใน EffectVector.vector
+EFFECT_KEYS: tuple[str, ...] = tuple(sorted(ADDITIVE_KEYS))
+
+
+@dataclass(frozen=True, slots=True)
+class EffectVector:
+    """stat ที่บวกเพิ่ม (key, ค่า) เรียงตาม EFFECT_KEYS - เฉพาะ key ที่ระบุ (ค่า 0 ก็นับว่าระบุ)"""
+    effects: tuple[tuple[str, float], ...] = ()
+
+    @classmethod
+    def of(cls, effects: Mapping[str, Any]) -> "EffectVector":
+        """จาก dict ของ stat → ค่า (key ที่ไม่ใช่ additive หรือค่าที่ไม่ใช่ตัวเลข → ValueError)"""
+        unknown = [k for k in effects if k not in ADDITIVE_KEYS]
+        if unknown:
+            raise ValueError(f"effect รองรับเฉพาะ additive key: {', '.join(unknown)}")
+        pairs = []
+        for key in EFFECT_KEYS:
+            if key in effects:
+                value = effects[key]
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"effect {key} ต้องเป็นตัวเลข (ได้ {value!r})")
+                pairs.append((key, float(value)))
+        return cls(tuple(pairs))
+
+    @property
+    def vector(self) -> tuple[float, ...]:
+        """ค่าทุกช่องตามลำดับ EFFECT_KEYS (key ที่ไม่ระบุ = 0.0)"""
+        values = dict(self.effects)
+        return tuple(values.get(key, 0.0) for key in EFFECT_KEYS)
+
+    def __add__(self, other: "EffectVector") -> "EffectVector":
+        combined = dict(self.effects)
+        for key, value in other.effects:
+            combined[key] = combined.get(key, 0.0) + value
+        return EffectVector.of(combined)
+
+    def __bool__(self) -> bool:
+        return bool(self.effects)
+
+    def as_dict(self) -> dict[str, float]:
+        return dict(self.effects)
+
+    def apply(self, config: Mapping[str, Any]) -> dict[str, Any]:
+        """config ใหม่ที่บวก effect แล้ว (ไม่แก้ config ที่ส่งมา)"""
+        applied = dict(config)
+        for key, value in self.effects:
+            applied[key] = float(applied.get(key, 0)) + value
+        return applied
+
+
+EMPTY_EFFECTS = EffectVector()
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponSet:
+    """ชุดเซ็ทอาวุธหนึ่งชุด (id = ค่า Weapon_Set)"""
+    id: int
+    name: str
+    effects: EffectVector
+
+
+def parse_weapon_sets(data: Mapping[str, Any]) -> Mapping[int, WeaponSet]:
+    """แปลง JSON ของตาราง (ตัด comment "//" ออก) → {id: WeaponSet} เรียงตาม id"""
+    sets = {}
+    for key, entry in data.items():
+        if key.startswith("//"):
+            continue
+        try:
+            set_id = int(key)
+        except ValueError:
+            raise ValueError(f"key ของชุดเซ็ทต้องเป็นจำนวนเต็ม (ได้ '{key}')") from None
+        if not isinstance(entry, dict):
+            raise ValueError(f"ชุดเซ็ท {key} ต้องเป็น JSON object")
+        effects = {k: v for k, v in entry.items() if not k.startswith("_") and not k.startswith("//")}
+        try:
+            vector = EffectVector.of(effects)
+        except ValueError as e:
+            raise ValueError(f"ชุดเซ็ท {key}: {e}") from None
+        sets[set_id] = WeaponSet(set_id, str(entry.get("_name", key)), vector)
+    return MappingProxyType(dict(sorted(sets.items())))
+
+
+def load_weapon_sets(path: Path = WEAPON_SETS_FILE) -> Mapping[int, WeaponSet]:
+    """โหลดตารางชุดเซ็ทอาวุธจากไฟล์"""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_weapon_sets(json.load(f))
+
+
+_weapon_sets: Mapping[int, WeaponSet] | None = None
+
+
+def get_weapon_sets() -> Mapping[int, WeaponSet]:
+    """ตารางของ process นี้ (โหลดครั้งแรกที่เรียก, อ่านอย่างเดียว)"""
+    global _weapon_sets
+    if _weapon_sets is None:
+        _weapon_sets = load_weapon_sets()
+    return _weapon_sets
+
+
+def set_weapon_sets(weapon_sets: Mapping[int, WeaponSet] | None) -> None:
+    """ใช้ตารางที่กำหนด (None = โหลดจากไฟล์ใหม่ตอนเรียกครั้งถัดไป)"""
+    global _weapon_sets
+    _weapon_sets = weapon_sets
+
+
+def weapon_set_effects(weapon_set: int) -> EffectVector:
+    """effect ของ Weapon_Set (ไม่มีในตาราง = ไม่มี effect)"""
+    entry = (_weapon_sets if _weapon_sets is not None else get_weapon_sets()).get(weapon_set)
+    return EMPTY_EFFECTS if entry is None else entry.effects
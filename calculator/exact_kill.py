@@ -0,0 +1,207 @@
+"""
+Exact Kill - โอกาสฆ่ามอนแบบแม่นยำ (ไม่สุ่ม) ด้วย DP convolution ของการกระจายดาเมจ
+
+- 1 hit มี 4 ผลลัพธ์ (crit, crit_weak, no_crit, weak_only) ตามโอกาส crit_rate / weak_rate
+  ผลลัพธ์ที่ดาเมจเท่ากันถูกรวมเป็นพจน์เดียว (polynomial ของ x^damage)
+- การกระจายของดาเมจรวม 1 สกิล = (polynomial)^hits กระจายด้วย multinomial
+  ผลรวมที่ >= HP ถูกรวมเป็น bucket เดียว (ฆ่าแล้ว) ขนาด state จึงไม่เกิน min(HP, จำนวนผลรวมที่ต่างกัน)
+- rotation หลายสกิล: convolution ของแต่ละครึ่งแล้วจับคู่ด้วย suffix sum + binary search
+  (meet-in-the-middle) ไม่ต้องสร้างการกระจายของผลรวมทั้งหมด
+
+การใช้งาน:
+    from exact_kill import exact_kill_character
+    odds = exact_kill_character("miho", "both", user_config, "castle_room2.json", weak_rate=0.5)
+    print(odds.probability, odds.expected_damage)
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from math import exp, lgamma, log
+from typing import Any
+
+from config_loader import get_crit_rate, load_character_full
+from pipeline import BOTH_SKILLS, compute_damage
+from results import HitDamage
+
+
+@dataclass(frozen=True, slots=True)
+class SkillHits:
+    """สกิล 1 ครั้งใน rotation: ดาเมจต่อ hit + จำนวน hit + โอกาสต่อ hit (0-1)"""
+    damage: HitDamage
+    hits: int
+    crit_rate: float
+    weak_rate: float
+    name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class KillOdds:
+    """ผลลัพธ์ของ rotation"""
+    probability: float
+    expected_damage: float
+    hp: int
+    hits: int
+    skills: tuple[str, ...]
+
+
+def hit_outcomes(damage: HitDamage, crit_rate: float, weak_rate: float) -> tuple[tuple[int, float], ...]:
+    """(ดาเมจ, โอกาส) ของ 1 hit - รวมผลลัพธ์ที่ดาเมจเท่ากัน ตัดผลลัพธ์ที่โอกาสเป็น 0"""
+    if not 0.0 <= crit_rate <= 1.0 or not 0.0 <= weak_rate <= 1.0:
+        raise ValueError("crit_rate และ weak_rate ต้องอยู่ในช่วง 0-1")
+    terms: dict[int, float] = {}
+    for value, probability in (
+        (damage.crit, crit_rate * (1 - weak_rate)),
+        (damage.crit_weak, crit_rate * weak_rate),
+        (damage.no_crit, (1 - crit_rate) * (1 - weak_rate)),
+        (damage.weak_only, (1 - crit_rate) * weak_rate),
+    ):
+        if probability > 0.0:
+            terms[value] = terms.get(value, 0.0) + probability
+    return tuple(sorted(terms.items()))
+
+
+def convolve(a: dict[int, float], b: dict[int, float], cap: int | None = None) -> dict[int, float]:
+    """การกระจายของผลรวม 2 ตัวแปรอิสระ ผลรวมที่ >= cap ถูกรวมไว้ที่ cap"""
+    out: dict[int, float] = {}
+    get = out.get
+    for x, p in a.items():
+        for y, q in b.items():
+            s = x + y
+            if cap is not None and s > cap:
+                s = cap
+            out[s] = get(s, 0.0) + p * q
+    return out
+
+
+def damage_distribution(
+    outcomes: Iterable[tuple[int, float]], hits: int, cap: int | None = None
+) -> dict[int, float]:
+    """
+    การกระจายของดาเมจรวม hits hit = กระจาย (sum p_i x^d_i)^hits ด้วย multinomial
+    (ไล่จำนวน hit ของแต่ละผลลัพธ์ ไม่ต้อง convolution ทีละ hit)
+    """
+    if hits < 0:
+        raise ValueError("hits ต้อง >= 0")
+    terms = list(outcomes)
+    if not terms:
+        return {0: 1.0}
+    log_fact = [lgamma(k + 1) for k in range(hits + 1)]
+
+    # state = (hit ที่เหลือ, ดาเมจสะสม, log ของโอกาสสะสม)
+    states = [(hits, 0, log_fact[hits])]
+    for i, (value, probability) in enumerate(terms):
+        log_p = log(probability)
+        if i == len(terms) - 1:
+            states = [
+                (0, dmg + rem * value, acc + rem * log_p - log_fact[rem])
+                for rem, dmg, acc in states
+            ]
+            break
+        states = [
+            (rem - c, dmg + c * value, acc + c * log_p - log_fact[c])
+            for rem, dmg, acc in states
+            for c in range(rem + 1)
+        ]
+
+    dist: dict[int, float] = {}
+    for _, dmg, acc in states:
+        if cap is not None and dmg > cap:
+            dmg = cap
+        dist[dmg] = dist.get(dmg, 0.0) + exp(acc)
+    return dist
+
+
+def _fold(dists: Sequence[dict[int, float]], cap: int) -> dict[int, float]:
+    total = {0: 1.0}
+    for dist in dists:
+        total = convolve(total, dist, cap)
+    return total
+
+
+def kill_probability(skills: Sequence[SkillHits], hp: int) -> float:
+    """โอกาสที่ดาเมจรวมของทุกสกิลใน rotation >= hp"""
+    if hp <= 0:
+        return 1.0
+    dists = [
+        damage_distribution(hit_outcomes(s.damage, s.crit_rate, s.weak_rate), s.hits, hp)
+        for s in skills
+    ]
+    if not dists:
+        return 0.0
+
+    # แบ่งสองครึ่งให้ขนาด state ใกล้กัน แล้วจับคู่: P = sum p(x) * P(right >= hp - x)
+    mid = len(dists) // 2
+    left = _fold(dists[:mid], hp)
+    right = _fold(dists[mid:], hp)
+    keys = sorted(right)
+    suffix = [0.0] * (len(keys) + 1)
+    for i in range(len(keys) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + right[keys[i]]
+
+    total = 0.0
+    for x, p in left.items():
+        total += p * suffix[bisect_left(keys, hp - x)]
+    return min(1.0, total)
+
+
+def expected_damage(skills: Sequence[SkillHits]) -> float:
+    """ดาเมจรวมเฉลี่ย (linearity of expectation)"""
+    return sum(
+        s.hits * sum(d * p for d, p in hit_outcomes(s.damage, s.crit_rate, s.weak_rate))
+        for s in skills
+    )
+
+
+def kill_odds(skills: Sequence[SkillHits], hp: int) -> KillOdds:
+    """รวมโอกาสฆ่าและดาเมจเฉลี่ยไว้ใน KillOdds"""
+    return KillOdds(
+        probability=kill_probability(skills, hp),
+        expected_damage=expected_damage(skills),
+        hp=hp,
+        hits=sum(s.hits for s in skills),
+        skills=tuple(s.name for s in skills),
+    )
+
+
+def exact_kill_character(
+    character: str,
+    skill: str | Sequence[str] | None = None,
+    user_config: dict[str, Any] | None = None,
+    monster_preset: dict[str, Any] | str | None = None,
+    weak_rate: float = 0.0,
+    crit_rate: float | None = None,
+) -> KillOdds:
+    """
+    โอกาสฆ่าของตัวละครจาก pipeline
+
+    Args:
+        skill: key ใน _skills, BOTH_SKILLS (= ทุกสกิลตามลำดับใน _skills),
+               ลำดับของ key (rotation) หรือ None = สกิลแรก
+        crit_rate: None = CRIT_RATE + Bonus_Crit_Rate ของแต่ละสกิล (get_crit_rate)
+        weak_rate: โอกาสติดจุดอ่อนต่อ hit (0-1)
+    แต่ละสกิลใช้ config ที่ merge กับสกิลนั้นเอง HP เป้าหมายมาจากสกิลแรก
+    (HP ของ monster preset ถ้ามี ไม่งั้นใช้ HP_Target)
+    """
+    if skill == BOTH_SKILLS:
+        meta, _ = load_character_full(character)
+        keys: Sequence[str | None] = list(meta.get("_skills", {})) or [None]
+    elif skill is None or isinstance(skill, str):
+        keys = [skill]
+    else:
+        keys = list(skill)
+
+    hp = None
+    rotation = []
+    for key in keys:
+        result = compute_damage(character, key, user_config, monster_preset)
+        if hp is None:
+            hp = result.monster_hp or int(result.hp_target)
+        rate = crit_rate
+        if rate is None:
+            rate = float(get_crit_rate(result.config) / Decimal("100"))
+        rotation.append(SkillHits(
+            HitDamage.from_result(result), result.skill_hits, rate, weak_rate, key or ""
+        ))
+    return kill_odds(rotation, hp or 0)
@@ -0,0 +1,216 @@
+"""
+7k Rebirth Damage Calculator - Float Fast-Path (เลือก backend ได้ตอน runtime)
+คำนวณ Final_DMG_HP + 4 scenario ของ build เดียว โดยไม่ต้องใช้ NumPy
+
+- backend "decimal" (ค่าเริ่มต้น): ใช้ damage_calc.py ตรงๆ
+- backend "float": คำนวณทั้ง chain ด้วย float แล้วตรวจทุกจุดที่ ROUNDDOWN
+  ถ้าค่าอยู่ใกล้จำนวนเต็มเกิน FLOAT_ROUNDDOWN_GUARD → คำนวณ build นั้นใหม่ด้วย Decimal
+  ผลลัพธ์ (int) จึงตรงกับ Decimal ทุกกรณี (ดู D007 ใน decisions.md)
+
+การใช้งาน:
+    from fast_calc import use_backend, calculate_scenarios
+    with use_backend("float"):
+        final_dmg_hp, (crit, crit_weak, no_crit, weak_only) = calculate_scenarios(config, atk_base)
+"""
+
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from decimal import Decimal
+
+from constants import CONFIG_DEFAULTS, DEF_MODIFIER, FLOAT_ROUNDDOWN_GUARD
+from damage_calc import (
+    NumericType,
+    calculate_total_atk,
+    calculate_dmg_hp,
+    calculate_cap_atk,
+    calculate_final_dmg_hp,
+    calculate_raw_matrix,
+    calculate_effective_def,
+    calculate_final_dmg,
+    to_decimal,
+)
+
+BACKEND_DECIMAL = "decimal"
+BACKEND_FLOAT = "float"
+BACKENDS = (BACKEND_DECIMAL, BACKEND_FLOAT)
+
+_backend = BACKEND_DECIMAL
+
+_DEF_MODIFIER = float(DEF_MODIFIER)
+
+# key ที่ใช้ในการคำนวณ 4 scenario (ลำดับนี้ใช้กับ float_scenarios)
+SCENARIO_INPUT_KEYS = (
+    "ATK_CHAR", "ATK_PET", "Formation", "Potential_PET", "BUFF_ATK", "BUFF_ATK_PET",
+    "SKILL_DMG", "CRIT_DMG", "WEAK_DMG", "DMG_AMP_BUFF", "DMG_AMP_DEBUFF", "DMG_Reduction",
+    "DEF_Target", "DEF_BUFF", "DEF_REDUCE", "Ignore_DEF",
+    "HP_Target", "Bonus_DMG_HP_Target", "Cap_ATK_Percent",
+)
+
+# ชื่อ scenario → index ในผลของ calculate_scenarios (crit, crit_weak, no_crit, weak_only)
+SCENARIO_INDEX = {"crit": 0, "crit_weak": 1, "no_crit": 2, "weak_only": 3}
+
+# ค่า default แปลงเป็น float ไว้ล่วงหน้า (ไม่ต้อง parse string ทุกครั้ง)
+_FLOAT_DEFAULTS = tuple(float(CONFIG_DEFAULTS[k]) for k in SCENARIO_INPUT_KEYS)
+
+
+# ============================================
+# Backend selection
+# ============================================
+
+def get_backend() -> str:
+    """backend ที่ใช้อยู่ ("decimal" หรือ "float")"""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """เลือก backend สำหรับ calculate_scenarios()"""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"ไม่รู้จัก backend '{name}' (มี: {', '.join(BACKENDS)})")
+    _backend = name
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[None]:
+    """เปลี่ยน backend ชั่วคราวภายใน with block"""
+    previous = get_backend()
+    set_backend(name)
+    try:
+        yield
+    finally:
+        set_backend(previous)
+
+
+# ============================================
+# Guarded ROUNDDOWN
+# ============================================
+
+def guarded_rounddown(value: float) -> int | None:
+    """
+    ROUNDDOWN ค่า float (ปัดเข้าหา 0 แบบเดียวกับ Decimal ROUND_DOWN)
+    Returns None ถ้าค่าใกล้จำนวนเต็มเกินไป (float อาจปัดผิด ให้ Decimal ตัดสิน)
+
+    0.0 พอดีถือว่าปลอดภัย: เกิดจากตัวคูณเป็น 0 ซึ่ง Decimal ก็ได้ 0 เหมือนกัน
+    """
+    if not math.isfinite(value):
+        return None
+    if value == 0.0:
+        return 0
+    frac = abs(value) % 1.0
+    tol = FLOAT_ROUNDDOWN_GUARD * max(1.0, abs(value))
+    if frac < tol or frac > 1.0 - tol:
+        return None
+    return math.trunc(value)
+
+
+def scenario_floats(values: Mapping[str, NumericType]) -> list[float]:
+    """ค่า float ตามลำดับ SCENARIO_INPUT_KEYS (key ที่ไม่มีใช้ CONFIG_DEFAULTS)"""
+    return [
+        float(values[k]) if k in values else default
+        for k, default in zip(SCENARIO_INPUT_KEYS, _FLOAT_DEFAULTS)
+    ]
+
+
+def scenario_row(values: Mapping[str, NumericType], atk_base: NumericType) -> dict[str, Decimal]:
+    """ค่า Decimal สำหรับ decimal_scenarios (key ที่ไม่มีใช้ CONFIG_DEFAULTS)"""
+    row = {k: to_decimal(values.get(k, CONFIG_DEFAULTS[k])) for k in SCENARIO_INPUT_KEYS}
+    row["ATK_BASE"] = to_decimal(atk_base)
+    return row
+
+
+def float_scenarios(values: Sequence[float], atk_base: float) -> tuple[int, tuple[int, ...]] | None:
+    """
+    คำนวณ Final_DMG_HP + 4 scenario ด้วย float (ลำดับเดียวกับ main.py)
+
+    Args:
+        values: ค่า float ตามลำดับ SCENARIO_INPUT_KEYS
+    Returns:
+        (final_dmg_hp, (crit, crit_weak, no_crit, weak_only)) หรือ None ถ้ามีจุดที่ต้องใช้ Decimal
+    """
+    (atk_char, atk_pet, formation, potential_pet, buff_atk, buff_atk_pet,
+     skill_dmg, crit_dmg, weak_dmg, dmg_amp_buff, dmg_amp_debuff, dmg_reduction,
+     def_target, def_buff, def_reduce, ignore_def,
+     hp_target, bonus_dmg_hp_target, cap_atk_percent) = values
+
+    # 1. Total ATK
+    formation_bonus = atk_base * (formation + potential_pet) / 100.0
+    total_atk = (atk_char + atk_pet + formation_bonus) * (1.0 + (buff_atk + buff_atk_pet) / 100.0)
+
+    # 2. HP-Based Damage
+    dmg_hp = hp_target * bonus_dmg_hp_target / 100.0
+    cap_atk = total_atk * cap_atk_percent / 100.0
+    if cap_atk > 0.0 and math.isclose(dmg_hp, cap_atk, rel_tol=FLOAT_ROUNDDOWN_GUARD):
+        return None  # ใกล้ cap มาก float อาจเลือกฝั่งผิด
+    final_dmg_hp = guarded_rounddown(cap_atk if dmg_hp > cap_atk and cap_atk > 0.0 else dmg_hp)
+    if final_dmg_hp is None:
+        return None
+
+    # 3. Effective DEF
+    def_mult = 1.0 + def_buff / 100.0 - def_reduce / 100.0
+    ignore_mult = 1.0 - ignore_def / 100.0
+    effective_def = 1.0 + (_DEF_MODIFIER * def_target * def_mult * ignore_mult)
+    if effective_def == 0.0:
+        return None  # ให้ Decimal raise แบบเดิม
+
+    # 4. RAW → Final (4 scenario)
+    amp_mult = (1.0 + dmg_amp_buff / 100.0) * (1.0 + (dmg_amp_debuff - dmg_reduction) / 100.0)
+    base = total_atk * (skill_dmg / 100.0) + final_dmg_hp
+    total_weak_mult = 1.0 + (30.0 + weak_dmg) / 100.0
+    finals = []
+    for crit_mult, weak_mult in (
+        (crit_dmg / 100.0, 1.0),
+        (crit_dmg / 100.0, total_weak_mult),
+        (1.0, 1.0),
+        (1.0, total_weak_mult),
+    ):
+        final = guarded_rounddown(base * crit_mult * weak_mult * amp_mult / effective_def)
+        if final is None:
+            return None
+        finals.append(final)
+    return final_dmg_hp, tuple(finals)
+
+
+def decimal_scenarios(row: Mapping[str, Decimal]) -> tuple[Decimal, tuple[int, ...]]:
+    """คำนวณ Final_DMG_HP และ 4 scenario ของ build เดียวด้วย Decimal (ลำดับเดียวกับ main.py)"""
+    total_atk = calculate_total_atk(
+        row["ATK_CHAR"], row["ATK_PET"], row["ATK_BASE"],
+        row["Formation"], row["Potential_PET"],
+        row["BUFF_ATK"], row["BUFF_ATK_PET"]
+    )
+    dmg_hp = calculate_dmg_hp(row["HP_Target"], row["Bonus_DMG_HP_Target"])
+    cap_atk = calculate_cap_atk(total_atk, row["Cap_ATK_Percent"])
+    final_dmg_hp = calculate_final_dmg_hp(dmg_hp, cap_atk)
+    effective_def = calculate_effective_def(
+        row["DEF_Target"], row["DEF_BUFF"], row["DEF_REDUCE"], row["Ignore_DEF"]
+    )
+    # ลำดับของ values (crit x weak) = crit, crit_weak, no_crit, weak_only (SCENARIO_INDEX)
+    raw = calculate_raw_matrix(
+        total_atk, (row["SKILL_DMG"],), (row["CRIT_DMG"], Decimal("100")),
+        (Decimal("0"), Decimal("30") + row["WEAK_DMG"]),
+        row["DMG_AMP_BUFF"], row["DMG_AMP_DEBUFF"], row["DMG_Reduction"], (final_dmg_hp,)
+    )
+    finals = tuple(calculate_final_dmg(value, effective_def) for value in raw.values)
+    return final_dmg_hp, finals
+
+
+def calculate_scenarios(
+    values: Mapping[str, NumericType],
+    atk_base: NumericType
+) -> tuple[int, tuple[int, ...]]:
+    """
+    คำนวณ Final_DMG_HP และ Final Damage ต่อ hit ทั้ง 4 scenario ตาม backend ที่เลือก
+
+    Args:
+        values: config ที่ merge แล้ว (key ที่ไม่มีใช้ CONFIG_DEFAULTS แบบเดียวกับ main.py)
+        atk_base: ATK_BASE ของตัวละคร
+    Returns:
+        (final_dmg_hp, (crit, crit_weak, no_crit, weak_only))
+    """
+    if _backend == BACKEND_FLOAT:
+        fast = float_scenarios(scenario_floats(values), float(atk_base))
+        if fast is not None:
+            return fast
+
+    final_dmg_hp, finals = decimal_scenarios(scenario_row(values, atk_base))
+    return int(final_dmg_hp), finals
@@ -0,0 +1,266 @@
+"""
+Gear Optimizer - หาการจัดสเตตัส ATK_CHAR / CRIT_DMG + ชุดเซ็ทอาวุธ ที่ดีที่สุด (headless)
+
+ค้นหาแบบ branch-and-bound แทนการลองทุกจุด:
+- ดาเมจ (และโอกาสฆ่า) ไม่ลดลงเมื่อ ATK_CHAR หรือ CRIT_DMG เพิ่ม (monotonic)
+- ถ้ามีงบ (max_points) จุดที่ดีที่สุดต้องอยู่บนขอบงบ: ต่อ ATK_CHAR หนึ่งค่า ใช้ CRIT_DMG สูงสุดที่งบพอ
+- ช่วงของจุดบนขอบงบ [lo, hi] มี upper bound = ค่าที่ (ATK สูงสุดในช่วง, CRIT สูงสุดในช่วง)
+  ค้นแบบ best-first: ช่วงแรกที่เหลือจุดเดียวตอนถูกดึงออกจาก heap คือคำตอบ
+จึงประเมินแค่ O(log n) จุดต่อชุดเซ็ทอาวุธ แม้ space จะมีเป็นล้านจุด
+
+หมายเหตุ: ใช้สูตร 4 กรณีปกติ (ไม่รวม special logic ของตัวละครใน character_registry)
+"""
+
+import heapq
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from constants import get_atk_base
+from config_loader import get_crit_rate
+from equipment import get_weapon_sets
+from fast_calc import BACKEND_FLOAT, SCENARIO_INDEX, calculate_scenarios, use_backend
+from pipeline import prepare_config
+
+OBJECTIVE_DAMAGE = "damage"
+OBJECTIVE_KILL = "kill_probability"
+OBJECTIVES = (OBJECTIVE_DAMAGE, OBJECTIVE_KILL)
+
+# ชุดเซ็ทอาวุธที่ค้นหา: ทุกชุดที่มี effect ใน equipment/weapon_sets.json
+WEAPON_SETS = tuple(weapon_set.id for weapon_set in get_weapon_sets().values() if weapon_set.effects)
+
+
+@dataclass(frozen=True, slots=True)
+class StatRange:
+    """ช่วงค่าสเตตัสที่ค้นหา: start, start + step, ..., <= stop"""
+    start: int
+    stop: int
+    step: int = 1
+
+    def values(self) -> range:
+        if self.step <= 0:
+            raise ValueError("step ต้องมากกว่า 0")
+        return range(self.start, self.stop + 1, self.step)
+
+
+@dataclass(frozen=True, slots=True)
+class GearBudget:
+    """
+    space ของการค้นหา
+    max_points: งบรวม (None = ไม่จำกัด) โดยใช้แต้ม
+        (ATK_CHAR - atk_char.start) * atk_cost + (CRIT_DMG - crit_dmg.start) * crit_cost
+    """
+    atk_char: StatRange
+    crit_dmg: StatRange
+    max_points: float | None = None
+    atk_cost: float = 1.0
+    crit_cost: float = 1.0
+    weapon_sets: tuple[int, ...] = WEAPON_SETS
+
+    def points(self, atk_char: int, crit_dmg: int) -> float:
+        """แต้มที่ใช้สำหรับการจัดสเตตัสนี้"""
+        return (atk_char - self.atk_char.start) * self.atk_cost + (crit_dmg - self.crit_dmg.start) * self.crit_cost
+
+    def space_size(self) -> int:
+        """จำนวนจุดทั้งหมดใน space (รวมจุดที่เกินงบ)"""
+        return len(self.atk_char.values()) * len(self.crit_dmg.values()) * len(self.weapon_sets)
+
+
+@dataclass(frozen=True, slots=True)
+class GearCandidate:
+    """ผลของการจัดสเตตัสหนึ่งแบบ"""
+    weapon_set: int
+    atk_char: int
+    crit_dmg: int
+    score: float
+    damage: int  # ดาเมจรวมทุก hit ของ scenario ที่เลือก
+    kill_probability: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OptimizeResult:
+    """ผลการค้นหาทั้งหมด"""
+    best: GearCandidate | None
+    per_weapon_set: tuple[GearCandidate, ...]
+    evaluated: int
+    space_size: int
+    objective: str
+
+
+def kill_probability(
+    hits: int, crit_rate: float, dmg_crit: int, dmg_normal: int, hp: int
+) -> float:
+    """
+    โอกาสฆ่ามอนใน 1 สกิล: แต่ละ hit ติดคริอิสระกันด้วยโอกาส crit_rate (0-1)
+    ต้องติดคริอย่างน้อย k ครั้ง โดย k * dmg_crit + (hits - k) * dmg_normal >= hp
+    """
+    if hp <= 0:
+        return 1.0
+    for k in range(hits + 1):
+        if k * dmg_crit + (hits - k) * dmg_normal >= hp:
+            return sum(
+                math.comb(hits, i) * crit_rate ** i * (1.0 - crit_rate) ** (hits - i)
+                for i in range(k, hits + 1)
+            )
+    return 0.0
+
+
+def _frontier(budget: GearBudget) -> list[tuple[int, int]]:
+    """
+    จุดที่ไม่ถูก dominate: ต่อ ATK_CHAR หนึ่งค่า ใช้ CRIT_DMG สูงสุดที่งบพอ
+    (CRIT_DMG บนขอบงบไม่เพิ่มขึ้นเมื่อ ATK_CHAR เพิ่ม)
+    """
+    crit_values = budget.crit_dmg.values()
+    if budget.max_points is None:
+        return [(a, crit_values[-1]) for a in budget.atk_char.values()] if crit_values else []
+
+    frontier = []
+    for atk in budget.atk_char.values():
+        left = budget.max_points - (atk - budget.atk_char.start) * budget.atk_cost
+        if left < 0:
+            break
+        if budget.crit_cost <= 0:
+            crit = crit_values[-1]
+        else:
+            steps = min(int(left // (budget.crit_cost * budget.crit_dmg.step)), len(crit_values) - 1)
+            crit = crit_values[steps]
+            # กันปัดเศษ float: ถอยจนกว่างบจะพอ
+            while steps > 0 and budget.points(atk, crit) > budget.max_points:
+                steps -= 1
+                crit = crit_values[steps]
+        if budget.points(atk, crit) <= budget.max_points:
+            frontier.append((atk, crit))
+    return frontier
+
+
+def optimize_gear(
+    char_meta: dict[str, Any],
+    char_config: dict[str, Any],
+    skill_config: dict[str, Any],
+    user_config: dict[str, Any],
+    budget: GearBudget,
+    objective: str = OBJECTIVE_DAMAGE,
+    scenario: str = "crit_weak",
+    monster_preset: dict[str, Any] | None = None,
+) -> OptimizeResult:
+    """
+    หา ATK_CHAR / CRIT_DMG / Weapon_Set ที่ให้ค่า objective สูงสุด
+
+    Args:
+        objective: "damage" = ดาเมจรวมของ scenario ที่เลือก
+                   "kill_probability" = โอกาสฆ่ามอน (HP_Target) ใน 1 สกิล
+                   โดยคริตามอัตรา CRIT_RATE + Bonus_Crit_Rate
+        scenario: สำหรับ "damage": crit / crit_weak / no_crit / weak_only
+                  สำหรับ "kill_probability": "crit_weak" / "weak_only" = ตีติดจุดอ่อน, อื่นๆ = ไม่ติด
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"ไม่รู้จัก objective '{objective}' (มี: {', '.join(OBJECTIVES)})")
+    if scenario not in SCENARIO_INDEX:
+        raise ValueError(f"ไม่รู้จัก scenario '{scenario}' (มี: {', '.join(SCENARIO_INDEX)})")
+
+    atk_base = get_atk_base(char_meta.get("_rarity", "legend"), char_meta.get("_class", "magic"))
+    frontier = _frontier(budget)
+    evaluated = 0
+    per_set: list[GearCandidate] = []
+
+    with use_backend(BACKEND_FLOAT):
+        for weapon_set in budget.weapon_sets:
+            evaluate = _make_evaluator(
+                char_config, skill_config, user_config, monster_preset,
+                weapon_set, atk_base, objective, scenario
+            )
+            best, count = _best_first(frontier, evaluate)
+            evaluated += count
+            if best is not None:
+                per_set.append(best)
+
+    # เท่ากัน → เลือกชุดแรกตามลำดับ weapon_sets
+    overall = max(per_set, key=_rank, default=None)
+    return OptimizeResult(
+        best=overall,
+        per_weapon_set=tuple(per_set),
+        evaluated=evaluated,
+        space_size=budget.space_size(),
+        objective=objective,
+    )
+
+
+def _make_evaluator(
+    char_config: dict[str, Any],
+    skill_config: dict[str, Any],
+    user_config: dict[str, Any],
+    monster_preset: dict[str, Any] | None,
+    weapon_set: int,
+    atk_base: Decimal,
+    objective: str,
+    scenario: str,
+) -> Callable[[int, int], GearCandidate]:
+    """สร้างฟังก์ชันประเมิน (ATK_CHAR, CRIT_DMG) → GearCandidate สำหรับชุดเซ็ทอาวุธหนึ่งชุด"""
+    base_user = dict(user_config)
+    base_user["Weapon_Set"] = weapon_set
+    _, merged = prepare_config(char_config, skill_config, base_user, monster_preset)
+
+    hits = int(merged.get("SKILL_HITS", 1))
+    crit_rate = float(get_crit_rate(merged)) / 100.0
+    hp = int(float(merged.get("HP_Target", 0)))
+    weak = scenario in ("crit_weak", "weak_only")
+    index = SCENARIO_INDEX[scenario]
+
+    def evaluate(atk_char: int, crit_dmg: int) -> GearCandidate:
+        # merge ใหม่ทุกจุด: CRIT_DMG เป็น additive key ผลจึงตรงกับ pipeline ทุกบิต
+        user = dict(base_user)
+        user["ATK_CHAR"] = atk_char
+        user["CRIT_DMG"] = crit_dmg
+        _, config = prepare_config(char_config, skill_config, user, monster_preset)
+        _, finals = calculate_scenarios(config, atk_base)
+        if objective == OBJECTIVE_DAMAGE:
+            damage = finals[index] * hits
+            return GearCandidate(weapon_set, atk_char, crit_dmg, float(damage), damage)
+        dmg_crit, dmg_normal = (finals[1], finals[3]) if weak else (finals[0], finals[2])
+        probability = kill_probability(hits, crit_rate, dmg_crit, dmg_normal, hp)
+        return GearCandidate(weapon_set, atk_char, crit_dmg, probability, dmg_crit * hits, probability)
+
+    return evaluate
+
+
+def _rank(candidate: GearCandidate) -> tuple[float, int]:
+    """ลำดับการเปรียบเทียบ: score ก่อน แล้วดาเมจ (เช่น โอกาสฆ่า 100% เท่ากัน → เลือกดาเมจสูงกว่า)"""
+    return candidate.score, candidate.damage
+
+
+def _best_first(
+    frontier: list[tuple[int, int]],
+    evaluate: Callable[[int, int], GearCandidate],
+) -> tuple[GearCandidate | None, int]:
+    """
+    Best-first branch-and-bound บนจุดของขอบงบ
+    ช่วง [lo, hi]: ATK สูงสุดอยู่ที่ hi, CRIT สูงสุดอยู่ที่ lo → bound = evaluate(atk[hi], crit[lo])
+    Returns: (จุดที่ดีที่สุด, จำนวนครั้งที่ประเมิน)
+    """
+    if not frontier:
+        return None, 0
+
+    cache: dict[tuple[int, int], GearCandidate] = {}
+
+    def bound(lo: int, hi: int) -> GearCandidate:
+        key = (frontier[hi][0], frontier[lo][1])
+        if key not in cache:
+            cache[key] = evaluate(*key)
+        return cache[key]
+
+    def key(lo: int, hi: int) -> tuple[float, int, int, int]:
+        score, damage = _rank(bound(lo, hi))
+        return -score, -damage, lo, hi
+
+    heap = [key(0, len(frontier) - 1)]
+    while heap:
+        _, _, lo, hi = heapq.heappop(heap)
+        if lo == hi:
+            # bound ของจุดเดียว = ค่าจริง และมากกว่าหรือเท่ากับทุกช่วงที่เหลือ
+            return bound(lo, hi), len(cache)
+        mid = (lo + hi) // 2
+        heapq.heappush(heap, key(lo, mid))
+        heapq.heappush(heap, key(mid + 1, hi))
+    return None, len(cache)
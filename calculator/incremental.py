@@ -0,0 +1,224 @@
+"""
+Incremental - pipeline ปกติในรูป dependency graph เล็กๆ: แก้ค่าเดียว คำนวณใหม่เฉพาะ node ที่ขึ้นกับค่านั้น
+
+input (ค่าหลัง merge ตาม SCENARIO_INPUT_KEYS + ATK_BASE) → node ตามลำดับใน NODES:
+    total_atk     ← ATK_CHAR, ATK_PET, ATK_BASE, Formation, Potential_PET, BUFF_ATK, BUFF_ATK_PET
+    dmg_hp        ← HP_Target, Bonus_DMG_HP_Target
+    cap_atk       ← total_atk, Cap_ATK_Percent
+    final_dmg_hp  ← dmg_hp, cap_atk
+    raw           ← total_atk, SKILL_DMG, CRIT_DMG, WEAK_DMG, DMG_AMP_BUFF, DMG_AMP_DEBUFF, DMG_Reduction, final_dmg_hp
+    effective_def ← DEF_Target, DEF_BUFF, DEF_REDUCE, Ignore_DEF
+    final_dmg     ← raw, effective_def
+SKILL_HITS เป็น input ที่ไม่มี node ขึ้นกับมัน (user / preset ทับค่าสกิลเหมือน merge_configs) → DamageGraph.skill_hits
+
+- update({"CRIT_DMG": 200}) merge ใหม่เฉพาะ key ที่แก้ (Weapon_Set → key ที่ชุดเซ็ทเก่า/ใหม่บวกให้)
+  แล้วคำนวณเฉพาะ node ปลายทาง ถ้า node ได้ค่าเดิม (ทุกหลัก) จะไม่ส่งต่อ (เช่น final_dmg_hp ติด Cap เท่าเดิม)
+- ฟังก์ชันของแต่ละ node คือสูตรเดียวกับ run_pipeline (damage_calc) ผลจึงตรงกับ compute_damage ทุกบิต (D001)
+- ค่าที่ผิด (เช่น ตัวเลขพิมพ์ไม่จบ) → ValueError โดย state ไม่เปลี่ยน เหมาะกับเครื่องมือที่คำนวณทุกครั้งที่กดแป้น
+
+หมายเหตุ: ให้ผล 4 scenario ปกติ (ไม่รวม special logic ของตัวละครใน character_registry)
+
+การใช้งาน:
+    from incremental import DamageGraph
+    graph = DamageGraph("miho", "skill2", user_config, monster_preset)
+    graph.update({"CRIT_DMG": 210})   # → frozenset({"raw", "final_dmg"})
+    print(graph.final_dmg, graph["total_atk"])
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from character_db import CharacterDB
+from damage_calc import (
+    calculate_cap_atk,
+    calculate_dmg_hp,
+    calculate_effective_def,
+    calculate_final_dmg,
+    calculate_final_dmg_hp,
+    calculate_raw_matrix,
+    calculate_total_atk,
+    to_decimal,
+)
+from equipment import weapon_set_effects
+from fast_calc import SCENARIO_INPUT_KEYS
+from specs import SkillSpec
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    """ค่าที่คำนวณจาก deps (ชื่อ input หรือ node ก่อนหน้า) ด้วย fn(*deps)"""
+    name: str
+    deps: tuple[str, ...]
+    fn: Callable[..., Any]
+
+
+def _raw(total_atk, skill_dmg, crit_dmg, weak_dmg, dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp):
+    """RAW 4 scenario ตามลำดับ SCENARIO_INDEX (เหมือน run_pipeline ขั้นที่ 3)"""
+    raw = calculate_raw_matrix(
+        total_atk, (skill_dmg,), (crit_dmg, Decimal("100")), (Decimal("0"), Decimal("30") + weak_dmg),
+        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, (final_dmg_hp,)
+    )
+    return raw[0, 0, 0, 0], raw[0, 0, 1, 0], raw[0, 1, 0, 0], raw[0, 1, 1, 0]
+
+
+def _final_dmg(raw: tuple[Decimal, ...], effective_def: Decimal) -> tuple[int, ...]:
+    return tuple(calculate_final_dmg(value, effective_def) for value in raw)
+
+
+# เรียงแบบ topological (deps ของ node มาก่อนเสมอ)
+NODES: tuple[Node, ...] = (
+    Node("total_atk", ("ATK_CHAR", "ATK_PET", "ATK_BASE", "Formation", "Potential_PET", "BUFF_ATK", "BUFF_ATK_PET"),
+         calculate_total_atk),
+    Node("dmg_hp", ("HP_Target", "Bonus_DMG_HP_Target"), calculate_dmg_hp),
+    Node("cap_atk", ("total_atk", "Cap_ATK_Percent"), calculate_cap_atk),
+    Node("final_dmg_hp", ("dmg_hp", "cap_atk"), calculate_final_dmg_hp),
+    Node("raw", ("total_atk", "SKILL_DMG", "CRIT_DMG", "WEAK_DMG", "DMG_AMP_BUFF", "DMG_AMP_DEBUFF",
+                 "DMG_Reduction", "final_dmg_hp"), _raw),
+    Node("effective_def", ("DEF_Target", "DEF_BUFF", "DEF_REDUCE", "Ignore_DEF"), calculate_effective_def),
+    Node("final_dmg", ("raw", "effective_def"), _final_dmg),
+)
+
+def downstream(changed: set[str] | frozenset[str]) -> tuple[str, ...]:
+    """node ทั้งหมดที่ขึ้นกับ input / node ใน changed (ตามลำดับ NODES)"""
+    dirty = set(changed)
+    names = []
+    for node in NODES:
+        if dirty.intersection(node.deps):
+            dirty.add(node.name)
+            names.append(node.name)
+    return tuple(names)
+
+
+# input ทั้งหมดของ graph (SKILL_HITS ใช้คูณดาเมจต่อ hit ภายนอก graph เช่น margin ใน watch.py)
+INPUT_KEYS = (*SCENARIO_INPUT_KEYS, "SKILL_HITS")
+
+
+def _same(a: Any, b: Any) -> bool:
+    # ทุกหลัก: Decimal("1") กับ Decimal("1.0") นับว่าต่างกัน (str ของค่ากลางต้องตรงกับ pipeline)
+    return repr(a) == repr(b)
+
+
+class DamageGraph:
+    """
+    ค่าทุก node ของ (ตัวละคร, สกิล, user config, monster preset) ที่แก้ทีละค่าได้
+
+    Args:
+        skill: key ใน _skills (None = สกิลแรก, ไม่รองรับ "both")
+        monster_preset: ค่าที่ทับ user config (เหมือน prepare_config)
+    """
+
+    def __init__(
+        self,
+        character: str,
+        skill: str | None = None,
+        user_config: Mapping[str, Any] | None = None,
+        monster_preset: Mapping[str, Any] | None = None,
+        db: CharacterDB | None = None,
+    ) -> None:
+        self.spec = SkillSpec.load(character, skill, db)
+        self._rules = dict(zip(SCENARIO_INPUT_KEYS, self.spec.rules))
+        self._user: dict[str, Any] = dict(user_config or {})
+        self._preset: dict[str, Any] = dict(monster_preset or {})
+        self._values: dict[str, Any] = {"ATK_BASE": self.spec.atk_base}
+        self._values.update(self._merge(self._user, self._preset, INPUT_KEYS))
+        for node in NODES:
+            self._values[node.name] = node.fn(*(self._values[dep] for dep in node.deps))
+        self.evaluations = {node.name: 1 for node in NODES}
+
+    @property
+    def user_config(self) -> dict[str, Any]:
+        return dict(self._user)
+
+    @property
+    def final_dmg(self) -> tuple[int, ...]:
+        """ดาเมจต่อ hit 4 scenario ตามลำดับ SCENARIO_INDEX"""
+        return self._values["final_dmg"]
+
+    @property
+    def skill_hits(self) -> int:
+        """SKILL_HITS หลัง merge (ค่าผู้ใช้ / preset ทับค่าสกิล)"""
+        return self._values["SKILL_HITS"]
+
+    def __getitem__(self, name: str) -> Any:
+        """ค่าของ node หรือ input หลัง merge"""
+        return self._values[name]
+
+    def values(self) -> dict[str, Any]:
+        """ค่าทุก input + node"""
+        return dict(self._values)
+
+    def _merge(self, user: Mapping[str, Any], preset: Mapping[str, Any], keys: Iterable[str]) -> dict[str, Any]:
+        """input หลัง merge ของ keys: user ทับด้วย preset → ชุดเซ็ทอาวุธ → MergeRule ของตัวละคร + สกิล"""
+        source = {**user, **preset}
+        try:
+            effects = dict(weapon_set_effects(int(source.get("Weapon_Set", 0))).effects)
+        except (TypeError, ValueError):
+            raise ValueError(f"Weapon_Set ต้องเป็นจำนวนเต็ม (ได้ {source.get('Weapon_Set')!r})") from None
+        merged: dict[str, Any] = {}
+        for key in keys:
+            u = source.get(key)
+            if key == "SKILL_HITS":
+                try:
+                    merged[key] = self.spec.skill_hits if u is None else int(u)
+                except (TypeError, ValueError):
+                    raise ValueError(f"SKILL_HITS ต้องเป็นจำนวนเต็ม (ได้ {u!r})") from None
+                continue
+            try:
+                if key in effects:
+                    u = float(0 if u is None else u) + effects[key]
+                merged[key] = to_decimal(self._rules[key](u))
+            except (TypeError, ValueError, InvalidOperation):
+                raise ValueError(f"{key} ต้องเป็นตัวเลข (ได้ {source.get(key)!r})") from None
+        return merged
+
+    def _touched(
+        self, old_source: Mapping[str, Any], new_source: Mapping[str, Any], keys: Iterable[str]
+    ) -> set[str]:
+        """input ที่อาจเปลี่ยนเมื่อแก้ keys (Weapon_Set → key ของชุดเซ็ทเก่าและใหม่)"""
+        touched = set(keys)
+        if "Weapon_Set" in touched:
+            for source in (old_source, new_source):
+                try:
+                    touched.update(dict(weapon_set_effects(int(source.get("Weapon_Set", 0))).effects))
+                except (TypeError, ValueError):
+                    pass
+        return touched.intersection(INPUT_KEYS)
+
+    def _apply(self, user: dict[str, Any], preset: dict[str, Any], keys: Iterable[str]) -> frozenset[str]:
+        touched = self._touched({**self._user, **self._preset}, {**user, **preset}, keys)
+        merged = self._merge(user, preset, touched)  # ValueError → state ไม่เปลี่ยน
+        self._user, self._preset = user, preset
+
+        changed = {key for key, value in merged.items() if not _same(value, self._values[key])}
+        self._values.update(merged)
+        recomputed = []
+        for node in NODES:
+            if not changed.intersection(node.deps):
+                continue
+            value = node.fn(*(self._values[dep] for dep in node.deps))
+            recomputed.append(node.name)
+            self.evaluations[node.name] += 1
+            if not _same(value, self._values[node.name]):
+                self._values[node.name] = value
+                changed.add(node.name)
+        return frozenset(recomputed)
+
+    def update(self, changes: Mapping[str, Any]) -> frozenset[str]:
+        """
+        แก้ค่าใน user config (None = ลบ key) แล้วคำนวณใหม่เฉพาะส่วนที่ขึ้นกับค่านั้น
+        Returns: ชื่อ node ที่ถูกคำนวณใหม่
+        """
+        user = dict(self._user)
+        for key, value in changes.items():
+            if value is None:
+                user.pop(key, None)
+            else:
+                user[key] = value
+        return self._apply(user, self._preset, changes.keys())
+
+    def set_preset(self, monster_preset: Mapping[str, Any] | None) -> frozenset[str]:
+        """เปลี่ยน monster preset (None = ไม่มี) → ชื่อ node ที่ถูกคำนวณใหม่"""
+        preset = dict(monster_preset or {})
+        return self._apply(self._user, preset, self._preset.keys() | preset.keys())
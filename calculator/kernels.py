@@ -0,0 +1,165 @@
+"""
+Damage Kernels - คอมไพล์ (ตัวละคร, สกิล, ชุดเซ็ทอาวุธ) เป็นฟังก์ชันคำนวณเฉพาะตัว (headless)
+
+ตอนคอมไพล์:
+- อ่านค่าคงที่ของตัวละคร + สกิล (SKILL_DMG, SKILL_HITS, Ignore_DEF, Bonus_DMG_HP_Target,
+  Cap_ATK_Percent, ...) จาก CharacterDB ครั้งเดียว
+- จำลอง apply_weapon_set + merge_configs ต่อ key ล่วงหน้าด้วย specs.MergeRule (ลำดับการบวก float เหมือนเดิม)
+- ค่าที่ไม่เปลี่ยน (ค่าสกิล, monster preset, ATK_BASE) ถูกพับเป็นค่าคงที่
+
+ตอนเรียก: รับแค่สเตตัสที่เปลี่ยนได้ (ตามลำดับ kernel.variables) ไม่มี merge_configs / get_decimal
+คำนวณด้วย float_scenarios + Decimal fallback ผลจึงตรงกับ pipeline ทุกกรณี (D007)
+
+หมายเหตุ: ให้ผล 4 scenario ปกติ (ไม่รวม special logic ของตัวละครใน character_registry)
+
+การใช้งาน:
+    from kernels import compile_kernel
+    kernel = compile_kernel("miho", "skill2", weapon_set=3, monster_preset="castle_room1.json")
+    final_dmg_hp, (crit, crit_weak, no_crit, weak_only) = kernel(3773, 564, ...)  # ตาม kernel.variables
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from decimal import Decimal
+from typing import Any
+
+from constants import get_atk_base
+from character_db import CharacterDB, get_character_db
+from damage_calc import NumericType, to_decimal
+from equipment import weapon_set_effects
+from fast_calc import SCENARIO_INPUT_KEYS, decimal_scenarios, float_scenarios
+from pipeline import BOTH_SKILLS, resolve_skill
+from specs import KernelOutput, MergeRule
+
+# ค่าที่มาจากสกิลเท่านั้น ไม่เป็น variable โดยปริยาย
+SKILL_CONSTANT_KEYS = ("SKILL_DMG", "Bonus_DMG_HP_Target", "Cap_ATK_Percent")
+
+# สเตตัสที่ผู้ใช้เปลี่ยนได้ (ค่าเริ่มต้นของ variables)
+DEFAULT_VARIABLES = tuple(k for k in SCENARIO_INPUT_KEYS if k not in SKILL_CONSTANT_KEYS)
+
+
+def _weapon_set_offsets(weapon_set: int) -> dict[str, float]:
+    """ค่าที่ apply_weapon_set บวกเพิ่มให้แต่ละ key"""
+    return weapon_set_effects(weapon_set).as_dict()
+
+
+class DamageKernel:
+    """
+    ฟังก์ชันคำนวณที่คอมไพล์แล้วสำหรับ (ตัวละคร, สกิล, ชุดเซ็ทอาวุธ)
+    เรียก kernel(*values) ตามลำดับ variables → (final_dmg_hp, (crit, crit_weak, no_crit, weak_only))
+    """
+
+    __slots__ = (
+        "character", "skill", "weapon_set", "atk_base", "skill_hits", "variables",
+        "_atk_base_float", "_raw", "_floats", "_slots",
+    )
+
+    def __init__(
+        self,
+        character: str,
+        skill: str | None,
+        weapon_set: int,
+        atk_base: Decimal,
+        skill_hits: int,
+        variables: tuple[str, ...],
+        fixed: Sequence[Any],
+        slots: Sequence[tuple[int, Callable[[Any], Any]]],
+    ) -> None:
+        self.character = character
+        self.skill = skill
+        self.weapon_set = weapon_set
+        self.atk_base = atk_base
+        self.skill_hits = skill_hits
+        self.variables = variables
+        self._atk_base_float = float(atk_base)
+        self._raw = list(fixed)
+        self._floats = [float(v) for v in fixed]
+        self._slots = tuple(slots)
+
+    def __call__(self, *values: NumericType | None) -> KernelOutput:
+        if len(values) != len(self._slots):
+            raise TypeError(f"ต้องส่ง {len(self._slots)} ค่า ตามลำดับ {', '.join(self.variables)}")
+        raw = self._raw.copy()
+        floats = self._floats.copy()
+        for (position, merged), value in zip(self._slots, values):
+            value = merged(value)
+            raw[position] = value
+            floats[position] = float(value)
+
+        fast = float_scenarios(floats, self._atk_base_float)
+        if fast is not None:
+            return fast
+        row = {k: to_decimal(v) for k, v in zip(SCENARIO_INPUT_KEYS, raw)}
+        row["ATK_BASE"] = self.atk_base
+        final_dmg_hp, finals = decimal_scenarios(row)
+        return int(final_dmg_hp), finals
+
+    def evaluate(self, stats: Mapping[str, NumericType]) -> KernelOutput:
+        """เรียกด้วย dict (อ่านเฉพาะ key ใน variables, key ที่ไม่มี = ผู้ใช้ไม่ได้กรอก)"""
+        return self(*(stats.get(k) for k in self.variables))
+
+    def __repr__(self) -> str:
+        return f"DamageKernel({self.character!r}, {self.skill!r}, weapon_set={self.weapon_set})"
+
+
+def compile_kernel(
+    character: str,
+    skill: str | None = None,
+    weapon_set: int = 0,
+    *,
+    monster_preset: Mapping[str, Any] | str | None = None,
+    base_user: Mapping[str, Any] | None = None,
+    variables: Sequence[str] | None = None,
+    db: CharacterDB | None = None,
+) -> DamageKernel:
+    """
+    คอมไพล์ kernel สำหรับตัวละคร + สกิล + ชุดเซ็ทอาวุธ
+
+    Args:
+        skill: key ใน _skills (None = สกิลแรก, ไม่รองรับ BOTH_SKILLS)
+        monster_preset: dict หรือชื่อไฟล์ preset - key ของ preset กลายเป็นค่าคงที่
+        base_user: ค่าผู้ใช้ของ key ที่ไม่ใช่ variable (ค่าคงที่) - SKILL_HITS ในนี้ / ใน preset ทับค่าสกิล
+                   เหมือน merge_configs
+        variables: key ที่ส่งตอนเรียก (ค่าเริ่มต้น: DEFAULT_VARIABLES ที่ไม่อยู่ใน preset)
+    """
+    db = db or get_character_db()
+    entry = db.get(character)
+    if skill == BOTH_SKILLS:
+        raise ValueError("kernel รองรับทีละสกิล (ใช้ compile_kernel แยกแต่ละสกิล)")
+    skill_config, _, _ = resolve_skill(entry.meta, skill)
+
+    if isinstance(monster_preset, str):
+        monster_preset = db.monster(monster_preset).preset
+    fixed_user = dict(base_user or {})
+    fixed_user.update(monster_preset or {})
+
+    if variables is None:
+        variables = tuple(k for k in DEFAULT_VARIABLES if k not in (monster_preset or {}))
+    unknown = [k for k in variables if k not in SCENARIO_INPUT_KEYS]
+    if unknown:
+        raise ValueError(f"ไม่รู้จัก variable: {', '.join(unknown)} (มี: {', '.join(SCENARIO_INPUT_KEYS)})")
+
+    combined = dict(entry.config)
+    combined.update(skill_config)
+    offsets = _weapon_set_offsets(weapon_set)
+
+    fixed = []
+    slots = []
+    for position, key in enumerate(SCENARIO_INPUT_KEYS):
+        merged = MergeRule.compile(key, combined, offsets.get(key))
+        if key in variables:
+            slots.append((variables.index(key), position, merged))
+            fixed.append(merged(None))  # placeholder (ถูกแทนตอนเรียก)
+        else:
+            fixed.append(merged(fixed_user.get(key)))
+    slots.sort()
+
+    return DamageKernel(
+        character=character,
+        skill=skill,
+        weapon_set=weapon_set,
+        atk_base=get_atk_base(entry.rarity, entry.char_class),
+        skill_hits=int(fixed_user.get("SKILL_HITS", combined.get("SKILL_HITS", 1))),
+        variables=tuple(variables),
+        fixed=fixed,
+        slots=[(position, merged) for _, position, merged in slots],
+    )
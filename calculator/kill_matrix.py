@@ -0,0 +1,212 @@
+"""
+Kill Matrix - ตัวละคร 1 ตัว x ทุกสกิล x ทุก monster preset ในครั้งเดียว (headless)
+
+ส่วนที่ไม่ขึ้นกับเป้าหมายคำนวณครั้งเดียวต่อสกิล (SkillParts):
+- merge ค่าฝั่งผู้โจมตี (specs.SkillSpec / Build), Total ATK, Cap_ATK
+- ตัวเศษของ RAW ก่อนคูณ DMG_Reduction / หาร DEF: Total_ATK x SKILL x CRIT x WEAK x AMP_BUFF (4 scenario)
+ต่อเป้าหมายคำนวณเฉพาะ DMG_Reduction, HP-based (HP_Target) และ Effective DEF
+
+ลำดับการคูณ Decimal เหมือน calculate_raw_matrix ทุกขั้น ผลจึงตรงกับ compute_damage ทุกบิต (D001)
+ฆ่าได้ = ดาเมจต่อ hit x SKILL_HITS >= HP_Target ของเป้าหมาย (หลัง merge: SKILL_HITS ของผู้ใช้ / preset ทับค่าสกิล)
+
+หมายเหตุ: ให้ผล 4 scenario ปกติ (ไม่รวม special logic ของตัวละครใน character_registry)
+
+การใช้งาน:
+    from kill_matrix import character_matrix
+    matrix = character_matrix("miho", user_config)
+    cell = matrix.cell("skill2", "castle_room1")
+    print(cell.kills, cell.margins)
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from character_db import CharacterDB, get_character_db
+from character_registry import get_character_handler
+from damage_calc import (
+    calculate_cap_atk,
+    calculate_dmg_hp,
+    calculate_effective_def,
+    calculate_final_dmg,
+    calculate_final_dmg_hp,
+    calculate_total_atk,
+    to_decimal,
+)
+from fast_calc import SCENARIO_INDEX, SCENARIO_INPUT_KEYS
+from specs import BUILD_FIELDS, TARGET_FIELDS, Build, SkillSpec, TargetSpec, skill_specs
+
+_HUNDRED = Decimal("100")
+_ONE = Decimal("1")
+
+# (crit, weak) ของแต่ละ scenario ตามลำดับ SCENARIO_INDEX: crit, crit_weak, no_crit, weak_only
+_SCENARIO_CELLS = ((0, 0), (0, 1), (1, 0), (1, 1))
+
+# ตำแหน่งใน SCENARIO_INPUT_KEYS → field ของ Build / TargetSpec
+_BUILD_SLOTS = tuple(
+    (SCENARIO_INPUT_KEYS.index(key), field) for field, key in BUILD_FIELDS.items() if key in SCENARIO_INPUT_KEYS
+)
+_TARGET_SLOTS = tuple(
+    (SCENARIO_INPUT_KEYS.index(key), field) for field, key in TARGET_FIELDS.items() if key in SCENARIO_INPUT_KEYS
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SkillParts:
+    """ค่าของ (build, สกิล) ที่ไม่ขึ้นกับเป้าหมาย"""
+    skill: SkillSpec
+    skill_hits: int
+    total_atk: Decimal
+    cap_atk: Decimal
+    bonus_dmg_hp_target: Decimal
+    dmg_amp_debuff: Decimal
+    def_reduce: Decimal
+    ignore_def: Decimal
+    crit_mults: tuple[Decimal, Decimal]
+    weak_mults: tuple[Decimal, Decimal]
+    amp_buff_mult: Decimal
+    numerators: tuple[Decimal, ...]  # Total_ATK x SKILL x CRIT x WEAK x AMP_BUFF ตาม _SCENARIO_CELLS
+
+
+@dataclass(frozen=True, slots=True)
+class KillCell:
+    """ผลของ 1 สกิลบน 1 เป้าหมาย"""
+    skill: str | None
+    target: str
+    skill_hits: int
+    hp: int
+    damage: tuple[int, ...]  # ต่อ hit ตามลำดับ SCENARIO_INDEX
+
+    @property
+    def totals(self) -> tuple[int, ...]:
+        """ดาเมจรวมทั้งสกิล (x SKILL_HITS)"""
+        return tuple(d * self.skill_hits for d in self.damage)
+
+    @property
+    def margins(self) -> tuple[int, ...]:
+        """ดาเมจรวม - HP (>= 0 = ฆ่าได้)"""
+        return tuple(total - self.hp for total in self.totals)
+
+    @property
+    def kills(self) -> tuple[bool, ...]:
+        return tuple(self.hp > 0 and margin >= 0 for margin in self.margins)
+
+    def kills_in(self, scenario: str) -> bool:
+        return self.kills[SCENARIO_INDEX[scenario]]
+
+
+@dataclass(frozen=True, slots=True)
+class KillMatrix:
+    """ทุกสกิล x ทุกเป้าหมายของตัวละคร 1 ตัว (cells เรียงตามสกิลแล้วตามเป้าหมาย)"""
+    character: str
+    weapon_set: int
+    skills: tuple[str | None, ...]
+    targets: tuple[str, ...]
+    cells: tuple[KillCell, ...]
+    special: bool  # มี special logic (ผลจริงในโหมดปกติอาจต่างจาก 4 scenario นี้)
+
+    def cell(self, skill: str | None, target: str) -> KillCell:
+        return self.cells[self.skills.index(skill) * len(self.targets) + self.targets.index(target)]
+
+    def row(self, skill: str | None) -> tuple[KillCell, ...]:
+        start = self.skills.index(skill) * len(self.targets)
+        return self.cells[start:start + len(self.targets)]
+
+
+def skill_parts(build: Build, skill: SkillSpec) -> SkillParts:
+    """merge ค่าฝั่งผู้โจมตีแล้วคำนวณทุกอย่างที่ไม่ขึ้นกับเป้าหมาย"""
+    rules = skill.rules
+    v = {SCENARIO_INPUT_KEYS[i]: to_decimal(rules[i](getattr(build, field))) for i, field in _BUILD_SLOTS}
+
+    total_atk = calculate_total_atk(
+        v["ATK_CHAR"], v["ATK_PET"], skill.atk_base,
+        v["Formation"], v["Potential_PET"],
+        v["BUFF_ATK"], v["BUFF_ATK_PET"],
+    )
+    # เหมือน run_pipeline → calculate_raw_matrix
+    amp_buff_mult = _ONE + v["DMG_AMP_BUFF"] / _HUNDRED
+    crit_mults = (v["CRIT_DMG"] / _HUNDRED, Decimal("100") / _HUNDRED)
+    weak_mults = (_ONE + Decimal("0") / _HUNDRED, _ONE + (Decimal("30") + v["WEAK_DMG"]) / _HUNDRED)
+    base = total_atk * (v["SKILL_DMG"] / _HUNDRED)
+    numerators = tuple(base * crit_mults[c] * weak_mults[w] * amp_buff_mult for c, w in _SCENARIO_CELLS)
+    return SkillParts(
+        skill=skill,
+        skill_hits=skill.hits(build),
+        total_atk=total_atk,
+        cap_atk=calculate_cap_atk(total_atk, v["Cap_ATK_Percent"]),
+        bonus_dmg_hp_target=v["Bonus_DMG_HP_Target"],
+        dmg_amp_debuff=v["DMG_AMP_DEBUFF"],
+        def_reduce=v["DEF_REDUCE"],
+        ignore_def=v["Ignore_DEF"],
+        crit_mults=crit_mults,
+        weak_mults=weak_mults,
+        amp_buff_mult=amp_buff_mult,
+        numerators=numerators,
+    )
+
+
+def evaluate_target(parts: SkillParts, target: TargetSpec) -> KillCell:
+    """ส่วนที่ขึ้นกับเป้าหมาย: DMG_Reduction, HP-based, Effective DEF → KillCell"""
+    rules = parts.skill.rules
+    t = {SCENARIO_INPUT_KEYS[i]: to_decimal(rules[i](getattr(target, field))) for i, field in _TARGET_SLOTS}
+    hp_target = t["HP_Target"]
+
+    final_dmg_hp = calculate_final_dmg_hp(calculate_dmg_hp(hp_target, parts.bonus_dmg_hp_target), parts.cap_atk)
+    reduction_mult = _ONE + (parts.dmg_amp_debuff - t["DMG_Reduction"]) / _HUNDRED
+    effective_def = calculate_effective_def(t["DEF_Target"], t["DEF_BUFF"], parts.def_reduce, parts.ignore_def)
+
+    damage = []
+    for (c, w), numerator in zip(_SCENARIO_CELLS, parts.numerators):
+        raw = numerator * reduction_mult
+        if final_dmg_hp:
+            raw += final_dmg_hp * parts.crit_mults[c] * parts.weak_mults[w] * parts.amp_buff_mult * reduction_mult
+        damage.append(calculate_final_dmg(raw, effective_def))
+    return KillCell(parts.skill.skill, target.name, parts.skill_hits, int(hp_target), tuple(damage))
+
+
+def monster_targets(
+    user_config: Mapping[str, Any], monsters: Iterable[str] | None = None, db: CharacterDB | None = None
+) -> tuple[TargetSpec, ...]:
+    """TargetSpec ของทุก monster preset เรียงตามชื่อ (หรือเฉพาะที่ระบุ) ทับ user config"""
+    db = db or get_character_db()
+    names = sorted(db.monster_names()) if monsters is None else monsters
+    return tuple(TargetSpec.from_monster(name, user_config, db) for name in names)
+
+
+def character_matrix(
+    character: str,
+    user_config: Mapping[str, Any],
+    targets: Sequence[TargetSpec] | None = None,
+    skills: Sequence[SkillSpec] | None = None,
+    db: CharacterDB | None = None,
+) -> KillMatrix:
+    """
+    kill matrix ของตัวละคร 1 ตัว
+
+    Args:
+        user_config: config ของผู้ใช้ (Weapon_Set และสเตตัส)
+        targets: เป้าหมาย (None = ทุก monster preset ทับ user_config)
+        skills: สกิล (None = ทุกสกิลของตัวละคร)
+    """
+    db = db or get_character_db()
+    build = Build.from_config(user_config)
+    skills = skill_specs(character, db) if skills is None else skills
+    targets = monster_targets(user_config, db=db) if targets is None else targets
+    # preset ที่ทับค่าฝั่งผู้โจมตีได้ Build ของตัวเอง (เหมือน prepare_config)
+    builds = {target.build_overrides: Build.from_config(user_config, dict(target.build_overrides))
+              for target in targets if target.build_overrides}
+
+    cells = []
+    for skill in skills:
+        parts = {(): skill_parts(build, skill)}
+        parts.update((key, skill_parts(b, skill)) for key, b in builds.items())
+        cells.extend(evaluate_target(parts[target.build_overrides], target) for target in targets)
+    return KillMatrix(
+        character=character,
+        weapon_set=build.weapon_set,
+        skills=tuple(skill.skill for skill in skills),
+        targets=tuple(target.name for target in targets),
+        cells=tuple(cells),
+        special=get_character_handler(character) is not None,
+    )
@@ -0,0 +1,63 @@
+"""
+Kill Matrix Mode - ตัวละคร 1 ตัวกับทุก monster preset ในครั้งเดียว (CLI)
+การคำนวณอยู่ใน kill_matrix.py ไฟล์นี้มีแค่ input() / print()
+"""
+
+import time
+from typing import Any
+
+from character_db import get_character_db
+from config_loader import load_user_config
+from display import WEAPON_SET_NAMES, print_calculation_header
+from kill_matrix import KillCell, KillMatrix, character_matrix
+from menu import select_character
+
+# หัวคอลัมน์ตามลำดับ SCENARIO_INDEX
+SCENARIO_LABELS = ("คริ", "คริ+จุดอ่อน", "ไม่คริ", "จุดอ่อน")
+
+
+def format_margin(cell: KillCell, index: int) -> str:
+    """💀 +เกิน / -ขาด ของ scenario เดียว (ไม่มี HP = ดาเมจรวม)"""
+    if cell.hp <= 0:
+        return f"{cell.totals[index]:,}"
+    margin = cell.margins[index]
+    return f"💀 +{margin:,}" if margin >= 0 else f"{margin:,}"
+
+
+def print_kill_matrix(matrix: KillMatrix, char_meta: dict[str, Any], elapsed: float) -> None:
+    """แสดงตาราง: แต่ละสกิล → แถวละ 1 monster preset, คอลัมน์ละ 1 scenario"""
+    db = get_character_db()
+    skills = char_meta.get("_skills") or {}
+    print_calculation_header()
+    print(f"\n  ชุดเซ็ทอาวุธ: {WEAPON_SET_NAMES.get(matrix.weapon_set, 'ไม่ทราบ')}"
+          f" | {len(matrix.skills)} สกิล x {len(matrix.targets)} preset ({elapsed * 1e3:.1f} ms)")
+    if matrix.special:
+        print("  ⚠️ ตัวละครนี้มี special logic: ตารางนี้เป็นดาเมจ 4 แบบปกติ (ดูผลเต็มในโหมดปกติ/ตีปราสาท)")
+
+    for skill in matrix.skills:
+        row = matrix.row(skill)
+        name = skills.get(skill, {}).get("_name", skill) if skill else "-"
+        print("\n" + "-" * 78)
+        print(f"  สกิล: {name} (x{row[0].skill_hits} hit)" if row else f"  สกิล: {name}")
+        print("-" * 78)
+        print(f"  {'preset':<22}{'HP':>9}" + "".join(f"{label:>12}" for label in SCENARIO_LABELS))
+        for cell in row:
+            label = db.monster(cell.target).meta.get("_name", cell.target)
+            hp = f"{cell.hp:,}" if cell.hp > 0 else "-"
+            margins = "".join(f"{format_margin(cell, i):>12}" for i in range(len(SCENARIO_LABELS)))
+            print(f"  {label:<22}{hp:>9}{margins}")
+    print("\n  💀 +N = ฆ่าได้ (ดาเมจรวมเกิน HP N), -N = ขาดอีก N")
+
+
+def run_kill_matrix_mode() -> None:
+    """
+    Runs the Kill Matrix mode logic
+    """
+    char_name, char_meta, _ = select_character()
+    if char_name is None:
+        return
+    user_config = load_user_config()
+
+    start = time.perf_counter()
+    matrix = character_matrix(char_name, user_config)
+    print_kill_matrix(matrix, char_meta, time.perf_counter() - start)
@@ -0,0 +1,205 @@
+"""
+Kill Solver - หาค่าสเตตัสต่ำสุด (จำนวนเต็ม) ที่ฆ่ามอนได้แน่นอน (headless)
+
+รองรับ ATK_CHAR, CRIT_DMG, DMG_AMP_BUFF, Ignore_DEF:
+1. กลับสูตร (Total ATK → HP-based → RAW → Effective DEF) ด้วย float เพื่อได้ค่าประมาณ
+2. ค้นหาจำนวนเต็มรอบค่าประมาณ (gallop + bisection) เพื่อแก้ผลของ ROUNDDOWN
+   ทุกจุดที่ตรวจใช้ float_scenarios + Decimal fallback จึงตรงกับ pipeline ทุกกรณี
+ปกติตรวจแค่ 2 จุดต่อการหา 1 ครั้ง (ระดับไมโครวินาที)
+
+ค่าที่ได้เป็นค่าหลัง merge (รวมโบนัสตัวละคร/ชุดเซ็ทอาวุธแล้ว) เหมือนค่าใน config ที่ส่งเข้ามา
+
+การใช้งาน:
+    from kill_solver import min_stat_to_kill
+    atk = min_stat_to_kill(config, atk_base, "ATK_CHAR", hp=50000, hits=3)
+"""
+
+import math
+from collections.abc import Callable, Mapping
+from decimal import Decimal
+
+from constants import CONFIG_DEFAULTS, DEF_MODIFIER
+from damage_calc import NumericType, to_decimal
+from fast_calc import (
+    SCENARIO_INDEX,
+    SCENARIO_INPUT_KEYS,
+    decimal_scenarios,
+    float_scenarios,
+    scenario_floats,
+    scenario_row,
+)
+
+# สเตตัสที่หาได้ → ช่วงค่าที่ค้นหา (ต่ำสุด, สูงสุด)
+STAT_BOUNDS = {
+    "ATK_CHAR": (0, 10**9),
+    "CRIT_DMG": (0, 10**7),
+    "DMG_AMP_BUFF": (0, 10**7),
+    "Ignore_DEF": (0, 100),
+}
+SOLVABLE_STATS = tuple(STAT_BOUNDS)
+
+_DEF_MODIFIER = float(DEF_MODIFIER)
+
+
+def min_stat_to_kill(
+    config: Mapping[str, NumericType],
+    atk_base: NumericType,
+    stat: str,
+    hp: int,
+    hits: int = 1,
+    scenario: str = "crit_weak",
+) -> int | None:
+    """
+    หาค่า stat (จำนวนเต็ม) ที่น้อยที่สุดที่ทำให้ hits * Final Damage ต่อ hit >= hp
+
+    Args:
+        config: config ที่ merge แล้ว (key ที่ไม่มีใช้ CONFIG_DEFAULTS)
+        stat: ATK_CHAR / CRIT_DMG / DMG_AMP_BUFF / Ignore_DEF
+        scenario: crit / crit_weak / no_crit / weak_only
+    Returns:
+        ค่าต่ำสุดใน STAT_BOUNDS[stat] หรือ None ถ้าเพิ่มสเตตัสนี้อย่างเดียวไม่พอ
+    """
+    if stat not in STAT_BOUNDS:
+        raise ValueError(f"ไม่รู้จัก stat '{stat}' (มี: {', '.join(SOLVABLE_STATS)})")
+    if scenario not in SCENARIO_INDEX:
+        raise ValueError(f"ไม่รู้จัก scenario '{scenario}' (มี: {', '.join(SCENARIO_INDEX)})")
+    if stat == "CRIT_DMG" and scenario in ("no_crit", "weak_only"):
+        raise ValueError(f"CRIT_DMG ไม่มีผลกับ scenario '{scenario}'")
+    if hits <= 0:
+        raise ValueError("hits ต้องมากกว่า 0")
+
+    lo, hi = STAT_BOUNDS[stat]
+    if hp <= 0:
+        return lo
+    need = -(-int(hp) // hits)  # ดาเมจต่อ hit ที่ต้องได้ (ปัดขึ้น)
+
+    floats = scenario_floats(config)
+    per_hit = _per_hit_damage(config, floats, float(atk_base), stat, SCENARIO_INDEX[scenario])
+    estimate = _invert(floats, float(atk_base), stat, scenario, need)
+    return _search(lambda x: per_hit(x) >= need, estimate, lo, hi)
+
+
+def stat_shortfall(
+    config: Mapping[str, NumericType],
+    atk_base: NumericType,
+    stat: str,
+    hp: int,
+    hits: int = 1,
+    scenario: str = "crit_weak",
+) -> int | None:
+    """
+    ต้องเพิ่ม stat อีกเท่าไหร่ถึงจะฆ่ามอนได้ (0 = ฆ่าได้แล้ว, None = เพิ่มอย่างเดียวไม่พอ)
+    ค่าปัจจุบันที่ไม่มีใน config ใช้ CONFIG_DEFAULTS (เหมือน min_stat_to_kill)
+    """
+    required = min_stat_to_kill(config, atk_base, stat, hp, hits, scenario)
+    if required is None:
+        return None
+    current = to_decimal(config.get(stat, CONFIG_DEFAULTS[stat]))
+    return max(0, math.ceil(Decimal(required) - current))
+
+
+def _per_hit_damage(
+    config: Mapping[str, NumericType],
+    floats: list[float],
+    atk_base: float,
+    stat: str,
+    index: int,
+) -> Callable[[int], int]:
+    """ฟังก์ชัน ค่า stat → Final Damage ต่อ hit ของ scenario (float + Decimal fallback)"""
+    position = SCENARIO_INPUT_KEYS.index(stat)
+    values = list(floats)
+    row: dict[str, Decimal] | None = None
+
+    def per_hit(x: int) -> int:
+        nonlocal row
+        values[position] = float(x)
+        fast = float_scenarios(values, atk_base)
+        if fast is not None:
+            return fast[1][index]
+        if row is None:
+            row = scenario_row(config, atk_base)
+        row[stat] = Decimal(x)
+        return decimal_scenarios(row)[1][index]
+
+    return per_hit
+
+
+def _invert(floats: list[float], atk_base: float, stat: str, scenario: str, need: int) -> float:
+    """
+    กลับสูตรแบบต่อเนื่อง (ไม่สน ROUNDDOWN) หาค่า stat ที่ทำให้ RAW / Effective_DEF = need
+    Returns math.inf ถ้าหาไม่ได้ (เช่น ตัวคูณเป็น 0)
+    """
+    (atk_char, atk_pet, formation, potential_pet, buff_atk, buff_atk_pet,
+     skill_dmg, crit_dmg, weak_dmg, dmg_amp_buff, dmg_amp_debuff, dmg_reduction,
+     def_target, def_buff, def_reduce, ignore_def,
+     hp_target, bonus_dmg_hp_target, cap_atk_percent) = floats
+
+    crit_mult = crit_dmg / 100.0 if scenario in ("crit", "crit_weak") else 1.0
+    weak_mult = 1.0 + (30.0 + weak_dmg) / 100.0 if scenario in ("crit_weak", "weak_only") else 1.0
+    amp_mult = 1.0 + dmg_amp_buff / 100.0
+    debuff_mult = 1.0 + (dmg_amp_debuff - dmg_reduction) / 100.0
+    def_scale = _DEF_MODIFIER * def_target * (1.0 + def_buff / 100.0 - def_reduce / 100.0)
+    effective_def = 1.0 + def_scale * (1.0 - ignore_def / 100.0)
+
+    flat_atk = atk_pet + atk_base * (formation + potential_pet) / 100.0
+    buff_mult = 1.0 + (buff_atk + buff_atk_pet) / 100.0
+    total_atk = (atk_char + flat_atk) * buff_mult
+    dmg_hp = hp_target * bonus_dmg_hp_target / 100.0
+    cap_rate = cap_atk_percent / 100.0
+    skill_rate = skill_dmg / 100.0
+    hp_part = min(dmg_hp, total_atk * cap_rate) if cap_rate > 0.0 else dmg_hp
+    base = total_atk * skill_rate + hp_part
+
+    try:
+        if stat == "ATK_CHAR":
+            base_needed = need * effective_def / (crit_mult * weak_mult * amp_mult * debuff_mult)
+            # ช่วงที่ HP-based ติด cap ก่อน แล้วค่อยช่วงที่ไม่ติด cap
+            total_needed = base_needed / (skill_rate + cap_rate) if cap_rate > 0.0 else math.inf
+            if total_needed * cap_rate > dmg_hp or cap_rate <= 0.0:
+                total_needed = (base_needed - dmg_hp) / skill_rate
+            return total_needed / buff_mult - flat_atk
+        if stat == "CRIT_DMG":
+            return 100.0 * need * effective_def / (base * weak_mult * amp_mult * debuff_mult)
+        if stat == "DMG_AMP_BUFF":
+            return 100.0 * (need * effective_def / (base * crit_mult * weak_mult * debuff_mult) - 1.0)
+        # Ignore_DEF: Effective_DEF ที่ต้องได้ → Ignore_DEF
+        def_needed = base * crit_mult * weak_mult * amp_mult * debuff_mult / need
+        return 100.0 * (1.0 - (def_needed - 1.0) / def_scale)
+    except ZeroDivisionError:
+        return math.inf
+
+
+def _search(kills: Callable[[int], bool], estimate: float, lo: int, hi: int) -> int | None:
+    """
+    หาจำนวนเต็มที่น้อยที่สุดใน [lo, hi] ที่ kills() เป็นจริง (kills ต้องไม่ลดลงเมื่อค่าเพิ่ม)
+    เริ่มที่ค่าประมาณ แล้วขยายช่วงทีละ 2 เท่า (gallop) จนครอบคำตอบ จากนั้นแบ่งครึ่ง
+    """
+    x = min(max(math.ceil(estimate), lo), hi) if math.isfinite(estimate) else hi
+
+    if kills(x):
+        high, step = x, 1
+        while high > lo:
+            low = max(lo, high - step)
+            if not kills(low):
+                break
+            high, step = low, step * 2
+        else:
+            return lo
+    else:
+        low, step = x, 1
+        while True:
+            if low >= hi:
+                return None
+            high = min(hi, low + step)
+            if kills(high):
+                break
+            low, step = high, step * 2
+
+    # kills(low) = False, kills(high) = True
+    while high - low > 1:
+        mid = (low + high) // 2
+        if kills(mid):
+            high = mid
+        else:
+            low = mid
+    return high
@@ -4,24 +4,22 @@ Espada Special Logic
 """
 
 from decimal import Decimal
-from typing import Any
 
 from damage_calc import (
-    calculate_total_atk,
     calculate_dmg_hp,
     calculate_cap_atk,
     calculate_final_dmg_hp,
-    calculate_raw_dmg,
-    calculate_effective_def,
+    calculate_raw_matrix,
     calculate_final_dmg,
 )
+from results import EspadaResult, ScenarioDamage
 
 
 def calculate_espada_damage(
     total_atk: Decimal, skill_dmg: Decimal, crit_dmg: Decimal, weak_dmg: Decimal,
     dmg_amp_buff: Decimal, dmg_amp_debuff: Decimal, dmg_reduction: Decimal,
     effective_def: Decimal, hp_target: Decimal, bonus_dmg_hp: Decimal, cap_atk_percent: Decimal
-) -> dict[str, Any]:
+) -> EspadaResult:
     """
     คำนวณดาเมจของ Espada แบบพิเศษ
     - คำนวณ 2 กรณี: (1) ดาเมจปกติ (2) ดาเมจ HP-based
@@ -33,53 +31,28 @@ def calculate_espada_damage(
     cap_atk = calculate_cap_atk(total_atk, cap_atk_percent)
     final_dmg_hp = calculate_final_dmg_hp(dmg_hp, cap_atk)
     
-    # 2. คริ ไม่มี HP-based
-    raw_dmg_crit_no_hp = calculate_raw_dmg(
-        total_atk, skill_dmg, crit_dmg, Decimal("0"),
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, Decimal("0")
+    # 2-5. คริ / จุดอ่อน (30% base + weak_dmg) x ไม่มี / มี HP-based (คำนวณพร้อมกัน)
+    total_weak_dmg = Decimal("30") + weak_dmg
+    raw = calculate_raw_matrix(
+        total_atk, (skill_dmg,), (crit_dmg,), (Decimal("0"), total_weak_dmg),
+        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, (Decimal("0"), final_dmg_hp)
     )
+    raw_dmg_crit_no_hp = raw[0, 0, 0, 0]
+    raw_dmg_crit_with_hp = raw[0, 0, 0, 1]
+    raw_dmg_weak_no_hp = raw[0, 0, 1, 0]
+    raw_dmg_weak_with_hp = raw[0, 0, 1, 1]
     final_dmg_crit_no_hp = calculate_final_dmg(raw_dmg_crit_no_hp, effective_def)
-    
-    # 3. คริ + HP-based
-    raw_dmg_crit_with_hp = calculate_raw_dmg(
-        total_atk, skill_dmg, crit_dmg, Decimal("0"),
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
-    )
     final_dmg_crit_with_hp = calculate_final_dmg(raw_dmg_crit_with_hp, effective_def)
-    
-    # 4. จุดอ่อน (30% base + weak_dmg) ไม่มี HP-based
-    total_weak_dmg = Decimal("30") + weak_dmg
-    raw_dmg_weak_no_hp = calculate_raw_dmg(
-        total_atk, skill_dmg, crit_dmg, total_weak_dmg,
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, Decimal("0")
-    )
     final_dmg_weak_no_hp = calculate_final_dmg(raw_dmg_weak_no_hp, effective_def)
-    
-    # 5. จุดอ่อน + HP-based
-    raw_dmg_weak_with_hp = calculate_raw_dmg(
-        total_atk, skill_dmg, crit_dmg, total_weak_dmg,
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
-    )
     final_dmg_weak_with_hp = calculate_final_dmg(raw_dmg_weak_with_hp, effective_def)
     
-    return {
-        "dmg_hp": dmg_hp,
-        "cap_atk": cap_atk,
-        "final_dmg_hp": final_dmg_hp,
-        "crit_no_hp": {
-            "raw": raw_dmg_crit_no_hp,
-            "final": final_dmg_crit_no_hp
-        },
-        "crit_with_hp": {
-            "raw": raw_dmg_crit_with_hp,
-            "final": final_dmg_crit_with_hp
-        },
-        "weak_no_hp": {
-            "raw": raw_dmg_weak_no_hp,
-            "final": final_dmg_weak_no_hp
-        },
-        "weak_with_hp": {
-            "raw": raw_dmg_weak_with_hp,
-            "final": final_dmg_weak_with_hp
-        }
-    }
+    return EspadaResult(
+        dmg_hp=dmg_hp,
+        cap_atk=cap_atk,
+        final_dmg_hp=final_dmg_hp,
+        crit_no_hp=ScenarioDamage(raw_dmg_crit_no_hp, final_dmg_crit_no_hp),
+        crit_with_hp=ScenarioDamage(raw_dmg_crit_with_hp, final_dmg_crit_with_hp),
+        weak_no_hp=ScenarioDamage(raw_dmg_weak_no_hp, final_dmg_weak_no_hp),
+        weak_with_hp=ScenarioDamage(raw_dmg_weak_with_hp, final_dmg_weak_with_hp),
+        weak_dmg=weak_dmg,
+    )
@@ -4,9 +4,9 @@ HP Alteration = ปรับ HP เป้าหมายเหลือ X% (ไ
 """
 
 from decimal import Decimal, ROUND_DOWN
-from typing import Any
 
-from damage_calc import calculate_total_atk, calculate_raw_dmg, calculate_effective_def
+from damage_calc import calculate_raw_matrix
+from results import FreyjaResult
 
 
 def calculate_hp_alteration_damage(hp_target: Decimal, hp_alteration_percent: Decimal) -> int:
@@ -35,7 +35,7 @@ def calculate_freyja_damage(
     skill_hits: int,
     hp_target: Decimal,
     hp_alteration: Decimal
-) -> dict[str, Any]:
+) -> FreyjaResult:
     """
     คำนวณดาเมจ Freyja ทั้ง 4 กรณี:
     1. ดาเมจคริปกติ (ไม่มี HP Alteration)
@@ -48,51 +48,40 @@ def calculate_freyja_damage(
     base_weakness = Decimal("30")
     total_weakness = base_weakness + weak_dmg
     
-    # === กรณี 1: ดาเมจคริปกติ (ไม่มี HP Alteration) ===
-    raw_crit = calculate_raw_dmg(
+    # === กรณี 1 และ 3: ดาเมจคริปกติ / ติดจุดอ่อน (ไม่มี HP Alteration) คำนวณพร้อมกัน ===
+    raw = calculate_raw_matrix(
         total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=Decimal("0"),
+        skill_dmgs=(skill_dmg,),
+        crit_dmgs=(crit_dmg,),
+        weak_dmgs=(Decimal("0"), total_weakness),
         dmg_amp_buff=dmg_amp_buff,
         dmg_amp_debuff=dmg_amp_debuff,
         dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
     )
-    final_crit = int((raw_crit / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    final_crit = int((raw[0, 0, 0, 0] / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    final_weak = int((raw[0, 0, 1, 0] / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
     # === กรณี 2: HP Alteration damage ===
     hp_alter_damage = calculate_hp_alteration_damage(hp_target, hp_alteration)
     
-    # === กรณี 3: ดาเมจติดจุดอ่อน (ไม่มี HP Alteration) ===
-    raw_weak = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
+    return FreyjaResult(
+        crit_damage=final_crit,
+        crit_per_hit=final_crit // skill_hits if skill_hits > 0 else final_crit,
+        hp_alteration_damage=hp_alter_damage,
+        weakness_damage=final_weak,
+        weakness_per_hit=final_weak // skill_hits if skill_hits > 0 else final_weak,
+        hp_alteration_percent=hp_alteration,
+        total_weakness_percent=total_weakness,
+        skill_hits=skill_hits,
+        hp_target=hp_target,
     )
-    final_weak = int((raw_weak / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
-    return {
-        "crit_damage": final_crit,
-        "crit_per_hit": final_crit // skill_hits if skill_hits > 0 else final_crit,
-        "hp_alteration_damage": hp_alter_damage,
-        "weakness_damage": final_weak,
-        "weakness_per_hit": final_weak // skill_hits if skill_hits > 0 else final_weak,
-        "hp_alteration_percent": hp_alteration,
-        "total_weakness_percent": total_weakness,
-        "skill_hits": skill_hits
-    }
 
 
-def print_freyja_results(results: dict[str, Any], hp_target: Decimal) -> None:
+def print_freyja_results(results: FreyjaResult) -> None:
     """แสดงผลลัพธ์ Freyja แบบเต็ม"""
-    hits = results["skill_hits"]
-    hp_alt = results["hp_alteration_percent"]
+    hits = results.skill_hits
+    hp_alt = results.hp_alteration_percent
+    hp_target = results.hp_target
     
     print("\n" + "=" * 50)
     print("  🌟 Freyja - HP Alteration Calculator 🌟")
@@ -104,25 +93,25 @@ def print_freyja_results(results: dict[str, Any], hp_target: Decimal) -> None:
     print("\n" + "-" * 50)
     print("  ดาเมจปกติ (สกิล)")
     print("-" * 50)
-    print(f"  ดาเมจคริ:        {results['crit_damage']:,}")
+    print(f"  ดาเมจคริ:        {results.crit_damage:,}")
     if hits > 1:
-        print(f"                   ({hits} hits x {results['crit_per_hit']:,}/hit)")
+        print(f"                   ({hits} hits x {results.crit_per_hit:,}/hit)")
     
-    print(f"  ดาเมจติดจุดอ่อน: {results['weakness_damage']:,} (+{results['total_weakness_percent']:.0f}%)")
+    print(f"  ดาเมจติดจุดอ่อน: {results.weakness_damage:,} (+{results.total_weakness_percent:.0f}%)")
     if hits > 1:
-        print(f"                   ({hits} hits x {results['weakness_per_hit']:,}/hit)")
+        print(f"                   ({hits} hits x {results.weakness_per_hit:,}/hit)")
     
     print("\n" + "-" * 50)
     print("  ดาเมจ HP Alteration (ถ้ามี 4 Divinity stacks)")
     print("-" * 50)
-    print(f"  HP Alteration:   {results['hp_alteration_damage']:,}")
+    print(f"  HP Alteration:   {results.hp_alteration_damage:,}")
     print(f"                   (มอนเหลือ {hp_alt}% จาก {hp_target:,.0f} HP)")
     
     print("\n" + "-" * 50)
     print("  ดาเมจรวม (สกิล + HP Alteration)")
     print("-" * 50)
-    total_crit = results['crit_damage'] + results['hp_alteration_damage']
-    total_weak = results['weakness_damage'] + results['hp_alteration_damage']
+    total_crit = results.crit_damage + results.hp_alteration_damage
+    total_weak = results.weakness_damage + results.hp_alteration_damage
     print(f"  คริ + HP Alt:        {total_crit:,}")
     print(f"  จุดอ่อน + HP Alt:    {total_weak:,}")
     
@@ -7,12 +7,9 @@ Klahan Special Logic - HP Condition Bonus Calculator
 from __future__ import annotations
 
 from decimal import Decimal, ROUND_DOWN
-from typing import Any
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from damage_calc import calculate_raw_dmg
+from damage_calc import calculate_raw_matrix
+from results import KlahanResult, ScenarioDamage
 
 
 def calculate_klahan_damage(
@@ -28,7 +25,7 @@ def calculate_klahan_damage(
     eff_def: Decimal,
     skill_hits: int,
     skill_name: str
-) -> dict[str, Any]:
+) -> KlahanResult:
     """
     คำนวณดาเมจ Klahan ทั้ง 4 กรณี:
     1. ดาเมจคริ (ไม่มี HP bonus)
@@ -51,98 +48,49 @@ def calculate_klahan_damage(
         hp_bonus = hp_below_50_bonus
         hp_condition = "HP <= 50%"
     
-    # === กรณี 1: ดาเมจคริ (ไม่มี HP bonus) ===
-    raw_crit_no_bonus = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=Decimal("0"),
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
-    )
-    final_crit_no_bonus = int((raw_crit_no_bonus / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
-    # === กรณี 2: ดาเมจคริ + HP bonus ===
+    # === ทั้ง 4 กรณี: SKILL_DMG (ไม่มี / มี HP bonus) x คริ / ติดจุดอ่อน ===
     skill_dmg_with_bonus = skill_dmg + hp_bonus
-    raw_crit_with_bonus = calculate_raw_dmg(
+    raw = calculate_raw_matrix(
         total_atk=total_atk,
-        skill_dmg=skill_dmg_with_bonus,
-        crit_dmg=crit_dmg,
-        weak_dmg=Decimal("0"),
+        skill_dmgs=(skill_dmg, skill_dmg_with_bonus),
+        crit_dmgs=(crit_dmg,),
+        weak_dmgs=(Decimal("0"), total_weakness),
         dmg_amp_buff=dmg_amp_buff,
         dmg_amp_debuff=dmg_amp_debuff,
         dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
     )
+    raw_crit_no_bonus = raw[0, 0, 0, 0]
+    raw_crit_with_bonus = raw[1, 0, 0, 0]
+    raw_weak_no_bonus = raw[0, 0, 1, 0]
+    raw_weak_with_bonus = raw[1, 0, 1, 0]
+    final_crit_no_bonus = int((raw_crit_no_bonus / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     final_crit_with_bonus = int((raw_crit_with_bonus / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
-    # === กรณี 3: ดาเมจติดจุดอ่อน (ไม่มี HP bonus) ===
-    raw_weak_no_bonus = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
-    )
     final_weak_no_bonus = int((raw_weak_no_bonus / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
-    # === กรณี 4: ดาเมจติดจุดอ่อน + HP bonus ===
-    raw_weak_with_bonus = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg_with_bonus,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
-    )
     final_weak_with_bonus = int((raw_weak_with_bonus / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
-    return {
-        "crit_no_bonus": {
-            "raw": raw_crit_no_bonus,
-            "final": final_crit_no_bonus * skill_hits,
-            "per_hit": final_crit_no_bonus
-        },
-        "crit_with_bonus": {
-            "raw": raw_crit_with_bonus,
-            "final": final_crit_with_bonus * skill_hits,
-            "per_hit": final_crit_with_bonus
-        },
-        "weak_no_bonus": {
-            "raw": raw_weak_no_bonus,
-            "final": final_weak_no_bonus * skill_hits,
-            "per_hit": final_weak_no_bonus
-        },
-        "weak_with_bonus": {
-            "raw": raw_weak_with_bonus,
-            "final": final_weak_with_bonus * skill_hits,
-            "per_hit": final_weak_with_bonus
-        },
-        "skill_hits": skill_hits,
-        "skill_name": skill_name,
-        "skill_dmg": skill_dmg,
-        "hp_bonus": hp_bonus,
-        "hp_condition": hp_condition,
-        "total_skill_dmg": skill_dmg_with_bonus,
-        "total_weakness": total_weakness
-    }
+    return KlahanResult(
+        crit_no_bonus=ScenarioDamage(raw_crit_no_bonus, final_crit_no_bonus * skill_hits, final_crit_no_bonus),
+        crit_with_bonus=ScenarioDamage(raw_crit_with_bonus, final_crit_with_bonus * skill_hits, final_crit_with_bonus),
+        weak_no_bonus=ScenarioDamage(raw_weak_no_bonus, final_weak_no_bonus * skill_hits, final_weak_no_bonus),
+        weak_with_bonus=ScenarioDamage(raw_weak_with_bonus, final_weak_with_bonus * skill_hits, final_weak_with_bonus),
+        skill_hits=skill_hits,
+        skill_name=skill_name,
+        skill_dmg=skill_dmg,
+        hp_bonus=hp_bonus,
+        hp_condition=hp_condition,
+        total_skill_dmg=skill_dmg_with_bonus,
+        total_weakness=total_weakness,
+    )
 
 
-def print_klahan_results(results: dict[str, Any]) -> None:
+def print_klahan_results(results: KlahanResult) -> None:
     """แสดงผลลัพธ์ Klahan แบบเต็ม"""
-    hits = results["skill_hits"]
-    skill_name = results["skill_name"]
-    skill_dmg = results["skill_dmg"]
-    hp_bonus = results["hp_bonus"]
-    hp_cond = results["hp_condition"]
-    total_dmg = results["total_skill_dmg"]
+    hits = results.skill_hits
+    skill_name = results.skill_name
+    skill_dmg = results.skill_dmg
+    hp_bonus = results.hp_bonus
+    hp_cond = results.hp_condition
+    total_dmg = results.total_skill_dmg
     
     print("\n" + "=" * 60)
     print(f"  🐯 Klahan - {skill_name} Calculator 🐯")
@@ -156,38 +104,38 @@ def print_klahan_results(results: dict[str, Any]) -> None:
     print("\n" + "-" * 60)
     print(f"  [1] ดาเมจคริ (HP ไม่ตรงเงื่อนไข)")
     print("-" * 60)
-    r = results["crit_no_bonus"]
-    print(f"  Final: {r['final']:,} (SKILL_DMG: {skill_dmg}%)")
+    r = results.crit_no_bonus
+    print(f"  Final: {r.final:,} (SKILL_DMG: {skill_dmg}%)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     # กรณี 2: คริ + HP bonus
     print("\n" + "-" * 60)
     print(f"  [2] ดาเมจคริ ({hp_cond}) 🔥")
     print("-" * 60)
-    r = results["crit_with_bonus"]
-    print(f"  Final: {r['final']:,} (SKILL_DMG: {total_dmg}%)")
+    r = results.crit_with_bonus
+    print(f"  Final: {r.final:,} (SKILL_DMG: {total_dmg}%)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     # กรณี 3: จุดอ่อน ไม่มี bonus
     print("\n" + "-" * 60)
     print(f"  [3] ดาเมจติดจุดอ่อน (HP ไม่ตรงเงื่อนไข)")
     print("-" * 60)
-    r = results["weak_no_bonus"]
-    print(f"  Final: {r['final']:,} (SKILL_DMG: {skill_dmg}%)")
+    r = results.weak_no_bonus
+    print(f"  Final: {r.final:,} (SKILL_DMG: {skill_dmg}%)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     # กรณี 4: จุดอ่อน + HP bonus (MAX DAMAGE)
     print("\n" + "-" * 60)
     print(f"  [4] ดาเมจติดจุดอ่อน ({hp_cond}) 🔥 MAX")
     print("-" * 60)
-    r = results["weak_with_bonus"]
-    print(f"  Final: {r['final']:,} (SKILL_DMG: {total_dmg}%)")
+    r = results.weak_with_bonus
+    print(f"  Final: {r.final:,} (SKILL_DMG: {total_dmg}%)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     print("\n" + "=" * 60)
-    print(f"  💀 ดาเมจสูงสุด: {results['weak_with_bonus']['final']:,}")
+    print(f"  💀 ดาเมจสูงสุด: {results.weak_with_bonus.final:,}")
     print("=" * 60)
@@ -5,9 +5,9 @@ Ryan Special Logic - Lost HP Bonus & Weakness Extra Damage Calculator
 """
 
 from decimal import Decimal, ROUND_DOWN
-from typing import Any
 
-from damage_calc import calculate_total_atk, calculate_raw_dmg, calculate_effective_def
+from damage_calc import calculate_raw_matrix
+from results import RyanResult, ScenarioDamage
 
 
 def calculate_lost_hp_multiplier(target_hp_percent: Decimal, max_bonus: Decimal) -> Decimal:
@@ -49,7 +49,7 @@ def calculate_ryan_damage(
     skill_hits: int,
     lost_hp_bonus: Decimal,
     target_hp_percent: Decimal
-) -> dict[str, Any]:
+) -> RyanResult:
     """
     คำนวณดาเมจ Ryan ทั้ง 4 กรณี:
     1. ดาเมจคริ (HP เต็ม)
@@ -66,79 +66,50 @@ def calculate_ryan_damage(
     lost_hp_mult_min = Decimal("1")  # HP เต็ม
     lost_hp_mult_max = calculate_lost_hp_multiplier(target_hp_percent, lost_hp_bonus)
     
-    # === กรณี 1: ดาเมจคริ (HP เต็ม) ===
-    raw_crit_full = calculate_raw_dmg(
+    # === กรณี 1 และ 3: คริ / ติดจุดอ่อน (HP เต็ม) คำนวณพร้อมกัน ===
+    # Ryan พิเศษ: ใช้ WEAK_SKILL_DMG แทน SKILL_DMG เมื่อติดจุดอ่อน
+    total_skill_dmg_weak = skill_dmg + weak_skill_dmg  # รวมดาเมจ
+    raw = calculate_raw_matrix(
         total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=Decimal("0"),
+        skill_dmgs=(skill_dmg, total_skill_dmg_weak),
+        crit_dmgs=(crit_dmg,),
+        weak_dmgs=(Decimal("0"), total_weakness),
         dmg_amp_buff=dmg_amp_buff,
         dmg_amp_debuff=dmg_amp_debuff,
         dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
     )
+    raw_crit_full = raw[0, 0, 0, 0]
+    raw_weak_full = raw[1, 0, 1, 0]
     final_crit_full = int((raw_crit_full / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    final_weak_full = int((raw_weak_full / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
     # === กรณี 2: ดาเมจคริ (HP ต่ำ - Lost HP Bonus) ===
     raw_crit_low = raw_crit_full * lost_hp_mult_max
     final_crit_low = int((raw_crit_low / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
-    # === กรณี 3: ดาเมจติดจุดอ่อน (HP เต็ม) ===
-    # Ryan พิเศษ: ใช้ WEAK_SKILL_DMG แทน SKILL_DMG เมื่อติดจุดอ่อน
-    total_skill_dmg_weak = skill_dmg + weak_skill_dmg  # รวมดาเมจ
-    raw_weak_full = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=total_skill_dmg_weak,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
-    )
-    final_weak_full = int((raw_weak_full / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
     # === กรณี 4: ดาเมจติดจุดอ่อน (HP ต่ำ - Lost HP Bonus) ===
     raw_weak_low = raw_weak_full * lost_hp_mult_max
     final_weak_low = int((raw_weak_low / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
-    return {
-        "crit_full_hp": {
-            "raw": raw_crit_full,
-            "final": final_crit_full * skill_hits,
-            "per_hit": final_crit_full
-        },
-        "crit_low_hp": {
-            "raw": raw_crit_low,
-            "final": final_crit_low * skill_hits,
-            "per_hit": final_crit_low,
-            "multiplier": lost_hp_mult_max
-        },
-        "weak_full_hp": {
-            "raw": raw_weak_full,
-            "final": final_weak_full * skill_hits,
-            "per_hit": final_weak_full
-        },
-        "weak_low_hp": {
-            "raw": raw_weak_low,
-            "final": final_weak_low * skill_hits,
-            "per_hit": final_weak_low,
-            "multiplier": lost_hp_mult_max
-        },
-        "skill_hits": skill_hits,
-        "lost_hp_bonus": lost_hp_bonus,
-        "target_hp_percent": target_hp_percent,
-        "weak_skill_dmg": weak_skill_dmg,
-        "total_weakness": total_weakness
-    }
+    return RyanResult(
+        crit_full_hp=ScenarioDamage(raw_crit_full, final_crit_full * skill_hits, final_crit_full),
+        crit_low_hp=ScenarioDamage(raw_crit_low, final_crit_low * skill_hits, final_crit_low, lost_hp_mult_max),
+        weak_full_hp=ScenarioDamage(raw_weak_full, final_weak_full * skill_hits, final_weak_full),
+        weak_low_hp=ScenarioDamage(raw_weak_low, final_weak_low * skill_hits, final_weak_low, lost_hp_mult_max),
+        skill_hits=skill_hits,
+        lost_hp_bonus=lost_hp_bonus,
+        target_hp_percent=target_hp_percent,
+        weak_skill_dmg=weak_skill_dmg,
+        total_weakness=total_weakness,
+    )
 
 
-def print_ryan_results(results: dict[str, Any]) -> None:
+def print_ryan_results(results: RyanResult) -> None:
     """แสดงผลลัพธ์ Ryan แบบเต็ม"""
-    hits = results["skill_hits"]
-    lost_hp = results["lost_hp_bonus"]
-    target_hp = results["target_hp_percent"]
-    weak_extra = results["weak_skill_dmg"]
+    hits = results.skill_hits
+    lost_hp = results.lost_hp_bonus
+    target_hp = results.target_hp_percent
+    weak_extra = results.weak_skill_dmg
     
     print("\n" + "=" * 60)
     print("  ⚔️ Ryan - Gale Slash Calculator ⚔️")
@@ -152,41 +123,41 @@ def print_ryan_results(results: dict[str, Any]) -> None:
     print("\n" + "-" * 60)
     print("  [1] ดาเมจคริ (HP เต็ม 100%)")
     print("-" * 60)
-    r = results["crit_full_hp"]
-    print(f"  Final: {r['final']:,}")
+    r = results.crit_full_hp
+    print(f"  Final: {r.final:,}")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     # กรณี 2: คริ HP ต่ำ
     print("\n" + "-" * 60)
     print(f"  [2] ดาเมจคริ (HP เหลือ {target_hp}%)")
     print("-" * 60)
-    r = results["crit_low_hp"]
-    bonus_pct = (r['multiplier'] - 1) * 100
-    print(f"  Final: {r['final']:,} (+{bonus_pct:.1f}% Lost HP Bonus)")
+    r = results.crit_low_hp
+    bonus_pct = (r.multiplier - 1) * 100
+    print(f"  Final: {r.final:,} (+{bonus_pct:.1f}% Lost HP Bonus)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     # กรณี 3: จุดอ่อน HP เต็ม
     print("\n" + "-" * 60)
     print(f"  [3] ดาเมจติดจุดอ่อน (HP เต็ม 100%)")
     print("-" * 60)
-    r = results["weak_full_hp"]
-    print(f"  Final: {r['final']:,} (+{weak_extra}% Weakness Extra)")
+    r = results.weak_full_hp
+    print(f"  Final: {r.final:,} (+{weak_extra}% Weakness Extra)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     # กรณี 4: จุดอ่อน HP ต่ำ (MAX DAMAGE)
     print("\n" + "-" * 60)
     print(f"  [4] ดาเมจติดจุดอ่อน (HP เหลือ {target_hp}%) 🔥 MAX")
     print("-" * 60)
-    r = results["weak_low_hp"]
-    bonus_pct = (r['multiplier'] - 1) * 100
-    print(f"  Final: {r['final']:,}")
+    r = results.weak_low_hp
+    bonus_pct = (r.multiplier - 1) * 100
+    print(f"  Final: {r.final:,}")
     print(f"         (+{weak_extra}% Weakness Extra, +{bonus_pct:.1f}% Lost HP)")
     if hits > 1:
-        print(f"         ({hits} hits x {r['per_hit']:,}/hit)")
+        print(f"         ({hits} hits x {r.per_hit:,}/hit)")
     
     print("\n" + "=" * 60)
-    print(f"  💀 ดาเมจสูงสุด: {results['weak_low_hp']['final']:,}")
+    print(f"  💀 ดาเมจสูงสุด: {results.weak_low_hp.final:,}")
     print("=" * 60)
@@ -7,12 +7,9 @@ Sun Wukong Special Logic - Castle Mode Calculator
 from __future__ import annotations
 
 from decimal import Decimal, ROUND_DOWN
-from typing import Any
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from damage_calc import calculate_raw_dmg
+from damage_calc import calculate_raw_matrix
+from results import CastleScenario, SunWukongResult
 
 
 def calculate_sun_wukong_castle_mode(
@@ -28,7 +25,7 @@ def calculate_sun_wukong_castle_mode(
     hp_target: Decimal,
     skill_name: str,
     final_dmg_hp: Decimal = Decimal("0")
-) -> dict[str, Any]:
+) -> SunWukongResult:
     """
     คำนวณดาเมจ Sun Wukong แบบ Castle Mode:
     - คำนวณดาเมจต่อ hit แบบติดจุดอ่อนเท่านั้น (no crit)
@@ -40,52 +37,28 @@ def calculate_sun_wukong_castle_mode(
     base_weakness = Decimal("30")
     total_weakness = base_weakness + weak_dmg
     
-    # === ดาเมจติดจุดอ่อน (ไม่ติดคริ) ===
+    # === ดาเมจต่อ hit: คริ / ไม่ติดคริ x ไม่ติด / ติดจุดอ่อน (คำนวณพร้อมกัน) ===
     # เมื่อไม่ติดคริ CRIT_DMG จะเป็น 100% (ตัวคูณ x1)
-    raw_weak_only = calculate_raw_dmg(
+    # ไม่ติดจุดอ่อน = WEAK_DMG 0 (และไม่บวก base 30%)
+    raw = calculate_raw_matrix(
         total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=Decimal("100"),  # ไม่ติดคริ = 100% (x1)
-        weak_dmg=total_weakness,
+        skill_dmgs=(skill_dmg,),
+        crit_dmgs=(crit_dmg, Decimal("100")),
+        weak_dmgs=(Decimal("0"), total_weakness),
         dmg_amp_buff=dmg_amp_buff,
         dmg_amp_debuff=dmg_amp_debuff,
         dmg_reduction=dmg_reduction,
-        final_dmg_hp=final_dmg_hp
+        final_dmg_hps=(final_dmg_hp,)
     )
-    dmg_weak_only_per_hit = int((raw_weak_only / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    # ติดจุดอ่อน (ไม่ติดคริ)
+    dmg_weak_only_per_hit = int((raw[0, 1, 1, 0] / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    # ติดคริ + จุดอ่อน
+    dmg_crit_weak_per_hit = int((raw[0, 0, 1, 0] / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    # ปกติ (ไม่คริ, ไม่จุดอ่อน)
+    dmg_normal_per_hit = int((raw[0, 1, 0, 0] / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
-    # === ดาเมจติดคริ + จุดอ่อน ===
-    raw_crit_weak = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=final_dmg_hp
-    )
-    dmg_crit_weak_per_hit = int((raw_crit_weak / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
-    # === หาจำนวนคริขั้นต่ำที่ต้องการ ===
-    # สูตร: c ครั้งติดคริ + (n-c) ครั้งติดแค่จุดอ่อน >= HP_Target
-    # c * dmg_crit + (n - c) * dmg_weak >= HP
-    # c * (dmg_crit - dmg_weak) >= HP - n * dmg_weak
-    # c >= (HP - n * dmg_weak) / (dmg_crit - dmg_weak)
-    
-    # === ดาเมจปกติ (ไม่คริ, ไม่จุดอ่อน) ===
-    # WEAK_DMG = 0 (และไม่บวก base 30%), CRIT_DMG = 100%
-    raw_normal = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=Decimal("100"),
-        weak_dmg=Decimal("0"),  # ไม่ติดจุดอ่อนเลย
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=final_dmg_hp
-    )
-    dmg_normal_per_hit = int((raw_normal / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    # สูตรหาคริขั้นต่ำ: c ครั้งติดคริ + (n-c) ครั้งไม่ติดคริ >= HP_Target
+    # c * dmg_crit + (n - c) * dmg_fail >= HP
     
     # === หาจำนวนคริขั้นต่ำที่ต้องการ (2 กรณี) ===
     hp = int(hp_target)
@@ -104,12 +77,7 @@ def calculate_sun_wukong_castle_mode(
         total_dmg = (success_hits * dmg_crit_weak_per_hit) + (fail_hits * dmg_weak_only_per_hit)
         is_kill = total_dmg >= hp
         
-        scenarios_weak_base.append({
-            "crit_count": c,
-            "fail_hits": fail_hits, # Weak Only
-            "total_damage": total_dmg,
-            "is_kill": is_kill
-        })
+        scenarios_weak_base.append(CastleScenario(c, fail_hits, total_dmg, is_kill))  # fail = Weak Only
         
         if is_kill and min_crits_weak_base == -1:
             min_crits_weak_base = c
@@ -132,12 +100,7 @@ def calculate_sun_wukong_castle_mode(
         total_dmg = (success_hits * dmg_crit_weak_per_hit) + (fail_hits * dmg_normal_per_hit)
         is_kill = total_dmg >= hp
         
-        scenarios_normal_base.append({
-            "crit_count": c,
-            "fail_hits": fail_hits, # Normal
-            "total_damage": total_dmg,
-            "is_kill": is_kill
-        })
+        scenarios_normal_base.append(CastleScenario(c, fail_hits, total_dmg, is_kill))  # fail = Normal
         
         if is_kill and min_crits_normal_base == -1:
             min_crits_normal_base = c
@@ -147,37 +110,37 @@ def calculate_sun_wukong_castle_mode(
         can_kill_normal_base = True
         min_crits_normal_base = n
     
-    return {
-        "skill_name": skill_name,
-        "skill_hits": skill_hits,
-        "hp_target": hp,
-        "dmg_normal_per_hit": dmg_normal_per_hit,
-        "dmg_weak_only_per_hit": dmg_weak_only_per_hit,
-        "dmg_crit_weak_per_hit": dmg_crit_weak_per_hit,
-        "total_weakness": total_weakness,
+    return SunWukongResult(
+        skill_name=skill_name,
+        skill_hits=skill_hits,
+        hp_target=hp,
+        dmg_normal_per_hit=dmg_normal_per_hit,
+        dmg_weak_only_per_hit=dmg_weak_only_per_hit,
+        dmg_crit_weak_per_hit=dmg_crit_weak_per_hit,
+        total_weakness=total_weakness,
         
         # Scenario 1: Weakness Base
-        "min_crits_weak_base": min_crits_weak_base,
-        "can_kill_weak_base": can_kill_weak_base,
-        "scenarios_weak_base": scenarios_weak_base,
+        min_crits_weak_base=min_crits_weak_base,
+        can_kill_weak_base=can_kill_weak_base,
+        scenarios_weak_base=tuple(scenarios_weak_base),
         
         # Scenario 2: Normal Base
-        "min_crits_normal_base": min_crits_normal_base,
-        "can_kill_normal_base": can_kill_normal_base,
-        "scenarios_normal_base": scenarios_normal_base
-    }
+        min_crits_normal_base=min_crits_normal_base,
+        can_kill_normal_base=can_kill_normal_base,
+        scenarios_normal_base=tuple(scenarios_normal_base),
+    )
 
 
-def print_castle_mode_results(results: dict[str, Any]) -> None:
+def print_castle_mode_results(results: SunWukongResult) -> None:
     """แสดงผลลัพธ์ Castle Mode (2 Scenarios)"""
     
-    skill_name = results["skill_name"]
-    hits = results["skill_hits"]
-    hp = results["hp_target"]
-    dmg_normal = results["dmg_normal_per_hit"]
-    dmg_weak = results["dmg_weak_only_per_hit"]
-    dmg_crit = results["dmg_crit_weak_per_hit"]
-    weakness = results["total_weakness"]
+    skill_name = results.skill_name
+    hits = results.skill_hits
+    hp = results.hp_target
+    dmg_normal = results.dmg_normal_per_hit
+    dmg_weak = results.dmg_weak_only_per_hit
+    dmg_crit = results.dmg_crit_weak_per_hit
+    weakness = results.total_weakness
     
     print("\n" + "=" * 60)
     print(f"  🐵 Sun Wukong Castle Mode - {skill_name} 🏰")
@@ -200,26 +163,26 @@ def print_castle_mode_results(results: dict[str, Any]) -> None:
     print(f"       | {'(Fail = 🔵 จุดอ่อน)':^32} | {'(Fail = ⚪ ปกติ)':^32}")
     print("-" * 75)
     
-    scenarios_1 = results["scenarios_weak_base"]
-    scenarios_2 = results["scenarios_normal_base"]
-    min_1 = results["min_crits_weak_base"]
-    min_2 = results["min_crits_normal_base"]
-    kill_1 = results["can_kill_weak_base"]
-    kill_2 = results["can_kill_normal_base"]
+    scenarios_1 = results.scenarios_weak_base
+    scenarios_2 = results.scenarios_normal_base
+    min_1 = results.min_crits_weak_base
+    min_2 = results.min_crits_normal_base
+    kill_1 = results.can_kill_weak_base
+    kill_2 = results.can_kill_normal_base
     
     for i in range(hits + 1):
         s1 = scenarios_1[i]
         s2 = scenarios_2[i]
         
         # Format S1
-        d1 = s1["total_damage"]
-        mark1 = "✅" if s1["is_kill"] else "❌"
+        d1 = s1.total_damage
+        mark1 = "✅" if s1.is_kill else "❌"
         note1 = "🔥 MIN" if i == min_1 and kill_1 else ""
         text1 = f"{d1:,} {mark1} {note1}"
         
         # Format S2
-        d2 = s2["total_damage"]
-        mark2 = "✅" if s2["is_kill"] else "❌"
+        d2 = s2.total_damage
+        mark2 = "✅" if s2.is_kill else "❌"
         note2 = "🔥 MIN" if i == min_2 and kill_2 else ""
         text2 = f"{d2:,} {mark2} {note2}"
         
@@ -0,0 +1,135 @@
+"""
+Memo - LRU cache ของขั้น Total ATK / Effective DEF ต่อ config ที่ merge แล้ว (skill + preset)
+
+- sweep ข้ามสกิล / monster: ค่าฝั่งผู้โจมตีใน config เหมือนเดิม → Total ATK ได้จาก cache
+- โหมดทั้งสองสกิล / ข้าม preset ที่ DEF เท่ากัน: Effective DEF ได้จาก cache
+- hit ข้ามทั้งการแปลงค่าใน config เป็น Decimal และสูตร (เรียกสูตรทีละครั้งถูกกว่าสร้าง key ที่แยก exponent ได้
+  จึงไม่ cache ระดับ argument Decimal: kill_matrix / incremental / fast_calc เรียก damage_calc ตรงๆ)
+- key = str ของแต่ละค่า (ค่าเดียวกับที่ get_decimal ส่งให้ Decimal) จึงแยก 1000 / 1000.0 / Decimal("1000.0")
+  ผลจาก cache ตรงกับการแปลง + เรียกสูตรตรงทุกหลัก (str เดียวกัน) ไม่ขึ้นกับลำดับการเรียก (D001)
+- ขนาดจำกัด (LRU) ต่อขั้น ค่าเริ่มต้น DEFAULT_CACHE_SIZE รายการ
+- ปิดได้ด้วย set_enabled(False) หรือ with memoization(False): (เช่นในเทส / วัดความเร็ว)
+
+การใช้งาน:
+    import memo
+    total_atk, (atk_char, atk_pet, formation, potential_pet, buff_atk, buff_atk_pet) = memo.total_atk(config, atk_base)
+    effective_def, (def_target, def_buff, def_reduce, ignore_def) = memo.effective_def(config)
+    print(memo.cache_stats()["total_atk"].hit_rate)
+"""
+
+import functools
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from constants import CONFIG_DEFAULTS
+from damage_calc import calculate_effective_def, calculate_total_atk
+
+# key ใน config ตามลำดับค่า input ที่คืนคู่กับผล
+TOTAL_ATK_KEYS = ("ATK_CHAR", "ATK_PET", "Formation", "Potential_PET", "BUFF_ATK", "BUFF_ATK_PET")
+EFFECTIVE_DEF_KEYS = ("DEF_Target", "DEF_BUFF", "DEF_REDUCE", "Ignore_DEF")
+
+# ผลของ 1 ขั้น: (ค่าที่คำนวณได้, ค่า input เป็น Decimal ตามลำดับ keys)
+Stage = tuple[Decimal, tuple[Decimal, ...]]
+
+DEFAULT_CACHE_SIZE = 4096
+
+_enabled = True
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """สถิติของ cache หนึ่งตัว (สะสมตั้งแต่ clear ครั้งล่าสุด)"""
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def _total_atk_stage(atk_base: str, *values: str) -> Stage:
+    atk_char, atk_pet, formation, potential_pet, buff_atk, buff_atk_pet = inputs = tuple(map(Decimal, values))
+    total = calculate_total_atk(atk_char, atk_pet, Decimal(atk_base), formation, potential_pet, buff_atk, buff_atk_pet)
+    return total, inputs
+
+
+def _effective_def_stage(*values: str) -> Stage:
+    inputs = tuple(map(Decimal, values))
+    return calculate_effective_def(*inputs), inputs
+
+
+def _lru(func: Callable[..., Stage], maxsize: int) -> Any:
+    return functools.lru_cache(maxsize=maxsize)(func)
+
+
+_total_atk = _lru(_total_atk_stage, DEFAULT_CACHE_SIZE)
+_effective_def = _lru(_effective_def_stage, DEFAULT_CACHE_SIZE)
+
+
+def _values(config: Mapping[str, Any], keys: tuple[str, ...]) -> list[str]:
+    """str ของค่าใน config (ไม่มี key → CONFIG_DEFAULTS) แบบเดียวกับ get_decimal"""
+    get = config.get
+    return [str(get(key, CONFIG_DEFAULTS[key])) for key in keys]
+
+
+def total_atk(config: Mapping[str, Any], atk_base: Decimal) -> Stage:
+    """Total ATK ของ config ที่ merge แล้ว → (Total ATK, ค่า input ตามลำดับ TOTAL_ATK_KEYS)"""
+    stage = _total_atk if _enabled else _total_atk_stage
+    return stage(str(atk_base), *_values(config, TOTAL_ATK_KEYS))
+
+
+def effective_def(config: Mapping[str, Any]) -> Stage:
+    """Effective DEF ของ config ที่ merge แล้ว → (Effective DEF, ค่า input ตามลำดับ EFFECTIVE_DEF_KEYS)"""
+    stage = _effective_def if _enabled else _effective_def_stage
+    return stage(*_values(config, EFFECTIVE_DEF_KEYS))
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """hit / miss / ขนาด ของทุก cache (สำหรับ monitoring)"""
+    stats = {}
+    for name, cached in (("total_atk", _total_atk), ("effective_def", _effective_def)):
+        info = cached.cache_info()
+        stats[name] = CacheStats(info.hits, info.misses, info.currsize, info.maxsize)
+    return stats
+
+
+def clear_caches() -> None:
+    """ล้างค่าและรีเซ็ตตัวนับ"""
+    _total_atk.cache_clear()
+    _effective_def.cache_clear()
+
+
+def configure(maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+    """เปลี่ยนขนาด cache (ล้างของเดิม)"""
+    global _total_atk, _effective_def
+    if maxsize <= 0:
+        raise ValueError("maxsize ต้อง > 0 (ใช้ set_enabled(False) เพื่อปิด)")
+    _total_atk = _lru(_total_atk_stage, maxsize)
+    _effective_def = _lru(_effective_def_stage, maxsize)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """เปิด/ปิด cache ทั้งหมด (ปิดแล้วเรียกสูตรตรงๆ ไม่นับ hit/miss)"""
+    global _enabled
+    _enabled = enabled
+
+
+@contextmanager
+def memoization(enabled: bool) -> Iterator[None]:
+    """เปิด/ปิด cache ภายในบล็อก with แล้วคืนค่าเดิม"""
+    previous = _enabled
+    set_enabled(enabled)
+    try:
+        yield
+    finally:
+        set_enabled(previous)
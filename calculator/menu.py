@@ -8,15 +8,23 @@ from decimal import Decimal
 
 
 def select_mode() -> tuple[str, dict[str, Any]]:
-    """ให้ผู้ใช้เลือกโหมด (ปกติ / ตีปราสาท)"""
+    """ให้ผู้ใช้เลือกโหมด (ปกติ / ตีปราสาท / คำนวน ATK / หาสเตตัสที่ดีที่สุด / ทุกห้อง)"""
     print("\n--- เลือกโหมด (Select Mode) ---")
     print("  1. ปกติ (ใช้ค่าจาก config.json)")
     print("  2. ตีปราสาท")
     print("  3. คำนวน ATK")
-    
-    choice = input("\nเลือก [1-3]: ").strip()
-    
-    if choice == "3":
+    print("  4. หาสเตตัสที่ดีที่สุด (Gear Optimizer)")
+    print("  5. ทุกห้องพร้อมกัน (Kill Matrix)")
+    
+    choice = input("\nเลือก [1-5]: ").strip()
+    
+    if choice == "5":
+        print(">>> โหมด: Kill Matrix (ทุก monster preset)")
+        return "kill_matrix", {}
+    elif choice == "4":
+        print(">>> โหมด: Gear Optimizer")
+        return "optimizer", {}
+    elif choice == "3":
         print(">>> โหมด: เปรียบเทียบ ATK")
         return "atk_compare", {}
     elif choice == "2":
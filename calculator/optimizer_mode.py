@@ -0,0 +1,118 @@
+"""
+Gear Optimizer Mode - โหมดหาการจัด ATK_CHAR / CRIT_DMG / ชุดเซ็ทอาวุธ ที่ดีที่สุด (CLI)
+การคำนวณอยู่ใน gear_optimizer.py ไฟล์นี้มีแค่ input() / print()
+"""
+
+import time
+from typing import Any
+
+from config_loader import load_user_config, load_monster_preset, get_decimal
+from menu import select_character, select_skill
+from display import WEAPON_SET_NAMES, print_calculation_header
+from gear_optimizer import (
+    OBJECTIVE_DAMAGE,
+    OBJECTIVE_KILL,
+    GearBudget,
+    OptimizeResult,
+    StatRange,
+    optimize_gear,
+)
+
+
+def _ask_number(prompt: str, default: float) -> float:
+    """รับตัวเลข (กด Enter = ใช้ค่า default)"""
+    raw = input(f"{prompt} [{default:g}]: ").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        print(f">>> ค่าไม่ถูกต้อง ใช้ค่าเดิม {default:g}")
+        return default
+
+
+def input_budget(user_config: dict[str, Any]) -> GearBudget:
+    """ให้ผู้ใช้กรอกช่วงสเตตัสและงบ"""
+    atk_now = int(get_decimal(user_config, "ATK_CHAR", "4000"))
+    crit_now = int(get_decimal(user_config, "CRIT_DMG", "256"))
+
+    print("\n--- ช่วงสเตตัสที่ค้นหา (Stat Ranges) ---")
+    print("(กด Enter เพื่อใช้ค่าเดิม)")
+    atk_min = int(_ask_number("ATK_CHAR ต่ำสุด", atk_now))
+    atk_max = int(_ask_number("ATK_CHAR สูงสุด", atk_now + 2000))
+    crit_min = int(_ask_number("CRIT_DMG ต่ำสุด", crit_now))
+    crit_max = int(_ask_number("CRIT_DMG สูงสุด", crit_now + 150))
+
+    print("\n--- งบ (Budget) ---")
+    print("แต้มที่ใช้ = (ATK_CHAR - ต่ำสุด) x ค่า ATK + (CRIT_DMG - ต่ำสุด) x ค่า CRIT")
+    max_points = _ask_number("งบรวม (0 = ไม่จำกัด)", 0)
+    crit_cost = _ask_number("แต้มต่อ CRIT_DMG 1%", 10)
+
+    return GearBudget(
+        atk_char=StatRange(atk_min, atk_max),
+        crit_dmg=StatRange(crit_min, crit_max),
+        max_points=max_points if max_points > 0 else None,
+        atk_cost=1.0,
+        crit_cost=crit_cost,
+    )
+
+
+def select_objective() -> tuple[str, dict[str, Any]]:
+    """เลือกเป้าหมาย: ดาเมจสูงสุด หรือ โอกาสฆ่ามอนปราสาท"""
+    print("\n--- เป้าหมาย (Objective) ---")
+    print("  1. ดาเมจสูงสุด (คริ+จุดอ่อน)")
+    print("  2. โอกาสฆ่ามอนสูงสุด - ปราสาทห้อง 1")
+    print("  3. โอกาสฆ่ามอนสูงสุด - ปราสาทห้อง 2")
+
+    choice = input("\nเลือก [1-3]: ").strip()
+    if choice == "2":
+        return OBJECTIVE_KILL, load_monster_preset("castle_room1.json")
+    if choice == "3":
+        return OBJECTIVE_KILL, load_monster_preset("castle_room2.json")
+    return OBJECTIVE_DAMAGE, {}
+
+
+def print_optimize_result(result: OptimizeResult, elapsed: float) -> None:
+    """แสดงผลการค้นหา"""
+    print_calculation_header()
+    print(f"\n  ค้นหา {result.space_size:,} จุด / ประเมินจริง {result.evaluated:,} จุด ({elapsed:.3f}s)")
+
+    if result.best is None:
+        print("  ❌ ไม่มีการจัดสเตตัสที่อยู่ในงบ")
+        return
+
+    print("\n" + "-" * 60)
+    print("  ผลแต่ละชุดเซ็ทอาวุธ")
+    print("-" * 60)
+    for candidate in result.per_weapon_set:
+        line = f"  {WEAPON_SET_NAMES[candidate.weapon_set]}: ATK_CHAR {candidate.atk_char:,} | CRIT_DMG {candidate.crit_dmg}%"
+        line += f" | ดาเมจ {candidate.damage:,}"
+        if candidate.kill_probability is not None:
+            line += f" | โอกาสฆ่า {candidate.kill_probability:.1%}"
+        print(line)
+
+    best = result.best
+    print("\n" + "=" * 60)
+    print(f">>> ชุดเซ็ทอาวุธ: {best.weapon_set} - {WEAPON_SET_NAMES[best.weapon_set]}")
+    print(f">>> ดีที่สุด: ATK_CHAR {best.atk_char:,} | CRIT_DMG {best.crit_dmg}% | ดาเมจ {best.damage:,} <<<")
+    if best.kill_probability is not None:
+        print(f">>> โอกาสฆ่า: {best.kill_probability:.1%} <<<")
+    print("=" * 60)
+
+
+def run_gear_optimizer_mode() -> None:
+    """
+    Runs the Gear Optimizer mode logic
+    """
+    char_name, char_meta, char_config = select_character()
+    skill_config, _, _ = select_skill(char_meta)
+    user_config = load_user_config()
+
+    objective, monster_preset = select_objective()
+    budget = input_budget(user_config)
+
+    start = time.perf_counter()
+    result = optimize_gear(
+        char_meta, char_config, skill_config, user_config, budget,
+        objective=objective,
+        monster_preset=monster_preset or None,
+    )
+    print_optimize_result(result, time.perf_counter() - start)
@@ -0,0 +1,189 @@
+"""
+Parallel Evaluation - กระจาย build จำนวนมากไปหลาย process (ProcessPoolExecutor)
+
+- CharacterDB ถูก dump แล้วส่งให้แต่ละ worker ครั้งเดียวผ่าน initializer (ไม่ส่งต่อ task)
+  worker ใช้ DB นั้นโดยไม่อ่านไฟล์ / ไม่ตรวจ mtime
+- งานถูกแบ่งเป็น chunk (หลาย build ต่อ 1 task) เพื่อลดต้นทุน pickle / IPC ต่อ build
+- ส่ง chunk ล่วงหน้าไม่เกิน MAX_PENDING_PER_WORKER ต่อ worker → input เป็น iterator ยาวเท่าไรก็ได้
+- ผลลัพธ์คืนตามลำดับ input เสมอ (ไม่ขึ้นกับว่า worker ไหนเสร็จก่อน)
+- workers=1 รันใน process นี้ (ไม่มี pool) ผลเหมือนกันทุกบิต
+- ผลที่ส่งกลับควรเล็ก: evaluate_builds ย่อเป็น HitDamage ใน worker โดยปริยาย
+
+build: dict รูปแบบเดียวกับ job ของ batch_cli.py
+    {"character": "miho", "skill": "skill2", "config": {...}, "preset": "castle_room1.json"}
+    (config = user config ทั้งชุด, def_char / def_pet สำหรับ Biscuit)
+
+การใช้งาน:
+    from parallel import evaluate_builds, imap_ordered
+    damages = evaluate_builds(builds, workers=16)                 # list[HitDamage] ตามลำดับ builds
+    results = evaluate_builds(builds, workers=16, summarize=None) # list[DamageResult]
+    for damage in imap_ordered(score_build, builds, workers=16):  # ฟังก์ชันระดับ module ใดก็ได้
+        ...
+"""
+
+import functools
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from decimal import Decimal
+from itertools import islice
+from typing import Any, TypeVar
+
+from character_db import CharacterDB, get_character_db, set_character_db
+from pipeline import compute_damage
+from results import DamageResult, HitDamage
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# chunk ที่ค้างอยู่ใน pool ได้ต่อ worker (1 กำลังทำ + 1 รอคิว)
+MAX_PENDING_PER_WORKER = 2
+
+# ขนาด chunk เมื่อไม่รู้จำนวน input (iterator)
+DEFAULT_CHUNK_SIZE = 128
+
+# ขนาด chunk สูงสุดเมื่อคำนวณจากจำนวน input (ไม่ให้ worker ว่างตอนท้าย)
+MAX_CHUNK_SIZE = 1024
+
+
+def default_workers() -> int:
+    """จำนวน CPU ที่ process นี้ใช้ได้"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def pick_chunk_size(count: int | None, workers: int) -> int:
+    """ประมาณ 4 chunk ต่อ worker (พอให้กระจายงานสม่ำเสมอ โดยไม่เพิ่ม IPC)"""
+    if count is None:
+        return DEFAULT_CHUNK_SIZE
+    return max(1, min(MAX_CHUNK_SIZE, -(-count // (workers * 4))))
+
+
+def _init_worker(
+    db_dump: Mapping[str, Any],
+    initializer: Callable[..., None] | None,
+    initargs: tuple[Any, ...],
+) -> None:
+    """ติดตั้ง DB ที่ส่งมา (ครั้งเดียวต่อ worker) แล้วเรียก initializer เพิ่มเติมของผู้ใช้"""
+    set_character_db(CharacterDB.from_dump(db_dump))
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_chunk(fn: Callable[[T], R], chunk: list[T]) -> list[R]:
+    return [fn(item) for item in chunk]
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def imap_chunks(
+    fn: Callable[[list[T]], R],
+    chunks: Iterable[list[T]],
+    workers: int,
+    *,
+    db: CharacterDB | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """
+    เรียก fn(chunk) ใน worker แล้วคืนผลต่อ chunk ตามลำดับ (fn ต้องเป็นฟังก์ชันระดับ module)
+    initializer(*initargs) รันครั้งเดียวต่อ worker หลังติดตั้ง DB
+    """
+    if workers <= 0:
+        raise ValueError("workers ต้อง > 0")
+    db_dump = (db or get_character_db()).dump()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(db_dump, initializer, initargs)
+    ) as pool:
+        pending: deque[Future[R]] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk))
+            if len(pending) >= workers * MAX_PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def imap_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    *,
+    db: CharacterDB | None = None,
+) -> Iterator[R]:
+    """
+    fn(item) ของทุก item ตามลำดับ input (lazy: อ่าน input เท่าที่ pool รับได้)
+
+    Args:
+        workers: จำนวน process (None = จำนวน CPU, 1 = รันใน process นี้)
+        chunk_size: item ต่อ task (None = เลือกจากจำนวน item ถ้ารู้ ไม่งั้น DEFAULT_CHUNK_SIZE)
+        db: DB ที่ส่งให้ worker (None = get_character_db())
+    """
+    workers = default_workers() if workers is None else workers
+    if workers <= 0 or (chunk_size is not None and chunk_size <= 0):
+        raise ValueError("workers และ chunk_size ต้อง > 0")
+    if workers == 1:
+        previous = get_character_db()
+        set_character_db(db or previous)
+        try:
+            yield from map(fn, items)
+        finally:
+            set_character_db(previous)
+        return
+    if chunk_size is None:
+        chunk_size = pick_chunk_size(len(items) if isinstance(items, Sequence) else None, workers)
+    runner = functools.partial(_run_chunk, fn)
+    for results in imap_chunks(runner, _chunks(items, chunk_size), workers, db=db):
+        yield from results
+
+
+def parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    *,
+    db: CharacterDB | None = None,
+) -> list[R]:
+    """imap_ordered แบบคืน list"""
+    return list(imap_ordered(fn, items, workers, chunk_size, db=db))
+
+
+def compute_build(build: Mapping[str, Any]) -> DamageResult:
+    """คำนวณ build เดียว (dict แบบ batch_cli job โดย config = user config ทั้งชุด)"""
+    def_char, def_pet = build.get("def_char"), build.get("def_pet")
+    return compute_damage(
+        build["character"], build.get("skill"), dict(build.get("config") or {}), build.get("preset"),
+        def_char=None if def_char is None else Decimal(str(def_char)),
+        def_pet=None if def_pet is None else Decimal(str(def_pet)),
+    )
+
+
+def _compute_summary(summarize: Callable[[DamageResult], Any] | None, build: Mapping[str, Any]) -> Any:
+    result = compute_build(build)
+    return result if summarize is None else summarize(result)
+
+
+def evaluate_builds(
+    builds: Iterable[Mapping[str, Any]],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    *,
+    db: CharacterDB | None = None,
+    summarize: Callable[[DamageResult], Any] | None = HitDamage.from_result,
+) -> list[Any]:
+    """
+    ผลของทุก build ตามลำดับ input
+
+    summarize: ย่อ DamageResult ใน worker ก่อนส่งกลับ (ปริยาย: HitDamage 4 scenario)
+               None = ส่ง DamageResult ทั้งก้อนกลับมา - pickle ค่า Decimal ~30 ตัวต่อ build
+               ช้าพอๆ กับการคำนวณเอง (process หลักกลายเป็นคอขวด) ใช้เมื่อต้องการรายละเอียดจริงๆ
+    """
+    return parallel_map(functools.partial(_compute_summary, summarize), builds, workers, chunk_size, db=db)
@@ -0,0 +1,405 @@
+"""
+Pipeline - คำนวณดาเมจทั้งหมดแบบ headless (ไม่มี input()/print())
+main.py เลือกค่าผ่านเมนูแล้วส่งมาที่นี่ จากนั้นค่อยแสดงผลด้วย display.py
+
+การใช้งาน:
+    from pipeline import compute_damage
+    result = compute_damage("miho", "skill2", user_config, monster_preset)
+    print(result.final_dmg_crit_weakness)
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import memo
+from damage_calc import (
+    calculate_dmg_hp,
+    calculate_cap_atk,
+    calculate_final_dmg_hp,
+    calculate_raw_matrix,
+    calculate_final_dmg,
+)
+from constants import CONFIG_DEFAULTS, get_atk_base
+from config_loader import (
+    load_character_full,
+    load_user_config,
+    load_monster_preset,
+    apply_weapon_set,
+    merge_configs,
+    get_decimal,
+)
+from character_registry import get_character_handler
+from fast_calc import SCENARIO_INDEX
+from kill_solver import stat_shortfall
+from profiling import profiled, stage
+from results import BothSkillsResult, DamageResult, SkillDamage
+
+# skill key พิเศษ: เลือกทั้งสองสกิล (เหมือนตัวเลือกสุดท้ายใน menu.select_skill)
+BOTH_SKILLS = "both"
+
+
+def _strip_meta(data: dict[str, Any]) -> dict[str, Any]:
+    """ตัด key ที่ขึ้นต้นด้วย _ ออก (ชื่อสกิล, notes)"""
+    return {k: v for k, v in data.items() if not k.startswith("_")}
+
+
+def resolve_skill(
+    meta: dict[str, Any], skill_key: str | None
+) -> tuple[dict[str, Any], bool, list[dict[str, Any]] | None]:
+    """
+    แปลง skill key เป็น config ของสกิล
+    Returns: (skill_config, is_both_skills, all_skills_data) - รูปแบบเดียวกับ menu.select_skill
+    """
+    skills = meta.get("_skills")
+    if not skills:
+        return {}, False, None
+
+    skill_keys = list(skills.keys())
+
+    if skill_key == BOTH_SKILLS and len(skill_keys) >= 2:
+        # เอาสกิลแรกเป็นหลัก, ทุกสกิลเก็บใน all_skills_data สำหรับคำนวณรวม
+        all_skills_data = [
+            {"name": skills[key].get("_name", key), "config": _strip_meta(skills[key])}
+            for key in skill_keys
+        ]
+        return _strip_meta(skills[skill_keys[0]]), True, all_skills_data
+
+    if skill_key not in skills:
+        if skill_key is not None:
+            raise KeyError(f"ไม่พบสกิล '{skill_key}' (มี: {', '.join(skill_keys)})")
+        # Default to first skill
+        skill_key = skill_keys[0]
+
+    return _strip_meta(skills[skill_key]), False, None
+
+
+def prepare_config(
+    char_config: dict[str, Any],
+    skill_config: dict[str, Any],
+    user_config: dict[str, Any],
+    monster_preset: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    รวม config: user + monster preset → weapon set → merge กับ char + skill
+    Returns: (user_config หลังใส่ weapon set, merged config)
+    """
+    applied = dict(user_config)
+
+    # Override ด้วย monster preset (ถ้ามี)
+    if monster_preset:
+        applied.update(monster_preset)
+
+    with stage("apply_weapon_set"):
+        applied = apply_weapon_set(applied)
+
+    # Skill overrides/adds to char
+    combined_char_config = char_config.copy()
+    combined_char_config.update(skill_config)
+    with stage("merge_configs"):
+        return applied, merge_configs(combined_char_config, applied)
+
+
+def calculate_both_skills(
+    all_skills_data: list[dict[str, Any]], char_config: dict[str, Any], user_config: dict[str, Any],
+    total_atk: Decimal, crit_dmg: Decimal, weak_dmg: Decimal,
+    dmg_amp_buff: Decimal, dmg_amp_debuff: Decimal, dmg_reduction: Decimal,
+    def_target: Decimal, def_buff: Decimal, def_reduce: Decimal, hp_target: Decimal
+) -> BothSkillsResult:
+    """คำนวณดาเมจรวมทั้งสองสกิล (คริ / ติดจุดอ่อน)"""
+    skills = []
+    total_damage_crit = 0
+    total_damage_weak = 0
+
+    for skill_info in all_skills_data:
+        # Merge skill config with user config
+        merged_skill_config = char_config.copy()
+        merged_skill_config.update(skill_info["config"])
+        merged_skill = merge_configs(merged_skill_config, user_config)
+
+        s_skill_dmg = get_decimal(merged_skill, "SKILL_DMG")
+        s_skill_hits = int(merged_skill.get("SKILL_HITS", 1))
+        s_ignore_def = get_decimal(merged_skill, "Ignore_DEF")
+        s_hp_alteration = get_decimal(merged_skill, "HP_Alteration")
+        s_bonus_hp = get_decimal(merged_skill, "Bonus_DMG_HP_Target")
+        s_cap_atk = get_decimal(merged_skill, "Cap_ATK_Percent")
+
+        # คำนวณ Effective DEF สำหรับสกิลนี้ (Ignore_DEF เท่ากัน → ได้จาก cache)
+        s_eff_def, _ = memo.effective_def({
+            "DEF_Target": def_target, "DEF_BUFF": def_buff, "DEF_REDUCE": def_reduce, "Ignore_DEF": s_ignore_def,
+        })
+
+        # HP-based damage
+        s_dmg_hp = calculate_dmg_hp(hp_target, s_bonus_hp)
+        s_cap = calculate_cap_atk(total_atk, s_cap_atk)
+        s_final_hp = calculate_final_dmg_hp(s_dmg_hp, s_cap)
+
+        # HP Alteration (Freyja)
+        s_hp_alt_dmg = Decimal("0")
+        if s_hp_alteration > 0:
+            s_hp_alt_dmg = hp_target * (Decimal("100") - s_hp_alteration) / Decimal("100")
+
+        # RAW damage
+        s_raw = calculate_raw_matrix(
+            total_atk, (s_skill_dmg,), (crit_dmg,), (Decimal("0"), Decimal("30") + weak_dmg),
+            dmg_amp_buff, dmg_amp_debuff, dmg_reduction, (s_final_hp,)
+        )
+        s_raw_crit = s_raw[0, 0, 0, 0]
+        s_raw_weak = s_raw[0, 0, 1, 0]
+
+        # Final damage per skill
+        s_final_crit = calculate_final_dmg(s_raw_crit, s_eff_def) * s_skill_hits + int(s_hp_alt_dmg)
+        s_final_weak = calculate_final_dmg(s_raw_weak, s_eff_def) * s_skill_hits + int(s_hp_alt_dmg)
+
+        total_damage_crit += s_final_crit
+        total_damage_weak += s_final_weak
+        skills.append(SkillDamage(skill_info["name"], s_final_crit, s_final_weak))
+
+    return BothSkillsResult(
+        skills=tuple(skills),
+        total_crit=total_damage_crit,
+        total_weak=total_damage_weak,
+        hp_target=hp_target,
+    )
+
+
+@profiled("pipeline")
+def run_pipeline(
+    char_name: str | None,
+    char_meta: dict[str, Any],
+    char_config: dict[str, Any],
+    skill_config: dict[str, Any],
+    user_config: dict[str, Any],
+    monster_preset: dict[str, Any] | None = None,
+    is_both_skills: bool = False,
+    all_skills_data: list[dict[str, Any]] | None = None,
+    def_char: Decimal | None = None,
+    def_pet: Decimal | None = None,
+) -> DamageResult:
+    """
+    รัน pipeline ทั้งหมดจากค่าที่เลือกไว้แล้ว (ลำดับเดียวกับ main.py เดิม)
+    def_char / def_pet ใช้กับ Biscuit เท่านั้น (None = ใช้ค่าจาก config)
+    """
+    # ดึง ATK_BASE จาก rarity และ class
+    rarity = char_meta.get("_rarity", "legend")
+    char_class = char_meta.get("_class", "magic")
+    atk_base = get_atk_base(rarity, char_class)
+
+    applied_user_config, config = prepare_config(char_config, skill_config, user_config, monster_preset)
+    weapon_set = int(applied_user_config.get("Weapon_Set", 0))
+
+    def value(key: str) -> Decimal:
+        return get_decimal(config, key, CONFIG_DEFAULTS[key])
+
+    # ดึงค่าจาก config (ค่าของ Total ATK / Effective DEF ดึงพร้อมผลจาก memo ด้านล่าง)
+    skill_dmg = value("SKILL_DMG")
+    skill_hits = int(config.get("SKILL_HITS", 1))
+    crit_dmg = value("CRIT_DMG")
+    weak_dmg = value("WEAK_DMG")
+    dmg_amp_buff = value("DMG_AMP_BUFF")
+    dmg_amp_debuff = value("DMG_AMP_DEBUFF")
+    dmg_reduction = value("DMG_Reduction")
+
+    bonus_dmg_hp_target = value("Bonus_DMG_HP_Target")
+    cap_atk_percent = value("Cap_ATK_Percent")
+    hp_target = value("HP_Target")
+
+    # 1. Total ATK
+    with stage("total_atk"):
+        total_atk, (atk_char, atk_pet, formation, potential_pet, buff_atk, buff_atk_pet) = memo.total_atk(
+            config, atk_base
+        )
+
+    # 2. HP-Based Damage
+    with stage("hp_damage"):
+        dmg_hp = calculate_dmg_hp(hp_target, bonus_dmg_hp_target)
+        cap_atk = calculate_cap_atk(total_atk, cap_atk_percent)
+        final_dmg_hp = calculate_final_dmg_hp(dmg_hp, cap_atk)
+
+    # 3. RAW Damage (แยกคำนวณ 4 แบบ)
+    with stage("raw_dmg"):
+        # คริ / ไม่คริ (CRIT_DMG = 100) x ไม่ติดจุดอ่อน (WEAK_DMG = 0) / ติดจุดอ่อน (30% พื้นฐาน + WEAK_DMG)
+        total_weak_dmg = Decimal("30") + weak_dmg
+        raw = calculate_raw_matrix(
+            total_atk, (skill_dmg,), (crit_dmg, Decimal("100")), (Decimal("0"), total_weak_dmg),
+            dmg_amp_buff, dmg_amp_debuff, dmg_reduction, (final_dmg_hp,)
+        )
+        raw_dmg_crit = raw[0, 0, 0, 0]
+        raw_dmg_crit_weakness = raw[0, 0, 1, 0]
+        raw_dmg_no_crit = raw[0, 1, 0, 0]
+        raw_dmg_weakness_only = raw[0, 1, 1, 0]
+
+    # 4. Effective DEF
+    with stage("effective_def"):
+        effective_def, (def_target, def_buff, def_reduce, ignore_def) = memo.effective_def(config)
+
+    # 5. Final Damage (ต่อ 1 hit) - สำหรับตัวละครปกติ
+    with stage("final_dmg"):
+        final_dmg_crit = calculate_final_dmg(raw_dmg_crit, effective_def)
+        final_dmg_crit_weakness = calculate_final_dmg(raw_dmg_crit_weakness, effective_def)
+        final_dmg_no_crit = calculate_final_dmg(raw_dmg_no_crit, effective_def)
+        final_dmg_weakness_only = calculate_final_dmg(raw_dmg_weakness_only, effective_def)
+
+    # ดึง HP มอนจาก monster_preset (ถ้ามี)
+    monster_hp = monster_preset.get("HP_Target", 0) if monster_preset else 0
+
+    # ตรวจสอบว่าเป็นตัวละครที่มี special logic หรือไม่ (ใช้ Registry pattern)
+    special_result = None
+    handler = get_character_handler(char_name) if char_name else None
+    if handler:
+        # เตรียมค่าที่จำเป็นสำหรับ handler
+        config_for_handler = {
+            "HP_Alteration": get_decimal(config, "HP_Alteration", "0"),
+            "Lost_HP_Bonus": get_decimal(config, "Lost_HP_Bonus", "0"),
+            "WEAK_SKILL_DMG": get_decimal(config, "WEAK_SKILL_DMG", "0"),
+            "Target_HP_Percent": get_decimal(config, "Target_HP_Percent", "100"),
+            "HP_Above_50_Bonus": get_decimal(config, "HP_Above_50_Bonus", "0"),
+            "HP_Below_50_Bonus": get_decimal(config, "HP_Below_50_Bonus", "0"),
+            "Bonus_DMG_HP_Target": bonus_dmg_hp_target,
+            "Cap_ATK_Percent": cap_atk_percent,
+            "DEF_CHAR": config.get("DEF_CHAR", "0"),
+            "DEF_PET": config.get("DEF_PET", "0"),
+            "SKILL_DMG_DEF": get_decimal(config, "SKILL_DMG_DEF", "0"),
+            "Final_DMG_HP": final_dmg_hp,
+            "_is_both_skills": is_both_skills,
+        }
+
+        # เพิ่มข้อมูลเพิ่มเติมลงใน skill_config
+        skill_config_for_handler = skill_config.copy()
+        skill_config_for_handler["_is_both_skills"] = is_both_skills
+
+        handler_kwargs: dict[str, Any] = {
+            "total_atk": total_atk,
+            "skill_dmg": skill_dmg,
+            "crit_dmg": crit_dmg,
+            "weak_dmg": weak_dmg,
+            "dmg_amp_buff": dmg_amp_buff,
+            "dmg_amp_debuff": dmg_amp_debuff,
+            "dmg_reduction": dmg_reduction,
+            "eff_def": effective_def,
+            "skill_hits": skill_hits,
+            "hp_target": hp_target,
+            "config": config_for_handler,
+            "char_meta": char_meta,
+            "skill_config": skill_config_for_handler,
+            "monster_preset": monster_preset,
+        }
+        # Biscuit: DEF ที่ผู้ใช้กรอก (ถ้ามี)
+        if def_char is not None:
+            handler_kwargs["def_char"] = def_char
+        if def_pet is not None:
+            handler_kwargs["def_pet"] = def_pet
+
+        with stage("handler"):
+            special_result = handler(**handler_kwargs)
+
+    # === ถ้าเลือกทั้งสองสกิล: คำนวณดาเมจรวม ===
+    both_skills = None
+    if special_result is None and is_both_skills and all_skills_data:
+        with stage("both_skills"):
+            both_skills = calculate_both_skills(
+                all_skills_data, char_config, applied_user_config,
+                total_atk, crit_dmg, weak_dmg,
+                dmg_amp_buff, dmg_amp_debuff, dmg_reduction,
+                def_target, def_buff, def_reduce, hp_target
+            )
+
+    # === โหมดปราสาท: ATK_CHAR ที่ต้องเพิ่มให้ฆ่ามอนได้ (ต่อ scenario) ===
+    atk_needed = None
+    if special_result is None and monster_hp > 0:
+        with stage("atk_needed"):
+            atk_needed = tuple(
+                stat_shortfall(config, atk_base, "ATK_CHAR", int(monster_hp), skill_hits, scenario)
+                for scenario in SCENARIO_INDEX
+            )
+
+    return DamageResult(
+        char_name=char_name,
+        rarity=rarity,
+        char_class=char_class,
+        atk_base=atk_base,
+        weapon_set=weapon_set,
+        char_config=char_config,
+        user_config=applied_user_config,
+        config=config,
+        atk_char=atk_char,
+        atk_pet=atk_pet,
+        formation=formation,
+        potential_pet=potential_pet,
+        buff_atk=buff_atk,
+        buff_atk_pet=buff_atk_pet,
+        skill_dmg=skill_dmg,
+        skill_hits=skill_hits,
+        crit_dmg=crit_dmg,
+        weak_dmg=weak_dmg,
+        dmg_amp_buff=dmg_amp_buff,
+        dmg_amp_debuff=dmg_amp_debuff,
+        dmg_reduction=dmg_reduction,
+        def_target=def_target,
+        def_buff=def_buff,
+        def_reduce=def_reduce,
+        ignore_def=ignore_def,
+        hp_target=hp_target,
+        bonus_dmg_hp_target=bonus_dmg_hp_target,
+        cap_atk_percent=cap_atk_percent,
+        total_atk=total_atk,
+        dmg_hp=dmg_hp,
+        cap_atk=cap_atk,
+        final_dmg_hp=final_dmg_hp,
+        raw_dmg_crit=raw_dmg_crit,
+        raw_dmg_crit_weakness=raw_dmg_crit_weakness,
+        raw_dmg_no_crit=raw_dmg_no_crit,
+        raw_dmg_weakness_only=raw_dmg_weakness_only,
+        effective_def=effective_def,
+        final_dmg_crit=final_dmg_crit,
+        final_dmg_crit_weakness=final_dmg_crit_weakness,
+        final_dmg_no_crit=final_dmg_no_crit,
+        final_dmg_weakness_only=final_dmg_weakness_only,
+        monster_hp=int(monster_hp),
+        special_character=char_name.lower() if special_result is not None else None,
+        special_result=special_result,
+        both_skills=both_skills,
+        atk_needed=atk_needed,
+    )
+
+
+def compute_damage(
+    character: str,
+    skill: str | None = None,
+    user_config: dict[str, Any] | None = None,
+    monster_preset: dict[str, Any] | str | None = None,
+    *,
+    def_char: Decimal | None = None,
+    def_pet: Decimal | None = None,
+) -> DamageResult:
+    """
+    คำนวณดาเมจแบบ headless (ไม่มี input()/print())
+
+    Args:
+        character: ชื่อไฟล์ตัวละคร (เช่น "miho")
+        skill: key ใน _skills (เช่น "skill1"), BOTH_SKILLS หรือ None = สกิลแรก
+        user_config: config ของผู้ใช้ (None = โหลดจาก config.json)
+        monster_preset: dict ของ preset หรือชื่อไฟล์ใน characters/monster/
+        def_char, def_pet: ค่า DEF สำหรับ Biscuit (None = ใช้ค่าจาก config)
+    """
+    with stage("load_character"):
+        char_meta, char_config = load_character_full(character)
+    if not char_meta and not char_config:
+        raise KeyError(f"ไม่พบตัวละคร '{character}'")
+
+    skill_config, is_both_skills, all_skills_data = resolve_skill(char_meta, skill)
+
+    if user_config is None:
+        with stage("load_user_config"):
+            user_config = load_user_config()
+    if isinstance(monster_preset, str):
+        with stage("load_monster_preset"):
+            monster_preset = load_monster_preset(monster_preset)
+
+    return run_pipeline(
+        character, char_meta, char_config, skill_config, user_config,
+        monster_preset=monster_preset,
+        is_both_skills=is_both_skills,
+        all_skills_data=all_skills_data,
+        def_char=def_char,
+        def_pet=def_pet,
+    )
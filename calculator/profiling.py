@@ -0,0 +1,194 @@
+"""
+Profiling - จับเวลา / นับครั้ง / วัด allocation ต่อขั้นของ pipeline (opt-in)
+
+- ปิดอยู่โดยปริยาย: stage() คืน context ว่าง (ต้นทุน ~0.1 us) จนกว่าจะมี profile() ครอบ
+- stage ซ้อนกันได้ ชื่อที่บันทึกเป็น path เช่น "pipeline/raw_dmg"
+- allocation (track_allocations=True) ใช้ tracemalloc: net = หน่วยความจำที่เพิ่มค้างหลังจบ stage,
+  peak = จุดสูงสุดระหว่าง stage เทียบกับตอนเริ่ม (tracemalloc ทำให้ทุกอย่างช้าลงหลายเท่า)
+- ใช้ใน thread เดียว (stack ของ stage ไม่แยกตาม thread)
+
+การใช้งาน:
+    from profiling import profile, stage, profiled
+
+    with profile(track_allocations=True) as profiler:
+        for user in users:
+            compute_damage("miho", "skill2", user)
+    print(profiler.summary())
+    Path("profile.json").write_text(profiler.to_json())
+
+CLI: DAMAGE_PROFILE=1 python calculator/main.py (ตารางท้ายโปรแกรม)
+     DAMAGE_PROFILE=profile.json / DAMAGE_PROFILE_MEMORY=1 (ดู PROFILE_ENV)
+"""
+
+import functools
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, TypeVar
+
+# ตัวแปร environment ที่ main.py อ่าน: "1" = พิมพ์ตาราง, "*.json" = เขียน JSON
+PROFILE_ENV = "DAMAGE_PROFILE"
+PROFILE_MEMORY_ENV = "DAMAGE_PROFILE_MEMORY"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NULL = nullcontext()
+_active: "Profiler | None" = None
+
+
+@dataclass(slots=True)
+class StageStats:
+    """สถิติสะสมของ 1 stage"""
+    calls: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+    alloc_bytes: int = 0
+    peak_bytes: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def add(self, elapsed_ns: int, alloc_bytes: int = 0, peak_bytes: int = 0) -> None:
+        self.min_ns = elapsed_ns if self.calls == 0 else min(self.min_ns, elapsed_ns)
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.alloc_bytes += alloc_bytes
+        self.peak_bytes = max(self.peak_bytes, peak_bytes)
+
+
+@dataclass
+class Profiler:
+    """เก็บสถิติต่อ stage (key = path ของ stage)"""
+    track_allocations: bool = False
+    stats: dict[str, StageStats] = field(default_factory=dict)
+    # stack ของ stage ที่เปิดอยู่: [path, start_ns, start_bytes, peak_bytes]
+    _stack: list[list[Any]] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        path = f"{self._stack[-1][0]}/{name}" if self._stack else name
+        memory = self.track_allocations and tracemalloc.is_tracing()
+        start_bytes = 0
+        if memory:
+            start_bytes, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][3] = max(self._stack[-1][3], peak)
+            tracemalloc.reset_peak()
+        frame = [path, time.perf_counter_ns(), start_bytes, start_bytes]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - frame[1]
+            self._stack.pop()
+            alloc = peak_delta = 0
+            if memory:
+                current, peak = tracemalloc.get_traced_memory()
+                frame[3] = max(frame[3], peak)
+                alloc = current - start_bytes
+                peak_delta = frame[3] - start_bytes
+                if self._stack:
+                    self._stack[-1][3] = max(self._stack[-1][3], frame[3])
+            entry = self.stats.get(path)
+            if entry is None:
+                entry = self.stats[path] = StageStats()
+            entry.add(elapsed, alloc, peak_delta)
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """สถิติทั้งหมด (หน่วย: ns / bytes) ตามลำดับที่ stage ถูกเรียกครั้งแรก"""
+        return {
+            "track_allocations": self.track_allocations,
+            "stages": {
+                path: {
+                    "calls": s.calls,
+                    "total_ns": s.total_ns,
+                    "mean_ns": round(s.mean_ns, 1),
+                    "min_ns": s.min_ns,
+                    "max_ns": s.max_ns,
+                    **({"alloc_bytes": s.alloc_bytes, "peak_bytes": s.peak_bytes}
+                       if self.track_allocations else {}),
+                }
+                for path, s in self.stats.items()
+            },
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    def summary(self) -> str:
+        """ตารางสรุป (เรียงตามเวลารวม มากไปน้อย)"""
+        width = max((len(p) for p in self.stats), default=5)
+        header = f"  {'stage':<{width}} {'calls':>8} {'total ms':>10} {'mean us':>10} {'max us':>10}"
+        if self.track_allocations:
+            header += f" {'net KiB':>9} {'peak KiB':>9}"
+        lines = ["=" * len(header), header, "-" * len(header)]
+        for path, s in sorted(self.stats.items(), key=lambda item: -item[1].total_ns):
+            line = (f"  {path:<{width}} {s.calls:>8,} {s.total_ns / 1e6:>10.3f}"
+                    f" {s.mean_ns / 1e3:>10.2f} {s.max_ns / 1e3:>10.2f}")
+            if self.track_allocations:
+                line += f" {s.alloc_bytes / 1024:>9.1f} {s.peak_bytes / 1024:>9.1f}"
+            lines.append(line)
+        lines.append("=" * len(header))
+        return "\n".join(lines)
+
+
+def active_profiler() -> Profiler | None:
+    """profiler ที่กำลังเก็บข้อมูล (None = ปิดอยู่)"""
+    return _active
+
+
+def stage(name: str) -> ContextManager[None]:
+    """จับเวลาบล็อก with ถ้ามี profiler ทำงานอยู่ ไม่งั้นไม่ทำอะไร"""
+    profiler = _active
+    if profiler is None:
+        return _NULL
+    return profiler.stage(name)
+
+
+def profiled(name: str | None = None) -> Callable[[F], F]:
+    """Decorator: จับเวลาทุกครั้งที่เรียกฟังก์ชัน (ชื่อ stage ปริยาย = ชื่อฟังก์ชัน)"""
+
+    def decorator(func: F) -> F:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.stage(label):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def profile(track_allocations: bool = False, profiler: Profiler | None = None) -> Iterator[Profiler]:
+    """
+    เปิด profiling ภายในบล็อก with (ซ้อนได้: ออกจากบล็อกแล้วคืน profiler เดิม)
+    profiler: ส่งตัวเดิมเข้ามาเพื่อสะสมสถิติต่อจากรอบก่อน
+    """
+    global _active
+    if profiler is None:
+        profiler = Profiler(track_allocations=track_allocations)
+    started = profiler.track_allocations and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    previous, _active = _active, profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+        if started:
+            tracemalloc.stop()
@@ -0,0 +1,246 @@
+"""
+Results - โครงสร้างผลลัพธ์การคำนวณ (ไม่มี I/O)
+pipeline.py / logic/*.py สร้าง record เหล่านี้ ส่วน display.py และ renderer เป็นคนแสดงผล
+"""
+
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class SkillDamage:
+    """ดาเมจรวมของสกิลเดียวในโหมดทั้งสองสกิล"""
+    name: str
+    damage_crit: int
+    damage_weak: int
+
+
+@dataclass(frozen=True, slots=True)
+class BothSkillsResult:
+    """ผลรวมทั้งสองสกิล (แทนการคำนวณใน print_both_skills_results เดิม)"""
+    skills: tuple[SkillDamage, ...]
+    total_crit: int
+    total_weak: int
+    hp_target: Decimal
+
+
+# ============================================
+# Character Results (ผลลัพธ์จาก logic/*.py ผ่าน character handler)
+# ============================================
+
+@dataclass(frozen=True, slots=True)
+class ScenarioDamage:
+    """ดาเมจหนึ่งกรณี: RAW, Final (รวมทุก hit) และต่อ hit"""
+    raw: Decimal
+    final: int
+    per_hit: int | None = None
+    multiplier: Decimal | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CharacterResult:
+    """Base ของผลลัพธ์ตัวละครพิเศษ"""
+
+    def to_dict(self) -> dict[str, Any]:
+        """แปลงเป็น dict (เช่น เขียนเป็น JSON ใน batch_cli)"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class FreyjaResult(CharacterResult):
+    """ผลลัพธ์ Freyja (HP Alteration)"""
+    crit_damage: int
+    crit_per_hit: int
+    hp_alteration_damage: int
+    weakness_damage: int
+    weakness_per_hit: int
+    hp_alteration_percent: Decimal
+    total_weakness_percent: Decimal
+    skill_hits: int
+    hp_target: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class RyanResult(CharacterResult):
+    """ผลลัพธ์ Ryan (Lost HP Bonus + Weakness Extra)"""
+    crit_full_hp: ScenarioDamage
+    crit_low_hp: ScenarioDamage
+    weak_full_hp: ScenarioDamage
+    weak_low_hp: ScenarioDamage
+    skill_hits: int
+    lost_hp_bonus: Decimal
+    target_hp_percent: Decimal
+    weak_skill_dmg: Decimal
+    total_weakness: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class KlahanResult(CharacterResult):
+    """ผลลัพธ์ Klahan (HP Condition Bonus)"""
+    crit_no_bonus: ScenarioDamage
+    crit_with_bonus: ScenarioDamage
+    weak_no_bonus: ScenarioDamage
+    weak_with_bonus: ScenarioDamage
+    skill_hits: int
+    skill_name: str
+    skill_dmg: Decimal
+    hp_bonus: Decimal
+    hp_condition: str
+    total_skill_dmg: Decimal
+    total_weakness: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class EspadaResult(CharacterResult):
+    """ผลลัพธ์ Espada (HP-Based 4 กรณี)"""
+    dmg_hp: Decimal
+    cap_atk: Decimal
+    final_dmg_hp: Decimal
+    crit_no_hp: ScenarioDamage
+    crit_with_hp: ScenarioDamage
+    weak_no_hp: ScenarioDamage
+    weak_with_hp: ScenarioDamage
+    weak_dmg: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class BiscuitResult(CharacterResult):
+    """ผลลัพธ์ Biscuit (Dual Scaling ATK + DEF)"""
+    total_def: Decimal
+    raw_atk_crit: Decimal
+    raw_atk_normal: Decimal
+    raw_def_crit: Decimal
+    raw_def_normal: Decimal
+    final_atk_crit: int
+    final_atk_normal: int
+    final_def_crit: int
+    final_def_normal: int
+    total_per_hit_crit: int
+    total_per_hit_normal: int
+    total_skill_dmg_crit: Decimal
+    total_skill_dmg_normal: Decimal
+    skill_hits: int
+    castle_hp: Decimal | None = None  # HP มอนในโหมดปราสาท (None = ไม่เช็คว่าตายไหม)
+
+
+@dataclass(frozen=True, slots=True)
+class CastleScenario:
+    """Sun Wukong: ผลของการติดคริ c ครั้งจาก n hits"""
+    crit_count: int
+    fail_hits: int
+    total_damage: int
+    is_kill: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SunWukongResult(CharacterResult):
+    """ผลลัพธ์ Sun Wukong Castle Mode (จำนวนคริขั้นต่ำ 2 กรณี)"""
+    skill_name: str
+    skill_hits: int
+    hp_target: int
+    dmg_normal_per_hit: int
+    dmg_weak_only_per_hit: int
+    dmg_crit_weak_per_hit: int
+    total_weakness: Decimal
+    min_crits_weak_base: int
+    can_kill_weak_base: bool
+    scenarios_weak_base: tuple[CastleScenario, ...]
+    min_crits_normal_base: int
+    can_kill_normal_base: bool
+    scenarios_normal_base: tuple[CastleScenario, ...]
+
+
+# ============================================
+# Pipeline Result
+# ============================================
+
+@dataclass(frozen=True, slots=True)
+class DamageResult:
+    """ผลลัพธ์ทั้งหมดของ pipeline สำหรับตัวละคร + สกิล + config หนึ่งชุด"""
+
+    # ตัวละคร
+    char_name: str | None
+    rarity: str
+    char_class: str
+    atk_base: Decimal
+    weapon_set: int
+
+    # config ที่ใช้ (char = ค่าของตัวละคร, user = หลังใส่ weapon set, config = รวมแล้ว)
+    char_config: dict[str, Any]
+    user_config: dict[str, Any]
+    config: dict[str, Any]
+
+    # ค่า input หลัง merge
+    atk_char: Decimal
+    atk_pet: Decimal
+    formation: Decimal
+    potential_pet: Decimal
+    buff_atk: Decimal
+    buff_atk_pet: Decimal
+    skill_dmg: Decimal
+    skill_hits: int
+    crit_dmg: Decimal
+    weak_dmg: Decimal
+    dmg_amp_buff: Decimal
+    dmg_amp_debuff: Decimal
+    dmg_reduction: Decimal
+    def_target: Decimal
+    def_buff: Decimal
+    def_reduce: Decimal
+    ignore_def: Decimal
+    hp_target: Decimal
+    bonus_dmg_hp_target: Decimal
+    cap_atk_percent: Decimal
+
+    # ผลการคำนวณ
+    total_atk: Decimal
+    dmg_hp: Decimal
+    cap_atk: Decimal
+    final_dmg_hp: Decimal
+    raw_dmg_crit: Decimal
+    raw_dmg_crit_weakness: Decimal
+    raw_dmg_no_crit: Decimal
+    raw_dmg_weakness_only: Decimal
+    effective_def: Decimal
+    final_dmg_crit: int
+    final_dmg_crit_weakness: int
+    final_dmg_no_crit: int
+    final_dmg_weakness_only: int
+
+    # HP มอนจาก monster preset (0 = ไม่ใช่โหมดปราสาท)
+    monster_hp: int
+
+    # ผลจาก character handler (ถ้ามี) - แทนผล 4 กรณีปกติ
+    special_character: str | None = None
+    special_result: CharacterResult | None = None
+
+    # โหมดทั้งสองสกิล
+    both_skills: BothSkillsResult | None = None
+
+    # ATK_CHAR ที่ต้องเพิ่มเพื่อฆ่ามอน (crit, crit_weak, no_crit, weak_only)
+    # 0 = ฆ่าได้แล้ว, None = เพิ่ม ATK_CHAR อย่างเดียวไม่พอ / ไม่ใช่โหมดปราสาท
+    atk_needed: tuple[int | None, int | None, int | None, int | None] | None = None
+
+    @property
+    def is_special(self) -> bool:
+        """True ถ้า character handler จัดการผลลัพธ์แล้ว"""
+        return self.special_result is not None
+
+
+@dataclass(frozen=True, slots=True)
+class HitDamage:
+    """Final Damage ต่อ 1 hit ของทั้ง 4 แบบ"""
+    crit: int
+    crit_weak: int
+    no_crit: int
+    weak_only: int
+
+    @classmethod
+    def from_result(cls, result: "DamageResult") -> "HitDamage":
+        return cls(
+            crit=result.final_dmg_crit,
+            crit_weak=result.final_dmg_crit_weakness,
+            no_crit=result.final_dmg_no_crit,
+            weak_only=result.final_dmg_weakness_only,
+        )
@@ -0,0 +1,204 @@
+"""
+Roster Kill Matrix - ทุกตัวละคร x ทุกสกิล x ทุกชุดเซ็ทอาวุธ x ทุก monster preset (ไม่มีเมนู)
+
+- แต่ละตัวละครคือ 1 งาน: kill_matrix.character_matrix ของทุกชุดเซ็ท (Total ATK / RAW คิดครั้งเดียวต่อสกิล)
+- SkillSpec ของตัวละคร (merge rule, ATK_BASE, SKILL_HITS) ถูก cache ต่อ process
+  ใช้ซ้ำจนกว่าไฟล์ตัวละครนั้นจะเปลี่ยน (CharacterDB โหลด entry ใหม่) → เปลี่ยน config.json แล้วรันใหม่ไม่ต้อง parse สกิลซ้ำ
+- --workers N: กระจายตัวละครไปหลาย process ผ่าน parallel.imap_ordered (ผลเรียงตาม input เสมอ)
+- ผลเป็นแถวละ (ตัวละคร, สกิล, ชุดเซ็ท, preset) เรียงได้ตาม margin / damage / character / target
+
+การใช้งาน:
+    python calculator/roster.py --sort margin --scenario crit --kills-only
+    python calculator/roster.py --weapon-set 3 4 --monster castle_room1 --csv > roster.csv
+
+    from roster import roster_matrices, roster_rows, sort_rows
+    rows = sort_rows(roster_rows(roster_matrices(user_config, workers=4)), "margin", "crit_weak")
+"""
+
+import argparse
+import csv
+import functools
+import sys
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+# Add parent directory to path for imports (รันเป็นสคริปต์ได้)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from character_db import CharacterDB, CharacterEntry, get_character_db
+from config_loader import load_json, load_user_config
+from equipment import get_weapon_sets
+from fast_calc import SCENARIO_INDEX
+from kill_matrix import KillCell, KillMatrix, character_matrix, monster_targets
+from parallel import imap_ordered
+from specs import SkillSpec, TargetSpec, skill_specs
+
+# ลำดับเรียงที่รองรับ (margin / damage: มากไปน้อย, character / target: ตามชื่อ)
+SORT_KEYS = ("margin", "damage", "character", "target")
+
+# SkillSpec ต่อตัวละคร: ชื่อ → (entry ที่ใช้สร้าง, specs)
+_skill_cache: dict[str, tuple[CharacterEntry, tuple[SkillSpec, ...]]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class RosterRow:
+    """1 แถวของตาราง: สกิลของตัวละคร 1 ตัวกับ 1 preset ภายใต้ 1 ชุดเซ็ท"""
+    character: str
+    weapon_set: int
+    cell: KillCell
+
+
+def cached_skill_specs(character: str, db: CharacterDB | None = None) -> tuple[SkillSpec, ...]:
+    """skill_specs ที่ cache ไว้ (โหลดใหม่เมื่อ CharacterDB คืน entry ใหม่ เช่น ไฟล์ตัวละครเปลี่ยน)"""
+    db = db or get_character_db()
+    entry = db.get(character)
+    cached = _skill_cache.get(character)
+    if cached is not None and cached[0] is entry:
+        return cached[1]
+    specs = skill_specs(character, db)
+    _skill_cache[character] = (entry, specs)
+    return specs
+
+
+def clear_skill_cache() -> None:
+    _skill_cache.clear()
+
+
+def character_matrices(
+    character: str,
+    user_config: Mapping[str, Any],
+    targets: Sequence[TargetSpec],
+    weapon_sets: Sequence[int],
+) -> list[KillMatrix]:
+    """kill matrix ของตัวละคร 1 ตัว ต่อชุดเซ็ทอาวุธ (ตามลำดับ weapon_sets)"""
+    specs = cached_skill_specs(character)
+    return [
+        character_matrix(character, {**user_config, "Weapon_Set": weapon_set}, targets, specs)
+        for weapon_set in weapon_sets
+    ]
+
+
+def roster_matrices(
+    user_config: Mapping[str, Any],
+    characters: Iterable[str] | None = None,
+    weapon_sets: Iterable[int] | None = None,
+    monsters: Iterable[str] | None = None,
+    workers: int = 1,
+    db: CharacterDB | None = None,
+) -> list[KillMatrix]:
+    """
+    kill matrix ของทุก (ตัวละคร, ชุดเซ็ท) เรียงตามตัวละครแล้วตามชุดเซ็ท
+
+    Args:
+        characters / weapon_sets / monsters: None = ทั้งหมดใน CharacterDB / ตารางชุดเซ็ท
+        workers: จำนวน process (1 = รันใน process นี้ ใช้ cache ของ process นี้ต่อได้)
+    """
+    db = db or get_character_db()
+    characters = db.names() if characters is None else tuple(characters)
+    weapon_sets = tuple(get_weapon_sets()) if weapon_sets is None else tuple(weapon_sets)
+    targets = monster_targets(user_config, monsters, db)
+    task = functools.partial(character_matrices, user_config=dict(user_config),
+                             targets=targets, weapon_sets=weapon_sets)
+    matrices = []
+    for per_character in imap_ordered(task, characters, workers, chunk_size=1, db=db):
+        matrices.extend(per_character)
+    return matrices
+
+
+def roster_rows(matrices: Iterable[KillMatrix]) -> list[RosterRow]:
+    """แตก matrix เป็นแถวละ cell"""
+    return [RosterRow(m.character, m.weapon_set, cell) for m in matrices for cell in m.cells]
+
+
+def sort_rows(rows: Iterable[RosterRow], by: str = "margin", scenario: str = "crit") -> list[RosterRow]:
+    """เรียงแถว: margin / damage (ของ scenario, มากไปน้อย) หรือ character / target (ตามชื่อ)"""
+    i = SCENARIO_INDEX[scenario]
+    keys = {
+        "margin": lambda r: (-r.cell.margins[i] if r.cell.hp > 0 else float("inf"), r.character),
+        "damage": lambda r: (-r.cell.totals[i], r.character),
+        "character": lambda r: (r.character, r.weapon_set, r.cell.skill or "", r.cell.target),
+        "target": lambda r: (r.cell.target, -r.cell.margins[i], r.character),
+    }
+    if by not in keys:
+        raise ValueError(f"เรียงได้ตาม {', '.join(SORT_KEYS)} (ได้ '{by}')")
+    return sorted(rows, key=keys[by])
+
+
+def _skill_name(db: CharacterDB, row: RosterRow) -> str:
+    skills = db.get(row.character).meta.get("_skills") or {}
+    return skills.get(row.cell.skill, {}).get("_name", row.cell.skill) if row.cell.skill else "-"
+
+
+def write_table(rows: Sequence[RosterRow], scenario: str, out: TextIO, db: CharacterDB | None = None) -> None:
+    """ตารางอ่านง่ายของ scenario เดียว"""
+    db = db or get_character_db()
+    i = SCENARIO_INDEX[scenario]
+    out.write(f"{'character':<14}{'skill':<24}{'set':>4}  {'preset':<16}{'HP':>9}{'damage':>11}{'margin':>11}\n")
+    out.write("-" * 89 + "\n")
+    for row in rows:
+        cell = row.cell
+        hp = f"{cell.hp:,}" if cell.hp > 0 else "-"
+        margin = (f"💀 +{cell.margins[i]:,}" if cell.kills[i] else f"{cell.margins[i]:,}") if cell.hp > 0 else "-"
+        out.write(f"{row.character:<14}{_skill_name(db, row):<24}{row.weapon_set:>4}  {cell.target:<16}"
+                  f"{hp:>9}{cell.totals[i]:>11,}{margin:>11}\n")
+
+
+def write_csv(rows: Iterable[RosterRow], out: TextIO) -> int:
+    """CSV ทุก scenario (ดาเมจต่อ hit, ดาเมจรวม, margin) → จำนวนแถว"""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["character", "skill", "weapon_set", "preset", "hp", "skill_hits",
+                     *(f"{prefix}_{s}" for prefix in ("damage", "total", "margin") for s in SCENARIO_INDEX)])
+    count = 0
+    for row in rows:
+        cell = row.cell
+        writer.writerow([row.character, cell.skill or "", row.weapon_set, cell.target, cell.hp, cell.skill_hits,
+                         *cell.damage, *cell.totals, *cell.margins])
+        count += 1
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", type=Path, help="user config JSON (ปริยาย: config.json)")
+    parser.add_argument("--character", nargs="+", help="เฉพาะตัวละครเหล่านี้ (ปริยาย: ทุกตัว)")
+    parser.add_argument("--weapon-set", nargs="+", type=int, help="เฉพาะชุดเซ็ทเหล่านี้ (ปริยาย: ทุกชุด)")
+    parser.add_argument("--monster", nargs="+", help="เฉพาะ monster preset เหล่านี้ (ปริยาย: ทุก preset)")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="margin")
+    parser.add_argument("--scenario", choices=tuple(SCENARIO_INDEX), default="crit")
+    parser.add_argument("--kills-only", action="store_true", help="เฉพาะแถวที่ฆ่าได้ใน scenario ที่เลือก")
+    parser.add_argument("--csv", action="store_true", help="เขียน CSV (ทุก scenario) แทนตาราง")
+    parser.add_argument("--workers", type=int, default=1, help="จำนวน process (1 = รันใน process นี้)")
+    args = parser.parse_args(argv)
+
+    try:
+        user_config = load_json(args.config) if args.config else load_user_config()
+        start = time.perf_counter()
+        matrices = roster_matrices(user_config, args.character, args.weapon_set, args.monster, args.workers)
+        elapsed = time.perf_counter() - start
+    except (ValueError, KeyError) as e:
+        message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        print(f"❌ ไม่พบหรือค่าไม่ถูกต้อง: {message}", file=sys.stderr)
+        return 2
+    rows = sort_rows(roster_rows(matrices), args.sort, args.scenario)
+    if args.kills_only:
+        index = SCENARIO_INDEX[args.scenario]
+        rows = [row for row in rows if row.cell.kills[index]]
+
+    if args.csv:
+        write_csv(rows, sys.stdout)
+    else:
+        write_table(rows, args.scenario, sys.stdout)
+    special = sorted({m.character for m in matrices if m.special})
+    print(f"✅ {len(rows):,} แถว จาก {len(matrices):,} matrix ({elapsed * 1e3:.0f} ms)", file=sys.stderr)
+    if special:
+        print(f"⚠️ มี special logic (ตารางนี้เป็น 4 scenario ปกติ): {', '.join(special)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    # stdout เป็น UTF-8 เสมอ (Windows console ใช้ encoding อื่นโดยปริยาย)
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.exit(main())
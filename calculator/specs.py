@@ -0,0 +1,283 @@
+"""
+Specs - record แบบ slotted (Build / SkillSpec / TargetSpec) ที่ parse + ตรวจค่าครั้งเดียวตอนโหลด
+
+- Build: สเตตัสฝั่งผู้โจมตีที่ผู้ใช้กรอก (ใส่ชุดเซ็ทอาวุธแล้ว) เป็น float / None (= ไม่ได้กรอก)
+  รวม SKILL_HITS ที่ผู้ใช้ / preset กรอก (SkillSpec.hits ให้ค่านี้ทับค่าสกิลเหมือน merge_configs)
+- SkillSpec: ค่าคงที่ของ (ตัวละคร, สกิล) + กฎ merge ต่อ key (MergeRule) ตามลำดับ SCENARIO_INPUT_KEYS
+- TargetSpec: ค่าฝั่งศัตรู (user config ทับด้วย monster preset)
+ทั้ง Build และ TargetSpec ใช้ลำดับเดียวกับ prepare_config: user → monster preset → ชุดเซ็ทอาวุธ
+(preset ที่มีค่าฝั่งผู้โจมตีเก็บไว้ใน TargetSpec.build_overrides → Build.from_config(config, overrides))
+
+evaluate() อ่านค่าผ่าน attribute ไม่มี dict lookup / merge_configs / Decimal(str) ต่อ build
+คำนวณด้วย float_scenarios + Decimal fallback ผลจึงตรงกับ pipeline ทุกบิต (D001, D007)
+record ไม่มี __dict__ จึงเล็กกว่า config dict หลายเท่า (เหมาะกับ build จำนวนมากในหน่วยความจำ)
+
+หมายเหตุ: ให้ผล 4 scenario ปกติ (ไม่รวม special logic ของตัวละครใน character_registry)
+
+การใช้งาน:
+    from specs import Build, SkillSpec, TargetSpec, evaluate
+    build = Build.from_config(user_config)
+    skill = SkillSpec.load("miho", "skill2")
+    target = TargetSpec.from_monster("castle_room1.json", user_config)
+    final_dmg_hp, (crit, crit_weak, no_crit, weak_only) = evaluate(build, skill, target)
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from constants import CONFIG_DEFAULTS, get_atk_base
+from config_loader import ADDITIVE_KEYS, MAPPING_KEYS, apply_weapon_set
+from character_db import CharacterDB, get_character_db
+from damage_calc import to_decimal
+from fast_calc import SCENARIO_INPUT_KEYS, decimal_scenarios, float_scenarios
+from pipeline import BOTH_SKILLS, resolve_skill
+
+# field ของ Build → key ใน user config
+BUILD_FIELDS: dict[str, str] = {
+    "atk_char": "ATK_CHAR",
+    "atk_pet": "ATK_PET",
+    "formation": "Formation",
+    "potential_pet": "Potential_PET",
+    "buff_atk": "BUFF_ATK",
+    "buff_atk_pet": "BUFF_ATK_PET",
+    "skill_dmg": "SKILL_DMG",
+    "crit_dmg": "CRIT_DMG",
+    "weak_dmg": "WEAK_DMG",
+    "dmg_amp_buff": "DMG_AMP_BUFF",
+    "dmg_amp_debuff": "DMG_AMP_DEBUFF",
+    "def_reduce": "DEF_REDUCE",
+    "ignore_def": "Ignore_DEF",
+    "bonus_dmg_hp_target": "Bonus_DMG_HP_Target",
+    "cap_atk_percent": "Cap_ATK_Percent",
+    "crit_rate": "CRIT_RATE",
+}
+
+# field ของ TargetSpec → key ใน user config / monster preset
+TARGET_FIELDS: dict[str, str] = {
+    "def_target": "DEF_Target",
+    "def_buff": "DEF_BUFF",
+    "hp_target": "HP_Target",
+    "dmg_reduction": "DMG_Reduction",
+    "target_hp_percent": "Target_HP_Percent",
+}
+
+# (final_dmg_hp, (crit, crit_weak, no_crit, weak_only)) - ใช้ร่วมกับ kernels.py
+KernelOutput = tuple[int, tuple[int, ...]]
+
+# key ของ monster preset ที่ทับฝั่งผู้โจมตี (Build)
+_BUILD_KEYS = frozenset(BUILD_FIELDS.values()) | {"Weapon_Set", "SKILL_HITS"}
+
+
+def _number(key: str, value: Any) -> float | None:
+    """ค่าจาก JSON → float (None = ไม่ได้กรอก), ค่าที่ไม่ใช่ตัวเลข → ValueError"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str, Decimal)):
+        raise ValueError(f"{key} ต้องเป็นตัวเลข (ได้ {value!r})")
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{key} ต้องเป็นตัวเลข (ได้ {value!r})") from None
+
+
+def _hits(value: Any) -> int | None:
+    """SKILL_HITS จาก JSON → int แบบเดียวกับ run_pipeline (None = ไม่ได้กรอก)"""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"SKILL_HITS ต้องเป็นจำนวนเต็ม (ได้ {value!r})") from None
+
+
+def _with_weapon_set(source: Mapping[str, Any], keys: Iterable[str]) -> dict[str, Any]:
+    """ค่าตัวเลขของ keys จาก source แล้วใส่ชุดเซ็ทอาวุธด้วย apply_weapon_set (None = ไม่ได้กรอก)"""
+    try:
+        weapon_set = int(source.get("Weapon_Set", 0))
+    except (TypeError, ValueError):
+        raise ValueError(f"Weapon_Set ต้องเป็นจำนวนเต็ม (ได้ {source.get('Weapon_Set')!r})") from None
+    values = {key: _number(key, source.get(key)) for key in keys}
+    return apply_weapon_set({"Weapon_Set": weapon_set, **{k: v for k, v in values.items() if v is not None}})
+
+
+@dataclass(frozen=True, slots=True)
+class MergeRule:
+    """
+    user value → merged value ของ key เดียว (None = ผู้ใช้ไม่ได้กรอก)
+    ตามลำดับเดียวกับ apply_weapon_set แล้ว merge_configs (ลำดับการบวก float เหมือนเดิมทุกขั้น)
+    """
+    additive: float | None = None
+    char_value: Any = None
+    extras: tuple[float, ...] = ()
+    default: Any = None
+    weapon_add: float | None = None
+
+    @classmethod
+    def compile(cls, key: str, combined: Mapping[str, Any], weapon_add: float | None = None) -> "MergeRule":
+        """จำลอง merge_configs ของ key เดียวจาก config ตัวละคร + สกิล"""
+        additive: float | None = None
+        char_value: Any = None
+        extras: list[float] = []
+        for k, v in combined.items():
+            if k in ADDITIVE_KEYS:
+                if k == key:
+                    additive = float(v)
+                    extras = []  # merge_configs เขียนทับค่าที่ mapping ใส่ไว้ก่อนหน้า
+            elif k in MAPPING_KEYS:
+                if MAPPING_KEYS[k] == key:
+                    extras.append(float(v))
+            elif k == key and additive is None and not extras:
+                char_value = v
+        return cls(additive, char_value, tuple(extras), CONFIG_DEFAULTS.get(key), weapon_add)
+
+    def __call__(self, u: Any) -> Any:
+        if self.weapon_add is not None:
+            u = float(0 if u is None else u) + self.weapon_add
+        if self.additive is not None:
+            value = self.additive + float(0 if u is None else u)
+        else:
+            value = self.char_value if u is None else u
+        for extra in self.extras:
+            value = float(0 if value is None else value) + extra
+        return self.default if value is None else value
+
+
+@dataclass(frozen=True, slots=True)
+class Build:
+    """สเตตัสผู้โจมตี 1 ชุด (ค่าหลังใส่ชุดเซ็ทอาวุธ, None = ไม่ได้กรอก)"""
+    weapon_set: int = 0
+    atk_char: float | None = None
+    atk_pet: float | None = None
+    formation: float | None = None
+    potential_pet: float | None = None
+    buff_atk: float | None = None
+    buff_atk_pet: float | None = None
+    skill_dmg: float | None = None
+    crit_dmg: float | None = None
+    weak_dmg: float | None = None
+    dmg_amp_buff: float | None = None
+    dmg_amp_debuff: float | None = None
+    def_reduce: float | None = None
+    ignore_def: float | None = None
+    bonus_dmg_hp_target: float | None = None
+    cap_atk_percent: float | None = None
+    crit_rate: float | None = None
+    skill_hits: int | None = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], preset: Mapping[str, Any] | None = None) -> "Build":
+        """
+        parse user config ทับด้วย preset (key อื่นถูกข้าม) แล้วใส่ชุดเซ็ทอาวุธ (เหมือน prepare_config)
+        preset: monster preset หรือ TargetSpec.build_overrides, ค่าที่ไม่ใช่ตัวเลข → ValueError
+        """
+        source = {**config, **(preset or {})}
+        applied = _with_weapon_set(source, BUILD_FIELDS.values())
+        return cls(applied["Weapon_Set"], **{field: applied.get(key) for field, key in BUILD_FIELDS.items()},
+                   skill_hits=_hits(source.get("SKILL_HITS")))
+
+
+@dataclass(frozen=True, slots=True)
+class TargetSpec:
+    """ค่าฝั่งศัตรู 1 เป้าหมาย (None = ไม่ได้กรอก → ใช้ค่าตัวละคร / CONFIG_DEFAULTS)"""
+    name: str = ""
+    def_target: float | None = None
+    def_buff: float | None = None
+    hp_target: float | None = None
+    dmg_reduction: float | None = None
+    target_hp_percent: float | None = None
+    # ค่าใน preset ที่ทับฝั่งผู้โจมตี (Weapon_Set / SKILL_HITS / BUILD_FIELDS) → ส่งให้ Build.from_config
+    build_overrides: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def from_config(
+        cls, config: Mapping[str, Any], preset: Mapping[str, Any] | None = None, name: str = ""
+    ) -> "TargetSpec":
+        """
+        ค่าจาก user config ทับด้วย monster preset แล้วใส่ชุดเซ็ทอาวุธ (เหมือน prepare_config)
+        ค่าที่ไม่ใช่ตัวเลข → ValueError
+        """
+        applied = _with_weapon_set({**config, **(preset or {})}, TARGET_FIELDS.values())
+        overrides = tuple((k, v) for k, v in (preset or {}).items() if k in _BUILD_KEYS)
+        return cls(name, **{field: applied.get(key) for field, key in TARGET_FIELDS.items()},
+                   build_overrides=overrides)
+
+    @classmethod
+    def from_monster(
+        cls, monster: str, config: Mapping[str, Any] | None = None, db: CharacterDB | None = None
+    ) -> "TargetSpec":
+        """monster preset จาก CharacterDB (ชื่อมีหรือไม่มี .json ก็ได้) ทับ user config"""
+        entry = (db or get_character_db()).monster(monster)
+        return cls.from_config(config or {}, entry.preset, entry.name)
+
+
+@dataclass(frozen=True, slots=True)
+class SkillSpec:
+    """
+    ค่าคงที่ของ (ตัวละคร, สกิล): ATK_BASE, SKILL_HITS และ MergeRule ตามลำดับ SCENARIO_INPUT_KEYS
+    skill_hits คือค่าของตัวละคร + สกิล ใช้ hits(build) เพื่อให้ค่าผู้ใช้ / preset ทับ
+    """
+    character: str
+    skill: str | None
+    atk_base: Decimal
+    skill_hits: int
+    rules: tuple[MergeRule, ...]
+
+    @classmethod
+    def load(cls, character: str, skill: str | None = None, db: CharacterDB | None = None) -> "SkillSpec":
+        """
+        อ่านตัวละคร + สกิลจาก CharacterDB ครั้งเดียว
+        skill: key ใน _skills (None = สกิลแรก, ไม่รองรับ BOTH_SKILLS)
+        """
+        if skill == BOTH_SKILLS:
+            raise ValueError("SkillSpec รองรับทีละสกิล (ใช้ skill_specs เพื่อโหลดทุกสกิล)")
+        entry = (db or get_character_db()).get(character)
+        skill_config, _, _ = resolve_skill(entry.meta, skill)
+        combined = dict(entry.config)
+        combined.update(skill_config)
+        return cls(
+            character=character,
+            skill=skill,
+            atk_base=get_atk_base(entry.rarity, entry.char_class),
+            skill_hits=int(combined.get("SKILL_HITS", 1)),
+            rules=tuple(MergeRule.compile(key, combined) for key in SCENARIO_INPUT_KEYS),
+        )
+
+    def hits(self, build: Build) -> int:
+        """SKILL_HITS ของ build นี้ (ค่าผู้ใช้ / preset ทับค่าสกิล เหมือน merge_configs)"""
+        return self.skill_hits if build.skill_hits is None else build.skill_hits
+
+
+def skill_specs(character: str, db: CharacterDB | None = None) -> tuple[SkillSpec, ...]:
+    """SkillSpec ของทุกสกิลของตัวละคร (ตัวละครที่ไม่มี _skills → 1 spec ที่ skill=None)"""
+    db = db or get_character_db()
+    skills = db.get(character).meta.get("_skills") or {None: None}
+    return tuple(SkillSpec.load(character, key, db) for key in skills)
+
+
+def evaluate(build: Build, skill: SkillSpec, target: TargetSpec) -> KernelOutput:
+    """
+    Final_DMG_HP + 4 scenario ของ build บนเป้าหมาย
+    Returns: (final_dmg_hp, (crit, crit_weak, no_crit, weak_only)) ตรงกับ compute_damage
+    """
+    b, t = build, target
+    user = (
+        b.atk_char, b.atk_pet, b.formation, b.potential_pet, b.buff_atk, b.buff_atk_pet,
+        b.skill_dmg, b.crit_dmg, b.weak_dmg, b.dmg_amp_buff, b.dmg_amp_debuff, t.dmg_reduction,
+        t.def_target, t.def_buff, b.def_reduce, b.ignore_def,
+        t.hp_target, b.bonus_dmg_hp_target, b.cap_atk_percent,
+    )  # ลำดับ SCENARIO_INPUT_KEYS
+    raw = [rule(u) for rule, u in zip(skill.rules, user)]
+    fast = float_scenarios([float(v) for v in raw], float(skill.atk_base))
+    if fast is not None:
+        return fast
+    row = {k: to_decimal(v) for k, v in zip(SCENARIO_INPUT_KEYS, raw)}
+    row["ATK_BASE"] = skill.atk_base
+    final_dmg_hp, finals = decimal_scenarios(row)
+    return int(final_dmg_hp), finals
+
+
+def evaluate_many(builds: Iterable[Build], skill: SkillSpec, target: TargetSpec) -> list[KernelOutput]:
+    """evaluate ของหลาย build บน (สกิล, เป้าหมาย) เดียวกัน ตามลำดับ input"""
+    return [evaluate(build, skill, target) for build in builds]
@@ -0,0 +1,334 @@
+"""
+Parameter Sweep - กราฟดาเมจเมื่อเปลี่ยนค่า config 1-2 key (ผ่าน batch path, ต้องใช้ NumPy)
+
+- key ที่ sweep ได้: ทุก key ที่ merge_configs / apply_weapon_set เข้าใจ (รวม Weapon_Set, ค่าที่ ADD กับตัวละคร)
+  ค่าของ axis คือ "ค่าที่ผู้ใช้กรอก" แล้วผ่าน prepare_config ทีละค่า (ไม่ใช่ทีละแถว)
+- monster preset ถูกรวมเข้ากับ user config ก่อน แล้วค่า axis ทับอีกชั้น (sweep DEF_Target ได้แม้ใช้ preset)
+- 2 axis ที่กระทบ key ต่างกัน → ประกอบคอลัมน์จากผลของแต่ละ axis (prepare_config nx + ny ครั้ง)
+  ถ้ากระทบ key เดียวกัน (เช่น Weapon_Set + DMG_AMP_BUFF) → prepare_config ทุกคู่ (nx * ny ครั้ง)
+- แถวเรียงแบบ row-major (x นอก, y ใน) คำนวณทีละ chunk ด้วย calculate_damage_batch แล้วเขียนต่อเนื่อง
+- ผลเป็นดาเมจต่อ hit 4 scenario ปกติ (ไม่รวม special logic ของตัวละคร เหมือน kernels.py)
+
+การใช้งาน:
+    python calculator/sweep.py miho DEF_Target=0:3000:10 --skill skill2 --out def_curve.csv
+    python calculator/sweep.py miho ATK_CHAR=3000:5000:2 CRIT_DMG=150:350:0.2 --out grid.npz
+    python calculator/sweep.py teo Weapon_Set=0,1,2,3,4 --preset castle_room1.json --out -
+
+รูปแบบไฟล์ (ตามนามสกุล): .csv (stream), .npz (คอลัมน์ NumPy), .parquet (ต้องมี pyarrow), "-" = CSV ออก stdout
+"""
+
+import argparse
+import csv
+import math
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, TextIO
+
+# Add parent directory to path for imports (รันเป็นสคริปต์ได้)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_calc import SCENARIOS, _require_numpy, calculate_damage_batch, np
+from character_db import CharacterDB, get_character_db
+from config_loader import ADDITIVE_KEYS, MAPPING_KEYS, load_json, load_user_config
+from constants import CONFIG_DEFAULTS, get_atk_base
+from fast_calc import SCENARIO_INPUT_KEYS
+from pipeline import BOTH_SKILLS, prepare_config, resolve_skill
+
+# จำนวนแถวต่อ chunk (~200 KB ต่อคอลัมน์ float64)
+DEFAULT_CHUNK_ROWS = 25_000
+
+# key ที่ config pipeline เข้าใจ (นอกจากนี้ถือว่าพิมพ์ผิด)
+SWEEPABLE_KEYS = frozenset(CONFIG_DEFAULTS) | ADDITIVE_KEYS | frozenset(MAPPING_KEYS) | {"Weapon_Set"}
+
+
+@dataclass(frozen=True, slots=True)
+class SweepAxis:
+    """แกนที่ sweep: key ของ config + ค่าที่ผู้ใช้กรอก (เรียงตามลำดับที่ให้มา)"""
+    key: str
+    values: tuple[float, ...]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def integral(self) -> bool:
+        """ค่าทั้งหมดเป็นจำนวนเต็ม (เขียนออกเป็น int)"""
+        return all(float(v).is_integer() for v in self.values)
+
+    def column(self) -> "np.ndarray":
+        dtype = np.int64 if self.integral else np.float64
+        return np.array(self.values, dtype=dtype)
+
+
+def parse_axis(spec: str) -> SweepAxis:
+    """
+    แปลง "KEY=start:stop:step" (รวม stop ถ้าลงตัว) หรือ "KEY=a,b,c" เป็น SweepAxis
+    ค่าในช่วงคำนวณด้วย Decimal (0.1 + 0.2 ไม่กลายเป็น 0.30000000000000004)
+    """
+    key, sep, body = spec.partition("=")
+    key = key.strip()
+    if not sep or not key or not body.strip():
+        raise ValueError(f"รูปแบบ axis ไม่ถูกต้อง: '{spec}' (ใช้ KEY=start:stop:step หรือ KEY=a,b,c)")
+    if key not in SWEEPABLE_KEYS:
+        raise ValueError(f"ไม่รู้จัก key '{key}' (ใช้ได้: {', '.join(sorted(SWEEPABLE_KEYS))})")
+    try:
+        if ":" in body:
+            parts = [Decimal(p) for p in body.split(":")]
+            if len(parts) != 3:
+                raise ValueError(f"ช่วงต้องเป็น start:stop:step: '{spec}'")
+            start, stop, step = parts
+            if step == 0 or (stop - start) * step < 0:
+                raise ValueError(f"step ไม่พาจาก start ไปถึง stop: '{spec}'")
+            count = int((stop - start) / step) + 1
+            values = tuple(float(start + step * i) for i in range(count))
+        else:
+            values = tuple(float(Decimal(p)) for p in body.split(","))
+    except InvalidOperation:
+        raise ValueError(f"ค่าใน axis ไม่ใช่ตัวเลข: '{spec}'") from None
+    return SweepAxis(key, values)
+
+
+@dataclass(frozen=True, slots=True)
+class Sweep:
+    """แผนการ sweep ที่ resolve config แล้ว (สร้างด้วย plan_sweep)"""
+    character: str
+    skill: str | None
+    axes: tuple[SweepAxis, ...]
+    atk_base: Decimal
+    skill_hits: int
+    # ค่า merged ที่ไม่ขึ้นกับ axis
+    fixed: Mapping[str, float]
+    # ค่า merged ต่อค่าของ axis: [axis][key] → array ยาว len(axis) (หรือ shape (nx, ny) ถ้า joint)
+    varying: tuple[Mapping[str, "np.ndarray"], ...]
+    joint: bool
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(axis) for axis in self.axes)
+
+    @property
+    def rows(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(axis.key for axis in self.axes) + SCENARIOS
+
+
+def _scenario_inputs(merged: Mapping[str, Any]) -> list[float]:
+    return [float(merged.get(k, CONFIG_DEFAULTS[k])) for k in SCENARIO_INPUT_KEYS]
+
+
+def plan_sweep(
+    character: str,
+    axes: Sequence[SweepAxis],
+    skill: str | None = None,
+    user_config: Mapping[str, Any] | None = None,
+    monster_preset: Mapping[str, Any] | str | None = None,
+    db: CharacterDB | None = None,
+) -> Sweep:
+    """
+    resolve ตัวละคร + สกิล + config แล้วหาว่าแต่ละ axis เปลี่ยน key ไหนของ 4 scenario บ้าง
+
+    Args:
+        skill: key ใน _skills (None = สกิลแรก, ไม่รองรับ BOTH_SKILLS)
+        user_config: ค่าผู้ใช้ของ key ที่ไม่ได้ sweep (None = config.json)
+        monster_preset: dict หรือชื่อไฟล์ preset
+    """
+    _require_numpy()
+    if not 1 <= len(axes) <= 2:
+        raise ValueError("sweep ได้ 1 หรือ 2 axis")
+    if len({axis.key for axis in axes}) != len(axes):
+        raise ValueError("axis ต้องเป็นคนละ key")
+    if any(len(axis) == 0 for axis in axes):
+        raise ValueError("axis ต้องมีอย่างน้อย 1 ค่า")
+    if skill == BOTH_SKILLS:
+        raise ValueError("sweep ได้ทีละสกิล")
+
+    db = db or get_character_db()
+    entry = db.get(character)
+    skill_config, _, _ = resolve_skill(entry.meta, skill)
+    char_config = dict(entry.config)
+
+    if isinstance(monster_preset, str):
+        monster_preset = db.monster(monster_preset).preset
+    base_user = dict(load_user_config() if user_config is None else user_config)
+    base_user.update(monster_preset or {})
+
+    def merged_for(overrides: Mapping[str, float]) -> dict[str, Any]:
+        user = {**base_user, **overrides}
+        if "Weapon_Set" in overrides:
+            user["Weapon_Set"] = int(overrides["Weapon_Set"])
+        return prepare_config(char_config, skill_config, user)[1]
+
+    base = merged_for({})
+    fixed = dict(zip(SCENARIO_INPUT_KEYS, _scenario_inputs(base)))
+
+    # ผลต่อ axis: key ที่เปลี่ยนตามค่าของ axis
+    per_axis: list[dict[str, np.ndarray]] = []
+    for axis in axes:
+        table = np.array([_scenario_inputs(merged_for({axis.key: v})) for v in axis.values])
+        changed = np.any(table != [fixed[k] for k in SCENARIO_INPUT_KEYS], axis=0)
+        per_axis.append({k: table[:, i] for i, k in enumerate(SCENARIO_INPUT_KEYS) if changed[i]})
+
+    joint = len(axes) == 2 and bool(per_axis[0].keys() & per_axis[1].keys())
+    if joint:
+        x, y = axes
+        keys = sorted(per_axis[0].keys() | per_axis[1].keys(), key=SCENARIO_INPUT_KEYS.index)
+        table = np.array([
+            [_scenario_inputs(merged_for({x.key: vx, y.key: vy})) for vy in y.values]
+            for vx in x.values
+        ])
+        varying: tuple[dict[str, np.ndarray], ...] = (
+            {k: table[:, :, SCENARIO_INPUT_KEYS.index(k)] for k in keys},
+        )
+    else:
+        varying = tuple(per_axis)
+    for columns in varying:
+        for k in columns:
+            fixed.pop(k, None)
+
+    return Sweep(
+        character=character,
+        skill=skill,
+        axes=tuple(axes),
+        atk_base=get_atk_base(entry.rarity, entry.char_class),
+        skill_hits=int(base.get("SKILL_HITS", 1)),
+        fixed=fixed,
+        varying=varying,
+        joint=joint,
+    )
+
+
+def iter_sweep(plan: Sweep, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[dict[str, "np.ndarray"]]:
+    """
+    คำนวณทีละ chunk (แบ่งตามค่าของ axis แรก) → dict คอลัมน์: ค่า axis + 4 scenario (int64)
+    """
+    _require_numpy()
+    x = plan.axes[0]
+    ny = len(plan.axes[1]) if len(plan.axes) == 2 else 1
+    step = max(1, chunk_rows // ny)
+    x_column = x.column()
+    y_column = plan.axes[1].column() if len(plan.axes) == 2 else None
+
+    for start in range(0, len(x), step):
+        stop = min(start + step, len(x))
+        n = stop - start
+        columns: dict[str, Any] = dict(plan.fixed)
+        if plan.joint:
+            for k, grid in plan.varying[0].items():
+                columns[k] = grid[start:stop].ravel()
+        else:
+            for k, col in plan.varying[0].items():
+                columns[k] = np.repeat(col[start:stop], ny)
+            if y_column is not None:
+                for k, col in plan.varying[1].items():
+                    columns[k] = np.tile(col, n)
+        # atk_base เป็นคอลัมน์เต็ม: ได้ครบทุกแถวแม้ axis ไม่เปลี่ยน key ไหนเลย
+        result = calculate_damage_batch(columns, np.full(n * ny, float(plan.atk_base)))
+
+        chunk = {x.key: np.repeat(x_column[start:stop], ny)}
+        if y_column is not None:
+            chunk[plan.axes[1].key] = np.tile(y_column, n)
+        for name in SCENARIOS:
+            chunk[name] = result[name]
+        yield chunk
+
+
+# ============================================
+# Writers
+# ============================================
+
+def write_csv(chunks: Iterator[dict[str, "np.ndarray"]], out: TextIO) -> int:
+    """เขียนแบบ stream (header จาก chunk แรก) → จำนวนแถว"""
+    writer = csv.writer(out, lineterminator="\n")
+    rows = 0
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            writer.writerow(chunk.keys())
+        writer.writerows(zip(*(col.tolist() for col in chunk.values())))
+        rows += len(next(iter(chunk.values())))
+    return rows
+
+
+def write_npz(chunks: Iterator[dict[str, "np.ndarray"]], path: Path) -> int:
+    """รวมทุก chunk เป็นคอลัมน์เดียวแล้วเขียน .npz (np.load(path)[ชื่อคอลัมน์])"""
+    parts: dict[str, list[np.ndarray]] = {}
+    for chunk in chunks:
+        for name, col in chunk.items():
+            parts.setdefault(name, []).append(col)
+    columns = {name: np.concatenate(cols) for name, cols in parts.items()}
+    np.savez(path, **columns)
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def write_parquet(chunks: Iterator[dict[str, "np.ndarray"]], path: Path) -> int:
+    """เขียน Parquet ทีละ row group (optional: pip install pyarrow)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("เขียน .parquet ต้องใช้ pyarrow - ติดตั้งด้วย: pip install pyarrow "
+                          "(หรือใช้ .npz / .csv)") from None
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            table = pa.table(chunk)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_sweep(plan: Sweep, out: str | Path, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """เลือก writer ตามนามสกุล ("-" = CSV ออก stdout) → จำนวนแถว"""
+    chunks = iter_sweep(plan, chunk_rows)
+    if str(out) == "-":
+        return write_csv(chunks, sys.stdout)
+    path = Path(out)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            return write_csv(chunks, f)
+    if suffix == ".npz":
+        return write_npz(chunks, path)
+    if suffix == ".parquet":
+        return write_parquet(chunks, path)
+    raise ValueError(f"ไม่รองรับนามสกุล '{suffix}' (ใช้ .csv / .npz / .parquet)")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("character")
+    parser.add_argument("axes", nargs="+", metavar="KEY=RANGE", help="1-2 axis: KEY=start:stop:step หรือ KEY=a,b,c")
+    parser.add_argument("--skill", help="key ของสกิล (ปริยาย: สกิลแรก)")
+    parser.add_argument("--preset", help="ชื่อไฟล์ monster preset")
+    parser.add_argument("--config", type=Path, help="user config JSON (ปริยาย: config.json)")
+    parser.add_argument("--out", default="-", help="ไฟล์ผลลัพธ์ .csv / .npz / .parquet หรือ - (stdout)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    try:
+        axes = [parse_axis(spec) for spec in args.axes]
+        user_config = load_json(args.config) if args.config else None
+        plan = plan_sweep(args.character, axes, args.skill, user_config, args.preset)
+        rows = write_sweep(plan, args.out, args.chunk_rows)
+    except (ValueError, KeyError, ImportError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    if args.out != "-":
+        shape = " x ".join(f"{axis.key}[{len(axis)}]" for axis in plan.axes)
+        print(f"✅ {rows:,} แถว ({shape}, skill hits = {plan.skill_hits}) → {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -75,12 +75,12 @@ result = calculate_biscuit_damage(
     final_dmg_hp=Decimal("0")
 )
 
-print(f"   Total DEF: {result['total_def']} (Expected: ~1,929 with DEF_CHAR+DEF_PET from config)")
-print(f"   ATK Part (CRIT): {result['final_atk_crit']}")
-print(f"   DEF Part (CRIT): {result['final_def_crit']}")
-print(f"   Total (CRIT): {result['total_per_hit_crit']}")
-print(f"   Total Skill (Normal): {result['total_skill_dmg_normal']}")
-print(f"   Total Skill (CRIT): {result['total_skill_dmg_crit']}")
+print(f"   Total DEF: {result.total_def} (Expected: ~1,929 with DEF_CHAR+DEF_PET from config)")
+print(f"   ATK Part (CRIT): {result.final_atk_crit}")
+print(f"   DEF Part (CRIT): {result.final_def_crit}")
+print(f"   Total (CRIT): {result.total_per_hit_crit}")
+print(f"   Total Skill (Normal): {result.total_skill_dmg_normal}")
+print(f"   Total Skill (CRIT): {result.total_skill_dmg_crit}")
 print("✅ Biscuit calculation completed")
 
 # Test 3: Freyja - HP Alteration
@@ -114,7 +114,7 @@ freyja_result = calculate_freyja_damage(
 )
 
 expected_hp_alteration = 61000000
-actual = freyja_result['hp_alteration_damage']
+actual = freyja_result.hp_alteration_damage
 print(f"   HP Target: {hp_target:,}")
 print(f"   HP Alteration: {hp_alteration}% (HP left at {hp_alteration}%)")
 print(f"   HP Alteration Damage: {actual:,}")
@@ -155,11 +155,11 @@ espada_result = calculate_espada_damage(
     cap_atk_percent=cap_atk_percent
 )
 
-print(f"   Crit No HP: {espada_result['crit_no_hp']['final']:,}")
-print(f"   Crit With HP: {espada_result['crit_with_hp']['final']:,}")
-print(f"   Weak No HP: {espada_result['weak_no_hp']['final']:,}")
-print(f"   Weak With HP: {espada_result['weak_with_hp']['final']:,}")
-print(f"   HP-based adds: {espada_result['crit_with_hp']['final'] - espada_result['crit_no_hp']['final']:,}")
+print(f"   Crit No HP: {espada_result.crit_no_hp.final:,}")
+print(f"   Crit With HP: {espada_result.crit_with_hp.final:,}")
+print(f"   Weak No HP: {espada_result.weak_no_hp.final:,}")
+print(f"   Weak With HP: {espada_result.weak_with_hp.final:,}")
+print(f"   HP-based adds: {espada_result.crit_with_hp.final - espada_result.crit_no_hp.final:,}")
 print("✅ Espada calculation completed")
 
 # Test 5: Ryan - Lost HP Bonus
@@ -196,11 +196,11 @@ ryan_result = calculate_ryan_damage(
 
 print(f"   Lost HP Bonus: +{lost_hp_bonus}% (max)")
 print(f"   Target HP: {target_hp_percent}% left")
-print(f"   Actual bonus: {(ryan_result['crit_low_hp']['multiplier'] - 1) * 100:.1f}%")
-print(f"   Crit Full HP: {ryan_result['crit_full_hp']['final']:,}")
-print(f"   Crit Low HP: {ryan_result['crit_low_hp']['final']:,}")
-print(f"   Weak Full HP: {ryan_result['weak_full_hp']['final']:,}")
-print(f"   Weak Low HP: {ryan_result['weak_low_hp']['final']:,} (MAX)")
+print(f"   Actual bonus: {(ryan_result.crit_low_hp.multiplier - 1) * 100:.1f}%")
+print(f"   Crit Full HP: {ryan_result.crit_full_hp.final:,}")
+print(f"   Crit Low HP: {ryan_result.crit_low_hp.final:,}")
+print(f"   Weak Full HP: {ryan_result.weak_full_hp.final:,}")
+print(f"   Weak Low HP: {ryan_result.weak_low_hp.final:,} (MAX)")
 print("✅ Ryan calculation completed")
 
 print("\n" + "="*80)
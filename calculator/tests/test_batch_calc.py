@@ -0,0 +1,209 @@
+"""
+Unit Tests for Vectorized Batch Calculation (batch_calc.py)
+Batch results must be bit-identical to the Decimal path in damage_calc.py
+"""
+
+import random
+
+import pytest
+from decimal import Decimal
+
+np = pytest.importorskip("numpy")
+
+from batch_calc import (
+    SCENARIOS,
+    calculate_total_atk_batch,
+    calculate_dmg_hp_batch,
+    calculate_final_dmg_hp_batch,
+    calculate_raw_dmg_batch,
+    calculate_effective_def_batch,
+    calculate_final_dmg_batch,
+    calculate_damage_batch,
+)
+from damage_calc import (
+    calculate_total_atk,
+    calculate_dmg_hp,
+    calculate_cap_atk,
+    calculate_final_dmg_hp,
+    calculate_raw_dmg,
+    calculate_effective_def,
+    calculate_final_dmg,
+)
+
+
+# ============================================================================
+# Test vectors (same inputs as test_damage_calc.py)
+# ============================================================================
+
+# (raw_dmg, effective_def) from TestCalculateFinalDmg / TestInvariants
+FINAL_DMG_VECTORS = [
+    ("5000", "2"), ("5000", "3"), ("1000", "2"), ("1001", "2"), ("0", "2"),
+    ("100000000", "4.2"), ("5000.5", "2"), ("5000", "1"), ("10000", "5"),
+]
+
+# (dmg_hp, cap_atk) from TestCalculateFinalDmgHp
+FINAL_DMG_HP_VECTORS = [
+    ("700", "5000"), ("7000", "5000"), ("5000", "5000"),
+    ("700", "0"), ("700.9", "5000"), ("7000", "5000.9"),
+]
+
+# (atk_char, atk_pet, atk_base, formation, potential_pet, buff_atk, buff_atk_pet)
+TOTAL_ATK_VECTORS = [
+    ("5000", "400", "1500", "42", "0", "0", "0"),
+    ("5000", "0", "1500", "50", "0", "0", "0"),
+    ("4488", "391", "1500", "42", "0", "0", "19"),
+    ("0.01", "0.01", "0.01", "0.01", "0.01", "0.01", "0.01"),
+    ("10000", "0", "1500", "100", "0", "100", "0"),
+]
+
+
+def _decimals(row):
+    return [Decimal(v) for v in row]
+
+
+# ============================================================================
+# Per-formula tests
+# ============================================================================
+
+class TestBatchFormulas:
+    """Each batch formula matches its Decimal counterpart"""
+
+    def test_final_dmg_matches_decimal(self):
+        raw, eff = zip(*FINAL_DMG_VECTORS)
+        result = calculate_final_dmg_batch(list(raw), list(eff))
+        expected = [calculate_final_dmg(*_decimals(row)) for row in FINAL_DMG_VECTORS]
+        assert result.tolist() == expected
+        assert result.dtype == np.int64
+
+    def test_final_dmg_hp_matches_decimal(self):
+        dmg_hp, cap = zip(*FINAL_DMG_HP_VECTORS)
+        result = calculate_final_dmg_hp_batch(list(dmg_hp), list(cap))
+        expected = [int(calculate_final_dmg_hp(*_decimals(row))) for row in FINAL_DMG_HP_VECTORS]
+        assert result.tolist() == expected
+
+    def test_total_atk_matches_decimal(self):
+        columns = [list(col) for col in zip(*TOTAL_ATK_VECTORS)]
+        result = calculate_total_atk_batch(*columns)
+        expected = [float(calculate_total_atk(*_decimals(row))) for row in TOTAL_ATK_VECTORS]
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_raw_dmg_matches_decimal(self):
+        args = ("5400", "160", "288", "65", "0", "0", "10", "0")
+        result = calculate_raw_dmg_batch(*args)
+        assert result[0] == pytest.approx(float(calculate_raw_dmg(*_decimals(args))), rel=1e-12)
+
+    def test_effective_def_matches_decimal(self):
+        args = ("1461", "0", "24", "40")
+        result = calculate_effective_def_batch(*args)
+        expected = float(calculate_effective_def(*_decimals(args)))
+        assert result[0] == pytest.approx(expected, rel=1e-12)
+
+    def test_scalar_broadcast(self):
+        """Scalar arguments broadcast against array columns"""
+        result = calculate_dmg_hp_batch([10000, 20000, 30000], 7)
+        assert result.tolist() == [700.0, 1400.0, 2100.0]
+
+    def test_negative_values_truncate_like_round_down(self):
+        """ROUNDDOWN rounds toward zero: -2500.25 -> -2500 (np.floor would give -2501)"""
+        raw, eff = ["-5000.5", "-7", "-1001"], ["2", "3", "2"]
+        expected = [calculate_final_dmg(Decimal(r), Decimal(e)) for r, e in zip(raw, eff)]
+        assert calculate_final_dmg_batch(raw, eff).tolist() == expected
+        result = calculate_final_dmg_hp_batch(["-700.5"], ["5000"])
+        assert result.tolist() == [int(calculate_final_dmg_hp(Decimal("-700.5"), Decimal("5000")))]
+
+    def test_division_by_zero_raises_like_decimal(self):
+        """eff_def = 0 falls back to Decimal which raises"""
+        with pytest.raises(ArithmeticError):
+            calculate_final_dmg_batch([5000], [0])
+
+
+# ============================================================================
+# End-to-end tests
+# ============================================================================
+
+def _decimal_pipeline(row, atk_base):
+    """Reference: same steps as main.py with Decimal"""
+    d = {k: Decimal(str(v)) for k, v in row.items()}
+    total_atk = calculate_total_atk(
+        d["ATK_CHAR"], d["ATK_PET"], Decimal(str(atk_base)),
+        d["Formation"], d["Potential_PET"], d["BUFF_ATK"], d["BUFF_ATK_PET"]
+    )
+    final_dmg_hp = calculate_final_dmg_hp(
+        calculate_dmg_hp(d["HP_Target"], d["Bonus_DMG_HP_Target"]),
+        calculate_cap_atk(total_atk, d["Cap_ATK_Percent"])
+    )
+    eff_def = calculate_effective_def(d["DEF_Target"], d["DEF_BUFF"], d["DEF_REDUCE"], d["Ignore_DEF"])
+    weak = Decimal("30") + d["WEAK_DMG"]
+    finals = []
+    for crit, w in ((d["CRIT_DMG"], Decimal("0")), (d["CRIT_DMG"], weak),
+                    (Decimal("100"), Decimal("0")), (Decimal("100"), weak)):
+        raw = calculate_raw_dmg(
+            total_atk, d["SKILL_DMG"], crit, w,
+            d["DMG_AMP_BUFF"], d["DMG_AMP_DEBUFF"], d["DMG_Reduction"], final_dmg_hp
+        )
+        finals.append(calculate_final_dmg(raw, eff_def))
+    return finals
+
+
+def _random_row(rng):
+    return {
+        "ATK_CHAR": rng.randint(2000, 6000),
+        "ATK_PET": rng.randint(0, 600),
+        "Formation": rng.choice([0, 21, 42]),
+        "Potential_PET": rng.choice([0, 21, 51]),
+        "BUFF_ATK": rng.choice([0, 10, 25.5]),
+        "BUFF_ATK_PET": rng.randint(0, 21),
+        "SKILL_DMG": rng.choice([82, 102, 160, 185, 515]),
+        "CRIT_DMG": rng.randint(150, 350),
+        "WEAK_DMG": rng.choice([0, 23, 35, 58]),
+        "DMG_AMP_BUFF": rng.choice([0, 10, 40, 80]),
+        "DMG_AMP_DEBUFF": rng.choice([0, 22, 33]),
+        "DMG_Reduction": rng.choice([0, 10]),
+        "DEF_Target": rng.randint(0, 3000),
+        "DEF_BUFF": rng.choice([0, 10]),
+        "DEF_REDUCE": rng.choice([0, 24]),
+        "Ignore_DEF": rng.choice([0, 15, 40, 55]),
+        "HP_Target": rng.randint(5000, 200000),
+        "Bonus_DMG_HP_Target": rng.choice([0, 7, 26]),
+        "Cap_ATK_Percent": rng.choice([0, 100, 1300]),
+    }
+
+
+class TestCalculateDamageBatch:
+    """End-to-end batch vs Decimal pipeline"""
+
+    def test_pipeline_vector(self):
+        """Inputs from TestFullDamagePipeline.test_weakness_crit_scenario"""
+        row = {
+            "ATK_CHAR": 5400, "ATK_PET": 0, "Formation": 0, "Potential_PET": 0,
+            "BUFF_ATK": 0, "BUFF_ATK_PET": 0, "SKILL_DMG": 160, "CRIT_DMG": 288,
+            "WEAK_DMG": 35, "DMG_AMP_BUFF": 0, "DMG_AMP_DEBUFF": 0, "DMG_Reduction": 10,
+            "DEF_Target": 1461, "DEF_BUFF": 0, "DEF_REDUCE": 24, "Ignore_DEF": 40,
+            "HP_Target": 0, "Bonus_DMG_HP_Target": 0, "Cap_ATK_Percent": 0,
+        }
+        result = calculate_damage_batch({k: [v] for k, v in row.items()}, atk_base=1500)
+        expected = _decimal_pipeline(row, 1500)
+        assert [int(result[name][0]) for name in SCENARIOS] == expected
+
+    def test_randomized_rows_bit_identical(self):
+        rng = random.Random(20260130)
+        rows = [_random_row(rng) for _ in range(500)]
+        columns = {k: [row[k] for row in rows] for k in rows[0]}
+        result = calculate_damage_batch(columns, atk_base=1500)
+        for i, row in enumerate(rows):
+            assert [int(result[name][i]) for name in SCENARIOS] == _decimal_pipeline(row, 1500)
+
+    def test_negative_raw_damage(self):
+        """DMG_Reduction above 100% makes RAW negative; results still match ROUND_DOWN"""
+        rng = random.Random(7)
+        rows = [{**_random_row(rng), "DMG_Reduction": 150} for _ in range(50)]
+        columns = {k: [row[k] for row in rows] for k in rows[0]}
+        result = calculate_damage_batch(columns, atk_base=1500)
+        for i, row in enumerate(rows):
+            assert [int(result[name][i]) for name in SCENARIOS] == _decimal_pipeline(row, 1500)
+
+    def test_missing_keys_use_defaults(self):
+        """Columns not provided fall back to CONFIG_DEFAULTS like main.py"""
+        result = calculate_damage_batch({"ATK_CHAR": [4000, 5000]}, atk_base=1500)
+        assert result["crit"].shape == (2,)
+        assert result["crit"][1] > result["crit"][0]
@@ -0,0 +1,109 @@
+"""
+Unit Tests for the JSONL batch CLI (batch_cli.py)
+"""
+
+import io
+import json
+import pytest
+
+from batch_cli import iter_chunks, main, run_batch
+from pipeline import compute_damage
+
+BASE = {"Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DEF_Target": 1461.0, "HP_Target": 18205.0}
+
+JOBS = [
+    {"id": "a", "character": "miho", "skill": "skill2", "config": {"ATK_CHAR": 4200}},
+    {"id": "b", "character": "sun_wukong", "preset": "castle_room1.json"},
+    {"id": "c", "character": "biscuit", "def_char": 1200, "def_pet": 300},
+    {"id": "d", "character": "miho", "skill": "both"},
+]
+
+
+def _run(lines, **kwargs):
+    out = io.StringIO()
+    counts = run_batch(lines, out, BASE, **kwargs)
+    return [json.loads(line) for line in out.getvalue().splitlines()], counts
+
+
+class TestRunBatch:
+    """1 บรรทัดเข้า → 1 บรรทัดออก ตามลำดับ"""
+
+    def test_matches_compute_damage(self):
+        records, counts = _run([json.dumps(job) for job in JOBS])
+        assert counts == (4, 0)
+        assert [r["id"] for r in records] == ["a", "b", "c", "d"]
+        expected = compute_damage("miho", "skill2", {**BASE, "ATK_CHAR": 4200})
+        assert records[0]["damage"] == {
+            "crit": expected.final_dmg_crit, "crit_weak": expected.final_dmg_crit_weakness,
+            "no_crit": expected.final_dmg_no_crit, "weak_only": expected.final_dmg_weakness_only,
+        }
+        assert records[0]["total_atk"] == str(expected.total_atk)
+        assert records[1]["monster_hp"] > 0 and "special" in records[1]
+        assert records[2]["special"]["total_def"] is not None
+        assert len(records[3]["both_skills"]["skills"]) == 2
+
+    def test_errors_do_not_stop_the_stream(self):
+        lines = ["not json", "", json.dumps({"id": 7, "character": "nobody"}),
+                 json.dumps({"character": "miho", "preset": "missing.json"}),
+                 json.dumps([1, 2]), json.dumps(JOBS[0])]
+        records, counts = _run(lines)
+        assert counts == (5, 4)
+        assert [r["line"] for r in records] == [1, 3, 4, 5, 6]
+        assert records[1]["id"] == 7 and "nobody" in records[1]["error"]
+        assert "missing.json" in records[2]["error"]
+        assert "error" not in records[4]
+
+    def test_non_string_preset_is_an_error_record(self):
+        lines = [json.dumps({"character": "miho", "preset": 5}),
+                 json.dumps({"character": "miho", "preset": {"HP": 1}}), json.dumps(JOBS[0])]
+        records, counts = _run(lines)
+        assert counts == (3, 2)
+        assert all(r["error"].startswith("ValueError") and "'preset'" in r["error"] for r in records[:2])
+        assert "error" not in records[2]
+
+    def test_workers_keep_input_order(self):
+        lines = [json.dumps({"id": i, "character": "miho", "config": {"ATK_CHAR": 3000 + i}})
+                 for i in range(40)]
+        sequential, _ = _run(lines, chunk_lines=3)
+        parallel, counts = _run(lines, workers=2, chunk_lines=3)
+        assert counts == (40, 0)
+        assert parallel == sequential
+
+    def test_reads_incrementally(self):
+        consumed = []
+
+        def lines():
+            for i in range(100):
+                consumed.append(i)
+                yield json.dumps(JOBS[0])
+
+        class Sink(io.StringIO):
+            first_write_at = None
+
+            def write(self, text):
+                if self.first_write_at is None:
+                    self.first_write_at = len(consumed)
+                return super().write(text)
+
+        sink = Sink()
+        run_batch(lines(), sink, BASE, chunk_lines=10)
+        assert sink.first_write_at <= 11
+        assert len(consumed) == 100
+
+    def test_chunks(self):
+        assert list(iter_chunks(["a", "b", "c"], 2)) == [[(1, "a"), (2, "b")], [(3, "c")]]
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            run_batch([], io.StringIO(), BASE, workers=0)
+
+
+def test_cli_files(tmp_path):
+    source = tmp_path / "jobs.jsonl"
+    source.write_text("\n".join(json.dumps(job) for job in JOBS) + "\n", encoding="utf-8")
+    config = tmp_path / "base.json"
+    config.write_text(json.dumps(BASE), encoding="utf-8")
+    target = tmp_path / "out.jsonl"
+    assert main([str(source), "-o", str(target), "--config", str(config)]) == 0
+    records = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in records] == ["a", "b", "c", "d"]
@@ -0,0 +1,113 @@
+"""
+Unit Tests for the benchmark suite (benchmarks/bench_suite.py)
+ตรวจเฉพาะรายการ case / JSON / การตัดสิน regression (ไม่วัดเวลาจริง)
+"""
+
+import json
+import subprocess
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+from bench_suite import (
+    CALCULATOR_DIR, IMPORT_BUDGETS_MS, SCHEMA_VERSION, build_cases, find_regressions, load_baseline, measure,
+    measure_import, memo_cases, over_budget, slow_memo_hits, to_document,
+)
+from character_db import get_character_db
+from character_registry import list_registered_characters
+
+
+@pytest.fixture(scope="module")
+def names():
+    return [name for name, _ in build_cases()]
+
+
+class TestCases:
+    """ครอบคลุมทุกส่วนที่ต้องวัด"""
+
+    def test_names_unique(self, names):
+        assert len(names) == len(set(names))
+
+    def test_every_character_and_preset(self, names):
+        db = get_character_db()
+        for character in db.names():
+            assert f"pipeline.{character}.none" in names
+            for preset in db.monster_names():
+                assert f"pipeline.{character}.{preset.removesuffix('.json')}" in names
+
+    def test_every_logic_handler(self, names):
+        for character in list_registered_characters():
+            assert f"logic.{character}" in names
+
+    def test_cases_run(self):
+        for _, fn in build_cases():
+            fn()
+
+
+class TestRegression:
+    """การเทียบกับ baseline"""
+
+    def test_threshold(self):
+        baseline = {"a": 1000.0, "b": 1000.0, "c": 1000.0}
+        current = {"a": 900.0, "b": 700.0, "c": 1500.0, "new": 1.0}
+        assert find_regressions(current, baseline, 0.15) == [("b", 1000.0, 700.0)]
+        assert find_regressions(current, baseline, 0.05) == [("a", 1000.0, 900.0), ("b", 1000.0, 700.0)]
+
+    def test_json_round_trip(self, tmp_path):
+        path = tmp_path / "bench.json"
+        path.write_text(json.dumps(to_document({"a": 2000.0}, 0.1, 3)), encoding="utf-8")
+        assert load_baseline(path) == {"a": 2000.0}
+
+    def test_rejects_other_schema(self, tmp_path):
+        path = tmp_path / "bench.json"
+        path.write_text(json.dumps({"schema": SCHEMA_VERSION + 1, "results": {}}), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    def test_measure_positive(self):
+        assert measure(lambda: None, 0.001, 2) > 0
+
+
+class TestMemoHit:
+    """cache hit ของ memo ต้องเร็วกว่า miss (ไม่เช่นนั้น cache ทำให้ pipeline ช้าลง)"""
+
+    def test_check(self):
+        results = {"memo.a": 300.0, "memo.a.miss": 100.0, "memo.b": 90.0, "memo.b.miss": 100.0, "other": 1.0}
+        assert slow_memo_hits(results) == [("memo.b", 100.0, 90.0)]
+
+    def test_every_memo_case_has_miss(self):
+        names = {name for name, _ in memo_cases()}
+        assert {name for name in names if not name.endswith(".miss")} == {"memo.total_atk", "memo.effective_def"}
+        assert all(f"{name}.miss" in names for name in names if not name.endswith(".miss"))
+
+    def test_hit_faster_than_miss(self):
+        results = {name: measure(fn, 0.02, 3) for name, fn in memo_cases()}
+        assert slow_memo_hits(results) == []
+
+
+class TestImportBudget:
+    """เวลา import ของ entry point"""
+
+    def test_budget_check(self):
+        budgets = {"main": 50.0, "pipeline": 80.0}
+        assert over_budget({"main": 61.0, "pipeline": 40.0}, budgets) == [("main", 50.0, 61.0)]
+        assert over_budget({}, budgets) == []
+
+    def test_budget_modules_exist(self):
+        for module in IMPORT_BUDGETS_MS:
+            assert (CALCULATOR_DIR / f"{module}.py").exists()
+
+    def test_measure_import(self):
+        assert 0 < measure_import("constants", repeat=1) < 5
+
+    def test_main_defers_mode_modules(self):
+        """หน้าเมนูไม่ import pipeline / โหมดอื่น / handler ของตัวละคร"""
+        deferred = ("pipeline", "results", "character_registry", "atk_compare_mode", "optimizer_mode",
+                    "gear_optimizer", "kill_matrix_mode", "kill_matrix")
+        code = f"import sys, main; print([m for m in {deferred!r} if m in sys.modules])"
+        done = subprocess.run([sys.executable, "-c", code], cwd=CALCULATOR_DIR,
+                              capture_output=True, text=True, check=True)
+        assert done.stdout.strip() == "[]"
@@ -0,0 +1,142 @@
+"""
+Unit Tests for CharacterDB (character_db.py)
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from character_db import CharacterDB, get_character_db
+from config_loader import load_character_full, load_monster_preset, list_characters
+
+
+def _write(path: Path, data: dict, mtime_ns: int | None = None) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def db_root(tmp_path):
+    """โฟลเดอร์ตัวละครจำลอง: 3 ตัว + 1 monster"""
+    _write(tmp_path / "alpha.json", {"_rarity": "legend", "_class": "magic", "_element": "Dark",
+                                     "// note": "", "WEAK_DMG": 23.0,
+                                     "_skills": {"skill1": {"_name": "A", "SKILL_DMG": 100.0}}})
+    _write(tmp_path / "beta.json", {"_rarity": "legend", "_class": "attack", "_element": "Fire",
+                                    "CRIT_DMG": 10.0})
+    _write(tmp_path / "gamma.json", {"_rarity": "rare", "_class": "magic", "_element": "dark"})
+    (tmp_path / "monster").mkdir()
+    _write(tmp_path / "monster" / "boss.json", {"_mode": "castle", "HP_Target": 5000.0, "DEF_BUFF": None})
+    return tmp_path
+
+
+class TestLookup:
+    """ค้นหาตามชื่อ / index"""
+
+    def test_get_by_name(self, db_root):
+        db = CharacterDB(db_root)
+        alpha = db.get("alpha")
+        assert alpha.config == {"WEAK_DMG": 23.0}
+        assert alpha.meta["_skills"]["skill1"]["SKILL_DMG"] == 100.0
+        assert (alpha.element, alpha.rarity, alpha.char_class) == ("Dark", "legend", "magic")
+
+    def test_unknown_raises_key_error(self, db_root):
+        db = CharacterDB(db_root)
+        assert "delta" not in db
+        with pytest.raises(KeyError):
+            db.get("delta")
+
+    def test_find_by_index(self, db_root):
+        db = CharacterDB(db_root)
+        assert {e.name for e in db.find(element="DARK")} == {"alpha", "gamma"}
+        assert {e.name for e in db.find(rarity="legend", char_class="magic")} == {"alpha"}
+        assert db.find(element="Water") == ()
+        assert len(db.find()) == len(db) == 3
+
+    def test_monster_preset(self, db_root):
+        db = CharacterDB(db_root)
+        assert db.monster("boss").preset == {"HP_Target": 5000.0}
+        assert db.monster("boss.json").meta == {"_mode": "castle"}
+        assert db.monster_names() == ("boss",)
+
+
+class TestImmutability:
+    """ข้อมูลใน DB แก้ไม่ได้"""
+
+    def test_entry_is_read_only(self, db_root):
+        alpha = CharacterDB(db_root).get("alpha")
+        with pytest.raises(TypeError):
+            alpha.config["WEAK_DMG"] = 0
+        with pytest.raises(TypeError):
+            alpha.meta["_skills"]["skill1"]["SKILL_DMG"] = 0
+        with pytest.raises(AttributeError):
+            alpha.name = "other"
+
+    def test_loader_returns_independent_copies(self):
+        meta, config = load_character_full("miho")
+        config["WEAK_DMG"] = -1
+        meta["_skills"]["skill2"]["SKILL_DMG"] = -1
+        meta2, config2 = load_character_full("miho")
+        assert config2["WEAK_DMG"] != -1
+        assert meta2["_skills"]["skill2"]["SKILL_DMG"] != -1
+        assert isinstance(meta2["_skills"], dict)
+
+
+class TestInvalidation:
+    """โหลดใหม่เมื่อ mtime เปลี่ยน"""
+
+    def test_reload_on_mtime_change(self, db_root):
+        db = CharacterDB(db_root, check_interval=0)
+        assert db.get("beta").config["CRIT_DMG"] == 10.0
+        stat = (db_root / "beta.json").stat()
+        _write(db_root / "beta.json", {"CRIT_DMG": 20.0}, stat.st_mtime_ns + 10**9)
+        assert db.get("beta").config["CRIT_DMG"] == 20.0
+
+    def test_new_and_removed_files(self, db_root):
+        db = CharacterDB(db_root, check_interval=0)
+        _write(db_root / "delta.json", {"_element": "Water"})
+        (db_root / "gamma.json").unlink()
+        assert set(db.names()) == {"alpha", "beta", "delta"}
+        assert [e.name for e in db.find(element="water")] == ["delta"]
+
+    def test_no_check_until_refresh(self, db_root):
+        db = CharacterDB(db_root, check_interval=None)
+        db.names()
+        _write(db_root / "delta.json", {})
+        assert "delta" not in db
+        assert db.refresh() is True
+        assert "delta" in db
+        assert db.refresh() is False
+
+
+class TestDump:
+    """ส่ง DB ข้าม process (parallel.py)"""
+
+    def test_round_trip_through_pickle(self, db_root):
+        import pickle
+        db = CharacterDB(db_root)
+        copy = CharacterDB.from_dump(pickle.loads(pickle.dumps(db.dump())))
+        assert copy.names() == db.names() and copy.monster_names() == db.monster_names()
+        assert all(copy.get(name) == db.get(name) for name in db.names())
+        assert copy.monster("boss") == db.monster("boss")
+        assert [e.name for e in copy.find(element="dark")] == ["alpha", "gamma"]
+
+    def test_copy_does_not_touch_files(self, db_root):
+        copy = CharacterDB.from_dump(CharacterDB(db_root).dump())
+        _write(db_root / "delta.json", {})
+        assert "delta" not in copy
+        assert copy.refresh() is True and "delta" in copy
+
+
+class TestConfigLoaderIntegration:
+    """config_loader ใช้ DB เดียวกัน"""
+
+    def test_list_matches_db(self):
+        assert list_characters() == list(get_character_db().names())
+
+    def test_monster_preset_with_or_without_extension(self):
+        assert load_monster_preset("castle_room1.json") == load_monster_preset("castle_room1")
@@ -21,6 +21,8 @@ from config_loader import (
     load_monster_preset,
     apply_weapon_set,
     merge_configs,
+    merge_configs_many,
+    compile_merge,
     get_decimal,
     list_characters,
 )
@@ -207,6 +209,43 @@ class TestConfigMerging:
         assert result["Formation"] == Decimal("42")
 
 
+class TestMergePlan:
+    """compile_merge / merge_configs_many ต้องตรงกับ merge_configs ทุกค่าและลำดับ key"""
+
+    USERS = [
+        {},
+        {"CRIT_DMG": 186.0, "ATK_CHAR": 3773, "Formation": "21"},
+        {"CRIT_DMG": "150.5", "SKILL_DMG": 10, "SKILL_HITS": 5, "Ignore_DEF": 0.1},
+        {"Bonus_Crit_DMG": 7, "DMG_AMP_BUFF": Decimal("12.5"), "WEAK_DMG": 0.2},
+    ]
+
+    @pytest.mark.parametrize("char_config", [
+        {"CRIT_DMG": 10.0, "Bonus_Crit_DMG": 20.0, "SKILL_HITS": 3},
+        {"Bonus_Crit_DMG": 20.0, "CRIT_DMG": 10.0},   # additive ทีหลังเขียนทับ mapping
+        {"SKILL_HITS": 2, "Bonus_Crit_Rate": 100, "Ignore_DEF": "40.1"},
+        {},
+    ])
+    def test_matches_merge_configs(self, char_config):
+        plan = compile_merge(char_config)
+        for user in self.USERS:
+            expected = merge_configs(char_config, user)
+            assert list(plan.apply(user).items()) == list(expected.items())
+        assert merge_configs_many(char_config, self.USERS) == [merge_configs(char_config, u) for u in self.USERS]
+
+    def test_every_character_skill(self):
+        for name in list_characters():
+            meta, config = load_character_full(name)
+            for skill in (meta.get("_skills") or {None: {}}).values():
+                combined = {**config, **{k: v for k, v in (skill or {}).items() if not k.startswith("_")}}
+                results = merge_configs_many(combined, self.USERS)
+                assert results == [merge_configs(combined, u) for u in self.USERS], name
+
+    def test_user_config_not_mutated(self):
+        user = {"CRIT_DMG": 1.0}
+        compile_merge({"CRIT_DMG": 2.0, "SKILL_HITS": 2}).apply(user)
+        assert user == {"CRIT_DMG": 1.0}
+
+
 # ============================================================================
 # Weapon Set Tests
 # ============================================================================
@@ -0,0 +1,115 @@
+"""
+Unit Tests for the Monte Carlo Crit Simulator (crit_sim.py)
+"""
+
+import math
+import pytest
+from itertools import product
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from crit_sim import HitDamage, simulate_character, simulate_kill, wilson_interval, _outcome_probabilities
+
+
+def _exact_kill_probability(damage, hits, hp, crit_rate, weak_rate):
+    """แจกแจงทุกผลลัพธ์ของทุก hit (ใช้ได้เฉพาะ hits น้อยๆ)"""
+    probabilities = _outcome_probabilities(crit_rate, weak_rate)
+    values = (damage.crit, damage.crit_weak, damage.no_crit, damage.weak_only)
+    total = 0.0
+    for outcome in product(range(4), repeat=hits):
+        if sum(values[i] for i in outcome) >= hp:
+            total += math.prod(probabilities[i] for i in outcome)
+    return total
+
+
+class TestWilsonInterval:
+    """ช่วงความเชื่อมั่น (ไม่ต้องใช้ NumPy)"""
+
+    def test_contains_estimate(self):
+        low, high = wilson_interval(300, 1000)
+        assert low < 0.3 < high
+        assert high - low == pytest.approx(0.0568, abs=1e-3)
+
+    def test_bounds_at_extremes(self):
+        assert wilson_interval(0, 100)[0] == 0.0
+        assert wilson_interval(100, 100)[1] == 1.0
+
+    def test_wider_with_higher_confidence(self):
+        low95, high95 = wilson_interval(50, 200, 0.95)
+        low99, high99 = wilson_interval(50, 200, 0.99)
+        assert low99 < low95 and high99 > high95
+
+
+class TestSimulateKill:
+    """ผลจำลองเทียบกับค่าแม่นยำ"""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("crit_rate,weak_rate,hp", [
+        (0.4, 0.5, 4000), (0.75, 0.0, 3500), (0.2, 1.0, 3000), (0.5, 0.5, 5200),
+    ])
+    def test_matches_exact_enumeration(self, crit_rate, weak_rate, hp):
+        damage = HitDamage(crit=1200, crit_weak=1600, no_crit=500, weak_only=700)
+        exact = _exact_kill_probability(damage, 4, hp, crit_rate, weak_rate)
+        sim = simulate_kill(damage, 4, hp, crit_rate, weak_rate, trials=400_000, seed=42)
+        assert sim.ci_low <= exact <= sim.ci_high
+        assert sim.kill_probability == pytest.approx(exact, abs=0.005)
+
+    def test_deterministic_rates(self):
+        damage = HitDamage(crit=1000, crit_weak=1300, no_crit=400, weak_only=520)
+        always = simulate_kill(damage, 3, 3900, crit_rate=1.0, weak_rate=1.0, trials=10_000, seed=1)
+        never = simulate_kill(damage, 3, 3900, crit_rate=0.0, weak_rate=0.0, trials=10_000, seed=1)
+        assert always.kill_probability == 1.0 and always.mean_damage == 3900
+        assert never.kill_probability == 0.0 and never.mean_damage == 1200
+
+    def test_seed_reproducible(self):
+        damage = HitDamage(1200, 1600, 500, 700)
+        a = simulate_kill(damage, 5, 5000, 0.3, 0.3, trials=50_000, seed=7)
+        b = simulate_kill(damage, 5, 5000, 0.3, 0.3, trials=50_000, seed=7)
+        assert a == b
+
+    def test_multiple_workers(self):
+        damage = HitDamage(1200, 1600, 500, 700)
+        exact = _exact_kill_probability(damage, 3, 3000, 0.5, 0.5)
+        sim = simulate_kill(damage, 3, 3000, 0.5, 0.5, trials=100_001, seed=3, workers=2)
+        assert sim.trials == 100_001
+        assert sim.ci_low <= exact <= sim.ci_high
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            simulate_kill(HitDamage(1, 1, 1, 1), 1, 1, crit_rate=1.5, weak_rate=0.0)
+
+
+class TestSimulateCharacter:
+    """ใช้อัตราคริจาก config / ตัวละคร"""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.fixture
+    def user_config(self):
+        return {
+            "Weapon_Set": 0, "ATK_CHAR": 4000.0, "CRIT_DMG": 200.0, "CRIT_RATE": 40.0,
+            "ATK_PET": 500.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+            "DEF_Target": 1000.0, "HP_Target": 20000.0, "DMG_Reduction": 10.0,
+        }
+
+    def test_bonus_crit_rate_from_character(self, user_config):
+        sim = simulate_character("sun_wukong", "skill1", user_config, "castle_room1.json",
+                                 weak_rate=1.0, trials=1000, seed=1)
+        assert sim.crit_rate == 1.0
+        assert sim.hp == 8650
+
+    def test_user_crit_rate(self, user_config):
+        sim = simulate_character("miho", "skill2", user_config, trials=1000, seed=1)
+        assert sim.crit_rate == pytest.approx(0.4)
+        assert sim.hp == 20000
+
+    def test_crit_rate_override(self, user_config):
+        sim = simulate_character("miho", "skill2", user_config, crit_rate=0.9, trials=1000, seed=1)
+        assert sim.crit_rate == 0.9
@@ -3,6 +3,7 @@ Unit Tests for Core Damage Calculation Functions
 Tests all functions in damage_calc.py with comprehensive coverage
 """
 
+import random
 import pytest
 from decimal import Decimal
 
@@ -13,6 +14,7 @@ from damage_calc import (
     calculate_cap_atk,
     calculate_final_dmg_hp,
     calculate_raw_dmg,
+    calculate_raw_matrix,
     calculate_effective_def,
     calculate_final_dmg,
 )
@@ -439,6 +441,58 @@ class TestCalculateRawDmg:
         assert result > Decimal("20000")
 
 
+# ============================================================================
+# calculate_raw_matrix() Tests
+# ============================================================================
+
+class TestCalculateRawMatrix:
+    """RAW หลายกรณีพร้อมกันต้องเท่ากับ calculate_raw_dmg ทีละกรณี"""
+
+    def test_matches_single_calls_randomized(self):
+        rng = random.Random(13)
+
+        def dec(lo, hi):
+            return Decimal(str(round(rng.uniform(lo, hi), rng.choice([0, 1, 2, 3]))))
+
+        for _ in range(300):
+            total_atk = dec(1000, 20000)
+            skills = (dec(50, 600), dec(50, 600))
+            crits = (dec(100, 400), Decimal("100"))
+            weaks = (Decimal("0"), dec(30, 80))
+            hps = (Decimal("0"), Decimal(rng.randint(1, 5000)))
+            amp_buff, amp_debuff, reduction = dec(0, 100), dec(0, 50), dec(0, 30)
+            matrix = calculate_raw_matrix(
+                total_atk, skills, crits, weaks, amp_buff, amp_debuff, reduction, hps
+            )
+            assert matrix.shape == (2, 2, 2, 2)
+            for s, skill in enumerate(skills):
+                for c, crit in enumerate(crits):
+                    for w, weak in enumerate(weaks):
+                        for h, hp in enumerate(hps):
+                            expected = calculate_raw_dmg(
+                                total_atk, skill, crit, weak, amp_buff, amp_debuff, reduction, hp
+                            )
+                            assert matrix[s, c, w, h] == expected
+
+    def test_scenario_order(self):
+        """values เรียง skill > crit > weak > hp (row-major)"""
+        matrix = calculate_raw_matrix(
+            Decimal("5000"), (Decimal("200"),), (Decimal("150"), Decimal("100")),
+            (Decimal("0"), Decimal("30")), Decimal("0"), Decimal("0"), Decimal("0")
+        )
+        assert matrix.values == (
+            Decimal("15000"), Decimal("19500"), Decimal("10000"), Decimal("13000"),
+        )
+
+    def test_default_without_hp(self):
+        matrix = calculate_raw_matrix(
+            Decimal("5000"), (Decimal("100"),), (Decimal("100"),), (Decimal("0"),),
+            Decimal("0"), Decimal("0"), Decimal("0")
+        )
+        assert matrix.shape == (1, 1, 1, 1)
+        assert matrix[0, 0, 0, 0] == Decimal("5000")
+
+
 # ============================================================================
 # calculate_effective_def() Tests
 # ============================================================================
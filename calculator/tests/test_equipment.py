@@ -0,0 +1,95 @@
+"""
+Unit Tests for the weapon set table (equipment.py)
+apply_weapon_set ที่อ่านจากตารางต้องได้ผลเดียวกับ if/elif เดิมทุกบิต
+"""
+
+import json
+
+import pytest
+
+from config_loader import apply_weapon_set
+from equipment import (
+    EFFECT_KEYS, EMPTY_EFFECTS, EffectVector, get_weapon_sets, load_weapon_sets,
+    parse_weapon_sets, set_weapon_sets, weapon_set_effects,
+)
+
+# ค่าของ if/elif เดิมใน apply_weapon_set
+LEGACY_EFFECTS = {
+    0: {},
+    1: {"WEAK_DMG": 35.0},
+    2: {"Ignore_DEF": 15.0},
+    3: {"DMG_AMP_BUFF": 70.0},
+    4: {"DMG_AMP_BUFF": 30.0},
+}
+
+
+@pytest.fixture
+def restore_table():
+    yield
+    set_weapon_sets(None)
+
+
+class TestTable:
+    """ตารางใน equipment/weapon_sets.json"""
+
+    def test_matches_legacy_branches(self):
+        table = get_weapon_sets()
+        assert list(table) == [0, 1, 2, 3, 4]
+        for set_id, effects in LEGACY_EFFECTS.items():
+            assert table[set_id].effects.as_dict() == effects
+            assert table[set_id].name
+
+    @pytest.mark.parametrize("weapon_set", [0, 1, 2, 3, 4, 7, -1])
+    @pytest.mark.parametrize("user", [{}, {"WEAK_DMG": 12.3, "Ignore_DEF": "5", "DMG_AMP_BUFF": 0.1}])
+    def test_apply_weapon_set_matches_legacy(self, weapon_set, user):
+        expected = {**user, "Weapon_Set": weapon_set}
+        for key, value in LEGACY_EFFECTS.get(weapon_set, {}).items():
+            expected[key] = float(expected.get(key, 0)) + value
+        config = {**user, "Weapon_Set": weapon_set}
+        assert apply_weapon_set(config) == expected
+        assert config == expected  # แก้ config ที่ส่งมาเหมือนเดิม
+
+    def test_unknown_set_has_no_effect(self):
+        assert weapon_set_effects(99) is EMPTY_EFFECTS
+        assert not EMPTY_EFFECTS
+
+    def test_custom_table(self, tmp_path, restore_table):
+        path = tmp_path / "weapon_sets.json"
+        path.write_text(json.dumps({"// note": "", "5": {"_name": "ทดลอง", "CRIT_DMG": 20, "WEAK_DMG": 5}}),
+                        encoding="utf-8")
+        set_weapon_sets(load_weapon_sets(path))
+        assert apply_weapon_set({"Weapon_Set": 5, "CRIT_DMG": 100}) == \
+            {"Weapon_Set": 5, "CRIT_DMG": 120.0, "WEAK_DMG": 5.0}
+        assert apply_weapon_set({"Weapon_Set": 1}) == {"Weapon_Set": 1}
+
+    @pytest.mark.parametrize("data", [
+        {"x": {"WEAK_DMG": 1}},          # key ไม่ใช่ตัวเลข
+        {"1": {"ATK_CHAR": 100}},        # ไม่ใช่ additive key
+        {"1": {"WEAK_DMG": "35"}},       # ค่าไม่ใช่ตัวเลข
+        {"1": [1, 2]},
+    ])
+    def test_invalid_table(self, data):
+        with pytest.raises(ValueError):
+            parse_weapon_sets(data)
+
+
+class TestEffectVector:
+    """vector / การซ้อน effect"""
+
+    def test_vector_order(self):
+        vector = EffectVector.of({"WEAK_DMG": 35, "CRIT_DMG": 20}).vector
+        assert len(vector) == len(EFFECT_KEYS)
+        assert vector[EFFECT_KEYS.index("WEAK_DMG")] == 35.0
+        assert vector[EFFECT_KEYS.index("CRIT_DMG")] == 20.0
+        assert sum(vector) == 55.0
+
+    def test_stacking(self):
+        stacked = weapon_set_effects(3) + weapon_set_effects(4) + EffectVector.of({"WEAK_DMG": 5})
+        assert stacked.as_dict() == {"DMG_AMP_BUFF": 100.0, "WEAK_DMG": 5.0}
+        user = {"DMG_AMP_BUFF": 10.0}
+        assert stacked.apply(user) == {"DMG_AMP_BUFF": 110.0, "WEAK_DMG": 5.0}
+        assert user == {"DMG_AMP_BUFF": 10.0}
+
+    def test_zero_effect_is_kept(self):
+        # ค่า 0 ที่ระบุยังใส่ key ลง config (Ignore_DEF ไม่ได้กรอก → 0 ไม่ใช่ค่าปริยาย 39)
+        assert EffectVector.of({"Ignore_DEF": 0}).apply({}) == {"Ignore_DEF": 0.0}
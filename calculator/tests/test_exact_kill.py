@@ -0,0 +1,147 @@
+"""
+Unit Tests for the exact kill-probability engine (exact_kill.py)
+"""
+
+import math
+import time
+import pytest
+from itertools import product
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from exact_kill import (
+    KillOdds, SkillHits, convolve, damage_distribution, exact_kill_character,
+    expected_damage, hit_outcomes, kill_probability,
+)
+from gear_optimizer import kill_probability as binomial_kill_probability
+from results import HitDamage
+
+DAMAGE = HitDamage(crit=1200, crit_weak=1600, no_crit=500, weak_only=700)
+
+
+def _enumerate(skills, hp):
+    """แจกแจงทุกผลลัพธ์ของทุก hit (ใช้ได้เฉพาะ hits น้อยๆ)"""
+    per_hit = []
+    for s in skills:
+        per_hit += [hit_outcomes(s.damage, s.crit_rate, s.weak_rate)] * s.hits
+    total = 0.0
+    for outcome in product(*per_hit):
+        if sum(d for d, _ in outcome) >= hp:
+            total += math.prod(p for _, p in outcome)
+    return total
+
+
+class TestDistribution:
+    """การกระจายของดาเมจรวม"""
+
+    def test_equal_damage_outcomes_merged(self):
+        outcomes = hit_outcomes(HitDamage(900, 900, 400, 400), 0.3, 0.5)
+        assert outcomes == ((400, pytest.approx(0.7)), (900, pytest.approx(0.3)))
+
+    def test_zero_probability_dropped(self):
+        assert hit_outcomes(DAMAGE, 1.0, 0.0) == ((1200, 1.0),)
+
+    def test_matches_repeated_convolution(self):
+        outcomes = hit_outcomes(DAMAGE, 0.4, 0.3)
+        expected = {0: 1.0}
+        for _ in range(7):
+            expected = convolve(expected, dict(outcomes))
+        dist = damage_distribution(outcomes, 7)
+        assert dist.keys() == expected.keys()
+        for k, p in expected.items():
+            assert dist[k] == pytest.approx(p, rel=1e-12, abs=1e-18)
+        assert sum(dist.values()) == pytest.approx(1.0)
+
+    def test_cap_collapses_kill_bucket(self):
+        dist = damage_distribution(hit_outcomes(DAMAGE, 0.5, 0.5), 4, cap=3000)
+        assert max(dist) == 3000
+        assert sum(dist.values()) == pytest.approx(1.0)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            hit_outcomes(DAMAGE, 1.5, 0.0)
+
+
+class TestKillProbability:
+    """โอกาสฆ่าแบบแม่นยำ"""
+
+    @pytest.mark.parametrize("crit_rate,weak_rate,hp", [
+        (0.4, 0.5, 4000), (0.75, 0.0, 3500), (0.2, 1.0, 3000), (0.5, 0.5, 5200), (0.3, 0.3, 6400),
+    ])
+    def test_single_skill_matches_enumeration(self, crit_rate, weak_rate, hp):
+        skills = [SkillHits(DAMAGE, 4, crit_rate, weak_rate)]
+        assert kill_probability(skills, hp) == pytest.approx(_enumerate(skills, hp), abs=1e-12)
+
+    def test_rotation_matches_enumeration(self):
+        skills = [
+            SkillHits(DAMAGE, 3, 0.4, 0.5),
+            SkillHits(HitDamage(2100, 2900, 1000, 1400), 2, 0.25, 0.1),
+            SkillHits(HitDamage(800, 1000, 300, 450), 2, 0.6, 0.6),
+        ]
+        for hp in (6000, 8000, 9100, 11000):
+            assert kill_probability(skills, hp) == pytest.approx(_enumerate(skills, hp), abs=1e-12)
+
+    def test_matches_binomial_tail(self):
+        # ไม่มีจุดอ่อน = binomial ของจำนวนคริ
+        for hits, hp in [(5, 4000), (12, 9000), (30, 20000)]:
+            skills = [SkillHits(DAMAGE, hits, 0.35, 0.0)]
+            expected = binomial_kill_probability(hits, 0.35, DAMAGE.crit, DAMAGE.no_crit, hp)
+            assert kill_probability(skills, hp) == pytest.approx(expected, rel=1e-9)
+
+    def test_edge_cases(self):
+        skills = [SkillHits(DAMAGE, 3, 0.5, 0.5)]
+        assert kill_probability(skills, 0) == 1.0
+        assert kill_probability(skills, 1500) == pytest.approx(1.0)
+        assert kill_probability(skills, 4801) == 0.0
+        assert kill_probability([], 1) == 0.0
+
+    def test_expected_damage(self):
+        skills = [SkillHits(DAMAGE, 4, 0.5, 0.5)]
+        assert expected_damage(skills) == pytest.approx(4 * (1200 + 1600 + 500 + 700) / 4)
+
+    def test_long_rotation_is_fast(self):
+        skills = [
+            SkillHits(HitDamage(1203, 1611, 517, 703), 25, 0.4, 0.5),
+            SkillHits(HitDamage(2207, 2999, 1013, 1409), 25, 0.3, 0.2),
+        ]
+        start = time.perf_counter()
+        probability = kill_probability(skills, int(expected_damage(skills)))
+        assert time.perf_counter() - start < 0.5
+        assert 0.3 < probability < 0.7
+
+    def test_agrees_with_simulation(self):
+        pytest.importorskip("numpy")
+        from crit_sim import simulate_kill
+        exact = kill_probability([SkillHits(DAMAGE, 10, 0.4, 0.5)], 9000)
+        sim = simulate_kill(DAMAGE, 10, 9000, 0.4, 0.5, trials=200_000, seed=11)
+        assert sim.ci_low <= exact <= sim.ci_high
+
+
+class TestExactKillCharacter:
+    """ใช้ดาเมจต่อ hit และอัตราคริจาก pipeline"""
+
+    @pytest.fixture
+    def user_config(self):
+        return {
+            "Weapon_Set": 0, "ATK_CHAR": 4000.0, "CRIT_DMG": 200.0, "CRIT_RATE": 40.0,
+            "ATK_PET": 500.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+            "DEF_Target": 1000.0, "HP_Target": 20000.0, "DMG_Reduction": 10.0,
+        }
+
+    def test_single_skill(self, user_config):
+        odds = exact_kill_character("miho", "skill2", user_config, weak_rate=0.5)
+        assert isinstance(odds, KillOdds)
+        assert odds.hp == 20000 and odds.skills == ("skill2",)
+        assert 0.0 <= odds.probability <= 1.0
+
+    def test_both_skills_is_rotation(self, user_config):
+        both = exact_kill_character("miho", "both", user_config, crit_rate=0.5)
+        explicit = exact_kill_character("miho", ["skill2", "skill1"], user_config, crit_rate=0.5)
+        assert both == explicit
+        assert both.hits == 2
+
+    def test_certain_kill_with_low_hp(self, user_config):
+        user_config["HP_Target"] = 1.0
+        assert exact_kill_character("miho", "skill2", user_config).probability == pytest.approx(1.0)
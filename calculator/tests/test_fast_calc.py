@@ -0,0 +1,119 @@
+"""
+Unit Tests for the Float Fast-Path (fast_calc.py)
+The float backend must return exactly the same integers as the Decimal backend
+"""
+
+import random
+
+import pytest
+from decimal import Decimal
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fast_calc import (
+    BACKEND_DECIMAL,
+    BACKEND_FLOAT,
+    SCENARIO_INPUT_KEYS,
+    calculate_scenarios,
+    float_scenarios,
+    get_backend,
+    guarded_rounddown,
+    set_backend,
+    use_backend,
+)
+from constants import CONFIG_DEFAULTS
+
+
+def _random_config(rng):
+    """Random build in the same ranges as test_batch_calc (with fractional values)"""
+    return {
+        "ATK_CHAR": rng.randint(2000, 6000),
+        "ATK_PET": rng.randint(0, 600),
+        "Formation": rng.choice([0, 21, 42]),
+        "Potential_PET": rng.choice([0, 21, 51]),
+        "BUFF_ATK": rng.choice([0, 10, 25.5]),
+        "BUFF_ATK_PET": rng.randint(0, 21),
+        "SKILL_DMG": rng.choice([82, 102, 160, 185, 515, 37.5]),
+        "CRIT_DMG": rng.randint(150, 350),
+        "WEAK_DMG": rng.choice([0, 23, 35, 58]),
+        "DMG_AMP_BUFF": rng.choice([0, 10, 40, 80]),
+        "DMG_AMP_DEBUFF": rng.choice([0, 22, 33]),
+        "DMG_Reduction": rng.choice([0, 10]),
+        "DEF_Target": rng.randint(0, 3000),
+        "DEF_BUFF": rng.choice([0, 10]),
+        "DEF_REDUCE": rng.choice([0, 24]),
+        "Ignore_DEF": rng.choice([0, 15, 40, 55]),
+        "HP_Target": rng.randint(5000, 200000),
+        "Bonus_DMG_HP_Target": rng.choice([0, 7, 26]),
+        "Cap_ATK_Percent": rng.choice([0, 100, 1300]),
+    }
+
+
+class TestBackendSelection:
+    """set_backend / use_backend"""
+
+    def test_default_is_decimal(self):
+        assert get_backend() == BACKEND_DECIMAL
+
+    def test_use_backend_restores(self):
+        with use_backend(BACKEND_FLOAT):
+            assert get_backend() == BACKEND_FLOAT
+        assert get_backend() == BACKEND_DECIMAL
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            set_backend("gpu")
+
+
+class TestGuardedRounddown:
+    """Values near an integer are handed back to Decimal"""
+
+    def test_safe_value(self):
+        assert guarded_rounddown(1234.5) == 1234
+
+    def test_zero_is_safe(self):
+        assert guarded_rounddown(0.0) == 0
+
+    @pytest.mark.parametrize("value", [1000.0, 999.9999999999998, 1000.0000000000002])
+    def test_near_integer_is_risky(self, value):
+        assert guarded_rounddown(value) is None
+
+    def test_negative_truncates_toward_zero(self):
+        """ROUND_DOWN truncates toward zero like Decimal, not floor"""
+        assert guarded_rounddown(-2.5) == -2
+
+    def test_non_finite_is_risky(self):
+        assert guarded_rounddown(float("inf")) is None
+
+
+class TestDifferential:
+    """Float backend vs Decimal backend"""
+
+    def test_randomized_builds_identical(self):
+        rng = random.Random(20260131)
+        for _ in range(3000):
+            config = _random_config(rng)
+            atk_base = rng.choice([1500, 1300, 1100])
+            with use_backend(BACKEND_FLOAT):
+                fast = calculate_scenarios(config, atk_base)
+            assert fast == calculate_scenarios(config, atk_base), config
+
+    def test_exact_integer_boundary_falls_back(self):
+        """DEF_Target = 0 → Effective DEF = 1, RAW is an exact integer"""
+        config = {
+            "ATK_CHAR": 1000, "ATK_PET": 0, "Formation": 0, "Potential_PET": 0,
+            "BUFF_ATK": 0, "BUFF_ATK_PET": 0, "SKILL_DMG": 100, "CRIT_DMG": 100,
+            "WEAK_DMG": 0, "DEF_Target": 0, "Ignore_DEF": 0, "HP_Target": 0,
+        }
+        values = [float(config.get(k, CONFIG_DEFAULTS[k])) for k in SCENARIO_INPUT_KEYS]
+        assert float_scenarios(values, 0.0) is None
+        with use_backend(BACKEND_FLOAT):
+            assert calculate_scenarios(config, 0) == calculate_scenarios(config, 0)
+
+    def test_accepts_decimal_and_str(self):
+        config = {"ATK_CHAR": Decimal("4321.5"), "CRIT_DMG": "277"}
+        with use_backend(BACKEND_FLOAT):
+            fast = calculate_scenarios(config, Decimal("1500"))
+        assert fast == calculate_scenarios(config, Decimal("1500"))
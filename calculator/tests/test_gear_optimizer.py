@@ -0,0 +1,141 @@
+"""
+Unit Tests for the Gear Optimizer (gear_optimizer.py)
+Branch-and-bound must find the same optimum as brute force
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gear_optimizer import (
+    OBJECTIVE_DAMAGE,
+    OBJECTIVE_KILL,
+    GearBudget,
+    StatRange,
+    kill_probability,
+    optimize_gear,
+    _frontier,
+    _make_evaluator,
+    _rank,
+)
+from config_loader import get_crit_rate, load_character_full, load_monster_preset
+from constants import get_atk_base
+from fast_calc import BACKEND_FLOAT, use_backend
+from pipeline import resolve_skill
+
+
+@pytest.fixture
+def miho():
+    meta, char_config = load_character_full("miho")
+    skill_config, _, _ = resolve_skill(meta, "skill2")
+    return meta, char_config, skill_config
+
+
+@pytest.fixture
+def user_config():
+    return {
+        "Weapon_Set": 0, "ATK_CHAR": 4000.0, "CRIT_DMG": 200.0, "CRIT_RATE": 40.0,
+        "ATK_PET": 500.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+        "DEF_Target": 1000.0, "HP_Target": 20000.0, "DMG_Reduction": 10.0,
+    }
+
+
+def _brute_force(miho, user_config, budget, objective, preset=None):
+    """Evaluate every in-budget point"""
+    meta, char_config, skill_config = miho
+    atk_base = get_atk_base(meta["_rarity"], meta["_class"])
+    best = None
+    with use_backend(BACKEND_FLOAT):
+        for weapon_set in budget.weapon_sets:
+            evaluate = _make_evaluator(
+                char_config, skill_config, user_config, preset,
+                weapon_set, atk_base, objective, "crit_weak"
+            )
+            for atk in budget.atk_char.values():
+                for crit in budget.crit_dmg.values():
+                    if budget.max_points is not None and budget.points(atk, crit) > budget.max_points:
+                        continue
+                    candidate = evaluate(atk, crit)
+                    if best is None or _rank(candidate) > _rank(best):
+                        best = candidate
+    return best
+
+
+class TestKillProbability:
+    """Binomial kill probability"""
+
+    def test_needs_no_crit(self):
+        assert kill_probability(3, 0.0, 500, 400, 1200) == 1.0
+
+    def test_needs_all_crits(self):
+        assert kill_probability(2, 0.5, 600, 100, 1200) == pytest.approx(0.25)
+
+    def test_cannot_kill(self):
+        assert kill_probability(2, 1.0, 100, 50, 1200) == 0.0
+
+    def test_at_least_one_crit(self):
+        assert kill_probability(3, 0.5, 500, 300, 1000) == pytest.approx(1 - 0.125)
+
+
+class TestCritRate:
+    """CRIT_RATE + Bonus_Crit_Rate"""
+
+    def test_adds_bonus(self):
+        assert get_crit_rate({"CRIT_RATE": 40, "Bonus_Crit_Rate": 25}) == 65
+
+    def test_clamped(self):
+        assert get_crit_rate({"CRIT_RATE": 60, "Bonus_Crit_Rate": 100}) == 100
+        assert get_crit_rate({"CRIT_RATE": -5}) == 0
+
+
+class TestFrontier:
+    """Budget frontier"""
+
+    def test_unlimited_budget_uses_max_crit(self):
+        budget = GearBudget(StatRange(100, 103), StatRange(150, 160, 5))
+        assert _frontier(budget) == [(100, 160), (101, 160), (102, 160), (103, 160)]
+
+    def test_budget_trades_atk_for_crit(self):
+        budget = GearBudget(StatRange(0, 30, 10), StatRange(100, 103), max_points=25, crit_cost=10)
+        assert _frontier(budget) == [(0, 102), (10, 101), (20, 100)]
+
+
+class TestOptimizeGear:
+    """Branch-and-bound vs brute force"""
+
+    @pytest.mark.parametrize("max_points,crit_cost", [(None, 1.0), (300, 10.0), (150, 3.0), (40, 1.0)])
+    def test_damage_matches_brute_force(self, miho, user_config, max_points, crit_cost):
+        budget = GearBudget(StatRange(3000, 3300, 7), StatRange(180, 230, 2),
+                            max_points=max_points, crit_cost=crit_cost)
+        result = optimize_gear(*miho, user_config, budget, objective=OBJECTIVE_DAMAGE)
+        expected = _brute_force(miho, user_config, budget, OBJECTIVE_DAMAGE)
+        assert _rank(result.best) == _rank(expected)
+        assert result.evaluated < budget.space_size()
+
+    def test_kill_probability_matches_brute_force(self, miho, user_config):
+        preset = load_monster_preset("castle_room2.json")
+        budget = GearBudget(StatRange(1000, 2000, 25), StatRange(150, 250, 5), max_points=900, crit_cost=8)
+        result = optimize_gear(*miho, user_config, budget, objective=OBJECTIVE_KILL, monster_preset=preset)
+        expected = _brute_force(miho, user_config, budget, OBJECTIVE_KILL, preset)
+        assert _rank(result.best) == _rank(expected)
+        assert 0.0 <= result.best.kill_probability <= 1.0
+
+    def test_large_space_prunes(self, miho, user_config):
+        """~4M-point space is solved with a tiny number of evaluations"""
+        budget = GearBudget(StatRange(2000, 6000), StatRange(150, 400), max_points=2500, crit_cost=10)
+        result = optimize_gear(*miho, user_config, budget)
+        assert result.space_size > 4_000_000
+        assert result.evaluated < 5_000
+        assert budget.points(result.best.atk_char, result.best.crit_dmg) <= 2500
+
+    def test_nothing_in_budget(self, miho, user_config):
+        budget = GearBudget(StatRange(10, 20), StatRange(5, 6), max_points=-1)
+        result = optimize_gear(*miho, user_config, budget)
+        assert result.best is None
+
+    def test_invalid_objective_raises(self, miho, user_config):
+        budget = GearBudget(StatRange(10, 20), StatRange(5, 6))
+        with pytest.raises(ValueError):
+            optimize_gear(*miho, user_config, budget, objective="dps")
@@ -0,0 +1,116 @@
+"""
+Unit Tests for incremental recomputation (incremental.py)
+ทุกการแก้ต้องให้ผลเท่ากับ compute_damage ของ config ใหม่ทั้งชุด
+"""
+
+import random
+
+import pytest
+
+from character_db import get_character_db
+from incremental import NODES, DamageGraph, downstream
+from pipeline import compute_damage
+
+USER = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+EDITS = ("ATK_CHAR", "CRIT_DMG", "WEAK_DMG", "DEF_Target", "HP_Target", "Weapon_Set",
+         "Cap_ATK_Percent", "Bonus_DMG_HP_Target", "DMG_Reduction", "Ignore_DEF", "SKILL_HITS")
+
+
+def _assert_matches(graph, character, skill, user, preset=None):
+    result = compute_damage(character, skill, dict(user), preset)
+    assert graph.final_dmg == (result.final_dmg_crit, result.final_dmg_crit_weakness,
+                               result.final_dmg_no_crit, result.final_dmg_weakness_only)
+    assert str(graph["total_atk"]) == str(result.total_atk)
+    assert graph["final_dmg_hp"] == result.final_dmg_hp
+    assert graph["effective_def"] == result.effective_def
+    assert graph.skill_hits == result.skill_hits
+
+
+class TestGraph:
+    """โครงสร้าง graph"""
+
+    def test_nodes_are_topologically_ordered(self):
+        seen = set()
+        for node in NODES:
+            assert all(dep in seen or dep[0].isupper() for dep in node.deps), node.name
+            seen.add(node.name)
+
+    def test_downstream(self):
+        assert downstream({"CRIT_DMG"}) == ("raw", "final_dmg")
+        assert downstream({"DEF_Target"}) == ("effective_def", "final_dmg")
+        assert downstream({"ATK_CHAR"}) == ("total_atk", "cap_atk", "final_dmg_hp", "raw", "final_dmg")
+        assert downstream({"Weapon_Set"}) == ()
+
+
+class TestUpdate:
+    """แก้ทีละค่า"""
+
+    @pytest.mark.parametrize("character", get_character_db().names())
+    def test_random_edits_match_pipeline(self, character):
+        rng = random.Random(character)
+        db = get_character_db()
+        for skill in db.get(character).meta.get("_skills") or [None]:
+            preset = dict(db.monster("castle_room1").preset) if rng.random() < 0.5 else None
+            graph, user = DamageGraph(character, skill, USER, preset), dict(USER)
+            for _ in range(12):
+                key = rng.choice(EDITS)
+                if key in ("Weapon_Set", "SKILL_HITS"):
+                    value = rng.randint(0, 4) + (key == "SKILL_HITS")
+                else:
+                    value = round(rng.uniform(0, 6000), rng.randint(0, 2))
+                graph.update({key: value})
+                user[key] = value
+                _assert_matches(graph, character, skill, user, preset)
+
+    def test_only_downstream_is_recomputed(self):
+        graph = DamageGraph("miho", "skill2", USER)
+        before = dict(graph.evaluations)
+        assert graph.update({"CRIT_DMG": 210}) == {"raw", "final_dmg"}
+        assert graph.update({"DEF_Target": 900}) == {"effective_def", "final_dmg"}
+        assert graph.evaluations["total_atk"] == before["total_atk"]
+        assert graph.update({"Weapon_Set": 1}) == {"raw", "final_dmg"}  # DMG_AMP_BUFF -30, WEAK_DMG +35
+
+    def test_unchanged_value_stops_propagation(self):
+        graph = DamageGraph("miho", "skill2", USER)
+        assert graph.update({"CRIT_DMG": 186.0}) == frozenset()
+        # Cap_ATK_Percent = 0: final_dmg_hp ยังเป็น 0 → raw / final_dmg ไม่ถูกคำนวณใหม่
+        assert graph.update({"HP_Target": 5000}) == {"dmg_hp", "final_dmg_hp"}
+
+    def test_remove_key_and_preset(self):
+        graph = DamageGraph("miho", "skill2", USER)
+        graph.update({"DMG_Reduction": None})
+        user = {k: v for k, v in USER.items() if k != "DMG_Reduction"}
+        _assert_matches(graph, "miho", "skill2", user)
+        preset = dict(get_character_db().monster("castle_room2").preset)
+        assert "effective_def" in graph.set_preset(preset)
+        _assert_matches(graph, "miho", "skill2", user, preset)
+        graph.set_preset(None)
+        _assert_matches(graph, "miho", "skill2", user)
+
+    def test_skill_hits_is_an_input(self):
+        graph = DamageGraph("sun_wukong", "skill1", USER)
+        assert graph.skill_hits == 3
+        assert graph.update({"SKILL_HITS": 5}) == frozenset()  # ไม่มี node ขึ้นกับ SKILL_HITS
+        _assert_matches(graph, "sun_wukong", "skill1", {**USER, "SKILL_HITS": 5})
+        preset = {**get_character_db().monster("castle_room1").preset, "SKILL_HITS": 2}
+        graph.set_preset(preset)
+        _assert_matches(graph, "sun_wukong", "skill1", {**USER, "SKILL_HITS": 5}, preset)
+        graph.set_preset(None)
+        graph.update({"SKILL_HITS": None})
+        assert graph.skill_hits == 3
+
+    def test_invalid_value_keeps_state(self):
+        graph = DamageGraph("miho", "skill2", USER)
+        before = graph.values()
+        with pytest.raises(ValueError, match="CRIT_DMG"):
+            graph.update({"CRIT_DMG": "2x"})
+        with pytest.raises(ValueError, match="Weapon_Set"):
+            graph.update({"Weapon_Set": "x"})
+        with pytest.raises(ValueError, match="SKILL_HITS"):
+            graph.update({"SKILL_HITS": "many"})
+        assert graph.values() == before and graph.user_config == USER
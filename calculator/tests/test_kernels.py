@@ -0,0 +1,127 @@
+"""
+Unit Tests for compiled Damage Kernels (kernels.py)
+kernel ต้องให้ผลเหมือน run_pipeline ทุกบิต
+"""
+
+import random
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from kernels import DEFAULT_VARIABLES, compile_kernel
+from specs import MergeRule
+from character_db import get_character_db
+from constants import CONFIG_DEFAULTS
+from config_loader import load_character_full, load_monster_preset, merge_configs
+from pipeline import BOTH_SKILLS, resolve_skill, run_pipeline
+
+
+def _pipeline_output(character, skill, user, preset):
+    meta, char_config = load_character_full(character)
+    skill_config, _, _ = resolve_skill(meta, skill)
+    r = run_pipeline(character, meta, char_config, skill_config, user, monster_preset=preset)
+    return int(r.final_dmg_hp), (r.final_dmg_crit, r.final_dmg_crit_weakness,
+                                 r.final_dmg_no_crit, r.final_dmg_weakness_only)
+
+
+def _pipeline_skill_hits(character, skill, user):
+    meta, char_config = load_character_full(character)
+    skill_config, _, _ = resolve_skill(meta, skill)
+    return run_pipeline(character, meta, char_config, skill_config, user).skill_hits
+
+
+def _random_user(rng, weapon_set):
+    user = {
+        "Weapon_Set": weapon_set,
+        "ATK_CHAR": rng.choice([3773.0, 4000, rng.uniform(2000, 6000)]),
+        "CRIT_DMG": rng.choice([186.0, rng.randint(100, 300)]),
+        "DMG_AMP_BUFF": rng.choice([0, 10.0, 12.3]),
+        "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+        "DEF_Target": rng.randint(0, 2000), "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+    }
+    if rng.random() < 0.3:
+        user["Ignore_DEF"] = rng.choice([5, 7.7])
+    if rng.random() < 0.3:
+        user["WEAK_DMG"] = 0.1
+    return user
+
+
+class TestKernelMatchesPipeline:
+    """ทุกตัวละคร / สกิล / ชุดเซ็ทอาวุธ"""
+
+    @pytest.mark.parametrize("preset_name", [None, "castle_room2.json"])
+    def test_all_characters(self, preset_name):
+        rng = random.Random(5)
+        preset = load_monster_preset(preset_name) if preset_name else None
+        for entry in get_character_db():
+            for skill in entry.meta.get("_skills", {}):
+                for weapon_set in range(5):
+                    kernel = compile_kernel(entry.name, skill, weapon_set, monster_preset=preset_name)
+                    for _ in range(3):
+                        user = _random_user(rng, weapon_set)
+                        stats = {**user, **(preset or {})}
+                        assert kernel.evaluate(stats) == _pipeline_output(entry.name, skill, user, preset), \
+                            (entry.name, skill, weapon_set)
+
+    def test_positional_call(self):
+        kernel = compile_kernel("miho", "skill2", 3)
+        user = _random_user(random.Random(1), 3)
+        assert kernel(*(user.get(k) for k in kernel.variables)) == _pipeline_output("miho", "skill2", user, None)
+
+
+class TestCompile:
+    """ขั้นตอนคอมไพล์"""
+
+    def test_preset_keys_are_folded(self):
+        kernel = compile_kernel("miho", "skill2", monster_preset="castle_room1.json")
+        assert "DEF_Target" not in kernel.variables
+        assert "HP_Target" not in kernel.variables
+        assert "ATK_CHAR" in kernel.variables
+        assert set(compile_kernel("miho", "skill2").variables) == set(DEFAULT_VARIABLES)
+
+    def test_skill_constants(self):
+        kernel = compile_kernel("miho", "skill2")
+        assert kernel.skill_hits == 1
+        assert "SKILL_DMG" not in kernel.variables
+
+    def test_user_skill_hits_wins_like_pipeline(self):
+        # merge_configs: SKILL_HITS ไม่ใช่ ADDITIVE_KEYS → ค่าผู้ใช้ทับค่าสกิล
+        user = {"SKILL_HITS": 4}
+        kernel = compile_kernel("sun_wukong", "skill1", base_user=user)
+        assert kernel.skill_hits == _pipeline_skill_hits("sun_wukong", "skill1", user) == 4
+        assert compile_kernel("sun_wukong", "skill1").skill_hits == _pipeline_skill_hits("sun_wukong", "skill1", {})
+
+    def test_wrong_argument_count(self):
+        kernel = compile_kernel("miho", "skill2")
+        with pytest.raises(TypeError):
+            kernel(4000)
+
+    def test_both_skills_rejected(self):
+        with pytest.raises(ValueError):
+            compile_kernel("miho", BOTH_SKILLS)
+
+    def test_unknown_variable_rejected(self):
+        with pytest.raises(ValueError):
+            compile_kernel("miho", "skill2", variables=("ATK_CHAR", "LUCK"))
+
+    def test_unknown_character(self):
+        with pytest.raises(KeyError):
+            compile_kernel("nobody")
+
+
+class TestCompileKey:
+    """การจำลอง merge_configs ต่อ key"""
+
+    @pytest.mark.parametrize("combined", [
+        {"CRIT_DMG": 10.0, "Bonus_Crit_DMG": 20.0},
+        {"Bonus_Crit_DMG": 20.0, "CRIT_DMG": 10.0},   # additive ทีหลังเขียนทับ mapping
+        {"Bonus_Crit_DMG": 20.0},
+        {},
+    ])
+    @pytest.mark.parametrize("user_value", [None, 150, 186.1])
+    def test_matches_merge_configs(self, combined, user_value):
+        user = {} if user_value is None else {"CRIT_DMG": user_value}
+        expected = merge_configs(combined, user).get("CRIT_DMG", CONFIG_DEFAULTS["CRIT_DMG"])
+        assert MergeRule.compile("CRIT_DMG", combined)(user_value) == expected
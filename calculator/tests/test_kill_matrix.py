@@ -0,0 +1,107 @@
+"""
+Unit Tests for the kill matrix (kill_matrix.py)
+ทุกช่องต้องตรงกับ compute_damage ของ (ตัวละคร, สกิล, preset) เดียวกัน
+"""
+
+import random
+
+import pytest
+
+from character_db import get_character_db
+from kill_matrix import KillCell, character_matrix, monster_targets
+from kill_matrix_mode import format_margin
+from pipeline import compute_damage
+from specs import SkillSpec, TargetSpec
+
+USER = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+
+def _assert_matches_pipeline(character, user, presets=None):
+    """presets: ชื่อเป้าหมาย → preset dict (None = ทุก monster preset ใน DB)"""
+    targets = None if presets is None else [TargetSpec.from_config(user, p, name) for name, p in presets.items()]
+    matrix = character_matrix(character, user, targets)
+    for cell in matrix.cells:
+        preset = f"{cell.target}.json" if presets is None else presets[cell.target]
+        result = compute_damage(character, cell.skill, dict(user), preset)
+        expected = (result.final_dmg_crit, result.final_dmg_crit_weakness,
+                    result.final_dmg_no_crit, result.final_dmg_weakness_only)
+        assert cell.damage == expected, (character, cell.skill, cell.target)
+        assert cell.skill_hits == result.skill_hits
+        totals = tuple(d * result.skill_hits for d in expected)
+        assert cell.totals == totals
+        assert cell.margins == tuple(total - int(result.hp_target) for total in totals)
+
+
+class TestMatrix:
+    """ผลตรงกับ pipeline"""
+
+    @pytest.mark.parametrize("character", get_character_db().names())
+    def test_every_character(self, character):
+        _assert_matches_pipeline(character, USER)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_randomized_configs(self, seed):
+        rng = random.Random(seed)
+        user = {**USER, "ATK_CHAR": rng.uniform(2000, 6000), "CRIT_DMG": rng.uniform(100, 300),
+                "Weapon_Set": rng.randint(0, 4), "DEF_REDUCE": rng.choice([0, 12.5]),
+                "Bonus_DMG_HP_Target": rng.choice([0, 3.5]), "Cap_ATK_Percent": rng.choice([0, 40])}
+        for character in ("sun_wukong", "espada", "miho"):
+            _assert_matches_pipeline(character, user)
+
+    @pytest.mark.parametrize("character", ["miho", "sun_wukong"])
+    def test_user_skill_hits(self, character):
+        _assert_matches_pipeline(character, {**USER, "SKILL_HITS": 4})
+
+    @pytest.mark.parametrize("character", ["miho", "sun_wukong"])
+    def test_preset_skill_hits(self, character):
+        presets = {
+            "two_hits": {"HP_Target": 9000.0, "SKILL_HITS": 2},
+            "castle_room1": dict(get_character_db().monster("castle_room1.json").preset),
+        }
+        _assert_matches_pipeline(character, USER, presets)
+        _assert_matches_pipeline(character, {**USER, "SKILL_HITS": 5}, presets)
+
+    def test_shape_and_lookup(self):
+        matrix = character_matrix("miho", USER)
+        assert matrix.targets == tuple(sorted(get_character_db().monster_names()))
+        assert len(matrix.cells) == len(matrix.skills) * len(matrix.targets)
+        assert matrix.cell("skill1", "castle_room2").target == "castle_room2"
+        assert [c.skill for c in matrix.row("skill1")] == ["skill1"] * len(matrix.targets)
+        assert matrix.weapon_set == 4 and not matrix.special
+        assert character_matrix("sun_wukong", USER).special
+
+    def test_explicit_targets_and_skills(self):
+        targets = monster_targets(USER, ["castle_room1"])
+        matrix = character_matrix("teo", USER, targets, [SkillSpec.load("teo", "skill2")])
+        assert matrix.skills == ("skill2",) and matrix.targets == ("castle_room1",)
+
+    def test_preset_with_attacker_keys(self):
+        preset = {"DEF_Target": 900.0, "HP_Target": 9000.0, "DMG_AMP_BUFF": 25.0, "Ignore_DEF": 5.0}
+        targets = [TargetSpec.from_config(USER, preset, "custom"), *monster_targets(USER, ["castle_room1"])]
+        matrix = character_matrix("miho", USER, targets)
+        for skill in matrix.skills:
+            result = compute_damage("miho", skill, dict(USER), preset)
+            assert matrix.cell(skill, "custom").damage == (
+                result.final_dmg_crit, result.final_dmg_crit_weakness,
+                result.final_dmg_no_crit, result.final_dmg_weakness_only)
+
+
+class TestKillCell:
+    """ฆ่าได้ / margin"""
+
+    def test_margins(self):
+        cell = KillCell("skill1", "room", skill_hits=3, hp=1000, damage=(400, 500, 300, 333))
+        assert cell.totals == (1200, 1500, 900, 999)
+        assert cell.margins == (200, 500, -100, -1)
+        assert cell.kills == (True, True, False, False)
+        assert cell.kills_in("crit_weak") and not cell.kills_in("weak_only")
+        assert format_margin(cell, 0) == "💀 +200" and format_margin(cell, 3) == "-1"
+
+    def test_no_hp_never_kills(self):
+        cell = KillCell(None, "normal", skill_hits=1, hp=0, damage=(5, 5, 5, 5))
+        assert cell.kills == (False,) * 4
+        assert format_margin(cell, 0) == "5"
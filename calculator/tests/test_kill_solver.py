@@ -0,0 +1,140 @@
+"""
+Unit Tests for the Kill Solver (kill_solver.py)
+ค่าที่หาได้ต้องฆ่าได้ และค่าที่น้อยกว่า 1 ต้องฆ่าไม่ได้ (ตรวจด้วย Decimal backend)
+"""
+
+import random
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from kill_solver import STAT_BOUNDS, min_stat_to_kill, stat_shortfall
+from fast_calc import SCENARIO_INDEX, calculate_scenarios
+from pipeline import compute_damage
+
+ATK_BASE = 1500
+
+
+@pytest.fixture
+def user_config():
+    return {
+        "Weapon_Set": 0, "ATK_CHAR": 4000.0, "CRIT_DMG": 200.0,
+        "ATK_PET": 500.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+        "DEF_Target": 1000.0, "HP_Target": 20000.0, "DMG_Reduction": 10.0,
+    }
+
+
+def _kills(config, stat, value, hp, hits, scenario):
+    """ฆ่าได้ไหมที่ค่า stat นี้ (Decimal backend)"""
+    trial = dict(config)
+    trial[stat] = value
+    _, finals = calculate_scenarios(trial, ATK_BASE)
+    return finals[SCENARIO_INDEX[scenario]] * hits >= hp
+
+
+def _random_cases(n, seed=11):
+    rng = random.Random(seed)
+    for _ in range(n):
+        config = {
+            "ATK_CHAR": float(rng.randint(2000, 6000)),
+            "CRIT_DMG": float(rng.randint(150, 350)),
+            "SKILL_DMG": float(rng.randint(50, 400)),
+            "WEAK_DMG": rng.choice([0.0, 23.0, 35.0]),
+            "DMG_AMP_BUFF": rng.choice([0.0, 10.0, 40.0]),
+            "DEF_Target": float(rng.randint(0, 3000)),
+            "Ignore_DEF": rng.choice([0.0, 15.0, 40.0]),
+            "HP_Target": float(rng.randint(5000, 200000)),
+            "Bonus_DMG_HP_Target": rng.choice([0.0, 7.0]),
+            "Cap_ATK_Percent": rng.choice([0.0, 100.0]),
+        }
+        stat = rng.choice(list(STAT_BOUNDS))
+        scenarios = ["crit", "crit_weak"] if stat == "CRIT_DMG" else list(SCENARIO_INDEX)
+        yield config, stat, rng.randint(5000, 400000), rng.randint(1, 5), rng.choice(scenarios)
+
+
+class TestMinStatToKill:
+    """ค่าต่ำสุดที่ฆ่าได้ต้องเป็นขอบพอดี"""
+
+    def test_minimal_and_sufficient(self):
+        for config, stat, hp, hits, scenario in _random_cases(300):
+            lo, hi = STAT_BOUNDS[stat]
+            required = min_stat_to_kill(config, ATK_BASE, stat, hp, hits, scenario)
+            if required is None:
+                assert not _kills(config, stat, hi, hp, hits, scenario)
+                continue
+            assert _kills(config, stat, required, hp, hits, scenario)
+            if required > lo:
+                assert not _kills(config, stat, required - 1, hp, hits, scenario)
+
+    def test_hp_based_cap_branch(self):
+        """Total ATK ผ่านจุดที่ HP-based ติด cap"""
+        config = {"SKILL_DMG": 100.0, "HP_Target": 100000.0, "Bonus_DMG_HP_Target": 7.0, "Cap_ATK_Percent": 100.0}
+        for hp in (2000, 8000, 14000, 30000):
+            required = min_stat_to_kill(config, ATK_BASE, "ATK_CHAR", hp, 1, "no_crit")
+            assert _kills(config, "ATK_CHAR", required, hp, 1, "no_crit")
+            assert not _kills(config, "ATK_CHAR", required - 1, hp, 1, "no_crit")
+
+    def test_already_kills_returns_lower_bound(self):
+        config = {"ATK_CHAR": 4000.0, "SKILL_DMG": 10000.0}
+        assert min_stat_to_kill(config, ATK_BASE, "Ignore_DEF", 100, 1, "no_crit") == 0
+
+    def test_ignore_def_capped_at_100(self):
+        config = {"ATK_CHAR": 100.0, "SKILL_DMG": 10.0, "DEF_Target": 3000.0}
+        assert min_stat_to_kill(config, ATK_BASE, "Ignore_DEF", 10**9, 1, "no_crit") is None
+
+    def test_invalid_stat_raises(self):
+        with pytest.raises(ValueError):
+            min_stat_to_kill({}, ATK_BASE, "SKILL_DMG", 1000)
+
+    def test_crit_dmg_needs_crit_scenario(self):
+        with pytest.raises(ValueError):
+            min_stat_to_kill({}, ATK_BASE, "CRIT_DMG", 1000, scenario="no_crit")
+
+
+class TestStatShortfall:
+    """ส่วนต่างจากค่าปัจจุบัน"""
+
+    def test_zero_when_already_dead(self):
+        config = {"ATK_CHAR": 4000.0, "SKILL_DMG": 10000.0}
+        assert stat_shortfall(config, ATK_BASE, "ATK_CHAR", 100) == 0
+
+    def test_shortfall_matches_required(self):
+        config = {"ATK_CHAR": 4000.0, "SKILL_DMG": 200.0, "DEF_Target": 1500.0}
+        required = min_stat_to_kill(config, ATK_BASE, "ATK_CHAR", 50000, 2, "crit")
+        assert stat_shortfall(config, ATK_BASE, "ATK_CHAR", 50000, 2, "crit") == required - 4000
+
+    def test_missing_stat_uses_default(self):
+        # Ignore_DEF ไม่มีใน config → ค่าปัจจุบันคือ CONFIG_DEFAULTS (39) เหมือน min_stat_to_kill
+        required = min_stat_to_kill({}, ATK_BASE, "Ignore_DEF", 20000, 1, "crit")
+        assert stat_shortfall({}, ATK_BASE, "Ignore_DEF", 20000, 1, "crit") == required - 39
+
+
+class TestPipelineAtkNeeded:
+    """DamageResult.atk_needed ในโหมดปราสาท"""
+
+    def test_adding_shortfall_kills(self, user_config):
+        result = compute_damage("miho", "skill2", user_config, "castle_room2.json")
+        assert result.atk_needed is not None
+        for scenario, index in SCENARIO_INDEX.items():
+            extra = result.atk_needed[index]
+            if not extra:
+                continue
+            user = dict(user_config)
+            user["ATK_CHAR"] = float(user["ATK_CHAR"]) + extra
+            boosted = compute_damage("miho", "skill2", user, "castle_room2.json")
+            finals = (boosted.final_dmg_crit, boosted.final_dmg_crit_weakness,
+                      boosted.final_dmg_no_crit, boosted.final_dmg_weakness_only)
+            assert finals[index] * boosted.skill_hits >= boosted.monster_hp
+
+    def test_zero_when_default_config_already_kills(self):
+        # user config ว่าง: ค่า default ต้องนับเป็นค่าปัจจุบัน
+        result = compute_damage("miho", None, {}, "castle_room1.json")
+        finals = (result.final_dmg_crit, result.final_dmg_crit_weakness,
+                  result.final_dmg_no_crit, result.final_dmg_weakness_only)
+        for extra, final in zip(result.atk_needed, finals):
+            assert (extra == 0) == (final * result.skill_hits >= result.monster_hp)
+
+    def test_not_set_without_monster(self, user_config):
+        assert compute_damage("miho", "skill2", user_config).atk_needed is None
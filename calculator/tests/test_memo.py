@@ -0,0 +1,117 @@
+"""
+Unit Tests for the Total ATK / Effective DEF cache (memo.py)
+"""
+
+import pytest
+from decimal import Decimal
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import memo
+from config_loader import get_decimal
+from constants import CONFIG_DEFAULTS
+from damage_calc import calculate_effective_def, calculate_total_atk
+from pipeline import compute_damage
+
+ATK_BASE = Decimal("1500")
+CONFIG = {"ATK_CHAR": 3773.0, "ATK_PET": 564.0, "Formation": 0.0, "Potential_PET": 51.0, "BUFF_ATK_PET": 21.0,
+          "DEF_Target": 1461.0, "DEF_BUFF": 0.0, "Ignore_DEF": 39.0}
+
+
+def _direct_total_atk(config):
+    v = {key: get_decimal(config, key, CONFIG_DEFAULTS[key]) for key in memo.TOTAL_ATK_KEYS}
+    return calculate_total_atk(v["ATK_CHAR"], v["ATK_PET"], ATK_BASE, v["Formation"], v["Potential_PET"],
+                               v["BUFF_ATK"], v["BUFF_ATK_PET"])
+
+
+def _direct_effective_def(config):
+    keys = memo.EFFECTIVE_DEF_KEYS
+    return calculate_effective_def(*(get_decimal(config, key, CONFIG_DEFAULTS[key]) for key in keys))
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    memo.configure()
+    yield
+    memo.configure()
+    memo.set_enabled(True)
+
+
+class TestCache:
+    """ค่าเท่ากับแปลง config + สูตรตรง + นับ hit/miss"""
+
+    def test_same_result_as_formula(self):
+        total_atk, inputs = memo.total_atk(CONFIG, ATK_BASE)
+        assert total_atk == _direct_total_atk(CONFIG)
+        assert inputs == tuple(get_decimal(CONFIG, key, CONFIG_DEFAULTS[key]) for key in memo.TOTAL_ATK_KEYS)
+        effective_def, inputs = memo.effective_def(CONFIG)
+        assert effective_def == _direct_effective_def(CONFIG)
+        assert inputs == (Decimal("1461.0"), Decimal("0.0"), Decimal("0"), Decimal("39.0"))
+
+    def test_counts_hits_and_misses(self):
+        for _ in range(3):
+            memo.total_atk(CONFIG, ATK_BASE)
+        memo.effective_def(CONFIG)
+        stats = memo.cache_stats()
+        assert (stats["total_atk"].hits, stats["total_atk"].misses, stats["total_atk"].size) == (2, 1, 1)
+        assert stats["total_atk"].hit_rate == pytest.approx(2 / 3)
+        assert (stats["effective_def"].hits, stats["effective_def"].misses) == (0, 1)
+
+    def test_other_keys_share_entry(self):
+        # ค่าที่ไม่ใช่ input ของขั้น (เช่น CRIT_DMG / preset อื่นที่ DEF เท่ากัน) ไม่ทำให้ miss
+        memo.total_atk(CONFIG, ATK_BASE)
+        memo.total_atk({**CONFIG, "CRIT_DMG": 250.0, "DEF_Target": 900.0}, ATK_BASE)
+        assert memo.cache_stats()["total_atk"].hits == 1
+
+    def test_bounded(self):
+        memo.configure(maxsize=8)
+        for i in range(20):
+            memo.effective_def({**CONFIG, "DEF_Target": i})
+        assert memo.cache_stats()["effective_def"].size == 8
+        with pytest.raises(ValueError):
+            memo.configure(maxsize=0)
+
+    def test_int_float_and_decimal_not_shared(self):
+        # 1461 == 1461.0 == Decimal("1461.00") แต่ได้ Decimal คนละ exponent
+        for def_target in (1461.0, 1461, Decimal("1461.00")):
+            config = {**CONFIG, "DEF_Target": def_target}
+            for _ in range(2):  # miss แล้ว hit
+                effective_def, _ = memo.effective_def(config)
+                assert str(effective_def) == str(_direct_effective_def(config))
+        stats = memo.cache_stats()["effective_def"]
+        assert (stats.hits, stats.misses) == (3, 3)
+
+    def test_missing_keys_use_defaults(self):
+        total_atk, inputs = memo.total_atk({}, ATK_BASE)
+        assert total_atk == _direct_total_atk({})
+        assert inputs == tuple(Decimal(CONFIG_DEFAULTS[key]) for key in memo.TOTAL_ATK_KEYS)
+
+    def test_clear(self):
+        memo.total_atk(CONFIG, ATK_BASE)
+        memo.clear_caches()
+        assert memo.cache_stats()["total_atk"] == memo.CacheStats(0, 0, 0, memo.DEFAULT_CACHE_SIZE)
+
+
+class TestSwitch:
+    """ปิด cache สำหรับเทส"""
+
+    def test_disabled_bypasses_cache(self):
+        with memo.memoization(False):
+            assert not memo.is_enabled()
+            assert memo.total_atk(CONFIG, ATK_BASE)[0] == _direct_total_atk(CONFIG)
+        assert memo.is_enabled()
+        assert memo.cache_stats()["total_atk"].misses == 0
+
+    def test_pipeline_same_with_and_without_cache(self):
+        user = {"ATK_CHAR": 4000.0, "DEF_Target": 1200.0, "HP_Target": 30000.0}
+        cached = [compute_damage(name, "both", user, "castle_room1.json") for name in ("miho", "espada")]
+        with memo.memoization(False):
+            direct = [compute_damage(name, "both", user, "castle_room1.json") for name in ("miho", "espada")]
+        assert cached == direct
+
+    def test_both_skills_reuse_effective_def(self):
+        compute_damage("miho", "both", {"ATK_CHAR": 4000.0})
+        # pipeline หลัก 1 ครั้ง + ต่อสกิล 2 ครั้ง ด้วย Ignore_DEF เดียวกัน
+        assert memo.cache_stats()["effective_def"].hits >= 1
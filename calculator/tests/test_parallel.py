@@ -0,0 +1,71 @@
+"""
+Unit Tests for process-pool evaluation (parallel.py)
+"""
+
+import shutil
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from character_db import CHARACTERS_DIR, CharacterDB, get_character_db
+from parallel import evaluate_builds, imap_ordered, parallel_map, pick_chunk_size
+from pipeline import compute_damage
+from results import HitDamage
+
+USER = {"Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DEF_Target": 1461.0, "HP_Target": 18205.0}
+
+
+def _builds(n):
+    names = get_character_db().names()
+    presets = [None, "castle_room1.json", "castle_room2.json"]
+    return [
+        {"character": names[i % len(names)], "preset": presets[i % 3],
+         "config": {**USER, "ATK_CHAR": 3000.0 + 37 * i}}
+        for i in range(n)
+    ]
+
+
+def _character_names(_):
+    """ชื่อตัวละครที่ DB ของ worker เห็น"""
+    return get_character_db().names()
+
+
+class TestOrdering:
+    """ผลตรงกับการคำนวณทีละ build และเรียงตาม input"""
+
+    def test_matches_sequential(self):
+        builds = _builds(30)
+        expected = [compute_damage(b["character"], None, b["config"], b["preset"]) for b in builds]
+        assert evaluate_builds(builds, workers=1, summarize=None) == expected
+        assert evaluate_builds(builds, workers=2, chunk_size=4, summarize=None) == expected
+        assert evaluate_builds(builds, workers=2) == [HitDamage.from_result(r) for r in expected]
+
+    def test_iterator_input(self):
+        builds = _builds(11)
+        results = list(imap_ordered(len, (b["config"] for b in builds), workers=2, chunk_size=3))
+        assert results == [len(b["config"]) for b in builds]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            parallel_map(len, [], workers=0)
+        with pytest.raises(ValueError):
+            parallel_map(len, [], workers=2, chunk_size=0)
+
+    def test_chunk_size(self):
+        assert pick_chunk_size(None, 4) > 1
+        assert pick_chunk_size(10, 16) == 1
+        assert pick_chunk_size(10_000_000, 16) <= 1024
+
+
+def test_workers_use_shipped_db(tmp_path):
+    # DB ที่ส่งไปมีตัวละครที่ไม่อยู่ใน characters/ → worker ต้องไม่อ่านไฟล์เอง
+    shutil.copy(CHARACTERS_DIR / "miho.json", tmp_path / "shipped_only.json")
+    (tmp_path / "monster").mkdir()
+    db = CharacterDB(tmp_path)
+    assert parallel_map(_character_names, [0, 1], workers=2, chunk_size=1, db=db) == [("shipped_only",)] * 2
+    build = {"character": "shipped_only", "config": USER}
+    shipped = evaluate_builds([build], workers=2, db=db)[0]
+    assert shipped == HitDamage.from_result(compute_damage("miho", None, USER))
+    assert "shipped_only" not in get_character_db()
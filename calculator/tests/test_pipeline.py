@@ -0,0 +1,180 @@
+"""
+Integration Tests for the Headless Pipeline (pipeline.py)
+
+compute_damage must match the manual Decimal pipeline and never print.
+"""
+
+import subprocess
+
+import pytest
+from decimal import Decimal
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline import BOTH_SKILLS, compute_damage, resolve_skill
+from results import (
+    DamageResult,
+    BiscuitResult,
+    EspadaResult,
+    FreyjaResult,
+    KlahanResult,
+    RyanResult,
+    SunWukongResult,
+)
+from constants import get_atk_base
+from damage_calc import (
+    calculate_total_atk,
+    calculate_raw_dmg,
+    calculate_effective_def,
+    calculate_final_dmg,
+)
+from display import print_damage_result
+
+
+@pytest.fixture
+def user_config():
+    """Fixed user config (independent from config.json)"""
+    return {
+        "Weapon_Set": 0,
+        "Formation": 0.0,
+        "ATK_CHAR": 4000.0,
+        "CRIT_DMG": 250.0,
+        "ATK_PET": 500.0,
+        "BUFF_ATK_PET": 21.0,
+        "Potential_PET": 51.0,
+        "DEF_Target": 1000.0,
+        "HP_Target": 20000.0,
+        "DMG_Reduction": 10.0,
+        "DEF_BUFF": 0.0,
+    }
+
+
+class TestComputeDamage:
+    """compute_damage for standard characters"""
+
+    def test_returns_damage_result(self, user_config):
+        result = compute_damage("miho", "skill2", user_config)
+        assert isinstance(result, DamageResult)
+        assert not result.is_special
+        assert result.final_dmg_crit > result.final_dmg_no_crit > 0
+
+    def test_matches_manual_decimal_pipeline(self, user_config):
+        """Miho skill2: SKILL_DMG 185, WEAK_DMG 23 from character"""
+        result = compute_damage("miho", "skill2", user_config)
+
+        total_atk = calculate_total_atk(
+            Decimal("4000.0"), Decimal("500.0"), get_atk_base("legend", "magic"),
+            Decimal("0.0"), Decimal("51.0"), Decimal("0"), Decimal("21.0")
+        )
+        eff_def = calculate_effective_def(Decimal("1000.0"), Decimal("0.0"), Decimal("0"), Decimal("0.0"))
+        raw = calculate_raw_dmg(
+            total_atk, Decimal("185.0"), Decimal("250.0"), Decimal("30") + Decimal("23.0"),
+            Decimal("0"), Decimal("0"), Decimal("10.0"), Decimal("0")
+        )
+
+        assert result.total_atk == total_atk
+        assert result.effective_def == eff_def
+        assert result.final_dmg_crit_weakness == calculate_final_dmg(raw, eff_def)
+
+    def test_no_output(self, user_config, capsys):
+        compute_damage("miho", "skill2", user_config, "castle_room1.json")
+        assert capsys.readouterr().out == ""
+
+    def test_monster_preset_by_name(self, user_config):
+        result = compute_damage("miho", None, user_config, "castle_room1.json")
+        assert result.monster_hp == 8650
+        assert result.def_target == Decimal("689")
+
+    def test_user_config_not_mutated(self, user_config):
+        before = dict(user_config)
+        compute_damage("miho", "skill2", user_config, "castle_room1.json")
+        assert user_config == before
+
+    def test_unknown_skill_raises(self, user_config):
+        with pytest.raises(KeyError):
+            compute_damage("miho", "skill9", user_config)
+
+    def test_unknown_character_raises(self, user_config):
+        with pytest.raises(KeyError):
+            compute_damage("nobody", None, user_config)
+
+
+class TestSpecialCharacters:
+    """Handlers return typed records instead of printing"""
+
+    @pytest.mark.parametrize("char_name,skill,preset,record_type", [
+        ("freyja", "skill1", None, FreyjaResult),
+        ("ryan", "skill1", None, RyanResult),
+        ("klahan", "skill1", None, KlahanResult),
+        ("espada", "skill1", None, EspadaResult),
+        ("biscuit", "skill2", None, BiscuitResult),
+        ("sun_wukong", "skill1", "castle_room1.json", SunWukongResult),
+    ])
+    def test_special_result_without_output(self, user_config, capsys, char_name, skill, preset, record_type):
+        result = compute_damage(char_name, skill, user_config, preset)
+        assert result.is_special
+        assert result.special_character == char_name
+        assert type(result.special_result) is record_type
+        assert capsys.readouterr().out == ""
+
+    def test_records_are_slotted_and_frozen(self, user_config):
+        record = compute_damage("ryan", "skill1", user_config).special_result
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.skill_hits = 99
+
+    def test_to_dict_nests_scenarios(self, user_config):
+        """to_dict() (used for JSON output) nests ScenarioDamage fields as dicts"""
+        result = compute_damage("ryan", "skill1", user_config)
+        data = result.special_result.to_dict()
+        assert data["crit_low_hp"]["multiplier"] == result.special_result.crit_low_hp.multiplier
+        assert data["crit_full_hp"]["final"] == result.special_result.crit_full_hp.final
+
+    def test_sun_wukong_scenarios(self, user_config):
+        record = compute_damage("sun_wukong", "skill1", user_config, "castle_room1.json").special_result
+        assert len(record.scenarios_weak_base) == record.skill_hits + 1
+        assert record.scenarios_weak_base[-1].crit_count == record.skill_hits
+
+    def test_render_special_result(self, user_config, capsys):
+        result = compute_damage("biscuit", "skill2", user_config, "castle_room1.json",
+                                def_char=Decimal("1200"), def_pet=Decimal("300"))
+        print_damage_result(result)
+        out = capsys.readouterr().out
+        assert "HP มอนสเตอร์: 8,650" in out
+
+    def test_logic_module_loaded_once_on_demand(self):
+        """logic/*.py ถูก import เมื่อใช้ตัวละครนั้นครั้งแรก (process ใหม่ ไม่มีผลจากเทสอื่น)"""
+        code = (
+            "import sys; from pipeline import compute_damage; from character_registry import load_logic\n"
+            "before = sorted(m for m in sys.modules if m.startswith('logic.'))\n"
+            "compute_damage('ryan', 'skill1', {'HP_Target': 20000})\n"
+            "print(before, sorted(m for m in sys.modules if m.startswith('logic.')),"
+            " load_logic('ryan') is load_logic('ryan'), load_logic.cache_info().currsize)"
+        )
+        done = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+                              capture_output=True, text=True, check=True)
+        assert done.stdout.split() == ["[]", "['logic.ryan']", "True", "1"]
+
+
+class TestBothSkills:
+    """Both-skills mode"""
+
+    def test_both_skills_totals(self, user_config):
+        result = compute_damage("miho", BOTH_SKILLS, user_config)
+        both = result.both_skills
+        assert both is not None
+        assert len(both.skills) == 2
+        assert both.total_crit == sum(s.damage_crit for s in both.skills)
+        assert both.total_weak == sum(s.damage_weak for s in both.skills)
+
+    def test_resolve_skill_default_is_first(self):
+        meta = {"_skills": {"a": {"_name": "A", "SKILL_DMG": 1}, "b": {"SKILL_DMG": 2}}}
+        assert resolve_skill(meta, None) == ({"SKILL_DMG": 1}, False, None)
+
+    def test_render_both_skills(self, user_config, capsys):
+        print_damage_result(compute_damage("miho", BOTH_SKILLS, user_config))
+        out = capsys.readouterr().out
+        assert "รวมทั้งสองสกิล" in out
+        assert "Final Damage Results" in out
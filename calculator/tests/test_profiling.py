@@ -0,0 +1,112 @@
+"""
+Unit Tests for the opt-in profiling layer (profiling.py)
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from profiling import Profiler, active_profiler, profile, profiled, stage
+from pipeline import compute_damage
+
+
+class TestStage:
+    """context manager / decorator"""
+
+    def test_inactive_is_noop(self):
+        assert active_profiler() is None
+        with stage("ignored"):
+            pass
+        assert active_profiler() is None
+
+    def test_counts_and_nesting(self):
+        with profile() as profiler:
+            for _ in range(3):
+                with stage("outer"):
+                    with stage("inner"):
+                        pass
+        assert profiler.stats["outer"].calls == 3
+        assert profiler.stats["outer/inner"].calls == 3
+        outer = profiler.stats["outer"]
+        assert outer.min_ns <= outer.mean_ns <= outer.max_ns
+        assert outer.total_ns >= profiler.stats["outer/inner"].total_ns
+
+    def test_decorator(self):
+        @profiled()
+        def work(x):
+            return x * 2
+
+        assert work(2) == 4
+        with profile() as profiler:
+            assert work(3) == 6
+        assert profiler.stats["work"].calls == 1
+
+    def test_exception_still_recorded(self):
+        with profile() as profiler:
+            with pytest.raises(ValueError):
+                with stage("boom"):
+                    raise ValueError
+        assert profiler.stats["boom"].calls == 1
+        assert active_profiler() is None
+
+    def test_nested_profile_restores_previous(self):
+        with profile() as outer:
+            with profile() as inner:
+                with stage("a"):
+                    pass
+            assert active_profiler() is outer
+        assert "a" in inner.stats and "a" not in outer.stats
+
+    def test_accumulate_into_existing(self):
+        profiler = Profiler()
+        for _ in range(2):
+            with profile(profiler=profiler):
+                with stage("a"):
+                    pass
+        assert profiler.stats["a"].calls == 2
+
+
+class TestAllocations:
+    """tracemalloc"""
+
+    def test_peak_and_net(self):
+        with profile(track_allocations=True) as profiler:
+            with stage("outer"):
+                with stage("temp"):
+                    data = bytearray(1_000_000)
+                    del data
+                with stage("kept"):
+                    kept = bytearray(200_000)
+        assert profiler.stats["outer/temp"].peak_bytes >= 1_000_000
+        assert profiler.stats["outer/temp"].alloc_bytes < 100_000
+        assert profiler.stats["outer/kept"].alloc_bytes >= 200_000
+        assert profiler.stats["outer"].peak_bytes >= 1_000_000
+        assert len(kept) == 200_000
+
+
+class TestPipeline:
+    """stage ของ pipeline ถูกบันทึก"""
+
+    def test_pipeline_stages(self):
+        user = {"ATK_CHAR": 4000.0, "DEF_Target": 1000.0, "HP_Target": 20000.0}
+        with profile() as profiler:
+            compute_damage("miho", "skill2", user, "castle_room1.json")
+            compute_damage("sun_wukong", "skill1", user, "castle_room1.json")
+        for path in ("pipeline", "pipeline/merge_configs", "pipeline/apply_weapon_set",
+                     "pipeline/total_atk", "pipeline/hp_damage", "pipeline/raw_dmg",
+                     "pipeline/effective_def", "pipeline/final_dmg", "load_character"):
+            assert profiler.stats[path].calls == 2, path
+        assert profiler.stats["pipeline/handler"].calls == 1
+        assert profiler.stats["pipeline/atk_needed"].calls == 1
+
+    def test_export(self):
+        with profile(track_allocations=True) as profiler:
+            compute_damage("miho", "skill2", {"ATK_CHAR": 4000.0})
+        data = json.loads(profiler.to_json())
+        assert data["stages"]["pipeline"]["calls"] == 1
+        assert "peak_bytes" in data["stages"]["pipeline/raw_dmg"]
+        table = profiler.summary()
+        assert "pipeline/raw_dmg" in table and "peak KiB" in table
@@ -0,0 +1,107 @@
+"""
+Unit Tests for the roster-wide kill matrix (roster.py)
+"""
+
+import io
+from dataclasses import replace
+
+import pytest
+
+import roster
+from character_db import get_character_db
+from equipment import get_weapon_sets
+from kill_matrix import character_matrix
+from roster import (
+    cached_skill_specs,
+    clear_skill_cache,
+    main,
+    roster_matrices,
+    roster_rows,
+    sort_rows,
+    write_csv,
+)
+
+USER = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+
+class TestRosterMatrices:
+    """ทุกตัวละคร x ทุกชุดเซ็ท"""
+
+    def test_covers_every_character_and_weapon_set(self):
+        matrices = roster_matrices(USER)
+        db = get_character_db()
+        expected = [(name, ws) for name in db.names() for ws in get_weapon_sets()]
+        assert [(m.character, m.weapon_set) for m in matrices] == expected
+
+    def test_matches_character_matrix(self):
+        for matrix in roster_matrices(USER, ["miho", "espada"], [0, 3]):
+            assert matrix == character_matrix(matrix.character, {**USER, "Weapon_Set": matrix.weapon_set})
+
+    def test_workers_give_same_result(self):
+        kwargs = dict(characters=["miho", "teo", "sun_wukong"], weapon_sets=[1, 4])
+        assert roster_matrices(USER, workers=2, **kwargs) == roster_matrices(USER, **kwargs)
+
+    def test_unknown_character(self):
+        with pytest.raises(KeyError):
+            roster_matrices(USER, ["nobody"])
+
+
+class TestSkillCache:
+    """SkillSpec ถูกใช้ซ้ำจนกว่า entry ของตัวละครจะเปลี่ยน"""
+
+    def test_reused_until_entry_changes(self, monkeypatch):
+        clear_skill_cache()
+        first = cached_skill_specs("miho")
+        assert cached_skill_specs("miho") is first
+
+        db = get_character_db()
+        original = db.get
+        fresh = replace(original("miho"))  # entry ใหม่ค่าเดิม (เหมือน DB โหลดไฟล์ใหม่)
+        monkeypatch.setattr(db, "get", lambda name: fresh if name == "miho" else original(name))
+        reloaded = cached_skill_specs("miho")
+        assert reloaded is not first and reloaded == first
+        assert roster._skill_cache["miho"][0] is fresh
+
+
+class TestRows:
+    """แตกแถว / เรียง / เขียน"""
+
+    def test_sorting(self):
+        rows = roster_rows(roster_matrices(USER, ["miho", "pascal", "teo"]))
+        by_margin = sort_rows(rows, "margin", "crit_weak")
+        margins = [r.cell.margins[1] for r in by_margin if r.cell.hp > 0]
+        assert margins == sorted(margins, reverse=True)
+        assert all(r.cell.hp == 0 for r in by_margin[len(margins):])
+        by_target = sort_rows(rows, "target")
+        assert [r.cell.target for r in by_target] == sorted(r.cell.target for r in rows)
+        with pytest.raises(ValueError):
+            sort_rows(rows, "speed")
+
+    def test_csv(self):
+        rows = roster_rows(roster_matrices(USER, ["miho"], [4], ["castle_room1"]))
+        out = io.StringIO()
+        assert write_csv(rows, out) == len(rows)
+        header, first = out.getvalue().splitlines()[:2]
+        assert header.startswith("character,skill,weapon_set,preset,hp,skill_hits,damage_crit")
+        cell = rows[0].cell
+        assert first.split(",")[:6] == ["miho", cell.skill, "4", "castle_room1", str(cell.hp), str(cell.skill_hits)]
+
+
+class TestMain:
+    """CLI"""
+
+    def test_kills_only_table(self, capsys, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_text('{"ATK_CHAR": 6000, "CRIT_DMG": 250, "ATK_PET": 564}', encoding="utf-8")
+        assert main(["--config", str(config), "--monster", "castle_room1", "--kills-only"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("character") and len(lines) > 2
+        assert all("💀" in line for line in lines[2:])
+
+    def test_unknown_monster(self, capsys):
+        assert main(["--monster", "missing"]) == 2
+        assert "missing" in capsys.readouterr().err
@@ -0,0 +1,125 @@
+"""
+Unit Tests for slotted records (specs.py)
+evaluate ต้องตรงกับ compute_damage ทุกบิต และ record ต้องไม่มี __dict__
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from character_db import get_character_db
+from pipeline import compute_damage
+from specs import Build, SkillSpec, TargetSpec, evaluate, evaluate_many, skill_specs
+
+USER = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+
+def _expected(character, skill, user, preset=None):
+    result = compute_damage(character, skill, dict(user), preset)
+    return int(result.final_dmg_hp), (result.final_dmg_crit, result.final_dmg_crit_weakness,
+                                      result.final_dmg_no_crit, result.final_dmg_weakness_only)
+
+
+class TestParse:
+    """parse + ตรวจค่าตอนโหลด"""
+
+    def test_weapon_set_applied_once(self):
+        build = Build.from_config(USER)
+        assert build.weapon_set == 4 and build.dmg_amp_buff == 40.0
+        assert Build.from_config({"Weapon_Set": 1}).weak_dmg == 35.0
+
+    def test_comments_and_unknown_keys_ignored(self):
+        build = Build.from_config({"// --- ตัวเรา ---": "", "ATK_CHAR": "3773.5", "Other": [1]})
+        assert build.atk_char == 3773.5 and build.crit_dmg is None
+
+    @pytest.mark.parametrize("config", [{"ATK_CHAR": "abc"}, {"CRIT_DMG": True},
+                                        {"Weapon_Set": "x"}, {"ATK_PET": [1]}])
+    def test_invalid_values(self, config):
+        with pytest.raises(ValueError):
+            Build.from_config(config)
+
+    def test_target_preset_overrides_config(self):
+        target = TargetSpec.from_monster("castle_room1", USER)
+        preset = get_character_db().monster("castle_room1.json").preset
+        assert target.name == "castle_room1"
+        assert target.def_target == float(preset["DEF_Target"])
+        with pytest.raises(ValueError):
+            TargetSpec.from_config({"HP_Target": "lots"})
+
+    def test_invalid_skill_hits(self):
+        with pytest.raises(ValueError):
+            Build.from_config({"SKILL_HITS": "many"})
+
+    def test_both_skills_rejected(self):
+        with pytest.raises(ValueError):
+            SkillSpec.load("miho", "both")
+
+
+class TestEvaluate:
+    """ผลตรงกับ pipeline"""
+
+    @pytest.mark.parametrize("character", ["miho", "espada", "teo", "sun_wukong"])
+    @pytest.mark.parametrize("preset", [None, "castle_room1.json"])
+    def test_matches_pipeline(self, character, preset):
+        build = Build.from_config(USER)
+        target = TargetSpec.from_monster(preset, USER) if preset else TargetSpec.from_config(USER)
+        for skill in skill_specs(character):
+            assert evaluate(build, skill, target) == _expected(character, skill.skill, USER, preset)
+
+    @pytest.mark.parametrize("preset", [
+        {"DEF_Target": 900.0, "DMG_AMP_BUFF": 25.0, "Ignore_DEF": 5.0},
+        {"HP_Target": 8650.0, "Weapon_Set": 2},
+    ])
+    def test_preset_before_weapon_set(self, preset):
+        # prepare_config: user → preset → ชุดเซ็ทอาวุธ (preset ทับค่าผู้โจมตีก่อนบวกชุดเซ็ท)
+        target = TargetSpec.from_config(USER, preset)
+        build = Build.from_config(USER, dict(target.build_overrides))
+        for skill in skill_specs("espada"):
+            assert evaluate(build, skill, target) == _expected("espada", skill.skill, USER, preset)
+
+    @pytest.mark.parametrize("user, preset", [
+        ({**USER, "SKILL_HITS": 3}, None),
+        (USER, {"HP_Target": 8650.0, "SKILL_HITS": 2}),
+        ({**USER, "SKILL_HITS": 3}, {"SKILL_HITS": 5}),
+    ])
+    def test_user_and_preset_skill_hits_win_like_pipeline(self, user, preset):
+        target = TargetSpec.from_config(user, preset)
+        build = Build.from_config(user, dict(target.build_overrides))
+        for character in ("miho", "sun_wukong"):
+            for skill in skill_specs(character):
+                result = compute_damage(character, skill.skill, dict(user), preset)
+                assert skill.hits(build) == result.skill_hits
+        assert skill_specs("sun_wukong")[0].hits(Build.from_config(USER)) == \
+            compute_damage("sun_wukong", "skill1", dict(USER)).skill_hits
+
+    @pytest.mark.parametrize("weapon_set", [0, 1, 2, 3])
+    def test_weapon_sets(self, weapon_set):
+        user = {**USER, "Weapon_Set": weapon_set, "WEAK_DMG": 12.5, "Ignore_DEF": 3.3}
+        skill = SkillSpec.load("espada", "skill2")
+        assert evaluate(Build.from_config(user), skill, TargetSpec.from_config(user)) == \
+            _expected("espada", "skill2", user)
+
+    def test_evaluate_many(self):
+        skill, target = SkillSpec.load("miho"), TargetSpec.from_config(USER)
+        builds = [Build.from_config({**USER, "ATK_CHAR": atk}) for atk in (3000, 3500.5, 4200)]
+        assert evaluate_many(builds, skill, target) == [evaluate(b, skill, target) for b in builds]
+
+
+class TestFootprint:
+    """record ไม่มี __dict__ และเล็กกว่า dict"""
+
+    def test_slots(self):
+        build = Build.from_config(USER)
+        assert not hasattr(build, "__dict__")
+        assert sys.getsizeof(build) < sys.getsizeof(dict(USER))
+        with pytest.raises(AttributeError):
+            build.atk_char = 1.0
+
+    def test_picklable(self):
+        skill = SkillSpec.load("sun_wukong", "skill1")
+        assert pickle.loads(pickle.dumps(skill)) == skill
@@ -0,0 +1,131 @@
+"""
+Unit Tests for the parameter sweep (sweep.py)
+ทุกแถวต้องตรงกับ compute_damage ที่ใส่ค่า axis ลงใน user config
+"""
+
+import csv
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_calc import SCENARIOS
+from config_loader import load_monster_preset
+from pipeline import compute_damage
+from sweep import SweepAxis, iter_sweep, main, parse_axis, plan_sweep, write_sweep
+
+USER = {
+    "Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "DMG_AMP_BUFF": 10.0,
+    "ATK_PET": 564.0, "BUFF_ATK_PET": 21.0, "Potential_PET": 51.0,
+    "DEF_Target": 1461.0, "HP_Target": 18205.0, "DMG_Reduction": 10.0,
+}
+
+
+def _collect(plan, chunk_rows=1000):
+    chunks = list(iter_sweep(plan, chunk_rows))
+    return {k: np.concatenate([c[k] for c in chunks]) for k in chunks[0]}
+
+
+def _assert_matches_pipeline(plan, user, preset=None, every=1):
+    columns = _collect(plan, chunk_rows=17)
+    assert len(columns[SCENARIOS[0]]) == plan.rows
+    base = {**user, **(load_monster_preset(preset) if preset else {})}
+    for i in range(0, plan.rows, every):
+        overrides = {axis.key: columns[axis.key][i].item() for axis in plan.axes}
+        result = compute_damage(plan.character, plan.skill, {**base, **overrides})
+        expected = (result.final_dmg_crit, result.final_dmg_crit_weakness,
+                    result.final_dmg_no_crit, result.final_dmg_weakness_only)
+        assert tuple(int(columns[s][i]) for s in SCENARIOS) == expected, overrides
+
+
+class TestParseAxis:
+    """รูปแบบ KEY=start:stop:step / KEY=a,b,c"""
+
+    def test_range_inclusive(self):
+        assert parse_axis("DEF_Target=0:3000:1000") == SweepAxis("DEF_Target", (0.0, 1000.0, 2000.0, 3000.0))
+
+    def test_decimal_step(self):
+        assert parse_axis("CRIT_DMG=0.1:0.3:0.1").values == (0.1, 0.2, 0.3)
+        assert parse_axis("ATK_CHAR=5:0:-2").values == (5.0, 3.0, 1.0)
+
+    def test_list(self):
+        axis = parse_axis("Weapon_Set=0,2,4")
+        assert axis.values == (0.0, 2.0, 4.0)
+        assert axis.column().dtype == np.int64
+
+    @pytest.mark.parametrize("spec", ["DEF_Target", "Unknown_Key=1:2:1", "DEF_Target=0:10",
+                                      "DEF_Target=0:10:-1", "DEF_Target=a,b"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_axis(spec)
+
+
+class TestSweep:
+    """ผลตรงกับ pipeline ทีละแถว"""
+
+    def test_single_axis(self):
+        plan = plan_sweep("miho", [parse_axis("DEF_Target=0:3000:37")], "skill2", USER)
+        assert list(plan.varying[0]) == ["DEF_Target"]
+        _assert_matches_pipeline(plan, USER)
+
+    def test_two_independent_axes(self):
+        axes = [parse_axis("ATK_CHAR=3000:4000:125"), parse_axis("CRIT_DMG=100:300:40")]
+        plan = plan_sweep("espada", axes, None, USER, "castle_room1.json")
+        assert not plan.joint and plan.shape == (9, 6)
+        _assert_matches_pipeline(plan, USER, "castle_room1.json")
+
+    def test_preset_key_is_overridden(self):
+        plan = plan_sweep("teo", [parse_axis("HP_Target=10000:40000:5000")], None, USER, "castle_room1.json")
+        _assert_matches_pipeline(plan, USER, "castle_room1.json")
+
+    def test_overlapping_axes_use_joint_table(self):
+        # Weapon_Set 3/4 บวก DMG_AMP_BUFF → ต้อง prepare_config ทุกคู่
+        axes = [parse_axis("Weapon_Set=0,1,2,3,4"), parse_axis("DMG_AMP_BUFF=0:100:12.5")]
+        plan = plan_sweep("teo", axes, None, USER)
+        assert plan.joint
+        _assert_matches_pipeline(plan, USER)
+
+    def test_additive_key_adds_character_value(self):
+        plan = plan_sweep("sun_wukong", [parse_axis("Bonus_DMG_HP_Target=0:20:5")], "skill1", USER)
+        _assert_matches_pipeline(plan, USER)
+
+    def test_chunking_does_not_change_rows(self):
+        axes = [parse_axis("ATK_CHAR=3000:3100:10"), parse_axis("DEF_Target=500:700:50")]
+        plan = plan_sweep("miho", axes, None, USER)
+        small, large = _collect(plan, 1), _collect(plan, 10_000)
+        for name in plan.columns:
+            assert np.array_equal(small[name], large[name])
+
+    def test_both_skills_rejected(self):
+        with pytest.raises(ValueError):
+            plan_sweep("miho", [parse_axis("ATK_CHAR=1:2:1")], "both", USER)
+
+
+class TestOutput:
+    """CSV / npz"""
+
+    def test_csv_and_npz_agree(self, tmp_path):
+        axes = [parse_axis("ATK_CHAR=3000:3050:10"), parse_axis("CRIT_DMG=150:200:12.5")]
+        plan = plan_sweep("miho", axes, None, USER)
+        assert write_sweep(plan, tmp_path / "g.csv") == plan.rows
+        assert write_sweep(plan, tmp_path / "g.npz") == plan.rows
+        with open(tmp_path / "g.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        data = np.load(tmp_path / "g.npz")
+        assert list(rows[0]) == list(plan.columns) == list(data.files)
+        assert rows[1]["ATK_CHAR"] == "3000" and rows[1]["CRIT_DMG"] == "162.5"
+        for name in SCENARIOS:
+            assert [int(r[name]) for r in rows] == data[name].tolist()
+
+    def test_unknown_suffix(self, tmp_path):
+        plan = plan_sweep("miho", [parse_axis("ATK_CHAR=1:2:1")], None, USER)
+        with pytest.raises(ValueError):
+            write_sweep(plan, tmp_path / "g.xlsx")
+
+    def test_cli(self, tmp_path, capsys):
+        config = tmp_path / "user.json"
+        config.write_text('{"ATK_CHAR": 4000}', encoding="utf-8")
+        out = tmp_path / "curve.csv"
+        assert main(["miho", "DEF_Target=0:100:50", "--config", str(config), "--out", str(out)]) == 0
+        assert len(out.read_text(encoding="utf-8").splitlines()) == 4
+        assert main(["miho", "Nope=1:2:1"]) == 2
+        assert "Nope" in capsys.readouterr().err
@@ -0,0 +1,141 @@
+"""
+Unit Tests for watch mode (watch.py)
+ใช้สำเนาของ characters/ และ config ใน tmp_path (ไม่แตะไฟล์จริง)
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from character_db import CharacterDB
+from incremental import DamageGraph
+from watch import WatchKey, Watcher, render, run, watch_keys
+
+CHARACTERS = Path(__file__).parent.parent / "characters"
+
+USER = {"Weapon_Set": 4, "ATK_CHAR": 3773.0, "CRIT_DMG": 186.0, "ATK_PET": 564.0,
+        "DEF_Target": 1461.0, "HP_Target": 18205.0}
+
+
+def _write(path, data):
+    """เขียน JSON แล้วเลื่อน mtime ไปข้างหน้า (ไม่ขึ้นกับความละเอียดของ mtime ในระบบไฟล์)"""
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(data if isinstance(data, str) else json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(previous + 10**9, previous + 10**9))
+
+
+@pytest.fixture
+def env(tmp_path):
+    shutil.copytree(CHARACTERS, tmp_path / "characters")
+    db = CharacterDB(root=tmp_path / "characters", check_interval=None)
+    config = tmp_path / "config.json"
+    _write(config, USER)
+    keys = watch_keys(["miho", "teo:skill2"], [None, "castle_room1"], db)
+    return Watcher(keys, config, db), config, tmp_path / "characters"
+
+
+def _fresh(watcher, key):
+    preset = watcher.db.monster(key.preset).preset if key.preset else None
+    return DamageGraph(key.character, key.skill, watcher.user_config, preset, watcher.db)
+
+
+class TestWatchKeys:
+    def test_expand(self):
+        db = CharacterDB(check_interval=None)
+        keys = watch_keys(["miho", "teo:skill2"], ["castle_room1"], db)
+        assert keys[0] == WatchKey("miho", "skill2", "castle_room1")
+        assert keys[-1] == WatchKey("teo", "skill2", "castle_room1")
+        assert len(keys) == len(db.get("miho").meta["_skills"]) + 1
+        assert {k.character for k in watch_keys([], db=db)} == set(db.names())
+
+
+class TestPoll:
+    """เฉพาะผลที่เปลี่ยนถูกคืนมา และค่าตรงกับ graph ที่สร้างใหม่"""
+
+    def test_nothing_changed(self, env):
+        watcher, config, _ = env
+        assert watcher.poll() == []
+        _write(config, USER)  # บันทึกซ้ำค่าเดิม
+        assert watcher.poll() == []
+
+    def test_config_edit(self, env):
+        watcher, config, _ = env
+        before = {key: graph.final_dmg for key, graph in watcher.graphs.items()}
+        _write(config, {**USER, "CRIT_DMG": 240.0})
+        changed = watcher.poll()
+        assert len(changed) > 1
+        for key, graph in watcher.graphs.items():
+            assert graph.final_dmg == _fresh(watcher, key).final_dmg
+            assert (key in changed) == (graph.final_dmg != before[key])
+
+    def test_config_edit_overridden_by_preset(self, env):
+        watcher, config, _ = env
+        _write(config, {**USER, "DEF_Target": 900.0})
+        assert {key.preset for key in watcher.poll()} == {None}
+
+    def test_skill_hits_edit(self, env):
+        watcher, config, _ = env
+        _write(config, {**USER, "SKILL_HITS": 3})
+        assert watcher.poll() == list(watcher.graphs)  # ดาเมจต่อ hit เท่าเดิม แต่ margin เปลี่ยน
+        key = WatchKey("teo", "skill2", "castle_room1")
+        assert watcher.graphs[key].skill_hits == _fresh(watcher, key).skill_hits == 3
+        assert "(x3 vs HP 8,650" in render(key, watcher.graphs[key])
+
+    def test_character_edit_rebuilds_only_that_character(self, env):
+        watcher, _, characters = env
+        data = json.loads((characters / "miho.json").read_text(encoding="utf-8"))
+        data["_skills"]["skill2"]["SKILL_DMG"] = 250.0
+        _write(characters / "miho.json", data)
+        teo = {key: graph for key, graph in watcher.graphs.items() if key.character == "teo"}
+        changed = watcher.poll()
+        assert {(k.character, k.skill) for k in changed} == {("miho", "skill2")}
+        assert all(watcher.graphs[key] is graph for key, graph in teo.items())
+        for key in changed:
+            assert watcher.graphs[key].final_dmg == _fresh(watcher, key).final_dmg
+
+    def test_preset_edit(self, env):
+        watcher, _, characters = env
+        path = characters / "monster" / "castle_room1.json"
+        _write(path, {**json.loads(path.read_text(encoding="utf-8")), "HP_Target": 5000.0})
+        changed = watcher.poll()
+        assert changed and all(key.preset == "castle_room1" for key in changed)
+        assert all(watcher.graphs[key]["HP_Target"] == 5000 for key in changed)
+
+    def test_broken_file_keeps_state_and_retries(self, env):
+        watcher, config, _ = env
+        before = {key: graph.final_dmg for key, graph in watcher.graphs.items()}
+        _write(config, '{"ATK_CHAR": 40')
+        with pytest.raises(ValueError):
+            watcher.poll()
+        assert {key: graph.final_dmg for key, graph in watcher.graphs.items()} == before
+        _write(config, {**USER, "ATK_CHAR": 4000.0})
+        assert watcher.poll() and watcher.user_config["ATK_CHAR"] == 4000.0
+
+    def test_failed_rebuild_is_retried(self, env):
+        watcher, _, characters = env
+        path = characters / "miho.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        skill2 = data["_skills"].pop("skill2")
+        _write(path, data)
+        with pytest.raises(KeyError):
+            watcher.poll()
+        data["_skills"]["skill2"] = {**skill2, "SKILL_DMG": 250.0}
+        _write(path, data)
+        assert ("miho", "skill2") in {(k.character, k.skill) for k in watcher.poll()}
+
+
+class TestRender:
+    def test_render_and_run(self, env, capsys):
+        watcher, config, _ = env
+        key = WatchKey("teo", "skill2", "castle_room1")
+        line = render(key, watcher.graphs[key])
+        assert line.startswith("teo:skill2 @ castle_room1  crit ") and "vs HP 8,650" in line
+
+        _write(config, '{"ATK_CHAR": ')
+        run(watcher, interval=0, polls=2)
+        out = capsys.readouterr().out
+        assert out.count("⚠️") == 1  # ข้อผิดพลาดเดิมแจ้งครั้งเดียว
+        assert out.count("castle_room1  crit") == len(watcher.graphs) // 2
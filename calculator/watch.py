@@ -0,0 +1,210 @@
+"""
+Watch Mode - คำนวณใหม่ทันทีที่ config.json หรือไฟล์ตัวละคร / monster preset ถูกบันทึก (ไม่มีเมนู)
+
+- CharacterDB และ DamageGraph (SkillSpec ที่ compile แล้ว + ค่าทุก node) อยู่ในหน่วยความจำตลอด ไม่ import ใหม่
+- ตรวจ mtime ทุก --interval วินาที:
+    config.json เปลี่ยน    → DamageGraph.update เฉพาะ key ที่ค่าต่างจากเดิม (incremental.py)
+    ไฟล์ตัวละครเปลี่ยน     → สร้าง graph ใหม่เฉพาะตัวละครที่ entry เปลี่ยน
+    monster preset เปลี่ยน → set_preset เฉพาะ graph ที่ใช้ preset นั้น
+- แสดงเฉพาะผลที่ดาเมจหรือ HP เปลี่ยน
+- ไฟล์ที่ยังเขียนไม่เสร็จ / ค่าผิด → แจ้งเตือนแล้วใช้ค่าเดิมต่อ (ลองใหม่รอบถัดไป)
+
+หมายเหตุ: ให้ผล 4 scenario ปกติ (ไม่รวม special logic ของตัวละครใน character_registry)
+
+การใช้งาน:
+    python calculator/watch.py miho:skill2 espada --preset castle_room1 castle_room2
+    python calculator/watch.py                # ทุกตัวละคร ทุกสกิล, ไม่มี preset
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Add parent directory to path for imports (รันเป็นสคริปต์ได้)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from character_db import CharacterDB, CharacterEntry, MonsterEntry, get_character_db
+from config_loader import load_json
+from fast_calc import SCENARIO_INDEX
+from incremental import DamageGraph
+from kill_matrix import KillCell
+from kill_matrix_mode import format_margin
+
+CONFIG_PATH = Path(__file__).parent / "config.json"
+
+# วินาทีระหว่างการตรวจไฟล์
+DEFAULT_INTERVAL = 0.2
+
+# ข้อผิดพลาดจากไฟล์ที่บันทึกไม่ครบ / ค่าผิด (ไม่หยุด watch, JSONDecodeError เป็น ValueError)
+_RECOVERABLE = (ValueError, KeyError, TypeError, OSError)
+
+
+@dataclass(frozen=True, slots=True)
+class WatchKey:
+    """ผล 1 ชุดที่เฝ้าดู (preset None = ใช้ค่าใน config.json)"""
+    character: str
+    skill: str | None
+    preset: str | None
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def watch_keys(
+    specs: Iterable[str], presets: Sequence[str | None] = (None,), db: CharacterDB | None = None
+) -> list[WatchKey]:
+    """
+    "ตัวละคร" หรือ "ตัวละคร:สกิล" → WatchKey ต่อ preset (ไม่ระบุสกิล = ทุกสกิล, ไม่ระบุตัวละคร = ทุกตัว)
+    """
+    db = db or get_character_db()
+    keys = []
+    for spec in list(specs) or db.names():
+        character, _, skill = spec.partition(":")
+        skills = [skill] if skill else list(db.get(character).meta.get("_skills") or [None])
+        keys.extend(WatchKey(character, s, p) for s in skills for p in presets)
+    return keys
+
+
+class Watcher:
+    """DamageGraph ของทุก WatchKey + สถานะไฟล์ล่าสุดที่เห็น"""
+
+    def __init__(self, keys: Sequence[WatchKey], config_path: Path = CONFIG_PATH, db: CharacterDB | None = None):
+        self.db = db or get_character_db()
+        self.config_path = config_path
+        self._config_stamp = _stamp(config_path)
+        self.user_config: dict[str, Any] = load_json(config_path)
+        self._entries: dict[str, CharacterEntry] = {}
+        self._monsters: dict[str, MonsterEntry] = {}
+        self.graphs = {key: self._build(key) for key in keys}
+
+    def _build(self, key: WatchKey) -> DamageGraph:
+        entry = self.db.get(key.character)
+        monster = None if key.preset is None else self.db.monster(key.preset)
+        graph = DamageGraph(key.character, key.skill, self.user_config, monster and monster.preset, self.db)
+        self._entries[key.character] = entry
+        if monster is not None:
+            self._monsters[key.preset] = monster
+        return graph
+
+    def _outputs(self) -> dict[WatchKey, tuple[Any, ...]]:
+        return {key: (g.final_dmg, g["HP_Target"], g.skill_hits) for key, g in self.graphs.items()}
+
+    def _reload_db(self) -> None:
+        """ตัวละคร / preset ที่ entry เปลี่ยน → สร้าง graph ใหม่ / set_preset (ที่ยังทำไม่สำเร็จจะถูกลองใหม่)"""
+        self.db.refresh()
+        stale = {name for name, entry in self._entries.items() if self.db.get(name) is not entry}
+        moved = {name for name, entry in self._monsters.items() if self.db.monster(name) is not entry}
+        if not stale and not moved:
+            return
+        # DB โหลดใหม่ทั้งโฟลเดอร์: entry ใหม่ที่ค่าเท่าเดิมไม่ต้องคำนวณใหม่
+        rebuild = {name for name in stale if self.db.get(name) != self._entries[name]}
+        represet = {name for name in moved if self.db.monster(name) != self._monsters[name]}
+        for key in self.graphs:
+            if key.character in rebuild:
+                self.graphs[key] = self._build(key)
+            elif key.preset in represet:
+                self.graphs[key].set_preset(self.db.monster(key.preset).preset)
+        for name in stale:
+            self._entries[name] = self.db.get(name)
+        for name in moved:
+            self._monsters[name] = self.db.monster(name)
+
+    def _reload_config(self) -> None:
+        """ส่งเฉพาะ key ที่ค่าเปลี่ยนให้ทุก graph (None = key ถูกลบ)"""
+        stamp = _stamp(self.config_path)
+        if stamp == self._config_stamp:
+            return
+        config = load_json(self.config_path)
+        changes = {k: config.get(k) for k in self.user_config.keys() | config.keys()
+                   if self.user_config.get(k) != config.get(k)}
+        for graph in self.graphs.values():
+            graph.update(changes)
+        self.user_config, self._config_stamp = config, stamp
+
+    def poll(self) -> list[WatchKey]:
+        """
+        ตรวจไฟล์หนึ่งรอบ → WatchKey ที่ผลเปลี่ยน (ตามลำดับที่เฝ้าดู)
+        raise ValueError / KeyError / OSError ถ้าไฟล์ยังใช้ไม่ได้ (รอบถัดไปจะลองใหม่)
+        """
+        before = self._outputs()
+        try:
+            self._reload_db()
+            self._reload_config()
+        finally:
+            after = self._outputs()
+        return [key for key in self.graphs if after[key] != before[key]]
+
+
+def render(key: WatchKey, graph: DamageGraph) -> str:
+    """1 บรรทัด: ดาเมจต่อ hit 4 scenario (+ margin ถ้ามี HP)"""
+    cell = KillCell(key.skill, key.preset or "config", graph.skill_hits, int(graph["HP_Target"]), graph.final_dmg)
+    damage = " | ".join(f"{name} {value:,}" for name, value in zip(SCENARIO_INDEX, cell.damage))
+    line = f"{key.character}:{key.skill or '-'} @ {cell.target}  {damage}"
+    if cell.hp > 0:
+        margins = " | ".join(format_margin(cell, i) for i in range(len(SCENARIO_INDEX)))
+        line += f"  (x{cell.skill_hits} vs HP {cell.hp:,}: {margins})"
+    return line
+
+
+def run(watcher: Watcher, interval: float = DEFAULT_INTERVAL, polls: int | None = None) -> None:
+    """แสดงผลทั้งหมดครั้งแรก แล้วตรวจไฟล์ทุก interval วินาที (polls = จำนวนรอบ, None = จน Ctrl+C)"""
+    for key, graph in watcher.graphs.items():
+        print(render(key, graph))
+    print(f"👀 เฝ้าดู {watcher.config_path.name} และ {watcher.db.root.name}/ (Ctrl+C เพื่อออก)", flush=True)
+    count = 0
+    last_error = None
+    while polls is None or count < polls:
+        time.sleep(interval)
+        count += 1
+        start = time.perf_counter()
+        try:
+            changed = watcher.poll()
+        except _RECOVERABLE as e:
+            error = f"{type(e).__name__}: {e}"
+            if error != last_error:  # แจ้งครั้งเดียวจนกว่าข้อผิดพลาดจะเปลี่ยน
+                print(f"⚠️ ใช้ไฟล์ไม่ได้ ({error}) - ใช้ค่าเดิม", flush=True)
+            last_error = error
+            continue
+        last_error = None
+        if changed:
+            elapsed = (time.perf_counter() - start) * 1e3
+            print(f"\n[{time.strftime('%H:%M:%S')}] {len(changed)} ผลเปลี่ยน ({elapsed:.1f} ms)")
+            for key in changed:
+                print(render(key, watcher.graphs[key]), flush=True)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", metavar="CHARACTER[:SKILL]", help="ปริยาย: ทุกตัวละคร ทุกสกิล")
+    parser.add_argument("--preset", nargs="+", help="monster preset (ปริยาย: ใช้ค่าใน config.json)")
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH, help="user config JSON ที่เฝ้าดู")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="วินาทีระหว่างการตรวจไฟล์")
+    args = parser.parse_args(argv)
+
+    try:
+        keys = watch_keys(args.targets, args.preset or (None,))
+        watcher = Watcher(keys, args.config)
+    except _RECOVERABLE as e:
+        message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+        print(f"❌ {message}", file=sys.stderr)
+        return 2
+    try:
+        run(watcher, args.interval)
+    except KeyboardInterrupt:
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    # stdout เป็น UTF-8 เสมอ (Windows console ใช้ encoding อื่นโดยปริยาย)
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.exit(main())